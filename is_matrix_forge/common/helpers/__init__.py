@@ -1,10 +1,6 @@
 import hashlib
 from pathlib import Path
 from typing import Optional
-try:
-    import requests
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    requests = None
 try:
     from inspyre_toolbox.path_man import provision_path
 except ModuleNotFoundError:  # pragma: no cover - fallback
@@ -163,6 +159,8 @@ def download_file(url, local_path, headers=None):
     if not isinstance(local_path, Path):
         local_path = provision_path(local_path)
 
+    import requests
+
     response = requests.get(url, headers=headers, stream=True)
     response.raise_for_status()
 
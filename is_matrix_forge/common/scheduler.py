@@ -0,0 +1,316 @@
+"""
+Process-wide scheduler for periodic and one-shot device tasks.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/common/scheduler.py
+
+Description:
+    Keep-alive pings, breathing ticks, paused-frame refreshes, pattern holds and
+    progress heartbeats used to run on their own threads, one per device per
+    feature. :class:`TaskScheduler` runs all of them from a single thread that
+    keeps jobs in a heap ordered by due time.
+
+    Periodic jobs run on a fixed-rate timeline (``due += interval``), so time
+    spent inside a callback or waking late does not accumulate as drift. A job
+    that falls more than one interval behind is re-anchored instead of firing a
+    burst of catch-up runs. Jobs are cancelled through their :class:`Job`
+    handle. Callbacks must be short; anything that blocks for long should hand
+    off to its own worker.
+
+Example Usage:
+    from is_matrix_forge.common.scheduler import get_scheduler
+
+    job = get_scheduler().every(50.0, controller._ping, name='keep-alive')
+    ...
+    job.cancel()
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('common.scheduler')
+
+
+class Job:
+    """
+    Handle for a scheduled callback.
+
+    Properties:
+        name (str):
+            Label used in logs.
+
+        interval (Optional[float]):
+            Period in seconds, or ``None`` for a one-shot job.
+
+        runs (int):
+            Completed invocations.
+
+        cancelled (bool):
+            Whether the job has been cancelled (or a one-shot job has fired).
+    """
+
+    def __init__(
+            self,
+            scheduler: 'TaskScheduler',
+            fn: Callable[[], Any],
+            interval: Optional[float],
+            name: str,
+    ):
+        self._scheduler = scheduler
+        self._fn = fn
+        self.interval = interval
+        self.name = name
+        self.runs = 0
+        self.due = 0.0
+        self._cancelled = False
+        self._version = 0
+        self._idle = threading.Event()
+        self._idle.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def running(self) -> bool:
+        """Whether the callback is executing right now."""
+        return not self._idle.is_set()
+
+    def cancel(self, wait: bool = False, timeout: Optional[float] = None) -> None:
+        """
+        Stop the job; it will not run again.
+
+        Parameters:
+            wait (bool, optional):
+                Block until an in-flight run finishes. Ignored when called from
+                the scheduler thread (i.e. from inside a callback). Defaults to False.
+
+            timeout (Optional[float], optional):
+                Maximum time to wait.
+        """
+        self._cancelled = True
+        self._scheduler._wake()
+        if wait and not self._scheduler.in_scheduler_thread():
+            self._idle.wait(timeout)
+
+    def reschedule(self, delay: float = 0.0) -> None:
+        """
+        Move the next run to ``delay`` seconds from now.
+
+        Periodic jobs continue on a fresh timeline from that run.
+        """
+        if not self._cancelled:
+            self._scheduler._push(self, self._scheduler.clock() + max(0.0, delay))
+
+    def __repr__(self) -> str:
+        kind = f'every {self.interval:g}s' if self.interval else 'once'
+        state = 'cancelled' if self._cancelled else f'due {self.due:.3f}'
+        return f'Job({self.name!r}, {kind}, {state})'
+
+
+class TaskScheduler:
+    """
+    A single thread that runs all registered jobs at their due times.
+
+    The thread is started lazily on the first registration and exits after
+    ``idle_timeout`` seconds with nothing scheduled, so an idle process keeps
+    no extra thread.
+
+    Parameters:
+        clock (Callable[[], float], optional):
+            Monotonic clock. Defaults to :func:`time.monotonic`.
+
+        idle_timeout (float, optional):
+            Seconds to linger with an empty queue before the thread exits.
+            Defaults to 5.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, idle_timeout: float = 5.0):
+        self.clock = clock
+        self.idle_timeout = idle_timeout
+        self._heap: List[Tuple[float, int, int, Job]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Registration
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def every(
+            self,
+            interval: float,
+            fn: Callable[[], Any],
+            *,
+            delay: Optional[float] = None,
+            name: Optional[str] = None,
+    ) -> Job:
+        """
+        Run ``fn`` every ``interval`` seconds.
+
+        Parameters:
+            interval (float):
+                Period in seconds (> 0).
+
+            fn (Callable[[], Any]):
+                The callback.
+
+            delay (Optional[float], optional):
+                Seconds until the first run. Defaults to ``interval``.
+
+            name (Optional[str], optional):
+                Label used in logs.
+
+        Returns:
+            Job:
+                Handle for cancelling the job.
+
+        Raises:
+            ValueError:
+                If ``interval`` is not positive.
+        """
+        if interval <= 0:
+            raise ValueError('interval must be > 0')
+
+        job = Job(self, fn, float(interval), name or getattr(fn, '__name__', 'job'))
+        self._push(job, self.clock() + (interval if delay is None else max(0.0, delay)))
+        return job
+
+    def after(self, delay: float, fn: Callable[[], Any], *, name: Optional[str] = None) -> Job:
+        """
+        Run ``fn`` once, ``delay`` seconds from now.
+
+        Returns:
+            Job:
+                Handle for cancelling the job before it fires.
+        """
+        job = Job(self, fn, None, name or getattr(fn, '__name__', 'job'))
+        self._push(job, self.clock() + max(0.0, delay))
+        return job
+
+    def in_scheduler_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    @property
+    def pending(self) -> int:
+        """Number of live jobs waiting to run."""
+        with self._cond:
+            return len({id(job) for _, _, _, job in self._heap if not job.cancelled})
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Internals
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _push(self, job: Job, due: float) -> None:
+        with self._cond:
+            # Bumping the version orphans any older heap entry for this job.
+            job._version += 1
+            job.due = due
+            heapq.heappush(self._heap, (due, next(self._seq), job._version, job))
+            self._ensure_thread()
+            self._cond.notify()
+
+    def _wake(self) -> None:
+        with self._cond:
+            self._cond.notify()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='TaskScheduler', daemon=True)
+            self._thread.start()
+
+    def _next_job(self) -> Optional[Job]:
+        """Block until a job is due and pop it; ``None`` once idle for ``idle_timeout``."""
+        with self._cond:
+            while True:
+                while self._heap and (self._heap[0][3].cancelled or self._heap[0][2] != self._heap[0][3]._version):
+                    heapq.heappop(self._heap)
+
+                if not self._heap:
+                    if not self._cond.wait(self.idle_timeout) and not self._heap:
+                        self._thread = None
+                        return None
+                    continue
+
+                due, _, _, job = self._heap[0]
+                remaining = due - self.clock()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+
+                heapq.heappop(self._heap)
+                job._idle.clear()
+                return job
+
+    def _run(self) -> None:
+        log = MOD_LOGGER.get_child('TaskScheduler._run')
+
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            version = job._version
+            try:
+                if not job.cancelled:
+                    job._fn()
+            except Exception as exc:
+                log.error(f'Scheduled job {job.name!r} raised: {exc!r}')
+            finally:
+                job.runs += 1
+                job._idle.set()
+
+            if job.interval is None:
+                job._cancelled = True
+                continue
+
+            if job.cancelled or job._version != version:
+                continue  # cancelled, or rescheduled from inside the callback
+
+            # Fixed-rate timeline; re-anchor instead of bursting if we fell a
+            # whole interval behind.
+            due = job.due + job.interval
+            now = self.clock()
+            if due <= now - job.interval:
+                due = now + job.interval
+            self._push(job, due)
+
+
+_SCHEDULER: Optional[TaskScheduler] = None
+_SCHEDULER_LOCK = threading.Lock()
+
+
+def get_scheduler() -> TaskScheduler:
+    """
+    Return the process-wide scheduler, creating it on first use.
+
+    Returns:
+        TaskScheduler:
+            The shared scheduler.
+    """
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        with _SCHEDULER_LOCK:
+            if _SCHEDULER is None:
+                _SCHEDULER = TaskScheduler()
+    return _SCHEDULER
+
+
+__all__ = [
+    'Job',
+    'TaskScheduler',
+    'get_scheduler',
+]
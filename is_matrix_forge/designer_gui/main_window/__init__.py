@@ -5,7 +5,7 @@ import copy
 import os
 import json
 
-from is_matrix_forge.led_matrix.helpers.device import DEVICES
+from is_matrix_forge.led_matrix.helpers.device import list_devices
 from is_matrix_forge.led_matrix.display.animations.frame.base import Frame
 from is_matrix_forge.led_matrix.display.grid.helpers import is_valid_grid
 from is_matrix_forge.led_matrix.display.animations.frame.helpers import is_valid_frames
@@ -262,7 +262,7 @@ class PixelGrid:
 
     # Send to matrix
     def _handle_Send_to_Matrix(self, _event) -> None:
-        devices = DEVICES
+        devices = list_devices(refresh=True)
         if not devices:
             sg.popup_error('No devices found.')
             return
@@ -0,0 +1,207 @@
+"""
+Record, replay and compare serial captures of LED matrix workloads.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/dev_tools/capture.py
+
+Description:
+    Command-line front end for :mod:`is_matrix_forge.led_matrix.transport.capture`.
+
+    ``record`` runs a workload (``scroll_text``, ``fade_to``, ``identify``) on
+    the first matrix, or on the pty emulator with ``--emulator``, and saves its
+    serial traffic. ``stats`` reports frames per second, bytes per frame and
+    command counts. ``replay`` pushes a capture back to a device. ``diff``
+    compares the command streams and statistics of two captures, e.g. taken
+    before and after a change, and exits non-zero when the commands differ.
+
+Example Usage:
+    python -m is_matrix_forge.dev_tools.capture record before.lmcap --workload scroll_text --emulator
+    python -m is_matrix_forge.dev_tools.capture stats before.lmcap
+    python -m is_matrix_forge.dev_tools.capture diff before.lmcap after.lmcap
+    python -m is_matrix_forge.dev_tools.capture replay before.lmcap --emulator --fast
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import difflib
+import json
+import sys
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from is_matrix_forge.led_matrix.transport.capture import (
+    CaptureStats,
+    TrafficRecorder,
+    command_stream,
+    replay,
+    summarize,
+)
+
+
+WORKLOADS: Dict[str, Callable[[Any, argparse.Namespace], None]] = {
+    'scroll_text': lambda controller, args: controller.scroll_text(args.text),
+    'fade_to':     lambda controller, args: controller.fade_to(args.brightness, duration=args.duration),
+    'identify':    lambda controller, args: controller.identify(skip_clear=True, duration=args.duration, cycles=1),
+}
+"""Workloads ``record`` can run, by name."""
+
+
+def _emulator(args: argparse.Namespace):
+    if not getattr(args, 'emulator', False):
+        return contextlib.nullcontext()
+
+    from is_matrix_forge.led_matrix.emulator import VirtualMatrixDevice
+    return VirtualMatrixDevice(args.baudrate, args.latency)
+
+
+def _format_stats(stats: Dict[str, CaptureStats]) -> str:
+    if not stats:
+        return 'Empty capture.'
+
+    lines = []
+    for entry in stats.values():
+        commands = ', '.join(f'{name}={count}' for name, count in sorted(entry.commands.items()))
+        lines.append(
+            f'{entry.port}: {entry.frames} frames in {entry.duration:.3f}s '
+            f'({entry.fps:.1f} fps, {entry.bytes_per_frame:.1f} B/frame), '
+            f'{entry.bytes_written} B written, {entry.bytes_read} B read\n'
+            f'  {commands or "no commands"}'
+        )
+    return '\n'.join(lines)
+
+
+def _stats_json(stats: Dict[str, CaptureStats]) -> str:
+    return json.dumps(
+        [{**asdict(s), 'fps': s.fps, 'bytes_per_frame': s.bytes_per_frame} for s in stats.values()],
+        indent=2,
+    )
+
+
+def record_command(args: argparse.Namespace) -> int:
+    from is_matrix_forge.led_matrix.controller import get_controllers
+    from is_matrix_forge.led_matrix.helpers.device import refresh_devices
+
+    with _emulator(args):
+        refresh_devices()
+        controllers = get_controllers(threaded=True, skip_all_init_animations=True, clear_on_init=True)
+        if not controllers:
+            print('No LED matrices are available.', file=sys.stderr)
+            return 1
+
+        with TrafficRecorder(args.output):
+            WORKLOADS[args.workload](controllers[0], args)
+
+    print(_format_stats(summarize(args.output)))
+    return 0
+
+
+def stats_command(args: argparse.Namespace) -> int:
+    stats = summarize(args.capture)
+    print(_stats_json(stats) if args.json else _format_stats(stats))
+    return 0
+
+
+def replay_command(args: argparse.Namespace) -> int:
+    from is_matrix_forge.led_matrix.helpers.device import refresh_devices
+
+    with _emulator(args) as emulator:
+        if emulator is not None:
+            target = emulator.port_info
+        elif args.port:
+            target = args.port
+        else:
+            devices = refresh_devices()
+            if not devices:
+                print('No LED matrices are available; pass --port or --emulator.', file=sys.stderr)
+                return 1
+            target = devices[0]
+
+        result = replay(args.capture, target, speed=None if args.fast else args.speed, source_port=args.source_port)
+
+    print(f'Replayed {result.writes} writes ({result.bytes_written} B) in {result.elapsed:.3f}s')
+    return 0
+
+
+def diff_command(args: argparse.Namespace) -> int:
+    before, after = summarize(args.before), summarize(args.after)
+    for label, stats in (('before', before), ('after', after)):
+        print(f'[{label}] {_format_stats(stats)}')
+
+    diff = list(difflib.unified_diff(
+        command_stream(args.before, args.port),
+        command_stream(args.after, args.port),
+        fromfile=args.before,
+        tofile=args.after,
+        lineterm='',
+    ))
+    if not diff:
+        print('Command streams are identical.')
+        return 0
+
+    print('\n'.join(diff))
+    return 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Record, replay and compare LED matrix serial captures.')
+    sub = parser.add_subparsers(dest='action', required=True)
+
+    def add_link_options(p: argparse.ArgumentParser) -> None:
+        p.add_argument('--emulator', action='store_true', help='Use a virtual matrix instead of hardware.')
+        p.add_argument('--baudrate', type=int, default=None, help='Emulator line rate (default: unlimited).')
+        p.add_argument('--latency', type=float, default=0.0, help='Emulator per-command latency in seconds.')
+
+    record = sub.add_parser('record', help='Run a workload and capture its traffic.')
+    record.add_argument('output', help='Capture file to write.')
+    record.add_argument('--workload', choices=sorted(WORKLOADS), required=True)
+    record.add_argument('--text', default='Hello, World!', help='Text for scroll_text.')
+    record.add_argument('--brightness', type=int, default=10, help='Target for fade_to.')
+    record.add_argument('--duration', type=float, default=1.0, help='Seconds for fade_to and identify.')
+    add_link_options(record)
+    record.set_defaults(func=record_command)
+
+    stats = sub.add_parser('stats', help='Summarize a capture.')
+    stats.add_argument('capture')
+    stats.add_argument('--json', action='store_true', help='Print JSON.')
+    stats.set_defaults(func=stats_command)
+
+    replay_parser = sub.add_parser('replay', help='Send a capture to a device.')
+    replay_parser.add_argument('capture')
+    replay_parser.add_argument('--port', default=None, help='Target port (default: first matrix found).')
+    replay_parser.add_argument('--source-port', default=None, help='Captured port to replay if there are several.')
+    pace = replay_parser.add_mutually_exclusive_group()
+    pace.add_argument('--speed', type=float, default=1.0, help='Playback rate relative to the capture.')
+    pace.add_argument('--fast', action='store_true', help='Send as fast as possible.')
+    add_link_options(replay_parser)
+    replay_parser.set_defaults(func=replay_command)
+
+    diff = sub.add_parser('diff', help='Compare two captures; exits 1 if their commands differ.')
+    diff.add_argument('before')
+    diff.add_argument('after')
+    diff.add_argument('--port', default=None, help='Only compare this port.')
+    diff.set_defaults(func=diff_command)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+__all__ = [
+    'WORKLOADS',
+    'build_parser',
+    'main',
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -19,7 +19,6 @@ from pathlib import Path
 from typing import Union, Optional
 from is_matrix_forge.common.dirs import PRESETS_DIR
 from is_matrix_forge.led_matrix.constants import PROJECT_URLS
-import requests
 
 
 MANIFEST_FILE_NAME = 'manifest.json'
@@ -38,6 +37,8 @@ def get_remote_manifest():
         requests.RequestException:
             If there is an error during the HTTP request.
     """
+    import requests
+
     res = requests.get(REMOTE_MANIFEST_URL)
     res.raise_for_status()
 
@@ -0,0 +1,213 @@
+"""
+Import-time benchmark for the command-line entry points.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/dev_tools/startup_bench.py
+
+Description:
+    A one-shot ``led-matrix`` call should not pay for OpenCV, NumPy, Pillow,
+    PySimpleGUI or a serial-port scan before it parses its arguments. This tool
+    imports each entry point in a fresh interpreter with ``-X importtime``,
+    keeps the best of ``--repeat`` runs, and reports the import time together
+    with any heavy modules that were loaded. ``--budget`` makes it exit non-zero
+    when an entry point is slower than allowed, so it can run in CI.
+
+Example Usage:
+    python -m is_matrix_forge.dev_tools.startup_bench --repeat 5
+    python -m is_matrix_forge.dev_tools.startup_bench --json --budget 1.5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+ENTRY_POINTS: Dict[str, str] = {
+    'led-matrix':          'is_matrix_forge.led_matrix.Scripts.led_matrix',
+    'led-matrix-identify': 'is_matrix_forge.led_matrix.Scripts.identify_matrices',
+    'install-presets':     'is_matrix_forge.led_matrix.Scripts.install_presets.main',
+    'pixel-grid':          'is_matrix_forge.led_matrix.Scripts.pixel_grid',
+}
+"""Console scripts (see ``pyproject.toml``) mapped to the module each one imports."""
+
+HEAVY_MODULES: Tuple[str, ...] = ('cv2', 'PIL', 'numpy', 'PySimpleGUI', 'requests')
+"""Modules an entry point should only import when a command actually needs them."""
+
+# Printed by the child after importing the target; everything else on stderr is importtime output.
+_PROBE = (
+    'import sys, json, importlib; importlib.import_module({module!r}); '
+    'print(json.dumps([m for m in {heavy!r} if m in sys.modules]))'
+)
+
+
+@dataclass(frozen=True)
+class StartupResult:
+    """
+    Import cost of one entry point.
+
+    Properties:
+        name (str):
+            The console script name.
+
+        module (str):
+            The module it imports.
+
+        seconds (Optional[float]):
+            Best cumulative import time over all runs; ``None`` if the import failed.
+
+        heavy (Tuple[str, ...]):
+            Heavy modules that were loaded by the import.
+
+        error (Optional[str]):
+            The last line of the child's stderr when the import failed.
+    """
+    name:    str
+    module:  str
+    seconds: Optional[float]
+    heavy:   Tuple[str, ...] = ()
+    error:   Optional[str] = None
+
+
+def parse_importtime(output: str) -> float:
+    """
+    Sum the cumulative time of the top-level imports in ``-X importtime`` output.
+
+    Parameters:
+        output (str):
+            The child's stderr.
+
+    Returns:
+        float:
+            Seconds spent importing.
+    """
+    total_us = 0
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|', 2)
+        # Top-level entries are printed with exactly one space of indentation.
+        if not name.startswith('  '):
+            total_us += int(cumulative)
+
+    return total_us / 1_000_000
+
+
+def measure(module: str, *, repeat: int = 3, python: str = sys.executable) -> Tuple[Optional[float], Tuple[str, ...], Optional[str]]:
+    """
+    Import ``module`` in ``repeat`` fresh interpreters and keep the fastest run.
+
+    Parameters:
+        module (str):
+            Dotted module path to import.
+
+        repeat (int, optional):
+            Number of runs. Defaults to 3.
+
+        python (str, optional):
+            Interpreter to use. Defaults to the current one.
+
+    Returns:
+        Tuple[Optional[float], Tuple[str, ...], Optional[str]]:
+            Best time in seconds (``None`` on failure), heavy modules loaded, and
+            an error message if the import failed.
+    """
+    best: Optional[float] = None
+    heavy: Tuple[str, ...] = ()
+
+    for _ in range(max(1, repeat)):
+        proc = subprocess.run(
+            [python, '-X', 'importtime', '-c', _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            lines = [line for line in proc.stderr.splitlines() if not line.startswith('import time:')]
+            return None, (), lines[-1] if lines else f'exit status {proc.returncode}'
+
+        seconds = parse_importtime(proc.stderr)
+        heavy = tuple(json.loads(proc.stdout.strip().splitlines()[-1]))
+        best = seconds if best is None else min(best, seconds)
+
+    return best, heavy, None
+
+
+def run(names: Optional[Iterable[str]] = None, *, repeat: int = 3) -> List[StartupResult]:
+    """
+    Benchmark the named entry points (all of them by default).
+
+    Raises:
+        KeyError:
+            If a name is not in :data:`ENTRY_POINTS`.
+    """
+    results = []
+    for name in names or ENTRY_POINTS:
+        module = ENTRY_POINTS[name]
+        seconds, heavy, error = measure(module, repeat=repeat)
+        results.append(StartupResult(name, module, seconds, heavy, error))
+    return results
+
+
+def _format(results: Sequence[StartupResult]) -> str:
+    width = max(len(r.name) for r in results)
+    lines = []
+    for r in results:
+        if r.seconds is None:
+            lines.append(f'{r.name:<{width}}  FAILED   {r.error}')
+        else:
+            heavy = ', '.join(r.heavy) or '-'
+            lines.append(f'{r.name:<{width}}  {r.seconds * 1000:7.1f} ms  heavy: {heavy}')
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure import time of the command-line entry points.')
+    parser.add_argument('names', nargs='*', metavar='ENTRY_POINT',
+                        help=f'Entry points to measure (default: all of {", ".join(ENTRY_POINTS)}).')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per entry point; the best is kept.')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON.')
+    parser.add_argument('--budget', type=float, default=None,
+                        help='Fail if any entry point takes longer than this many seconds to import.')
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in ENTRY_POINTS]
+    if unknown:
+        parser.error(f'unknown entry point(s): {", ".join(unknown)}')
+
+    results = run(args.names, repeat=args.repeat)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        print(_format(results))
+
+    if args.budget is not None:
+        over = [r for r in results if r.seconds is not None and r.seconds > args.budget]
+        return 1 if over else 0
+
+    return 0
+
+
+__all__ = [
+    'ENTRY_POINTS',
+    'HEAVY_MODULES',
+    'StartupResult',
+    'main',
+    'measure',
+    'parse_importtime',
+    'run',
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -140,16 +140,12 @@ def send_command(dev, command, parameters=[], with_response=False):
 
 def send_command_raw(dev, command, with_response=False):
     """Send a command to the device.
-    Opens new serial connection every time"""
+    Reuses the pooled serial connection for the device"""
+    from is_matrix_forge.led_matrix.transport import get_pool
+
     # print(f"Sending command: {command}")
     try:
-        with serial.Serial(dev.device, 115200) as s:
-            s.write(command)
-
-            if with_response:
-                res = s.read(RESPONSE_SIZE)
-                # print(f"Received: {res}")
-                return res
+        return get_pool().exchange(dev, bytes(command), with_response=with_response, response_size=RESPONSE_SIZE)
     except (IOError, OSError) as _ex:
         disconnect_dev(dev.device)
         # print("Error: ", ex)
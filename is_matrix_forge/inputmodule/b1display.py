@@ -12,39 +12,18 @@ HIGH_FPS_MASK = 0b00010000
 LOW_FPS_MASK = 0b00000111
 
 
-def b1image_bl(dev, image_file):
+def b1image_bl(dev, image_file, dither='threshold', fit='crop'):
     """Display an image in black and white
     Confirmed working with PNG and GIF.
-    Must be 300x400 in size.
+    Scaled to 300x400 and reduced to 1 bit with ``dither``.
     Sends one 400px column in a single commands and a flush at the end
     """
+    from is_matrix_forge.led_matrix.display.image_convert import b1_columns
 
-    from PIL import Image
-
-    im = Image.open(image_file).convert("RGB")
-    width, height = im.size
-    assert width == B1_WIDTH
-    assert height == B1_HEIGHT
-    pixel_values = list(im.getdata())
+    columns = b1_columns(image_file, dither=dither, fit=fit)
 
     for x in range(B1_WIDTH):
-        vals = [0 for _ in range(50)]
-
-        byte = None
-        for y in range(B1_HEIGHT):
-            pixel = pixel_values[y * B1_WIDTH + x]
-            brightness = sum(pixel) / 3
-            black = brightness < 0xFF / 2
-
-            bit = y % 8
-
-            if bit == 0:
-                byte = 0
-            if black:
-                byte |= 1 << bit
-
-            if bit == 7:
-                vals[int(y / 8)] = byte
+        vals = columns[x].tolist()
 
         column_le = list((x).to_bytes(2, "little"))
         command = FWK_MAGIC + [0x16] + column_le + vals
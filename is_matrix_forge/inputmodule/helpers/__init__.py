@@ -1,16 +1,24 @@
 from serial import SerialException, Serial
 from serial.tools import list_ports
 
-from ...led_matrix.helpers.device import DEVICES
+from ...led_matrix.helpers.device import list_devices
 from ...log_engine import ROOT_LOGGER as PARENT_LOGGER
 
 MOD_LOGGER = PARENT_LOGGER.get_child('inputmodule.helpers')
 
 
-MOD_LOGGER.debug(f'Found {len(DEVICES)} devices.')
+def __getattr__(name):
+    # Resolved on first access so importing this module does not enumerate ports.
+    if name == 'DEVICES':
+        return list_devices()
 
-if len(DEVICES) == 1:
-    DEVICE = DEVICES[0]
-else:
-    MOD_LOGGER.warning(f'Found {len(DEVICES)} devices. Device choice must be explicit.')
+    if name == 'DEVICE':
+        devices = list_devices()
+        MOD_LOGGER.debug(f'Found {len(devices)} devices.')
 
+        if len(devices) == 1:
+            return devices[0]
+
+        MOD_LOGGER.warning(f'Found {len(devices)} devices. Device choice must be explicit.')
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
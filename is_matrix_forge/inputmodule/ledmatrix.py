@@ -5,6 +5,8 @@ import serial
 from . import font
 from . import send_command, CommandVals, PatternVals, FWK_MAGIC, send_serial, brightness
 
+from is_matrix_forge.led_matrix.display.helpers.columns import encode_greyscale_frame
+from is_matrix_forge.led_matrix.display.image_convert import draw_payload, greyscale_columns
 from is_matrix_forge.led_matrix.helpers.status_handler import get_status, set_status
 
 WIDTH = 9
@@ -60,43 +62,13 @@ def get_animate(dev):
     return bool(res[0])
 
 
-def image_bl(dev, image_file):
+def image_bl(dev, image_file, dither='threshold', fit='crop'):
     """Display an image in black and white
     Confirmed working with PNG and GIF.
-    Must be 9x34 in size.
+    Scaled to 9x34 and reduced to 1 bit with ``dither``.
     Sends everything in a single command
     """
-    # Initialize a list of 39 bytes (39*8 = 312 bits, enough for 9x34 = 306 pixels)
-    vals = [0 for _ in range(39)]
-
-    from PIL import Image
-
-    # Open the image and convert to RGB format
-    im = Image.open(image_file).convert("RGB")
-    width, height = im.size
-
-    # Verify image dimensions match the LED matrix size
-    assert width == 9
-    assert height == 34
-
-    # Get all pixel values as a flat list
-    pixel_values = list(im.getdata())
-
-    # Process each pixel
-    for i, pixel in enumerate(pixel_values):
-        # Calculate average brightness of RGB components
-        brightness = sum(pixel) / 3
-
-        # If brightness is above half of max (127.5), consider it "on"
-        # This creates a binary black/white effect
-        if brightness > 0xFF / 2:
-            # Calculate which byte in vals array this pixel belongs to (i/8)
-            # Then set the appropriate bit within that byte (i%8)
-            # This packs 8 pixels into each byte of the vals array
-            vals[int(i / 8)] |= 1 << i % 8
-
-    # Send the packed binary data to the device
-    send_command(dev, CommandVals.Draw, vals)
+    send_command(dev, CommandVals.Draw, draw_payload(image_file, dither=dither, fit=fit))
 
 
 def camera(dev):
@@ -129,77 +101,27 @@ def camera(dev):
             resized = cv2.resize(gray, (dim[1], dim[0]))
             cropped = resized[0:HEIGHT, start_x:end_x]
 
-            for x in range(0, cropped.shape[1]):
-                vals = [0 for _ in range(HEIGHT)]
-
-                for y in range(0, HEIGHT):
-                    vals[y] = cropped[y, x]
-
-                send_col(dev, s, x, vals)
-            commit_cols(dev, s)
+            send_serial(dev, s, encode_greyscale_frame(cropped.T))
 
 
 def video(dev, video_file):
     set_status('video')
     """Resize and play back a video"""
+    from is_matrix_forge.led_matrix.display.video_stream import stream_video
+
     with serial.Serial(dev.device, 115200) as s:
         import cv2
 
         capture = cv2.VideoCapture(video_file)
-        ret, frame = capture.read()
-
-        scale_y = HEIGHT / frame.shape[0]
-
-        # Scale the video to 34 pixels height
-        dim = (HEIGHT, int(round(frame.shape[1] * scale_y)))
-        # Find the starting position to crop the width to be centered
-        # For very narrow videos, make sure to stay in bounds
-        start_x = max(0, int(round(dim[1] / 2 - WIDTH / 2)))
-        end_x = min(dim[1], start_x + WIDTH)
-
-        processed = []
-
-        # Pre-process the video into resized, cropped, grayscale frames
-        while get_status() == 'video':
-            ret, frame = capture.read()
-            if not ret:
-                print("Failed to read video frames")
-                break
-
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-
-            resized = cv2.resize(gray, (dim[1], dim[0]))
-            cropped = resized[0:HEIGHT, start_x:end_x]
-
-            processed.append(cropped)
-
-        # Determine frame delay based on the video's FPS.  Default to 30 FPS if
-        # the information isn't available.
-        fps = capture.get(cv2.CAP_PROP_FPS)
         try:
-            fps = float(fps)
-            if fps <= 0 or fps != fps:
-                raise ValueError
-        except Exception:
-            fps = 30.0
-        frame_delay = 1.0 / fps
-
-        # Write it out to the module one frame at a time while respecting the
-        # frame rate.
-        for frame in processed:
-            start = time.time()
-            for x in range(0, cropped.shape[1]):
-                vals = [0 for _ in range(HEIGHT)]
-
-                for y in range(0, HEIGHT):
-                    vals[y] = frame[y, x]
-
-                send_col(dev, s, x, vals)
-            commit_cols(dev, s)
-
-            elapsed = time.time() - start
-            if frame_delay > elapsed:
-                time.sleep(frame_delay - elapsed)
+            # Decode in the background and write one buffered frame per slot
+            stream_video(
+                capture,
+                lambda buf: send_serial(dev, s, buf),
+                keep_running=lambda: get_status() == 'video',
+            )
+        finally:
+            capture.release()
 
 
 def pixel_to_brightness(pixel):
@@ -223,26 +145,13 @@ def pixel_to_brightness(pixel):
     return int(brightness)
 
 
-def image_greyscale(dev, image_file):
+def image_greyscale(dev, image_file, fit='crop'):
     """Display an image in greyscale
-    Sends each 1x34 column and then commits => 10 commands
+    Stages all 1x34 columns and commits in a single write
     """
+    columns = greyscale_columns(image_file, fit=fit)
     with serial.Serial(dev.device, 115200) as s:
-        from PIL import Image
-
-        im = Image.open(image_file).convert("RGB")
-        width, height = im.size
-        assert width == 9
-        assert height == 34
-        pixel_values = list(im.getdata())
-        for x in range(0, WIDTH):
-            vals = [0 for _ in range(HEIGHT)]
-
-            for y in range(HEIGHT):
-                vals[y] = pixel_to_brightness(pixel_values[x + y * WIDTH])
-
-            send_col(dev, s, x, vals)
-        commit_cols(dev, s)
+        send_serial(dev, s, encode_greyscale_frame(columns))
 
 
 def send_col(dev, s, x, vals):
@@ -260,32 +169,27 @@ def commit_cols(dev, s):
 
 def checkerboard(dev, n):
     with serial.Serial(dev.device, 115200) as s:
+        columns = []
         for x in range(0, WIDTH):
             vals = (([0xFF] * n) + ([0x00] * n)) * int(HEIGHT / 2)
             if x % (n * 2) < n:
                 # Rotate once
                 vals = vals[n:] + vals[:n]
 
-            send_col(dev, s, x, vals)
-        commit_cols(dev, s)
+            columns.append(vals)
+        send_serial(dev, s, encode_greyscale_frame(columns))
 
 
 def every_nth_col(dev, n):
     with serial.Serial(dev.device, 115200) as s:
-        for x in range(0, WIDTH):
-            vals = [(0xFF if x % n == 0 else 0) for _ in range(HEIGHT)]
-
-            send_col(dev, s, x, vals)
-        commit_cols(dev, s)
+        columns = [[(0xFF if x % n == 0 else 0) for _ in range(HEIGHT)] for x in range(WIDTH)]
+        send_serial(dev, s, encode_greyscale_frame(columns))
 
 
 def every_nth_row(dev, n):
     with serial.Serial(dev.device, 115200) as s:
-        for x in range(0, WIDTH):
-            vals = [(0xFF if y % n == 0 else 0) for y in range(HEIGHT)]
-
-            send_col(dev, s, x, vals)
-        commit_cols(dev, s)
+        columns = [[(0xFF if y % n == 0 else 0) for y in range(HEIGHT)] for _ in range(WIDTH)]
+        send_serial(dev, s, encode_greyscale_frame(columns))
 
 
 def breathing(dev):
@@ -319,6 +319,28 @@ def _build_horizontal_span_animations(text: str, controllers: Iterable):
     return animations
 
 
+def _play_span_animations(controllers: Iterable, animations, stop_event=None):
+    """Play spanned animations in lockstep on one shared clock and return its ``SyncStats``."""
+    from is_matrix_forge.led_matrix.display.animations.sync import SynchronizedPlayer
+
+    selected = {controller: animations[controller] for controller in controllers if controller in animations}
+    if not selected:
+        return None
+
+    for controller in selected:
+        controller.keep_alive = True
+
+    return SynchronizedPlayer(selected).play(stop_event)
+
+
+def _span_summary(stats) -> str:
+    """One-line report of a spanned run, printed by whichever process the user is watching."""
+    return (
+        f'Spanned {stats.devices} matrices at {stats.playback.actual_fps:.1f}/'
+        f'{stats.playback.target_fps:.1f} fps; max skew {stats.max_skew * 1000:.1f} ms'
+    )
+
+
 def _run_operation(controllers: Iterable, operation: Callable, *, concurrent: bool) -> None:
     """Run an operation against one or more controllers, optionally in parallel."""
 
@@ -338,6 +360,32 @@ def _run_operation(controllers: Iterable, operation: Callable, *, concurrent: bo
         operation(controller)
 
 
+def create_controllers():
+    """Build a controller for every connected LED matrix, the way every CLI command starts."""
+    from is_matrix_forge.led_matrix.controller import get_controllers
+    return get_controllers(
+        threaded                 = True,
+        skip_all_init_animations = True,
+        clear_on_init            = True
+    )
+
+
+def select_controllers(controllers, cli_args=None):
+    """Apply the CLI matrix selection (``--only-left`` / ``--only-right``) to ``controllers``.
+
+    Raises:
+        SystemExit:
+            If there are no controllers, or none match the selection.
+    """
+    if not controllers:
+        raise SystemExit('No LED matrices are available.')
+
+    if filtered := _filter_controllers_by_side(controllers, cli_args):
+        return filtered
+
+    raise SystemExit(f'No LED matrices matched the requested selection ({_describe_selection(cli_args)}).')
+
+
 def execute_get_controllers(cli_args=None):
     """Return the available controllers honoring any CLI matrix selection.
 
@@ -351,20 +399,44 @@ def execute_get_controllers(cli_args=None):
         List[LEDMatrixController]:
             A list of controller objects, each representing an available LED matrix.
     """
-    from is_matrix_forge.led_matrix.controller import get_controllers
-    controllers = get_controllers(
-        threaded                 = True,
-        skip_all_init_animations = True,
-        clear_on_init            = True
-    )
+    return select_controllers(create_controllers(), cli_args)
 
-    if not controllers:
-        raise SystemExit('No LED matrices are available.')
 
-    if filtered := _filter_controllers_by_side(controllers, cli_args):
-        return filtered
+def _forward_to_daemon(cli_args) -> bool:
+    """Run the parsed sub-command on a running daemon, if there is one.
 
-    raise SystemExit(f'No LED matrices matched the requested selection ({_describe_selection(cli_args)}).')
+    Returns:
+        bool:
+            ``True`` if the daemon ran the command; ``False`` if the caller
+            should run it in-process (``--no-daemon``, no daemon listening, or
+            no Unix socket support).
+
+    Raises:
+        SystemExit:
+            If the daemon reports that the command failed.
+
+    Note:
+        A string result is a report for the user (e.g. the span skew line) and
+        is printed here, on the client, rather than on the daemon's console.
+    """
+    if getattr(cli_args, 'no_daemon', False):
+        return False
+
+    from .daemon.client import DaemonClient
+    from .daemon.protocol import DaemonCommandError, DaemonUnavailableError, namespace_to_args
+
+    client = DaemonClient(getattr(cli_args, 'socket', None))
+    try:
+        result = client.call(cli_args.subcommand, **namespace_to_args(cli_args))
+    except DaemonUnavailableError:
+        return False
+    except DaemonCommandError as exc:
+        raise SystemExit(str(exc)) from None
+
+    if isinstance(result, str) and result:
+        print(result)
+
+    return True
 
 
 def scroll_text_command(cli_args=ARGUMENTS):
@@ -379,24 +451,46 @@ def scroll_text_command(cli_args=ARGUMENTS):
     Returns:
         None
     """
+    if _forward_to_daemon(cli_args):
+        return
+
+    summary = run_scroll_text(execute_get_controllers(cli_args), cli_args)
+    if summary:
+        print(summary)
+
+
+def run_scroll_text(controllers, cli_args, *, stop_event=None):
+    """Scroll text on ``controllers``; the body of ``scroll-text``, shared with the daemon.
+
+    Parameters:
+        stop_event (Optional[threading.Event]):
+            Cancels the scroll when set (the daemon sets it when its client
+            disconnects).
+
+    Returns:
+        Optional[str]:
+            With ``--span-matrices``, the sync report for the caller to show;
+            otherwise ``None``.
+    """
     from .arguments.commands.scroll_text import DIRECTION_MAP
-    controllers = execute_get_controllers(cli_args)
 
     direction = DIRECTION_MAP[cli_args.direction.strip().lower()]
     text = cli_args.input
 
+    if getattr(cli_args, 'sequential', False) and getattr(cli_args, 'span_matrices', False):
+        # Also reached from the daemon, which gets the flags without argparse's check.
+        raise SystemExit('--span-matrices cannot be combined with --sequential.')
+
     sequential_requested = getattr(cli_args, 'sequential', False) and len(controllers) > 1
     span_requested = getattr(cli_args, 'span_matrices', False) and len(controllers) > 1
 
     span_animations = None
+    span_stats = []
 
     if span_requested:
         if cli_args.direction.strip().lower() != 'h':
             raise SystemExit('--span-matrices requires --direction h.')
 
-        if sequential_requested:
-            raise SystemExit('--span-matrices cannot be combined with --sequential.')
-
         controllers = _order_controllers_for_span(controllers)
         span_animations = _build_horizontal_span_animations(text, controllers)
         sequential = False
@@ -405,16 +499,16 @@ def scroll_text_command(cli_args=ARGUMENTS):
         sequential = sequential_requested
         concurrent = not sequential
 
-    def activator(devices, _stop_event):
+    def activator(devices, stop_event):
+        if span_animations is not None:
+            stats = _play_span_animations(devices, span_animations, stop_event)
+            if stats is not None:
+                span_stats.append(stats)
+            return
+
         def operation(controller):
             controller.keep_alive = True
-            if span_animations is not None:
-                animation = span_animations.get(controller)
-                if animation is None:
-                    return
-                controller.play_animation(animation)
-            else:
-                controller.scroll_text(text, direction=direction)
+            controller.scroll_text(text, direction=direction)
 
         _run_operation(devices, operation, concurrent=concurrent)
 
@@ -425,19 +519,39 @@ def scroll_text_command(cli_args=ARGUMENTS):
             clear_after=False,
             activator=activator,
             thread_name='scroll-text-guard' if index is None else f'scroll-text-guard-{index}',
+            stop_event=stop_event,
         )
 
     if sequential:
         for index, controller in enumerate(controllers, start=1):
+            if stop_event is not None and stop_event.is_set():
+                break
             invoke([controller], index)
     else:
         invoke(controllers)
 
+    return _span_summary(span_stats[-1]) if span_stats else None
+
 
 def display_text_command(cli_args):
     """Display static text on the selected LED matrices until interrupted."""
-    controllers = execute_get_controllers(cli_args)
+    if _forward_to_daemon(cli_args):
+        return
 
+    run_display_text(execute_get_controllers(cli_args), cli_args)
+
+
+def run_display_text(controllers, cli_args, *, resident=False, stop_event=None):
+    """Display text on ``controllers``; the body of ``display-text``, shared with the daemon.
+
+    Parameters:
+        resident (bool):
+            Running inside the daemon. Without ``--run-for`` the text is left
+            on the (kept-alive) matrices and this returns at once instead of
+            waiting for an interrupt; the next command replaces it.
+        stop_event (Optional[threading.Event]):
+            Ends a ``--run-for`` display early when set.
+    """
     clear_after = not cli_args.skip_clear
     sequential = getattr(cli_args, 'sequential', False) and len(controllers) > 1
 
@@ -449,11 +563,15 @@ def display_text_command(cli_args):
 
     concurrent = not sequential
 
-    def activator(devices, _stop_event):
-        def operation(controller):
-            controller.keep_alive = True
-            controller.show_text(text)
+    def operation(controller):
+        controller.keep_alive = True
+        controller.show_text(text)
+
+    if resident and cli_args.run_for is None:
+        _run_operation(controllers, operation, concurrent=concurrent)
+        return
 
+    def activator(devices, _stop_event):
         _run_operation(devices, operation, concurrent=concurrent)
 
     def invoke(targets, index=None):
@@ -464,10 +582,13 @@ def display_text_command(cli_args):
             activator=activator,
             thread_name='display-text-guard' if index is None else f'display-text-guard-{index}',
             wait_for_interrupt=wait_for_interrupt,
+            stop_event=stop_event,
         )
 
     if sequential:
         for index, controller in enumerate(controllers, start=1):
+            if stop_event is not None and stop_event.is_set():
+                break
             invoke([controller], index)
     else:
         invoke(controllers)
@@ -480,16 +601,79 @@ def identify_matrices_command(cli_args):
         cli_args: argparse.Namespace
             The parsed arguments for the ``identify-matrices`` sub-command.
     """
-    controllers = execute_get_controllers(cli_args)
+    if _forward_to_daemon(cli_args):
+        return
+
+    run_identify_matrices(execute_get_controllers(cli_args), cli_args)
+
+
+def run_identify_matrices(controllers, cli_args, *, stop_event=None):
+    """Identify ``controllers``; the body of ``identify-matrices``, shared with the daemon.
+
+    Parameters:
+        stop_event (Optional[threading.Event]):
+            Cuts the identification short when set.
+    """
+    extra = {} if stop_event is None else {'stop_event': stop_event}
 
     for controller in controllers:
+        if stop_event is not None and stop_event.is_set():
+            break
         controller.identify(
             skip_clear=cli_args.skip_clear,
             duration=float(cli_args.runtime),
             cycles=int(cli_args.cycle_count),
+            **extra,
         )
 
 
+def daemon_command(cli_args):
+    """Run the resident daemon in the foreground, or query/stop a running one.
+
+    Parameters:
+        cli_args: argparse.Namespace
+            The parsed arguments for the ``daemon`` sub-command.
+    """
+    from .daemon import DaemonClient, DaemonUnavailableError, MatrixDaemon
+
+    socket_path = getattr(cli_args, 'socket', None)
+
+    if cli_args.status or cli_args.stop:
+        client = DaemonClient(socket_path)
+        try:
+            if cli_args.stop:
+                client.call('shutdown')
+                print(f'Stopped the daemon on {client.socket_path}.')
+                return
+
+            status = client.call('ping')
+        except DaemonUnavailableError as exc:
+            raise SystemExit(str(exc)) from None
+
+        devices = ', '.join(status['devices']) or 'none yet'
+        print(
+            f"Daemon pid {status['pid']} on {status['socket']}: up {status['uptime']:.0f}s, "
+            f"{status['commands']} command(s) run, devices: {devices}"
+            f"{' (busy)' if status['busy'] else ''}"
+        )
+        return
+
+    daemon = MatrixDaemon(socket_path)
+    try:
+        daemon.bind()
+    except RuntimeError as exc:
+        raise SystemExit(str(exc)) from None
+
+    # Warm up before accepting clients so the first command is as fast as the rest.
+    daemon.controllers
+    print(f'Serving {len(daemon.controllers)} LED matrix(es) on {daemon.socket_path}. Press Ctrl+C to stop.')
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
 def main(cli_args=ARGUMENTS):
     """
     Parses and handles command-line arguments, registering specific subcommands
@@ -510,6 +694,7 @@ def main(cli_args=ARGUMENTS):
         ('scroll_parser', 'Scroll text command parser was not initialized.', scroll_text_command),
         ('identify_parser', 'Identify matrices command parser was not initialized.', identify_matrices_command),
         ('display_parser', 'Display text command parser was not initialized.', display_text_command),
+        ('daemon_parser', 'Daemon command parser was not initialized.', daemon_command),
     )
 
     for attr_name, error_message, handler in parser_bindings:
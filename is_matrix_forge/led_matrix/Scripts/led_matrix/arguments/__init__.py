@@ -20,6 +20,7 @@ class Arguments(ArgumentParser):
         self.__identify_parser = None
         self.__scroll_parser   = None
         self.__display_parser  = None
+        self.__daemon_parser   = None
 
         selection_group = self.add_mutually_exclusive_group()
         selection_group.add_argument(
@@ -35,6 +36,19 @@ class Arguments(ArgumentParser):
             help='Only target the rightmost matrix when executing commands.'
         )
 
+        self.add_argument(
+            '--no-daemon',
+            action='store_true',
+            default=False,
+            help='Drive the matrices from this process even if a led-matrix daemon is running.'
+        )
+        self.add_argument(
+            '--socket',
+            default=None,
+            metavar='PATH',
+            help='The led-matrix daemon socket (default: $LED_MATRIX_SOCKET or the user runtime directory).'
+        )
+
         self.SUBCOMMANDS = self.add_subparsers(
             dest='subcommand',
             required=True,
@@ -74,6 +88,10 @@ class Arguments(ArgumentParser):
     def display_parser(self):
         return self.__display_parser
 
+    @property
+    def daemon_parser(self):
+        return self.__daemon_parser
+
     def __build_identify_matrices(self):
         from .commands.identify_matrices import register_command
         self.__identify_parser = register_command(self)
@@ -86,6 +104,10 @@ class Arguments(ArgumentParser):
         from .commands.display_text import register_command
         self.__display_parser = register_command(self)
 
+    def __build_daemon(self):
+        from .commands.daemon import register_command
+        self.__daemon_parser = register_command(self)
+
     def __build(self):
         self.__building = True
 
@@ -95,6 +117,8 @@ class Arguments(ArgumentParser):
 
         self.__build_display_text()
 
+        self.__build_daemon()
+
         self.__building = False
         self.__built    = True
 
@@ -0,0 +1,36 @@
+from argparse import ArgumentParser
+
+
+COMMAND = 'daemon'
+
+
+HELP_TXT = (
+    'Keep the LED matrices initialized in a background process. While it runs, other led-matrix '
+    'commands are handed to it over a Unix socket instead of re-initializing the hardware '
+    "(use the global '--no-daemon' flag to bypass it)."
+)
+
+
+def register_command(parser: ArgumentParser):
+    daemon_parser = parser.SUBCOMMANDS.add_parser(
+        COMMAND,
+        help=HELP_TXT,
+    )
+
+    action_group = daemon_parser.add_mutually_exclusive_group()
+
+    action_group.add_argument(
+        '--status',
+        action='store_true',
+        default=False,
+        help='Report whether a daemon is running and what it is serving, then exit.',
+    )
+
+    action_group.add_argument(
+        '--stop',
+        action='store_true',
+        default=False,
+        help='Ask the running daemon to release the matrices and exit.',
+    )
+
+    return daemon_parser
@@ -32,14 +32,16 @@ def register_command(parser: ArgumentParser):
         help='The direction to scroll the text in. Default is up.'
     )
 
-    scroll_parser.add_argument(
+    layout_group = scroll_parser.add_mutually_exclusive_group()
+
+    layout_group.add_argument(
         '--sequential',
         action='store_true',
         default=False,
         help='Scroll across one matrix at a time when multiple are selected. Cannot be used with --span-matrices.',
     )
 
-    scroll_parser.add_argument(
+    layout_group.add_argument(
         '--span-matrices',
         action='store_true',
         default=False,
@@ -0,0 +1,25 @@
+"""
+Resident daemon for the ``led-matrix`` CLI.
+
+``led-matrix daemon`` keeps the controllers warm; other ``led-matrix``
+sub-commands detect it on its Unix socket and hand their work to it instead
+of initializing the hardware themselves.
+"""
+from .client import DaemonClient
+from .protocol import (
+    DaemonCommandError,
+    DaemonUnavailableError,
+    HAS_UNIX_SOCKETS,
+    default_socket_path,
+)
+from .server import MatrixDaemon
+
+
+__all__ = [
+    'DaemonClient',
+    'DaemonCommandError',
+    'DaemonUnavailableError',
+    'HAS_UNIX_SOCKETS',
+    'MatrixDaemon',
+    'default_socket_path',
+]
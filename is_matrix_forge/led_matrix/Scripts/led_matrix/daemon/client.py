@@ -0,0 +1,122 @@
+"""
+Client side of the ``led-matrix`` daemon.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/Scripts/led_matrix/daemon/client.py
+
+Description:
+    :class:`DaemonClient` sends one request per connection and waits for the
+    daemon to finish the command. Commands are serialized by the daemon, so a
+    call may also wait for other clients' commands to complete.
+"""
+from __future__ import annotations
+
+import socket
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .protocol import (
+    DaemonCommandError,
+    DaemonUnavailableError,
+    HAS_UNIX_SOCKETS,
+    default_socket_path,
+    encode_message,
+    read_message,
+)
+
+
+class DaemonClient:
+    """
+    Talks to a running daemon over its Unix socket.
+
+    Parameters:
+        socket_path (Optional[Union[str, Path]], optional):
+            The daemon's socket. Defaults to :func:`default_socket_path`.
+
+        connect_timeout (float, optional):
+            Seconds to wait for the connection itself. Defaults to 0.5.
+
+        timeout (Optional[float], optional):
+            Seconds to wait for a reply; ``None`` waits for the command to
+            finish however long it takes. Defaults to None.
+    """
+
+    def __init__(
+            self,
+            socket_path:     Optional[Union[str, Path]] = None,
+            connect_timeout: float                      = 0.5,
+            timeout:         Optional[float]            = None,
+    ):
+        self.socket_path     = Path(socket_path) if socket_path else default_socket_path()
+        self.connect_timeout = connect_timeout
+        self.timeout         = timeout
+
+    def _connect(self) -> socket.socket:
+        if not HAS_UNIX_SOCKETS:
+            raise DaemonUnavailableError('Unix domain sockets are not supported on this platform.')
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.connect_timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except (FileNotFoundError, ConnectionRefusedError, socket.timeout) as exc:
+            sock.close()
+            raise DaemonUnavailableError(f'No daemon listening on {self.socket_path}') from exc
+        except OSError:
+            sock.close()
+            raise
+
+        sock.settimeout(self.timeout)
+        return sock
+
+    def call(self, command: str, **args: Any) -> Any:
+        """
+        Run ``command`` on the daemon and return its result.
+
+        Parameters:
+            command (str):
+                The sub-command name (e.g. ``'scroll-text'``, ``'ping'``).
+
+            **args (Any):
+                The command's arguments.
+
+        Returns:
+            Any:
+                Whatever the daemon's handler returned.
+
+        Raises:
+            DaemonUnavailableError:
+                If no daemon is listening.
+
+            DaemonCommandError:
+                If the command failed inside the daemon.
+        """
+        with self._connect() as sock, sock.makefile('rwb') as stream:
+            stream.write(encode_message({'command': command, 'args': args}))
+            stream.flush()
+            reply = read_message(stream)
+
+        if reply is None:
+            raise DaemonCommandError(f'Daemon closed the connection while running {command!r}.')
+
+        if not reply.get('ok'):
+            raise DaemonCommandError(reply.get('error') or f'{command!r} failed')
+
+        return reply.get('result')
+
+    def is_running(self) -> bool:
+        """Whether a daemon answers a ``ping`` on the socket."""
+        try:
+            self.call('ping')
+        except (DaemonUnavailableError, DaemonCommandError, OSError):
+            return False
+        return True
+
+
+__all__ = ['DaemonClient']
@@ -0,0 +1,125 @@
+"""
+Wire format shared by the ``led-matrix`` daemon and its clients.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/Scripts/led_matrix/daemon/protocol.py
+
+Description:
+    One request and one response per connection, each a single line of JSON:
+
+        -> {"command": "scroll-text", "args": {"input": "hi", ...}}
+        <- {"ok": true, "result": ...}
+        <- {"ok": false, "error": "--span-matrices requires --direction h."}
+
+    ``args`` is the parsed command line of the client (``vars(namespace)``
+    minus anything that is not JSON-serializable), so the daemon runs exactly
+    the sub-command the user typed.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+
+SOCKET_ENV_VAR = 'LED_MATRIX_SOCKET'
+"""str: Environment variable that overrides the default socket path."""
+
+SOCKET_NAME = 'led-matrix.sock'
+
+HAS_UNIX_SOCKETS = hasattr(socket, 'AF_UNIX')
+"""bool: Whether this platform supports Unix domain sockets (the daemon is unavailable otherwise)."""
+
+MAX_MESSAGE_SIZE = 1 << 20
+
+
+class DaemonUnavailableError(ConnectionError):
+    """Raised when no daemon is listening on the socket."""
+
+
+class DaemonCommandError(RuntimeError):
+    """Raised on the client when the daemon reports that a command failed."""
+
+
+def default_socket_path() -> Path:
+    """
+    Return the socket path clients and the daemon agree on.
+
+    ``$LED_MATRIX_SOCKET`` wins; otherwise the socket lives in the per-user
+    runtime directory.
+
+    Returns:
+        Path:
+            The socket path.
+    """
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override).expanduser()
+
+    from is_matrix_forge.common.dirs import APP_DIRS
+    return APP_DIRS.user_runtime_path / SOCKET_NAME
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Serialize one message as a JSON line."""
+    return json.dumps(message, separators=(',', ':'), default=repr).encode('utf-8') + b'\n'
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Read one JSON line from ``stream``.
+
+    Returns:
+        Optional[Dict[str, Any]]:
+            The message, or ``None`` if the peer closed the connection first.
+
+    Raises:
+        ValueError:
+            If the line is too long or is not a JSON object.
+    """
+    line = stream.readline(MAX_MESSAGE_SIZE + 1)
+    if not line:
+        return None
+    if len(line) > MAX_MESSAGE_SIZE:
+        raise ValueError('message too large')
+
+    message = json.loads(line.decode('utf-8'))
+    if not isinstance(message, dict):
+        raise ValueError('message must be a JSON object')
+    return message
+
+
+def namespace_to_args(namespace: Any) -> Dict[str, Any]:
+    """
+    Convert a parsed ``argparse.Namespace`` into request ``args``.
+
+    Values that cannot be sent as JSON (e.g. the bound ``func`` handler) are dropped.
+    """
+    args = {}
+    for key, value in vars(namespace).items():
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        args[key] = value
+    return args
+
+
+__all__ = [
+    'DaemonCommandError',
+    'DaemonUnavailableError',
+    'HAS_UNIX_SOCKETS',
+    'SOCKET_ENV_VAR',
+    'default_socket_path',
+    'encode_message',
+    'namespace_to_args',
+    'read_message',
+]
@@ -0,0 +1,371 @@
+"""
+Resident ``led-matrix`` daemon.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/Scripts/led_matrix/daemon/server.py
+
+Description:
+    Each ``led-matrix`` invocation used to enumerate ports, build and clear its
+    controllers and open connections before doing anything. :class:`MatrixDaemon`
+    builds the controllers once, keeps them (and their pooled connections)
+    warm, and runs the same sub-command handlers the CLI runs, on behalf of
+    clients connecting over a Unix domain socket. Commands are executed one at
+    a time, so concurrent clients never interleave writes to a matrix.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import select
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+from .protocol import (
+    HAS_UNIX_SOCKETS,
+    default_socket_path,
+    encode_message,
+    read_message,
+)
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.Scripts.led_matrix.daemon.server')
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Command handlers
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _ping(daemon: 'MatrixDaemon', _args: argparse.Namespace, _cancel: threading.Event) -> Dict[str, Any]:
+    return daemon.status()
+
+
+def _scroll_text(daemon: 'MatrixDaemon', args: argparse.Namespace, cancel: threading.Event) -> Optional[str]:
+    from is_matrix_forge.led_matrix.Scripts.led_matrix import run_scroll_text
+    # The span report goes back to the client, which prints it.
+    return run_scroll_text(daemon.select(args), args, stop_event=cancel)
+
+
+def _display_text(daemon: 'MatrixDaemon', args: argparse.Namespace, cancel: threading.Event) -> None:
+    from is_matrix_forge.led_matrix.Scripts.led_matrix import run_display_text
+    run_display_text(daemon.select(args), args, resident=True, stop_event=cancel)
+
+
+def _identify(daemon: 'MatrixDaemon', args: argparse.Namespace, cancel: threading.Event) -> None:
+    from is_matrix_forge.led_matrix.Scripts.led_matrix import run_identify_matrices
+    run_identify_matrices(daemon.select(args), args, stop_event=cancel)
+
+
+def _clear(daemon: 'MatrixDaemon', args: argparse.Namespace, _cancel: threading.Event) -> None:
+    for controller in daemon.select(args):
+        controller.keep_alive = False
+        controller.clear_grid()
+
+
+def _shutdown(daemon: 'MatrixDaemon', _args: argparse.Namespace, _cancel: threading.Event) -> None:
+    # Reply first; stop serving from another thread once the handler returns.
+    threading.Thread(target=daemon.shutdown, name='led-matrix-daemon-shutdown', daemon=True).start()
+
+
+COMMANDS: Dict[str, Callable[['MatrixDaemon', argparse.Namespace, threading.Event], Any]] = {
+    'ping':              _ping,
+    'scroll-text':       _scroll_text,
+    'display-text':      _display_text,
+    'identify-matrices': _identify,
+    'clear':             _clear,
+    'shutdown':          _shutdown,
+}
+"""Commands the daemon accepts, by name."""
+
+_UNSERIALIZED = frozenset({'ping', 'shutdown'})
+"""Commands answered without waiting for the command in progress."""
+
+DISCONNECT_POLL_INTERVAL = 0.2
+"""float: How often (seconds) a running command's client socket is checked for EOF."""
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Socket server
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _watch_for_disconnect(sock: socket.socket, cancel: threading.Event, finished: threading.Event) -> None:
+    """Set ``cancel`` if the client hangs up before ``finished`` is set."""
+    while not finished.is_set():
+        try:
+            readable, _, _ = select.select([sock], [], [], DISCONNECT_POLL_INTERVAL)
+            if not readable:
+                continue
+            if sock.recv(1, socket.MSG_PEEK) == b'':
+                cancel.set()
+        except (OSError, ValueError):
+            cancel.set()
+        # EOF, a dead socket, or unexpected bytes (the protocol is one request
+        # per connection): either way there is nothing more to watch for.
+        return
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = read_message(self.rfile)
+        except ValueError as exc:
+            self.wfile.write(encode_message({'ok': False, 'error': f'Bad request: {exc}'}))
+            return
+
+        if request is None:
+            return
+
+        # A client that goes away (Ctrl+C on ``led-matrix``) cancels its command
+        # instead of leaving an animation or identify running unattended.
+        cancel, finished = threading.Event(), threading.Event()
+        watcher = threading.Thread(
+            target=_watch_for_disconnect,
+            args=(self.request, cancel, finished),
+            name='led-matrix-daemon-client-watch',
+            daemon=True,
+        )
+        watcher.start()
+        try:
+            reply = self.server.matrix_daemon.handle(request, cancel)
+        finally:
+            finished.set()
+            watcher.join()
+
+        try:
+            self.wfile.write(encode_message(reply))
+        except OSError:
+            MOD_LOGGER.debug(f'Client went away before the {request.get("command")!r} reply')
+
+
+if HAS_UNIX_SOCKETS:
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, path: str, matrix_daemon: 'MatrixDaemon'):
+            self.matrix_daemon = matrix_daemon
+            super().__init__(path, _RequestHandler)
+
+
+class MatrixDaemon:
+    """
+    Own the LED matrix controllers and run CLI commands for clients.
+
+    Parameters:
+        socket_path (Optional[Union[str, Path]], optional):
+            Where to listen. Defaults to :func:`default_socket_path`.
+
+        controllers (Optional[List[Any]], optional):
+            Controllers to serve. When omitted they are built on the first
+            command with ``controller_factory``.
+
+        controller_factory (Optional[Callable[[], List[Any]]], optional):
+            Builds the controllers. Defaults to the CLI's
+            :func:`~is_matrix_forge.led_matrix.Scripts.led_matrix.create_controllers`.
+    """
+
+    def __init__(
+            self,
+            socket_path:        Optional[Union[str, Path]]       = None,
+            *,
+            controllers:        Optional[List[Any]]              = None,
+            controller_factory: Optional[Callable[[], List[Any]]] = None,
+    ):
+        self.socket_path   = Path(socket_path) if socket_path else default_socket_path()
+        self._controllers  = list(controllers) if controllers is not None else None
+        self._factory      = controller_factory
+        self._lock         = threading.Lock()
+        self._server       = None
+        self._serving      = threading.Event()
+        self.started_at: Optional[float] = None
+        self.commands_run  = 0
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Controllers
+    # ──────────────────────────────────────────────────────────────────────
+
+    @property
+    def controllers(self) -> List[Any]:
+        """The warm controllers, built on first use."""
+        if self._controllers is None:
+            if self._factory is None:
+                from is_matrix_forge.led_matrix.Scripts.led_matrix import create_controllers
+                self._factory = create_controllers
+            self._controllers = list(self._factory())
+        return self._controllers
+
+    def select(self, args: argparse.Namespace) -> List[Any]:
+        """
+        Return the controllers matching the client's ``--only-left``/``--only-right`` flags.
+
+        Raises:
+            SystemExit:
+                If no controller is available or matches, with the same message
+                the CLI uses.
+        """
+        from is_matrix_forge.led_matrix.Scripts.led_matrix import select_controllers
+        return select_controllers(self.controllers, args)
+
+    def status(self) -> Dict[str, Any]:
+        """Summary returned by ``ping``."""
+        controllers = self._controllers or []
+        return {
+            'pid':      os.getpid(),
+            'socket':   str(self.socket_path),
+            'uptime':   time.monotonic() - self.started_at if self.started_at else 0.0,
+            'commands': self.commands_run,
+            'busy':     self._lock.locked(),
+            'devices':  [getattr(c, 'name', repr(c)) for c in controllers],
+        }
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Requests
+    # ──────────────────────────────────────────────────────────────────────
+
+    def handle(self, request: Dict[str, Any], cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Run one request and build the reply.
+
+        Parameters:
+            request (Dict[str, Any]):
+                ``{"command": str, "args": dict}``.
+
+            cancel (Optional[threading.Event], optional):
+                Set to cancel the command (e.g. its client disconnected). A
+                command still queued behind another one is dropped.
+
+        Returns:
+            Dict[str, Any]:
+                ``{"ok": True, "result": ...}`` or ``{"ok": False, "error": str}``.
+        """
+        log = MOD_LOGGER.get_child('MatrixDaemon.handle')
+
+        command = request.get('command')
+        handler = COMMANDS.get(command)
+        if handler is None:
+            return {'ok': False, 'error': f'Unknown command: {command!r}'}
+
+        args = argparse.Namespace(**(request.get('args') or {}))
+        cancel = cancel if cancel is not None else threading.Event()
+
+        try:
+            if command in _UNSERIALIZED:
+                result = handler(self, args, cancel)
+            else:
+                with self._lock:
+                    if cancel.is_set():
+                        log.debug(f'Dropping {command!r}; its client disconnected')
+                        return {'ok': False, 'error': f'{command!r} was cancelled'}
+                    log.debug(f'Running {command!r}')
+                    result = handler(self, args, cancel)
+                    self.commands_run += 1
+        except SystemExit as exc:
+            return {'ok': False, 'error': str(exc.code) if exc.code is not None else f'{command!r} exited'}
+        except Exception as exc:  # noqa: BLE001 - report to the client, keep serving
+            log.error(f'{command!r} failed: {exc!r}')
+            return {'ok': False, 'error': f'{type(exc).__name__}: {exc}'}
+
+        return {'ok': True, 'result': result}
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Lifecycle
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _remove_stale_socket(self) -> None:
+        if not self.socket_path.exists():
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            self.socket_path.unlink(missing_ok=True)
+        else:
+            raise RuntimeError(f'A daemon is already listening on {self.socket_path}')
+        finally:
+            probe.close()
+
+    def bind(self) -> None:
+        """
+        Create the listening socket (readable and writable by the current user only).
+
+        Raises:
+            RuntimeError:
+                If Unix sockets are unsupported or another daemon owns the socket.
+        """
+        if not HAS_UNIX_SOCKETS:
+            raise RuntimeError('The led-matrix daemon requires Unix domain sockets.')
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self._remove_stale_socket()
+
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(str(self.socket_path), self)
+        finally:
+            os.umask(old_umask)
+
+    def serve_forever(self) -> None:
+        """Bind (if needed) and serve until :meth:`shutdown` is called."""
+        log = MOD_LOGGER.get_child('MatrixDaemon.serve_forever')
+
+        if self._server is None:
+            self.bind()
+
+        self.started_at = time.monotonic()
+        self._serving.set()
+        log.info(f'led-matrix daemon listening on {self.socket_path}')
+        try:
+            self._server.serve_forever()
+        finally:
+            self._close()
+
+    def start(self) -> threading.Thread:
+        """
+        Serve from a background thread.
+
+        Returns:
+            threading.Thread:
+                The serving thread; it exits after :meth:`shutdown`.
+        """
+        self.bind()
+        thread = threading.Thread(target=self.serve_forever, name='led-matrix-daemon', daemon=True)
+        thread.start()
+        self._serving.wait()
+        return thread
+
+    def shutdown(self) -> None:
+        """Stop serving. Controllers are released and the socket is removed."""
+        if self._server is not None and self._serving.is_set():
+            self._server.shutdown()
+
+    def _close(self) -> None:
+        log = MOD_LOGGER.get_child('MatrixDaemon._close')
+
+        self._serving.clear()
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        self.socket_path.unlink(missing_ok=True)
+
+        for controller in self._controllers or []:
+            try:
+                controller.keep_alive = False
+                controller.clear_grid()
+            except Exception as exc:  # noqa: BLE001 - best-effort cleanup
+                log.warning(f'Could not release {controller!r}: {exc!r}')
+
+        log.info('led-matrix daemon stopped')
+
+
+__all__ = ['COMMANDS', 'MatrixDaemon']
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import threading
 from collections.abc import Callable, Iterable
+from typing import Optional
 
 
 LOGGER = logging.getLogger(__name__)
@@ -24,6 +25,15 @@ def _cleanup_controllers(controllers: Iterable, *, clear_after: bool) -> None:
     cleanup_errors: list[Exception] = []
 
     for controller in controllers:
+        # An animation still playing when the guard fires (timeout, or a daemon
+        # client that went away) would keep drawing over the cleanup.
+        animation = getattr(controller, 'current_animation', None)
+        if animation is not None and getattr(animation, 'is_playing', False):
+            try:
+                animation.stop()
+            except Exception:  # noqa: BLE001 - best-effort cleanup
+                LOGGER.exception('Exception while stopping the animation on %r', controller)
+
         try:
             controller.keep_alive = False
         except Exception as exc:  # noqa: BLE001 - best-effort cleanup
@@ -58,6 +68,7 @@ def run_with_guard(
     activator: Callable[[Iterable, threading.Event], None],
     thread_name: str,
     wait_for_interrupt: bool = False,
+    stop_event: Optional[threading.Event] = None,
 ) -> None:
     """Execute an action while keeping controllers alive until timeout or interruption.
 
@@ -76,10 +87,13 @@ def run_with_guard(
             When ``True`` and no duration is provided, the guard waits for an
             external interrupt (such as Ctrl+C) instead of stopping once the
             activator completes.
+        stop_event:
+            Ends the run early when set from outside (the daemon sets it when
+            its client disconnects). A fresh event is used when omitted.
     """
 
     duration = _ensure_positive_duration(run_for)
-    stop_event = threading.Event()
+    stop_event = stop_event if stop_event is not None else threading.Event()
 
     def guard() -> None:
         try:
@@ -33,17 +33,23 @@ MEMORY_FILE = APP_DIR / "memory.ini"
 MEMORY_FILE_TEMPLATE = {"first_run": True}
 first_run = False
 
-APP_DIR.mkdir(parents=True, exist_ok=True)
-if not MEMORY_FILE.exists():
-    MEMORY_FILE.write_text(json.dumps(MEMORY_FILE_TEMPLATE))
+
+def _ensure_memory_file() -> None:
+    # Created on first use rather than on import so that importing the
+    # package has no filesystem side effects.
+    if not MEMORY_FILE.exists():
+        APP_DIR.mkdir(parents=True, exist_ok=True)
+        MEMORY_FILE.write_text(json.dumps(MEMORY_FILE_TEMPLATE))
 
 
 def _read_memory() -> dict:
+    _ensure_memory_file()
     with open(MEMORY_FILE, "r") as fh:
         return json.load(fh)
 
 
 def _write_memory(memory: dict) -> None:
+    APP_DIR.mkdir(parents=True, exist_ok=True)
     with open(MEMORY_FILE, "w") as fh:
         json.dump(memory, fh)
 
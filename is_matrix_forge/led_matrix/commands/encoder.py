@@ -0,0 +1,206 @@
+"""
+Encode commands into reusable per-device buffers.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/commands/encoder.py
+
+Description:
+    Building a command as ``FWK_MAGIC + [command] + parameters`` creates two
+    lists and a ``bytes`` object per call, and packing a frame the old way
+    creates another 39-item list. At animation frame rates that is a steady
+    stream of short-lived objects for every matrix.
+
+    A :class:`CommandEncoder` keeps one ``bytearray`` per ``(command, length)``
+    with the magic and opcode already in place. Encoding copies the
+    parameters into that buffer and returns a ``memoryview`` of it, which the
+    transport writes as-is. Matrices are packed straight into a reusable
+    payload buffer with the precomputed :data:`DRAW_BITS` table (no
+    ``int(i / 8)`` per pixel), so a steady-state frame loop builds no new
+    lists or command buffers.
+
+    Buffers are shared, so encode and write under :attr:`CommandEncoder.lock`
+    (:func:`~is_matrix_forge.led_matrix.hardware.send_command` does) and do not
+    keep a returned view past the write.
+
+Example Usage:
+    from is_matrix_forge.led_matrix.commands.encoder import get_encoder, pack_matrix_into
+
+    encoder = get_encoder(dev)
+    with encoder.lock:
+        pack_matrix_into(encoder.draw_buffer, matrix)
+        get_pool().write(dev, encoder.encode_draw())
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.constants import FWK_MAGIC, HEIGHT, WIDTH
+from is_matrix_forge.led_matrix.transport.pool import port_name
+
+
+DRAW_PAYLOAD_SIZE = (WIDTH * HEIGHT + 7) // 8
+"""Bytes in a ``Draw`` payload (39 for 9×34)."""
+
+FRAME_SIZE = WIDTH * HEIGHT
+"""Bytes in a raw one-byte-per-pixel frame (see :func:`pack_frame_into`)."""
+
+MAX_TEMPLATES = 64
+"""Command buffers kept per encoder; rarer shapes are encoded into a fresh buffer."""
+
+PIXEL_BITS: Tuple[Tuple[int, int], ...] = tuple((i >> 3, 1 << (i & 7)) for i in range(FRAME_SIZE))
+"""``(byte index, bit mask)`` of pixel ``i = x + WIDTH * y`` in a ``Draw`` payload."""
+
+DRAW_BITS: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+    tuple(PIXEL_BITS[x + WIDTH * y] for y in range(HEIGHT)) for x in range(WIDTH)
+)
+"""``DRAW_BITS[x][y]`` is the ``(byte index, bit mask)`` of pixel ``(x, y)``."""
+
+_ZERO_PAYLOAD = bytes(DRAW_PAYLOAD_SIZE)
+
+_PIXEL_ON = bytes([0x30]) + bytes([0x31]) * 255
+"""``bytes.translate`` table mapping a zero byte to ``'0'`` and anything else to ``'1'``."""
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def pack_matrix_into(buffer: bytearray, matrix: Sequence[Sequence[int]], offset: int = 0) -> None:
+    """
+    Pack a column-major black/white matrix into ``buffer`` at ``offset``.
+
+    Matrices smaller than 9×34 (or with short columns) are packed with the
+    missing pixels off; pixels outside 9×34 are ignored.
+
+    Parameters:
+        buffer (bytearray):
+            Receives the ``DRAW_PAYLOAD_SIZE`` payload bytes.
+
+        matrix (Sequence[Sequence[int]]):
+            Column-major pixel data (``matrix[x][y]``).
+
+        offset (int, optional):
+            Where the payload starts in ``buffer``. Defaults to 0.
+    """
+    buffer[offset:offset + DRAW_PAYLOAD_SIZE] = _ZERO_PAYLOAD
+    for bits, column in zip(DRAW_BITS, matrix):
+        if not isinstance(column, list):
+            continue
+        for (byte, mask), value in zip(bits, column):
+            if value:
+                buffer[offset + byte] |= mask
+
+
+def pack_frame_into(buffer: bytearray, frame: BytesLike, offset: int = 0) -> None:
+    """
+    Pack a raw frame (one byte per pixel, pixel ``(x, y)`` at ``x + 9 * y``) into ``buffer``.
+
+    Raises:
+        ValueError:
+            If ``frame`` is not ``FRAME_SIZE`` bytes long.
+    """
+    if len(frame) != FRAME_SIZE:
+        raise ValueError(f'A raw frame is {FRAME_SIZE} bytes, got {len(frame)}')
+
+    # Byte i becomes bit i: map to '0'/'1', reverse so byte 0 is the LSB. This
+    # stays in C, which beats a per-pixel loop even with its temporaries.
+    bits = int(bytes(frame).translate(_PIXEL_ON)[::-1], 2)
+    buffer[offset:offset + DRAW_PAYLOAD_SIZE] = bits.to_bytes(DRAW_PAYLOAD_SIZE, 'little')
+
+
+class CommandEncoder:
+    """
+    Reusable command buffers for one device.
+
+    Properties:
+        lock (threading.RLock):
+            Hold while encoding and writing; the buffers are shared.
+
+        draw_buffer (bytearray):
+            Scratch ``Draw`` payload for packing frames in place.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.draw_buffer = bytearray(DRAW_PAYLOAD_SIZE)
+        self._templates: Dict[Tuple[int, int], Tuple[bytearray, memoryview]] = {}
+
+    def _template(self, command: int, length: int) -> Optional[Tuple[bytearray, memoryview]]:
+        key = (command, length)
+        template = self._templates.get(key)
+        if template is None and len(self._templates) < MAX_TEMPLATES:
+            buf = bytearray(3 + length)
+            buf[0:2] = bytes(FWK_MAGIC)
+            buf[2] = command
+            template = self._templates[key] = (buf, memoryview(buf))
+        return template
+
+    def encode(self, command: int, parameters: Optional[Union[BytesLike, Sequence[int]]] = None) -> memoryview:
+        """
+        Encode ``command`` with ``parameters``.
+
+        Parameters:
+            command (int):
+                The opcode.
+
+            parameters (bytes-like | Sequence[int], optional):
+                Parameter bytes. Bytes-like parameters are copied without an
+                intermediate object. Defaults to none.
+
+        Returns:
+            memoryview:
+                The encoded command, valid until the next ``encode`` of the
+                same command and length.
+        """
+        length = len(parameters) if parameters is not None else 0
+        template = self._template(command, length)
+        if template is None:
+            return memoryview(bytes(FWK_MAGIC) + bytes([command]) + bytes(parameters or b''))
+
+        buf, view = template
+        if length:
+            buf[3:] = parameters
+        return view
+
+    def encode_draw(self, payload: Optional[BytesLike] = None) -> memoryview:
+        """Encode a ``Draw`` command (defaults to the contents of :attr:`draw_buffer`)."""
+        return self.encode(CommandVals.Draw, self.draw_buffer if payload is None else payload)
+
+
+_ENCODERS: Dict[str, CommandEncoder] = {}
+_ENCODERS_LOCK = threading.Lock()
+
+
+def get_encoder(dev: Any) -> CommandEncoder:
+    """
+    Return the encoder for a device, creating it on first use.
+
+    Parameters:
+        dev (Any):
+            A ``ListPortInfo``, controller or port name (see
+            :func:`~is_matrix_forge.led_matrix.transport.port_name`).
+    """
+    port = port_name(dev)
+    encoder = _ENCODERS.get(port)
+    if encoder is None:
+        with _ENCODERS_LOCK:
+            encoder = _ENCODERS.setdefault(port, CommandEncoder())
+    return encoder
+
+
+__all__ = [
+    'CommandEncoder',
+    'DRAW_BITS',
+    'DRAW_PAYLOAD_SIZE',
+    'FRAME_SIZE',
+    'PIXEL_BITS',
+    'get_encoder',
+    'pack_frame_into',
+    'pack_matrix_into',
+]
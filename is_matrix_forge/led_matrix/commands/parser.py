@@ -0,0 +1,146 @@
+"""
+Decode ``FWK_MAGIC``-framed commands from a byte stream.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/commands/parser.py
+
+Description:
+    The host side only ever encodes commands (``FWK_MAGIC + [command] +
+    parameters``). Anything that needs to look at the wire from the device's
+    side, such as the virtual device emulator, uses :class:`CommandParser` to
+    split the stream back into :class:`Command` records.
+
+    The protocol has no length field. Commands with a fixed parameter block
+    (see :data:`PARAM_LENGTHS`) are read to that length, waiting for more data
+    if needed. Every other command takes the bytes up to the next
+    ``FWK_MAGIC`` or the end of what has arrived, which matches how the host
+    writes one command per write. Bytes before a magic sequence (for example
+    the zeros written by a connection test) are skipped.
+
+Example Usage:
+    from is_matrix_forge.led_matrix.commands.parser import CommandParser
+
+    parser = CommandParser()
+    for command in parser.feed(chunk):
+        print(command.name, command.params.hex())
+"""
+from __future__ import annotations
+
+from typing import Dict, List, NamedTuple, Optional
+
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.constants import FWK_MAGIC, HEIGHT, WIDTH
+
+
+MAGIC = bytes(FWK_MAGIC)
+
+
+PARAM_LENGTHS: Dict[int, int] = {
+    CommandVals.Draw:              (WIDTH * HEIGHT + 7) // 8,
+    CommandVals.StageGreyCol:      1 + HEIGHT,
+    CommandVals.GetAllBrightness:  0,
+    CommandVals.Version:           0,
+}
+"""Parameter lengths of the commands whose payload size is fixed."""
+
+
+class Command(NamedTuple):
+    """One decoded command."""
+
+    opcode: int
+    params: bytes
+
+    @property
+    def command(self) -> Optional[CommandVals]:
+        """The opcode as a :class:`CommandVals`, or ``None`` if it is not one."""
+        try:
+            return CommandVals(self.opcode)
+        except ValueError:
+            return None
+
+    @property
+    def name(self) -> str:
+        command = self.command
+        return command.name if command is not None else f'0x{self.opcode:02X}'
+
+
+class CommandParser:
+    """
+    Incremental decoder for the host → device command stream.
+
+    Properties:
+        skipped (int):
+            Bytes discarded because they were not part of a command.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.skipped = 0
+
+    @property
+    def pending(self) -> int:
+        """Bytes buffered while waiting for the rest of a fixed-length command."""
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> List[Command]:
+        """
+        Add received bytes and return the commands completed by them.
+
+        Parameters:
+            data (bytes):
+                The next chunk of the stream.
+
+        Returns:
+            List[Command]:
+                The decoded commands, in order.
+        """
+        buf = self._buffer
+        buf += data
+        commands: List[Command] = []
+
+        while buf:
+            start = buf.find(MAGIC)
+            if start < 0:
+                # Keep a trailing first magic byte; its partner may be in the next chunk.
+                keep = 1 if buf[-1] == MAGIC[0] else 0
+                self.skipped += len(buf) - keep
+                del buf[:len(buf) - keep]
+                break
+
+            if start:
+                self.skipped += start
+                del buf[:start]
+
+            if len(buf) < 3:
+                break
+
+            opcode = buf[2]
+            length = PARAM_LENGTHS.get(opcode)
+            if length is None:
+                end = buf.find(MAGIC, 3)
+                length = (end if end >= 0 else len(buf)) - 3
+            elif len(buf) < 3 + length:
+                break
+
+            commands.append(Command(opcode, bytes(buf[3:3 + length])))
+            del buf[:3 + length]
+
+        return commands
+
+    def reset(self) -> None:
+        """Drop any partially received command."""
+        self._buffer.clear()
+
+
+__all__ = [
+    'Command',
+    'CommandParser',
+    'MAGIC',
+    'PARAM_LENGTHS',
+]
@@ -22,6 +22,9 @@ VID       = 0x32AC
 DEFAULT_BAUDRATE = 115_200
 RESPONSE_SIZE    = 32
 
+# Seconds of inactivity after which the firmware blanks the matrix
+FIRMWARE_SLEEP_TIMEOUT = 60.0
+
 # Disconnected device placeholder
 DISCONNECTED_DEVS = []
 
@@ -47,31 +50,36 @@ SLOT_MAP = {
 }
 
 
-try:
-    from cv2 import COLOR_BGR2GRAY, COLOR_RGB2GRAY
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    COLOR_BGR2GRAY = COLOR_RGB2GRAY = 0
-from is_matrix_forge.led_matrix.helpers.device import DEVICES
 from is_matrix_forge.common.dirs import APP_DIRS
 from is_matrix_forge.dev_tools.presets import MANIFEST_FILE_NAME
 
 MANIFEST_FILE_PATH = PRESETS_DIR.joinpath(MANIFEST_FILE_NAME)
 
-# Grayscale conversion constants
+# Grayscale conversion constants. These are the values of ``cv2.COLOR_BGR2GRAY``
+# and ``cv2.COLOR_RGB2GRAY``; they are spelled out so importing the constants
+# does not import OpenCV.
 GRAYSCALE_CVT = {
-    'camera': COLOR_BGR2GRAY,
-    'video': COLOR_RGB2GRAY,
+    'camera': 6,
+    'video': 7,
 }
 
 
-# Cleanup
-del COLOR_BGR2GRAY, COLOR_RGB2GRAY
+def __getattr__(name: str):
+    # Resolved lazily so importing the constants does not enumerate serial ports.
+    if name == 'DEVICES':
+        from is_matrix_forge.led_matrix.helpers.device import list_devices
+        return list_devices()
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
+# ``DEVICES`` is deliberately left out: a star import would resolve it and
+# enumerate serial ports at import time. Access it as ``constants.DEVICES``.
 __all__ = [
     'APP_DIRS',
     'DEFAULT_BAUDRATE',
-    'DEVICES',
     'DISCONNECTED_DEVS',
+    'FIRMWARE_SLEEP_TIMEOUT',
     'FWK_MAGIC',
     'GITHUB_REQ_HEADERS',
     'GRAYSCALE_CVT',
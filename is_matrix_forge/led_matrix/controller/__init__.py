@@ -8,6 +8,7 @@ from is_matrix_forge.led_matrix.constants import HEIGHT, WIDTH
 from is_matrix_forge.led_matrix.display.grid.base import Grid
 
 from .controller import LEDMatrixController
+from .async_controller import AsyncLEDMatrixController
 from .helpers import get_controllers
 from .multiton import MultitonMeta
 from .helpers.threading import synchronized
@@ -0,0 +1,315 @@
+"""
+asyncio LED matrix controller.
+
+Description:
+    :class:`AsyncLEDMatrixController` mirrors the drawing, brightness and
+    animation surface of :class:`~is_matrix_forge.led_matrix.controller.controller.LEDMatrixController`
+    with awaitable methods. All serial I/O goes through the asyncio transport
+    and all waits use ``asyncio.sleep``, so a single event loop can drive every
+    connected matrix concurrently without a thread per device.
+
+Example Usage:
+    async def main():
+        async with AsyncLEDMatrixController(device) as ctrl:
+            await ctrl.fade_to(80, 0.5)
+            await ctrl.scroll_text('Hello')
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Optional, Union
+
+from serial.tools.list_ports_common import ListPortInfo
+
+from is_matrix_forge.common.helpers import percentage_to_value
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.controller.components.animation import build_scroll_animation
+from is_matrix_forge.led_matrix.controller.components.brightness.helpers import (
+    Easing,
+    FadePlanner,
+    Levels,
+    Percent,
+)
+from is_matrix_forge.led_matrix.display.animations import Animation
+from is_matrix_forge.led_matrix.display.grid import Grid
+from is_matrix_forge.led_matrix.display.grid.helpers import generate_blank_grid
+from is_matrix_forge.led_matrix.hardware import send_command_async
+from is_matrix_forge.led_matrix.transport.aio import get_async_transport
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.controller.async_controller')
+
+
+class AsyncLEDMatrixController:
+    """
+    Awaitable controller for a single LED matrix.
+
+    Parameters:
+        device (ListPortInfo):
+            The serial device to control.
+
+        default_brightness (Optional[int], optional):
+            Brightness percentage [0..100] used by :meth:`reset_brightness` and
+            as the starting point before any brightness has been set.
+
+    Properties:
+        device (ListPortInfo):
+            The underlying serial device.
+
+        brightness (int):
+            Last brightness percentage written (or the default).
+
+        grid (Optional[Grid]):
+            The last grid drawn.
+
+        current_animation (Optional[Animation]):
+            The most recently played animation.
+
+    Methods:
+        draw_grid(grid):
+            Draw a grid.
+
+        clear():
+            Blank the matrix.
+
+        set_brightness(brightness):
+            Set absolute brightness [0..100].
+
+        fade_to(target, duration):
+            Fade to an absolute or relative brightness.
+
+        play_animation(animation):
+            Play an Animation; cancel the awaiting task to stop it.
+
+        scroll_text(text, ...):
+            Build and play a scrolling text animation.
+    """
+
+    FACTORY_DEFAULT_BRIGHTNESS: int = 75
+    PERCEPTION_HZ: int = 60
+
+    def __init__(self, device: ListPortInfo, *, default_brightness: Optional[int] = None):
+        if not device:
+            raise ValueError('device cannot be None or empty.')
+
+        self._device = device
+        self._default_brightness = Percent.norm(
+            default_brightness if default_brightness is not None
+            else self.FACTORY_DEFAULT_BRIGHTNESS
+        )
+        self._brightness: Optional[int] = None
+        self._grid: Optional[Grid] = None
+        self._current_animation: Optional[Animation] = None
+
+        self.easing: Optional[Callable[[float], float]] = None
+
+    async def __aenter__(self) -> 'AsyncLEDMatrixController':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return f'AsyncLEDMatrixController(device={getattr(self._device, "device", self._device)!r})'
+
+    # ——— properties ———
+    @property
+    def device(self) -> ListPortInfo:
+        return self._device
+
+    @property
+    def brightness(self) -> int:
+        return self._brightness if self._brightness is not None else self._default_brightness
+
+    @property
+    def grid(self) -> Optional[Grid]:
+        return self._grid
+
+    @property
+    def current_animation(self) -> Optional[Animation]:
+        return self._current_animation
+
+    # ——— drawing ———
+    async def draw_grid(self, grid: Optional[Union[Grid, list]] = None) -> None:
+        """
+        Draw a grid on the matrix.
+
+        Parameters:
+            grid (Optional[Union[Grid, list]], optional):
+                A :class:`Grid` or raw grid data. Defaults to the last grid drawn.
+        """
+        g = grid or self._grid
+        if g is None:
+            raise ValueError('No grid to draw.')
+        if not isinstance(g, Grid):
+            g = Grid(init_grid=g)
+
+        self._grid = g
+        await send_command_async(self._device, CommandVals.Draw, list(g.to_draw_payload()))
+
+    async def clear(self, fill_value: int = 0) -> None:
+        """Blank the matrix (or fill it with ``fill_value``)."""
+        await self.draw_grid(Grid(init_grid=generate_blank_grid(fill_value=fill_value)))
+
+    # ——— brightness ———
+    async def set_brightness(self, brightness: Union[int, float, str]) -> None:
+        """
+        Parameters:
+
+            brightness (int | float | str):
+                : Absolute brightness (strings like '80%' accepted).
+        """
+        pct = Percent.norm(brightness)
+        raw = percentage_to_value(max_value=255, percent=pct)
+        await send_command_async(self._device, CommandVals.Brightness, [raw])
+        self._brightness = pct
+
+    async def reset_brightness(self) -> None:
+        """Restore the default brightness."""
+        await self.set_brightness(self._default_brightness)
+
+    async def fade_to(
+            self,
+            target: Union[int, float, str],
+            duration: float = 0.33,
+            *,
+            steps: Optional[int] = None,
+            easing: Optional[Callable[[float], float]] = None,
+            clear_when_done: Optional[bool] = None,
+    ) -> None:
+        """
+        Parameters:
+
+            target (int | float | str):
+                : Destination brightness in [0..100], or relative like '+10', '-25%'.
+
+            duration (float):
+                : Total fade time in seconds. Defaults to 0.33.
+
+            steps (Optional[int]):
+                : Explicit number of steps; if None, computed from fps and delta.
+
+            easing (Optional[Callable[[float], float]]):
+                : Easing function f:[0,1]->[0,1]. Defaults to self.easing or linear.
+
+            clear_when_done (Optional[bool]):
+                : If None, auto-clear only when final target == 0. Otherwise obey.
+        """
+        tgt = Percent.resolve(target, current=self.brightness)
+        do_clear = clear_when_done if clear_when_done is not None else (tgt == 0)
+
+        if duration <= 0:
+            await self.set_brightness(tgt)
+        else:
+            spec = FadePlanner.make_spec(
+                start=self.brightness,
+                target=tgt,
+                duration=duration,
+                fps=self.PERCEPTION_HZ,
+                steps=steps,
+                clear_when_done=do_clear,
+            )
+            loop = asyncio.get_running_loop()
+            next_tick = loop.time()
+            last = None
+            for level in Levels.iter(spec, easing=easing or self.easing or Easing.linear):
+                if level != last:
+                    await self.set_brightness(level)
+                    last = level
+                next_tick += spec.step_delay
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+            if self.brightness != tgt:
+                await self.set_brightness(tgt)
+
+        if do_clear and tgt == 0:
+            await self.clear()
+
+    # ——— animation ———
+    async def play_animation(self, animation: Animation, *, skip_clear_screen: bool = False) -> None:
+        """
+        Play an Animation on this matrix.
+
+        Frame deadlines are computed from the event loop clock, so slow writes
+        do not accumulate drift. Cancel the awaiting task to stop playback.
+
+        Parameters:
+            animation (Animation):
+                The animation to play. Honors ``animation.loop``.
+
+            skip_clear_screen (bool, optional):
+                Do not blank the matrix after each pass. Defaults to False.
+
+        Raises:
+            TypeError:
+                If 'animation' is not an Animation.
+
+            ValueError:
+                If the animation has no frames.
+        """
+        if not isinstance(animation, Animation):
+            raise TypeError(f'Expected Animation; got {type(animation)}')
+        if animation.is_empty:
+            raise ValueError('Cannot play an animation with no frames.')
+
+        self._current_animation = animation
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+
+        while True:
+            animation.rewind()
+            for frame in animation.iter_frames():
+                await self.draw_grid(frame.grid)
+                frame.number_of_plays += 1
+
+                deadline += frame.duration
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+            if not skip_clear_screen:
+                await self.clear()
+
+            if not animation.loop:
+                break
+
+    async def scroll_text(
+            self,
+            text: str,
+            *,
+            spacing: int = 1,
+            frame_duration: float = 0.05,
+            wrap: bool = False,
+            direction: str = 'horizontal',
+            font_map: Optional[Any] = None,
+            loop: bool = False,
+            set_duration_override: Optional[float] = None,
+    ) -> Animation:
+        """
+        Build and play a scrolling text Animation.
+
+        Accepts the same parameters as
+        :meth:`~is_matrix_forge.led_matrix.controller.components.animation.AnimationManager.scroll_text`.
+
+        Returns:
+            Animation:
+                The animation that was played.
+        """
+        anim = build_scroll_animation(
+            text,
+            spacing=spacing,
+            frame_duration=frame_duration,
+            wrap=wrap,
+            direction=direction,
+            font_map=font_map,
+            set_duration_override=set_duration_override,
+            stream=True,
+        )
+        anim.loop = loop
+
+        await self.play_animation(anim)
+        return anim
+
+    # ——— lifecycle ———
+    async def close(self) -> None:
+        """Close this device's transport on the running loop."""
+        await get_async_transport(self._device).close()
@@ -3,9 +3,12 @@ from typing import Optional, Dict, Any
 import threading
 from aliaser import alias, Aliases
 from serial.tools.list_ports_common import ListPortInfo
+from is_matrix_forge.led_matrix.controller.helpers.device_state import DEFAULT_STATE_TTL, DeviceStateCache
+from is_matrix_forge.led_matrix.controller.helpers.draw_cache import invalidate_draw_cache
 from is_matrix_forge.led_matrix.controller.helpers.threading import synchronized
 from is_matrix_forge.led_matrix.commands.map import CommandVals
-from is_matrix_forge.led_matrix.hardware import send_command
+from is_matrix_forge.led_matrix.hardware import send_command, get_pwm_freq, get_version
+from is_matrix_forge.led_matrix.transport import get_pool
 from is_matrix_forge.led_matrix.constants import SLOT_MAP
 from is_matrix_forge.led_matrix.display.text import show_string as _show_string_raw
 from is_matrix_forge.log_engine import ROOT_LOGGER
@@ -22,8 +25,14 @@ class DeviceBase(Aliases):
         device (ListPortInfo): The serial device to control.
         thread_safe (bool): Enables use of an internal RLock for synchronized ops.
         cmd_lock (Optional[threading.RLock]): Lazily created lock when thread_safe.
+        state_ttl (Optional[float]): Seconds cached device state (brightness, animate flag,
+            version, PWM frequency) is trusted before re-querying; ``None`` never expires.
     
     Properties:
+        animating (bool): Whether device-side animation is enabled (cached).
+        device_state (DeviceStateCache): Last-known device state.
+        firmware_version (str): Firmware version string (cached).
+        pwm_frequency (Optional[int]): PWM frequency in Hz (cached).
         location (Dict[str, Any]): Physical location information for the device.
         location_abbrev (str): Abbreviated location identifier (e.g., 'R1', 'L2').
         name (str): Device name.
@@ -31,7 +40,14 @@ class DeviceBase(Aliases):
         side_of_keyboard (str): Which side of the keyboard the device is on ('left' or 'right').
         slot (int): The slot number of the device (1 or 2).
     """
-    def __init__(self, *, device: ListPortInfo, thread_safe: bool = False, **kwargs: Any) -> None:
+    def __init__(
+            self,
+            *,
+            device: ListPortInfo,
+            thread_safe: bool = False,
+            state_ttl: Optional[float] = DEFAULT_STATE_TTL,
+            **kwargs: Any
+    ) -> None:
         # Initialize core device/threading state BEFORE forwarding to super(), so
         # downstream mixins (e.g., brightness/breather/identify) can safely access
         # self.device during their initialization.
@@ -40,6 +56,7 @@ class DeviceBase(Aliases):
         self._device: ListPortInfo = device
         self._thread_safe: bool = bool(thread_safe)
         self._cmd_lock: Optional[threading.RLock] = None
+        self._device_state = DeviceStateCache(ttl=state_ttl)
         # Cooperative init: forward any remaining kwargs down the MRO chain
         super().__init__(**kwargs)
 
@@ -60,10 +77,35 @@ class DeviceBase(Aliases):
 
     # ——— status helpers ———
     @property
-    def animating(self) -> bool:
+    def device_state(self) -> DeviceStateCache:
+        return self._device_state
+
+    def invalidate_device_state(self, key: Optional[str] = None) -> None:
+        """Forget cached device state (``key`` only, or everything) so the next read queries the device."""
+        self._device_state.invalidate(key)
+
+    def _query_animating(self) -> bool:
         res = send_command(dev=self.device, command=COMMANDS.Animate, with_response=True)
         return bool(res and res[0])
 
+    @property
+    def animating(self) -> bool:
+        return self._device_state.get('animate', self._query_animating)
+
+    def _query_version(self) -> Optional[str]:
+        version = get_version(self.device)
+        # ``None`` keeps a failed read out of the cache so the next access retries.
+        return None if version == 'Unknown' else version
+
+    @property
+    def firmware_version(self) -> str:
+        version = self._device_state.get('version', self._query_version)
+        return 'Unknown' if version is None else version
+
+    @property
+    def pwm_frequency(self) -> Optional[int]:
+        return self._device_state.get('pwm_freq', lambda: get_pwm_freq(self.device))
+
     @property
     def location(self) -> Dict[str, Any]:
         return SLOT_MAP.get(self.device.location)
@@ -103,18 +145,42 @@ class DeviceBase(Aliases):
         """
         return self.location['slot']
 
+    @property
+    def connected(self) -> bool:
+        """
+        Whether the device currently holds an open pooled serial connection.
+
+        Returns:
+            bool:
+                True if the shared pool has an open port for this device.
+        """
+        return get_pool().is_open(self.device)
+
+    def release_connection(self) -> None:
+        """
+        Close the pooled serial connection for this device.
+
+        The next command transparently reopens the port, so this is only needed
+        to hand the port over to another process.
+        """
+        get_pool().discard(self.device)
+
     def _ping(self) -> None:
+        # The ping exists to touch the device, so it always queries; the answer
+        # refreshes the cache for free.
         try:
-            _ = self.animating
+            self._device_state.get('animate', self._query_animating, refresh=True)
         except Exception:
             pass
 
     # ——— tiny display helpers (neutral) ———
     @synchronized
     def display_location(self) -> None:
+        invalidate_draw_cache(self)
         _show_string_raw(self.device, self.location_abbrev)
 
     @synchronized
     def display_name(self) -> None:
+        invalidate_draw_cache(self)
         _show_string_raw(self.device, self.name)
 
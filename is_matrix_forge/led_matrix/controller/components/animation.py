@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import replace
 from typing import Any, Optional
 
 from is_matrix_forge.led_matrix.controller.helpers.threading import synchronized
@@ -9,6 +10,96 @@ from is_matrix_forge.led_matrix.display.animations import Animation
 from is_matrix_forge.assets.font_map.base import FontMap
 
 
+def build_scroll_animation(
+        text: str,
+        *,
+        spacing: int = 1,
+        frame_duration: float = 0.05,
+        wrap: bool = False,
+        direction: str = 'horizontal',
+        font_map: Optional[FontMap] = None,
+        set_duration_override: Optional[float] = None,
+        stream: bool = False,
+) -> Animation:
+    """
+    Build (but do not play) a scrolling text Animation.
+
+    Shared by :meth:`AnimationManager.scroll_text` and the asyncio controller so
+    both honor the same font-map and case handling.
+
+    Parameters:
+        text:
+            Text to render.
+        spacing:
+            Columns (or rows for vertical scroll) between glyphs.
+        frame_duration:
+            Seconds to display each animation frame.
+        wrap:
+            Enable seamless horizontal wrapping.
+        direction:
+            One of ``'horizontal'``, ``'vertical_up'`` or ``'vertical_down'``.
+        font_map:
+            Either a :class:`FontMap` instance or any mapping of characters to glyphs.
+        set_duration_override:
+            Optional override for all frame durations.
+        stream:
+            Generate frames lazily while playing instead of building them all up
+            front; time-to-first-frame and memory no longer grow with the text.
+
+    Returns:
+        Animation:
+            The generated animation.
+    """
+    from is_matrix_forge.led_matrix.display.animations.text_scroller import (
+        TextScroller,
+        TextScrollerConfig,
+    )
+
+    fm = font_map or FontMap(case_sensitive=False)
+
+    if isinstance(text, str):
+        text = text.upper()
+
+    if isinstance(fm, FontMap):
+        case_sensitive = fm.is_case_sensitive
+        glyph_map = {
+            (key if case_sensitive else str(key).upper()): fm.lookup(key)
+            for key in fm.keys()
+        }
+    elif isinstance(fm, Mapping):
+        str_items = [(str(k), v) for k, v in fm.items()]
+        case_sensitive = any(key != key.upper() for key, _ in str_items)
+        glyph_map = {
+            (key if case_sensitive else key.upper()): value
+            for key, value in str_items
+        }
+    else:
+        raise TypeError('font_map must be a FontMap or mapping of glyphs')
+
+    cfg = TextScrollerConfig(
+        text=text,
+        font_map=glyph_map,
+        spacing=spacing,
+        frame_duration=frame_duration,
+        wrap=wrap,
+        direction=direction,
+        case_sensitive=case_sensitive,
+    )
+
+    if stream:
+        if set_duration_override is not None:
+            cfg = replace(cfg, frame_duration=set_duration_override)
+        return TextScroller(cfg).stream_animation()
+
+    scroller = TextScroller(cfg)
+    anim = scroller.generate_animation()
+
+    if set_duration_override is not None:
+        anim.set_all_frame_durations(set_duration_override)
+
+    return anim
+
+
 class AnimationManager:
     """
     AnimationManager
@@ -58,8 +149,12 @@ class AnimationManager:
                 True to enable, False to disable.
         """
         # Local import avoids hard import dependency for non-matrix test contexts
+        from is_matrix_forge.led_matrix.controller.helpers.device_state import record_device_state
+        from is_matrix_forge.led_matrix.controller.helpers.draw_cache import invalidate_draw_cache
         from is_matrix_forge.led_matrix.hardware import animate as hw_animate
+        invalidate_draw_cache(self)
         hw_animate(self.device, enable)
+        record_device_state(self, 'animate', bool(enable))
 
     # --- Animation playback --------------------------------------------------------
 
@@ -70,12 +165,19 @@ class AnimationManager:
 
         Parameters:
             animation:
-                An Animation instance to play on this device.
+                An Animation instance to play on this device, or a
+                ``CompiledAnimation`` (played once, straight from its payloads).
 
         Raises:
             TypeError:
                 If 'animation' is not an Animation.
         """
+        from is_matrix_forge.led_matrix.display.animations.compiled import CompiledAnimation
+
+        if isinstance(animation, CompiledAnimation):
+            animation.play([self])
+            return
+
         if not isinstance(animation, Animation):
             raise TypeError(f'Expected Animation; got {type(animation)}')
         self._current_animation = animation
@@ -119,48 +221,17 @@ class AnimationManager:
             set_duration_override:
                 Optional override for all frame durations.
         """
-        from is_matrix_forge.led_matrix.display.animations.text_scroller import (
-            TextScroller,
-            TextScrollerConfig,
-        )
-
-        fm = font_map or FontMap(case_sensitive=False)
-
-        if isinstance(text, str):
-            text = text.upper()
-
-        if isinstance(fm, FontMap):
-            case_sensitive = fm.is_case_sensitive
-            glyph_map = {
-                (key if case_sensitive else str(key).upper()): fm.lookup(key)
-                for key in fm.keys()
-            }
-        elif isinstance(fm, Mapping):
-            str_items = [(str(k), v) for k, v in fm.items()]
-            case_sensitive = any(key != key.upper() for key, _ in str_items)
-            glyph_map = {
-                (key if case_sensitive else key.upper()): value
-                for key, value in str_items
-            }
-        else:
-            raise TypeError('font_map must be a FontMap or mapping of glyphs')
-
-        cfg = TextScrollerConfig(
-            text=text,
-            font_map=glyph_map,
+        anim = build_scroll_animation(
+            text,
             spacing=spacing,
             frame_duration=frame_duration,
             wrap=wrap,
             direction=direction,
-            case_sensitive=case_sensitive,
+            font_map=font_map,
+            set_duration_override=set_duration_override,
+            stream=True,
         )
 
-        scroller = TextScroller(cfg)
-        anim = scroller.generate_animation()
-
-        if set_duration_override is not None:
-            anim.set_all_frame_durations(set_duration_override)
-
         anim.loop = loop
         self._current_animation = anim
 
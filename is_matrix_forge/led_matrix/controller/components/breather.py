@@ -1,37 +1,31 @@
 # is_matrix_forge/led_matrix/controller/components/breather.py
 from __future__ import annotations
-import threading
-from time import sleep
 from is_matrix_forge.led_matrix.display.effects.breather import Breather
 
 
 class _BreatherPauseCtx:
     """
-    Context manager to pause the breathing effect during critical operations.
+    Context manager used by ``@synchronized`` to bracket hardware operations.
 
-    Safely avoids self-join if invoked from the breather thread, and restores
-    prior breathing state on exit.
+    Defers breather ticks for the duration of the operation via
+    :meth:`Breather.hold`; the breathing thread keeps running and no sleep is
+    added, so commands interleave with the brightness stream.
     """
-    def __init__(self, controller: 'BreatherMixin'):
+    def __init__(self, controller: 'BreatherManager'):
         self.controller = controller
-        self._was_breathing = False
+        self._hold = None
 
     def __enter__(self):
         b = getattr(self.controller, 'breather', None)
-        if b is None:
+        if b is None or not getattr(self.controller, 'breathing', False):
             return
-        if getattr(self.controller, 'breathing', False):
-            # avoid joining own thread
-            th = getattr(b, '_thread', None)
-            if th is threading.current_thread():
-                return
-            self._was_breathing = True
-            self.controller.breathing = False
-            sleep(0.05)
+        self._hold = b.hold()
+        self._hold.__enter__()
 
     def __exit__(self, exc_type, exc, tb):
-        if self._was_breathing:
-            self.controller.breathing = True
+        if self._hold is not None:
+            hold, self._hold = self._hold, None
+            return hold.__exit__(exc_type, exc, tb)
 
 
 class BreatherManager:
@@ -33,13 +33,15 @@ from threading import Thread
 from time import sleep
 from typing import Callable, Optional, Union
 
-from is_matrix_forge.common.helpers import percentage_to_value
+from is_matrix_forge.common.helpers import percentage_to_value, value_to_percentage
 from is_matrix_forge.led_matrix.constants import WIDTH as MATRIX_WIDTH, HEIGHT as MATRIX_HEIGHT
 from is_matrix_forge.led_matrix.hardware import (
     brightness as _set_brightness_raw,
+    get_brightness as _get_brightness_raw,
     get_framebuffer_brightness as _get_framebuffer_brightness,
 )
 from is_matrix_forge.led_matrix.errors import InvalidBrightnessError
+from is_matrix_forge.led_matrix.controller.helpers.device_state import record_device_state
 from is_matrix_forge.led_matrix.controller.helpers.threading import synchronized
 
 # Helpers (one class per file)
@@ -110,6 +112,9 @@ class BrightnessManager:
         fade_to:
             : Fade to a target (absolute or relative like '+10', '-25%').
 
+        get_brightness:
+            : Device brightness percentage, served from the device-state cache when fresh.
+
     Raises:
 
         InvalidBrightnessError:
@@ -314,6 +319,30 @@ class BrightnessManager:
         except ValueError as e:
             raise InvalidBrightnessError(raw) from e
         self._brightness = pct
+        record_device_state(self, 'brightness', pct)
+
+    def get_brightness(self, refresh: bool = False) -> Optional[int]:
+        """
+        Parameters:
+
+            refresh (bool):
+                : Query the device even if the cached value is still fresh.
+
+        Returns:
+            Optional[int]: Brightness percentage [0..100] as last known or read from the device,
+            or ``None`` if the device did not answer.
+        """
+        def _query() -> Optional[int]:
+            raw = _get_brightness_raw(self.device)
+            if raw is None:
+                return None
+            return int(round(value_to_percentage(raw)))
+
+        state = getattr(self, 'device_state', None)
+        pct = state.get('brightness', _query, refresh=refresh) if state is not None else _query()
+        if pct is not None:
+            self._brightness = pct
+        return pct
 
     @synchronized(pause_breather=False)
     def get_brightness_grid(self) -> list[list[int]]:
@@ -1,12 +1,17 @@
 from __future__ import annotations
 from typing import Optional, Literal
 from is_matrix_forge.led_matrix.controller.helpers.threading import synchronized
+from is_matrix_forge.led_matrix.controller.helpers.draw_cache import DrawCache
 from aliaser import alias, Aliases
 
 
 class DrawingManager(Aliases):
     def __init__(self, *, init_grid=None, show_grid_on_init: bool | None = None,
-                 clear_on_init: bool | None = None, **kwargs):
+                 clear_on_init: bool | None = None, dedup_draws: bool = True,
+                 draw_refresh_interval: float | None = None, **kwargs):
+        # The cache must exist before downstream mixins (e.g. IdentifyManager) draw.
+        self._draw_cache = DrawCache(refresh_after=draw_refresh_interval) if dedup_draws else None
+        self._grid_payload = None
         super().__init__(**kwargs)
         self._grid = None
         self._show_grid_on_init = show_grid_on_init
@@ -25,6 +30,10 @@ class DrawingManager(Aliases):
 
     @property
     def grid(self):
+        if self._grid is None and self._grid_payload is not None:
+            # Drawn from a packed payload; only build the Grid if someone asks.
+            from is_matrix_forge.led_matrix.display.grid import PackedGrid
+            self._grid = PackedGrid.from_payload(self._grid_payload)
         return self._grid
 
     @property
@@ -50,19 +59,100 @@ class DrawingManager(Aliases):
         self._grid = Grid(init_grid=data)
         self.draw_grid(self._grid)
 
+    @property
+    def draw_cache(self) -> Optional[DrawCache]:
+        return self._draw_cache
+
+    def invalidate_draw_cache(self) -> None:
+        """Forget the cached frame so the next ``draw_grid`` is always sent."""
+        if self._draw_cache is not None:
+            self._draw_cache.invalidate()
+
     @synchronized
-    def draw_grid(self, grid: 'Grid' = None) -> None:
+    def draw_grid(self, grid: 'Grid' = None, *, force: bool = False) -> None:
+        """
+        Draw a grid on the matrix.
+
+        Identical frames are skipped while the device is known to be showing
+        them, except when the last write is close to the firmware sleep timeout.
+
+        Parameters:
+            grid (Grid, optional):
+                The grid to draw. Defaults to the current grid.
+
+            force (bool, optional):
+                Send the frame even if it matches the cached one. Defaults to False.
+        """
         from is_matrix_forge.led_matrix.display.grid import Grid
-        from is_matrix_forge.led_matrix.display.helpers import render_matrix
-        g = grid or self._grid
+        g = grid or self.grid
         if not isinstance(g, Grid):
             g = Grid(init_grid=g)
         self._grid = g
-        render_matrix(self.device, g.grid)
+        self._grid_payload = None
+
+        self._send_draw_payload(g.to_draw_payload(), force)
+
+    @synchronized
+    def draw_payload(self, payload, *, force: bool = False) -> None:
+        """
+        Draw an already packed 39-byte ``Draw`` payload.
+
+        The fast path for precompiled animations: no ``Grid`` is built unless
+        :attr:`grid` is read later. Deduplication works as in :meth:`draw_grid`.
+
+        Parameters:
+            payload (bytes-like):
+                The packed frame (see :meth:`Grid.to_draw_payload`).
+
+            force (bool, optional):
+                Send the frame even if it matches the cached one. Defaults to False.
+
+        Raises:
+            ValueError:
+                If ``payload`` is not ``PAYLOAD_SIZE`` (39) bytes.
+        """
+        from is_matrix_forge.led_matrix.display.animations.compiled import PAYLOAD_SIZE
+
+        if len(payload) != PAYLOAD_SIZE:
+            raise ValueError(f'A Draw payload is {PAYLOAD_SIZE} bytes; got {len(payload)}')
+
+        # Keep a copy: the caller's buffer may be a view into a mapping or
+        # array that must be released (or reused) once this returns.
+        payload = bytes(payload)
+        self._grid = None
+        self._grid_payload = payload
+        self._send_draw_payload(payload, force)
+
+    def _send_draw_payload(self, payload, force: bool) -> None:
+        from is_matrix_forge.led_matrix.commands.map import CommandVals
+        from is_matrix_forge.led_matrix.hardware import send_command
+        from is_matrix_forge.led_matrix.transport import is_disconnected
+
+        cache = self._draw_cache
+        if cache is None:
+            send_command(self.device, CommandVals.Draw, payload)
+            return
+
+        if not force and cache.is_redundant(payload):
+            return
+
+        # Only a write that reached the device counts as "on screen"; failed
+        # writes are swallowed into DISCONNECTED_DEVS, so check there too.
+        try:
+            send_command(self.device, CommandVals.Draw, payload)
+        except BaseException:
+            cache.invalidate()
+            raise
+
+        if is_disconnected(self.device):
+            cache.invalidate()
+        else:
+            cache.record(payload)
 
     @synchronized
     def draw_pattern(self, pattern: str) -> None:
         from is_matrix_forge.led_matrix.display.patterns.built_in import BuiltInPatterns
+        self.invalidate_draw_cache()
         BuiltInPatterns(self).render(pattern)
 
     @synchronized
@@ -83,11 +173,13 @@ class DrawingManager(Aliases):
         if not 0 <= n <= 100:
             raise ValueError('n must be between 0 and 100 inclusive')
 
+        self.invalidate_draw_cache()
         percentage(self.device, n)
 
     @synchronized
     def show_text(self, text: str) -> None:
         from is_matrix_forge.led_matrix.display.text import show_string
+        self.invalidate_draw_cache()
         show_string(self.device, text)
 
     # @synchronized
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Deque, Literal, Optional
+from typing import Any, Literal, Optional
+
+
+EventKind = Literal['grid', 'text', 'pattern', 'percentage', 'animation', 'clear', 'restore', 'brightness']
+
+EVENT_KINDS: tuple[str, ...] = ('grid', 'text', 'pattern', 'percentage', 'animation', 'clear', 'restore', 'brightness')
 
 
 @dataclass(frozen=True, slots=True)
@@ -13,12 +18,23 @@ class DisplayEvent:
         ts: UNIX timestamp when the event was committed.
         kind: 'grid' | 'text' | 'pattern' | 'percentage' | 'animation' | 'clear' | 'restore' | 'brightness'
         meta: Lightweight metadata (e.g., {'text': 'HELLO'}).
-        grid: Optional snapshot of the grid (list of lists) if available.
+        payload: Optional 39-byte packed snapshot of the grid (``Draw`` bit order).
+
+    Properties:
+        grid: The snapshot decoded to a column-major list of lists (decoded on
+            every access; ``None`` if no snapshot was taken).
     """
     ts: float
-    kind: Literal['grid', 'text', 'pattern', 'percentage', 'animation', 'clear', 'restore', 'brightness']
+    kind: EventKind
     meta: dict[str, Any]
-    grid: Optional[list[list[int]]] = None
+    payload: Optional[bytes] = None
+
+    @property
+    def grid(self) -> Optional[list[list[int]]]:
+        if self.payload is None:
+            return None
+        from is_matrix_forge.led_matrix.display.helpers import unpack_matrix
+        return unpack_matrix(self.payload)
 
 
-__all__ = ['DisplayEvent']
+__all__ = ['DisplayEvent', 'EVENT_KINDS', 'EventKind']
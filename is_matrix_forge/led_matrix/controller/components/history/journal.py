@@ -0,0 +1,165 @@
+"""
+Append-only on-disk journal for display history.
+
+Description:
+    :class:`HistoryJournal` appends each :class:`DisplayEvent` to a binary file
+    so a controller's history survives restarts. Each record is a fixed header
+    (timestamp, kind, snapshot flag, metadata length), the metadata as JSON,
+    and the 39-byte packed snapshot when there is one. A torn record at the end
+    of the file (e.g. after a crash mid-write) is ignored on load.
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
+
+from .event import DisplayEvent, EVENT_KINDS
+from .ring import SNAPSHOT_SIZE
+
+
+_MAGIC = b'LMHJ\x01'
+_HEADER = struct.Struct('<dBBI')  # ts, kind index, has snapshot, meta length
+
+
+class HistoryJournal:
+    """
+    Append-only event journal.
+
+    Parameters:
+        path (Union[str, os.PathLike]):
+            Journal file; created (with parent directories) if missing.
+
+        fsync (bool, optional):
+            ``fsync`` after every record for crash safety. Defaults to False
+            (records are flushed to the OS but not forced to disk).
+
+    Raises:
+        ValueError:
+            If ``path`` exists but is not a history journal.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], *, fsync: bool = False):
+        self.path = Path(path)
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._fh: Optional[BinaryIO] = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size:
+            with open(self.path, 'rb') as fh:
+                if fh.read(len(_MAGIC)) != _MAGIC:
+                    raise ValueError(f'{self.path} is not a display history journal')
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Encoding
+    # ──────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _encode(event: DisplayEvent) -> bytes:
+        meta = json.dumps(event.meta, default=repr, separators=(',', ':')).encode('utf-8')
+        has_frame = event.payload is not None
+        record = _HEADER.pack(event.ts, EVENT_KINDS.index(event.kind), int(has_frame), len(meta)) + meta
+        if has_frame:
+            record += bytes(event.payload)
+        return record
+
+    @staticmethod
+    def _decode(fh: BinaryIO) -> Iterator[DisplayEvent]:
+        while True:
+            header = fh.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            ts, kind, has_frame, meta_len = _HEADER.unpack(header)
+
+            meta = fh.read(meta_len)
+            payload = fh.read(SNAPSHOT_SIZE) if has_frame else None
+            if len(meta) < meta_len or (has_frame and len(payload) < SNAPSHOT_SIZE):
+                return  # torn final record
+
+            yield DisplayEvent(
+                ts=ts,
+                kind=EVENT_KINDS[kind],
+                meta=json.loads(meta.decode('utf-8')),
+                payload=payload,
+            )
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Public API
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def load(self, limit: Optional[int] = None) -> List[DisplayEvent]:
+        """
+        Read the journal.
+
+        Parameters:
+            limit (Optional[int], optional):
+                Keep only the newest ``limit`` events.
+
+        Returns:
+            List[DisplayEvent]:
+                Events, oldest first.
+        """
+        if not self.path.exists():
+            return []
+
+        with self._lock, open(self.path, 'rb') as fh:
+            if fh.read(len(_MAGIC)) != _MAGIC:
+                return []
+            events = list(self._decode(fh))
+
+        return events[-limit:] if limit else events
+
+    def append(self, event: DisplayEvent) -> None:
+        """Append one event and flush it."""
+        record = self._encode(event)
+        with self._lock:
+            fh = self._open()
+            fh.write(record)
+            fh.flush()
+            if self.fsync:
+                os.fsync(fh.fileno())
+
+    def compact(self, events: Iterable[DisplayEvent]) -> None:
+        """
+        Atomically replace the journal with ``events``.
+
+        Used to drop records that have fallen out of the in-memory history so
+        the file does not grow without bound.
+        """
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with self._lock:
+            self._close()
+            with open(tmp, 'wb') as fh:
+                fh.write(_MAGIC)
+                for event in events:
+                    fh.write(self._encode(event))
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, self.path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Internals
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _open(self) -> BinaryIO:
+        if self._fh is None:
+            self._fh = open(self.path, 'ab')
+            if self._fh.tell() == 0:
+                self._fh.write(_MAGIC)
+        return self._fh
+
+    def _close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+__all__ = ['HistoryJournal']
@@ -1,22 +1,37 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from collections import deque
+import os
 from time import time
-from typing import Any, Deque, Literal, Optional
+from typing import Any, Optional, Union
 
 from .event import DisplayEvent
+from .journal import HistoryJournal
+from .ring import HistoryRing, SNAPSHOT_SIZE
 
 
 class DisplayHistoryManager:
     """
     Mixin that records a rolling history of what's been shown, exposes the
     current display, supports go_back(n), and can restore the last brightness.
+
+    Grid snapshots are kept as 39-byte packed frames in a preallocated ring
+    buffer and only decoded when ``current_grid``/``go_back`` need them. Pass
+    ``history_journal=<path>`` to also append every event to an on-disk
+    journal that is replayed on start-up.
     """
 
-    def __init__(self, *, history_maxlen: int = 256, **kwargs):
+    def __init__(
+        self,
+        *,
+        history_maxlen: int = 256,
+        history_journal: Union[str, os.PathLike, HistoryJournal, None] = None,
+        **kwargs,
+    ):
         # History fields must exist before any parent init triggers draws.
-        self._display_history: Deque[DisplayEvent] = deque(maxlen=history_maxlen)
+        self._display_history: HistoryRing = HistoryRing(history_maxlen)
         self._current_event: Optional[DisplayEvent] = None
+        self._history_journal: Optional[HistoryJournal] = None
+        if history_journal is not None:
+            self._open_history_journal(history_journal)
 
         # Brightness tracking
         self._current_brightness: Optional[int] = self._get_brightness()
@@ -38,6 +53,10 @@ class DisplayHistoryManager:
     def display_history(self) -> tuple[DisplayEvent, ...]:
         return tuple(self._display_history)
 
+    @property
+    def history_journal(self) -> Optional[HistoryJournal]:
+        return self._history_journal
+
     def restore_last_brightness(self) -> Optional[int]:
         """
         Revert brightness to the most recent previous value (if known).
@@ -57,10 +76,10 @@ class DisplayHistoryManager:
         kind: DisplayEvent.__annotations__['kind'],
         *,
         meta: Optional[dict[str, Any]] = None,
-        grid: Optional[list[list[int]]] = None,
+        grid: Any = None,
     ) -> None:
         if not hasattr(self, '_display_history') or self._display_history is None:
-            self._display_history = deque(maxlen=256)
+            self._display_history = HistoryRing(256)
 
         # Always try to include current brightness in event metadata (if available)
         m = dict(meta or {})
@@ -68,19 +87,57 @@ class DisplayHistoryManager:
         if b is not None and 'brightness' not in m:
             m['brightness'] = int(b)
 
-        ev = DisplayEvent(ts=time(), kind=kind, meta=m, grid=grid)
+        ev = DisplayEvent(ts=time(), kind=kind, meta=m, payload=self._snapshot(grid))
         self._current_event = ev
-        self._display_history.append(ev)
+        self._display_history.append_event(ev)
+
+        journal = getattr(self, '_history_journal', None)
+        if journal is not None:
+            journal.append(ev)
+
+    @staticmethod
+    def _snapshot(grid: Any) -> Optional[bytes]:
+        """Pack a Grid, column-major list or payload into a 39-byte snapshot."""
+        if grid is None:
+            return None
+        if isinstance(grid, (bytes, bytearray, memoryview)):
+            return bytes(grid)
+        to_payload = getattr(grid, 'to_draw_payload', None)
+        if callable(to_payload):
+            payload = bytes(to_payload())
+            if len(payload) == SNAPSHOT_SIZE:
+                return payload
+            grid = grid.grid
+        from is_matrix_forge.led_matrix.display.helpers import pack_matrix
+        return bytes(pack_matrix(grid))
+
+    def _open_history_journal(self, journal: Union[str, os.PathLike, HistoryJournal]) -> None:
+        if not isinstance(journal, HistoryJournal):
+            journal = HistoryJournal(journal)
+
+        events = journal.load(limit=self._display_history.capacity)
+        for ev in events:
+            self._display_history.append_event(ev)
+        if events:
+            self._current_event = events[-1]
+            # Drop records that no longer fit (and any torn tail) before appending.
+            journal.compact(events)
+
+        self._history_journal = journal
 
     def _get_brightness(self) -> Optional[int]:
         """
-        Best-effort probe of current brightness across possible controller APIs.
+        Best-effort lookup of current brightness across possible controller APIs.
+
+        Runs on every recorded event, so it only consults state the controller
+        already holds (the device-state cache, then brightness attributes) and
+        never queries the device.
         """
-        try:
-            if hasattr(self, 'get_brightness') and callable(getattr(self, 'get_brightness')):
-                return int(self.get_brightness())  # type: ignore[misc]
-        except Exception:
-            pass
+        state = getattr(self, '_device_state', None)
+        if state is not None:
+            cached = state.peek('brightness')
+            if cached is not None:
+                return int(cached)
         for attr in ('brightness', '_brightness', 'default_brightness'):
             try:
                 if hasattr(self, attr):
@@ -104,10 +161,11 @@ class DisplayHistoryManager:
             event = self._display_history[-n] if n > 0 else self._display_history[n]
         except IndexError:
             return None
-        if event.grid is None:
+        if event.payload is None:
             return None
-        self.draw_grid(event.grid)
-        self._record_event('restore', meta={'source': n}, grid=event.grid)
+        from is_matrix_forge.led_matrix.display.grid import PackedGrid
+        self.draw_grid(PackedGrid.from_payload(event.payload))
+        self._record_event('restore', meta={'source': n}, grid=event.payload)
         return event
 
     # --- Brightness wrapper -------------------------------------------------------
@@ -146,8 +204,7 @@ class DisplayHistoryManager:
         ret = super().clear_grid(*args, **kwargs)  # type: ignore[misc]
         grid = None
         try:
-            g = getattr(self, '_grid', None)
-            grid = [row[:] for row in getattr(g, 'grid', [])] if g is not None else None
+            grid = self._snapshot(getattr(self, '_grid', None))
         except Exception:
             pass
         self._record_event('clear', meta={}, grid=grid)
@@ -157,13 +214,17 @@ class DisplayHistoryManager:
         ret = super().draw_grid(grid, *args, **kwargs)  # type: ignore[misc]
         snap = None
         try:
-            g = getattr(self, '_grid', None)
-            snap = [row[:] for row in getattr(g, 'grid', [])] if g is not None else None
+            snap = self._snapshot(getattr(self, '_grid', None))
         except Exception:
             pass
         self._record_event('grid', meta={}, grid=snap)
         return ret
 
+    def draw_payload(self, payload, *args, **kwargs):
+        ret = super().draw_payload(payload, *args, **kwargs)  # type: ignore[misc]
+        self._record_event('grid', meta={}, grid=payload)
+        return ret
+
     def draw_pattern(self, pattern: str, *args, **kwargs):
         ret = super().draw_pattern(pattern, *args, **kwargs)  # type: ignore[misc]
         self._record_event('pattern', meta={'pattern': str(pattern)}, grid=None)
@@ -0,0 +1,142 @@
+"""
+Fixed-capacity display history with packed grid snapshots.
+
+Description:
+    Keeping a list-of-lists copy of the grid per event costs 306 boxed ints per
+    snapshot. :class:`HistoryRing` preallocates one ``bytearray`` of
+    ``capacity × 39`` bytes and stores every snapshot there in ``Draw`` payload
+    form, overwriting the oldest entry once full. Events are rebuilt on access,
+    and their grids are only decoded when ``DisplayEvent.grid`` is read.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterator, List, Optional
+
+from .event import DisplayEvent
+
+
+SNAPSHOT_SIZE = 39
+"""int: Bytes per packed snapshot (the 9×34 ``Draw`` payload)."""
+
+
+class HistoryRing:
+    """
+    Ring buffer of display events.
+
+    Parameters:
+        capacity (int):
+            Maximum number of events kept; older events are overwritten.
+
+    Raises:
+        ValueError:
+            If ``capacity`` is less than 1.
+    """
+
+    def __init__(self, capacity: int = 256):
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+
+        self._capacity = int(capacity)
+        self._frames = bytearray(self._capacity * SNAPSHOT_SIZE)
+        self._has_frame = bytearray(self._capacity)
+        self._ts = array('d', bytes(8 * self._capacity))
+        self._kinds: List[Optional[str]] = [None] * self._capacity
+        self._metas: List[Optional[dict]] = [None] * self._capacity
+        self._start = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def maxlen(self) -> int:
+        """Alias of ``capacity`` (matches :class:`collections.deque`)."""
+        return self._capacity
+
+    def append(self, ts: float, kind: str, meta: dict[str, Any], payload: Optional[bytes] = None) -> None:
+        """
+        Add an event, evicting the oldest one when full.
+
+        Parameters:
+            ts (float):
+                Event timestamp.
+
+            kind (str):
+                Event kind.
+
+            meta (dict[str, Any]):
+                Event metadata.
+
+            payload (Optional[bytes]):
+                Packed grid snapshot (exactly :data:`SNAPSHOT_SIZE` bytes), if any.
+        """
+        if self._size < self._capacity:
+            slot = (self._start + self._size) % self._capacity
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self._capacity
+
+        self._ts[slot] = ts
+        self._kinds[slot] = kind
+        self._metas[slot] = meta
+        if payload is None:
+            self._has_frame[slot] = 0
+        else:
+            if len(payload) != SNAPSHOT_SIZE:
+                raise ValueError(f'Snapshot must be {SNAPSHOT_SIZE} bytes, got {len(payload)}')
+            offset = slot * SNAPSHOT_SIZE
+            self._frames[offset:offset + SNAPSHOT_SIZE] = payload
+            self._has_frame[slot] = 1
+
+    def append_event(self, event: DisplayEvent) -> None:
+        """Add an existing :class:`DisplayEvent`."""
+        self.append(event.ts, event.kind, event.meta, event.payload)
+
+    def payload_at(self, index: int) -> Optional[bytes]:
+        """Return the packed snapshot of event ``index`` (negative indexes count from the newest)."""
+        slot = self._slot(index)
+        if not self._has_frame[slot]:
+            return None
+        offset = slot * SNAPSHOT_SIZE
+        return bytes(self._frames[offset:offset + SNAPSHOT_SIZE])
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+        self._kinds = [None] * self._capacity
+        self._metas = [None] * self._capacity
+
+    def _slot(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('history index out of range')
+        return (self._start + index) % self._capacity
+
+    def __getitem__(self, index: int) -> DisplayEvent:
+        slot = self._slot(index)
+        return DisplayEvent(
+            ts=self._ts[slot],
+            kind=self._kinds[slot],
+            meta=self._metas[slot],
+            payload=self.payload_at(index),
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[DisplayEvent]:
+        for i in range(self._size):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f'HistoryRing({self._size}/{self._capacity})'
+
+
+__all__ = ['HistoryRing', 'SNAPSHOT_SIZE']
@@ -1,6 +1,9 @@
 from __future__ import annotations
 import logging
+from threading import Event
 from time import sleep
+from typing import Optional
+from is_matrix_forge.led_matrix.controller.helpers.draw_cache import invalidate_draw_cache
 from is_matrix_forge.led_matrix.controller.helpers.threading import synchronized
 from is_matrix_forge.led_matrix.display.text import show_string as _show_string_raw
 
@@ -24,10 +27,20 @@ class IdentifyManager:
     def _greet(self):
         # cheap, safe default
         from is_matrix_forge.led_matrix.display.text import show_string as _show
+        invalidate_draw_cache(self)
         _show(self.device, 'Hello')
 
     @synchronized
-    def identify(self, *, skip_clear: bool = False, duration: float = 20.0, cycles: int = 3) -> None:
+    def identify(self, *, skip_clear: bool = False, duration: float = 20.0, cycles: int = 3,
+                 stop_event: Optional[Event] = None) -> None:
+        """
+        Cycle the slot abbreviation and port name on the matrix.
+
+        Parameters:
+            stop_event (Optional[Event], optional):
+                Ends the cycle early when set (the display is still cleared
+                unless ``skip_clear``).
+        """
         # Validate arguments to prevent division by zero or negative intervals
         if not isinstance(cycles, int) or cycles <= 0:
             raise ValueError('cycles must be a positive integer')
@@ -37,10 +50,16 @@ class IdentifyManager:
             self.clear_matrix()
         messages = (self.location_abbrev, self.device.name)
         interval = duration / (cycles * len(messages))
+        invalidate_draw_cache(self)
         for _ in range(cycles):
             for msg in messages:
+                if stop_event is not None and stop_event.is_set():
+                    break
                 _show_string_raw(self.device, msg)
-                sleep(interval)
+                if stop_event is None:
+                    sleep(interval)
+                else:
+                    stop_event.wait(interval)
         if not skip_clear and hasattr(self, 'clear_matrix'):
             self.clear_matrix()
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import threading
-from contextlib import nullcontext
+
+from is_matrix_forge.common.scheduler import Job, get_scheduler
 
 
 class KeepAliveManager:
@@ -9,25 +10,38 @@ class KeepAliveManager:
     A class that manages the keep-alive functionality of the device.
     This class is used to keep the device alive by sending a keep-alive message to the device every `keep_alive_interval` seconds.
     The keep-alive message is sent to the device every `keep_alive_interval` seconds.
+
+    Pings run as a periodic job on the shared task scheduler rather than on a
+    dedicated thread per controller.
     """
+    KEEP_ALIVE_RETRY: float = 1.0
+    """Seconds before retrying a ping skipped because another command held the device."""
+
     def __init__(self, *, keep_alive_interval: float = 50.0, **kwargs):
         super().__init__(**kwargs)  # cooperative
         self._keep_alive: bool = False
         self._KEEP_ALIVE_INTERVAL: float = float(keep_alive_interval)
-        self._keep_alive_thread: threading.Thread | None = None
-        self._keep_alive_stop_evt: threading.Event | None = None
+        self._keep_alive_job: Job | None = None
         self._keep_alive_guard = threading.Lock()
 
-    def _keep_alive_worker(self, stop_evt: threading.Event) -> None:
-        while not stop_evt.is_set():
-            lock_ctx = nullcontext()
-            if getattr(self, '_thread_safe', False):
-                lock = self.cmd_lock
-                if lock is not None:
-                    lock_ctx = lock
-            with lock_ctx:
-                self._ping()
-            stop_evt.wait(self._KEEP_ALIVE_INTERVAL)
+    def _keep_alive_tick(self) -> None:
+        lock = self.cmd_lock if getattr(self, '_thread_safe', False) else None
+        if lock is None:
+            self._ping()
+            return
+
+        # Runs on the shared scheduler thread; blocking behind a long command
+        # (identify, an animation, a fade) would stall every other job. That
+        # command is writing to the device anyway, so retry shortly instead.
+        if not lock.acquire(blocking=False):
+            job = self._keep_alive_job
+            if job is not None:
+                job.reschedule(self.KEEP_ALIVE_RETRY)
+            return
+        try:
+            self._ping()
+        finally:
+            lock.release()
 
     @property
     def keep_alive(self) -> bool:
@@ -57,25 +71,18 @@ class KeepAliveManager:
                 return
 
             if enable:
-                stop_evt = threading.Event()
-                self._keep_alive_stop_evt = stop_evt
-                thread = threading.Thread(
-                    target=self._keep_alive_worker,
-                    args=(stop_evt,),
+                # Ping right away (as the old worker did), then every interval.
+                self._keep_alive_job = get_scheduler().every(
+                    self._KEEP_ALIVE_INTERVAL,
+                    self._keep_alive_tick,
+                    delay=0.0,
                     name=f'{self.__class__.__name__}-KeepAlive-{self.device.name}',
-                    daemon=True,
                 )
-                self._keep_alive_thread = thread
-                thread.start()
                 self._keep_alive = True
                 return
 
-            stop_evt = self._keep_alive_stop_evt
-            thread = self._keep_alive_thread
-            if stop_evt is not None:
-                stop_evt.set()
-            if thread is not None and thread.is_alive():
-                thread.join(timeout=self._KEEP_ALIVE_INTERVAL + 1)
-            self._keep_alive_thread = None
-            self._keep_alive_stop_evt = None
+            job = self._keep_alive_job
+            if job is not None:
+                job.cancel(wait=True, timeout=self._KEEP_ALIVE_INTERVAL + 1)
+            self._keep_alive_job = None
             self._keep_alive = False
@@ -0,0 +1,192 @@
+"""
+Per-controller cache of device state that would otherwise need a query.
+
+Description:
+    Reading brightness, the animate flag, the firmware version or the PWM
+    frequency costs a blocking write plus a 32-byte read. Most of the time the
+    controller already knows the answer, because it set the value itself.
+    :class:`DeviceStateCache` keeps the last known value of each field. Setters
+    write through to it, queries are served from it while the value is younger
+    than its TTL, and :meth:`DeviceStateCache.invalidate` forgets values after
+    something outside the controller may have changed them.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+
+DEFAULT_STATE_TTL = 5.0
+"""float: Seconds a cached value is trusted before the device is queried again."""
+
+DEFAULT_KEY_TTLS: Mapping[str, Optional[float]] = {
+    'version': None,
+}
+"""Per-field TTL overrides; ``None`` never expires (firmware version cannot change while connected)."""
+
+_MISSING = object()
+
+
+class DeviceStateCache:
+    """
+    Cache last-known device state with a time-to-live.
+
+    Parameters:
+        ttl (Optional[float], optional):
+            Default lifetime of a value in seconds. ``None`` keeps values until
+            invalidated; ``0`` disables caching. Defaults to
+            :data:`DEFAULT_STATE_TTL`.
+
+        ttls (Optional[Mapping[str, Optional[float]]], optional):
+            Per-field overrides, merged over :data:`DEFAULT_KEY_TTLS`.
+
+        clock (Callable[[], float], optional):
+            Monotonic clock. Defaults to :func:`time.monotonic`.
+
+    Properties:
+        hits (int):
+            Lookups answered from the cache.
+
+        misses (int):
+            Lookups that had to query the device.
+    """
+
+    def __init__(
+            self,
+            ttl:   Optional[float]                           = DEFAULT_STATE_TTL,
+            ttls:  Optional[Mapping[str, Optional[float]]]   = None,
+            clock: Callable[[], float]                       = time.monotonic,
+    ):
+        self.ttl    = ttl
+        self._ttls  = {**DEFAULT_KEY_TTLS, **(ttls or {})}
+        self._clock = clock
+        self._lock  = threading.Lock()
+        self._values: Dict[str, Tuple[Any, float]] = {}
+        self.hits   = 0
+        self.misses = 0
+
+    def ttl_for(self, key: str) -> Optional[float]:
+        """Return the TTL that applies to ``key``."""
+        return self._ttls.get(key, self.ttl)
+
+    def _fresh(self, key: str) -> Any:
+        entry = self._values.get(key)
+        if entry is None:
+            return _MISSING
+
+        value, stored_at = entry
+        ttl = self.ttl_for(key)
+        if ttl is not None and self._clock() - stored_at >= ttl:
+            return _MISSING
+        return value
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """
+        Return the cached value for ``key`` without ever querying the device.
+
+        Parameters:
+            key (str):
+                The state field (``'brightness'``, ``'animate'``, ``'version'``, ``'pwm_freq'``).
+
+            default (Any, optional):
+                Returned when there is no fresh value.
+
+        Returns:
+            Any:
+                The cached value, or ``default``.
+        """
+        with self._lock:
+            value = self._fresh(key)
+        return default if value is _MISSING else value
+
+    def get(self, key: str, loader: Callable[[], Any], *, refresh: bool = False) -> Any:
+        """
+        Return ``key`` from the cache, calling ``loader`` only when it is missing or stale.
+
+        Parameters:
+            key (str):
+                The state field.
+
+            loader (Callable[[], Any]):
+                Queries the device for the current value.
+
+            refresh (bool, optional):
+                Query the device even if a fresh value is cached. Defaults to False.
+
+        Returns:
+            Any:
+                The (possibly freshly loaded) value. A loader result of ``None``
+                (the device did not answer) is returned but not cached.
+        """
+        if not refresh:
+            with self._lock:
+                value = self._fresh(key)
+                if value is not _MISSING:
+                    self.hits += 1
+                    return value
+
+        # Query outside the lock so a slow device read does not block peeks.
+        value = loader()
+        with self._lock:
+            self.misses += 1
+            if value is not None:
+                self._values[key] = (value, self._clock())
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Record ``value`` as the device's current ``key`` (write-through from setters)."""
+        with self._lock:
+            self._values[key] = (value, self._clock())
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Forget cached state.
+
+        Parameters:
+            key (Optional[str], optional):
+                The field to forget; all fields when omitted.
+        """
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
+
+
+def invalidate_device_state(controller: Any, key: Optional[str] = None) -> None:
+    """
+    Invalidate a controller's device-state cache, if it has one.
+
+    Call this after anything that may change device state behind the
+    controller's back (another process, a device reset, a raw command).
+
+    Parameters:
+        controller (Any):
+            The controller whose cached state is out of date.
+
+        key (Optional[str], optional):
+            The field to forget; all fields when omitted.
+    """
+    invalidate = getattr(controller, 'invalidate_device_state', None)
+    if callable(invalidate):
+        invalidate(key)
+
+
+def record_device_state(controller: Any, key: str, value: Any) -> None:
+    """
+    Write a value the controller just set through to its device-state cache, if it has one.
+
+    Parameters:
+        controller (Any):
+            The controller that changed the device.
+
+        key (str):
+            The state field.
+
+        value (Any):
+            The value now on the device.
+    """
+    state = getattr(controller, 'device_state', None)
+    if isinstance(state, DeviceStateCache):
+        state.set(key, value)
@@ -0,0 +1,100 @@
+"""
+Packed-frame dedup cache for ``Draw`` commands.
+
+Description:
+    Holds, paused animations and static scroller frames keep re-sending the
+    same 39-byte ``Draw`` payload. :class:`DrawCache` remembers the last payload
+    written to a device and reports when a new payload is identical, so the
+    write can be skipped. An identical payload is still resent once the last
+    write is older than ``refresh_after`` seconds, keeping the image alive
+    before the firmware sleep timeout blanks the matrix.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Optional
+
+from is_matrix_forge.led_matrix.constants import FIRMWARE_SLEEP_TIMEOUT
+
+
+DEFAULT_REFRESH_AFTER = FIRMWARE_SLEEP_TIMEOUT - 5.0
+"""Resend an unchanged frame after this many seconds (5 s margin before firmware sleep)."""
+
+
+class DrawCache:
+    """
+    Remember the last ``Draw`` payload sent to one device.
+
+    Parameters:
+        refresh_after (Optional[float], optional):
+            Seconds after which an identical payload is sent anyway. Defaults to
+            :data:`DEFAULT_REFRESH_AFTER`.
+
+        clock (Callable[[], float], optional):
+            Monotonic clock. Defaults to :func:`time.monotonic`.
+
+    Properties:
+        skipped (int):
+            Number of writes reported as redundant.
+    """
+
+    def __init__(
+            self,
+            refresh_after: Optional[float]        = None,
+            clock:         Callable[[], float]    = time.monotonic,
+    ):
+        self.refresh_after = DEFAULT_REFRESH_AFTER if refresh_after is None else float(refresh_after)
+        self._clock        = clock
+        self._payload: Optional[bytes] = None
+        self._sent_at      = 0.0
+        self.skipped       = 0
+
+    @property
+    def payload(self) -> Optional[bytes]:
+        """The last payload recorded, or ``None`` after invalidation."""
+        return self._payload
+
+    def is_redundant(self, payload: bytes) -> bool:
+        """
+        Check whether ``payload`` matches what the device is already showing.
+
+        Parameters:
+            payload (bytes):
+                The packed ``Draw`` payload about to be sent.
+
+        Returns:
+            bool:
+                True if the write can be skipped.
+        """
+        if self._payload is None or payload != self._payload:
+            return False
+        if self._clock() - self._sent_at >= self.refresh_after:
+            return False
+
+        self.skipped += 1
+        return True
+
+    def record(self, payload: bytes) -> None:
+        """Remember ``payload`` as the frame now on the device."""
+        self._payload = bytes(payload)
+        self._sent_at = self._clock()
+
+    def invalidate(self) -> None:
+        """Forget the cached frame (the display was changed by another command)."""
+        self._payload = None
+
+
+def invalidate_draw_cache(controller: Any) -> None:
+    """
+    Invalidate a controller's draw cache, if it has one.
+
+    Call this after any command that changes the display without going through
+    ``draw_grid`` (text, patterns, device-side animation, ...).
+
+    Parameters:
+        controller (Any):
+            The controller whose display was changed.
+    """
+    invalidate = getattr(controller, 'invalidate_draw_cache', None)
+    if callable(invalidate):
+        invalidate()
@@ -0,0 +1,208 @@
+"""
+Latest-wins command mailbox for threaded controllers.
+
+Description:
+    A drop-in replacement for the unbounded ``queue.Queue`` used by
+    :class:`~is_matrix_forge.led_matrix.controller.threaded.ThreadedLEDMatrixController`.
+
+    State-setting commands (``draw_grid``, ``set_brightness``) coalesce: while a
+    command of the same kind is still pending, a newer call simply replaces its
+    arguments, so only the newest value is sent once the serial link catches up.
+    Every other command (``clear``, ``animate``, ...) keeps strict FIFO order and
+    acts as a barrier, meaning a state command queued after it is never merged
+    into one queued before it.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Mapping, Optional, Tuple
+
+
+DEFAULT_COALESCE_KEYS: Mapping[str, str] = {
+    'draw_grid':      'draw',
+    'set_brightness': 'brightness',
+}
+"""Method name → coalescing slot. Calls sharing a slot replace each other while pending."""
+
+
+class _Envelope:
+    __slots__ = ('method_name', 'args', 'kwargs', 'slot')
+
+    def __init__(self, method_name: str, args: tuple, kwargs: dict, slot: Optional[str]):
+        self.method_name = method_name
+        self.args        = args
+        self.kwargs      = kwargs
+        self.slot        = slot
+
+
+class CommandMailbox:
+    """
+    Thread-safe mailbox with per-slot coalescing.
+
+    Parameters:
+        maxsize (Optional[int], optional):
+            Maximum number of pending envelopes; ``None`` or ``0`` for unbounded.
+            Coalesced updates never count against the limit.
+
+        coalesce_keys (Optional[Mapping[str, str]], optional):
+            Mapping of method names to coalescing slots. Defaults to
+            :data:`DEFAULT_COALESCE_KEYS`.
+
+    Properties:
+        coalesced (int):
+            Number of calls that replaced a still-pending call (i.e. dropped
+            stale values).
+
+        pending (int):
+            Number of envelopes waiting to be processed.
+    """
+
+    def __init__(
+            self,
+            maxsize:       Optional[int]                = None,
+            coalesce_keys: Optional[Mapping[str, str]] = None,
+    ):
+        self.maxsize       = maxsize or 0
+        self.coalesce_keys = dict(DEFAULT_COALESCE_KEYS if coalesce_keys is None else coalesce_keys)
+
+        self._queue: Deque[_Envelope] = deque()
+        self._latest: Dict[str, _Envelope] = {}
+        self._coalesced   = 0
+        self._unfinished  = 0
+
+        self._mutex       = threading.Lock()
+        self._not_empty   = threading.Condition(self._mutex)
+        self._not_full    = threading.Condition(self._mutex)
+        self._all_done    = threading.Condition(self._mutex)
+
+    @property
+    def coalesced(self) -> int:
+        return self._coalesced
+
+    @property
+    def pending(self) -> int:
+        with self._mutex:
+            return len(self._queue)
+
+    def put(
+            self,
+            method_name: str,
+            args:        tuple            = (),
+            kwargs:      Optional[dict]   = None,
+            block:       bool             = True,
+            timeout:     Optional[float]  = None,
+    ) -> bool:
+        """
+        Post a method call.
+
+        Parameters:
+            method_name (str):
+                Name of the controller method to invoke.
+
+            args (tuple, optional):
+                Positional arguments.
+
+            kwargs (Optional[dict], optional):
+                Keyword arguments.
+
+            block (bool, optional):
+                Wait for room when the mailbox is full. Defaults to True.
+
+            timeout (Optional[float], optional):
+                Maximum seconds to wait for room.
+
+        Returns:
+            bool:
+                True if the call replaced a pending call of the same slot.
+
+        Raises:
+            queue.Full:
+                If the mailbox is full and ``block`` is False or ``timeout`` expired.
+        """
+        kwargs = kwargs or {}
+        slot = self.coalesce_keys.get(method_name)
+
+        with self._mutex:
+            pending = self._latest.get(slot) if slot else None
+            if pending is not None:
+                pending.method_name = method_name
+                pending.args        = args
+                pending.kwargs      = kwargs
+                self._coalesced    += 1
+                return True
+
+            self._wait_for_room(block, timeout)
+
+            envelope = _Envelope(method_name, args, kwargs, slot)
+            self._queue.append(envelope)
+            self._unfinished += 1
+
+            if slot:
+                self._latest[slot] = envelope
+            else:
+                # Ordered command: later state updates must not jump ahead of it.
+                self._latest.clear()
+
+            self._not_empty.notify()
+            return False
+
+    def _wait_for_room(self, block: bool, timeout: Optional[float]) -> None:
+        if not self.maxsize or len(self._queue) < self.maxsize:
+            return
+        if not block:
+            raise queue.Full
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._queue) >= self.maxsize:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Full
+            self._not_full.wait(remaining)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Tuple[str, tuple, dict]:
+        """
+        Take the next call in order.
+
+        Returns:
+            Tuple[str, tuple, dict]:
+                ``(method_name, args, kwargs)``.
+
+        Raises:
+            queue.Empty:
+                If nothing is pending and ``block`` is False or ``timeout`` expired.
+        """
+        with self._not_empty:
+            if not block and not self._queue:
+                raise queue.Empty
+            if not self._not_empty.wait_for(lambda: self._queue, timeout):
+                raise queue.Empty
+
+            envelope = self._queue.popleft()
+            if envelope.slot and self._latest.get(envelope.slot) is envelope:
+                del self._latest[envelope.slot]
+
+            self._not_full.notify()
+            return envelope.method_name, envelope.args, envelope.kwargs
+
+    def task_done(self) -> None:
+        """Mark a call returned by :meth:`get` as processed."""
+        with self._all_done:
+            if self._unfinished <= 0:
+                raise ValueError('task_done() called too many times')
+            self._unfinished -= 1
+            if not self._unfinished:
+                self._all_done.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every posted call has been processed.
+
+        Returns:
+            bool:
+                False if ``timeout`` expired first.
+        """
+        with self._all_done:
+            return self._all_done.wait_for(lambda: not self._unfinished, timeout)
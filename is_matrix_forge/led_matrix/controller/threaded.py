@@ -1,11 +1,17 @@
 import threading
-import queue
-from typing import Optional, Any
+from typing import Optional, Any, Mapping
+
+from is_matrix_forge.led_matrix.controller.helpers.mailbox import CommandMailbox
 
 class ThreadedLEDMatrixController:
     """
-    Wraps an LEDMatrixController to execute commands in one or more background threads,
-    ensuring no calls are lost when invoked concurrently.
+    Wraps an LEDMatrixController to execute commands in one or more background threads.
+
+    Calls are posted to a latest-wins :class:`CommandMailbox`: while a
+    ``draw_grid`` or ``set_brightness`` call is still pending, a newer call of
+    the same kind replaces it, so a producer that draws faster than the serial
+    link cannot build up unbounded latency. Other calls (``clear``, ``animate``,
+    ...) are never dropped and run in FIFO order.
 
     Usage:
         base = LEDMatrixController(device, default_brightness=50)
@@ -15,6 +21,7 @@ class ThreadedLEDMatrixController:
         threaded.set_brightness(80)
         threaded.animate(True)
         # ...even while a long identify() or Breather is running!
+        threaded.coalesced_count  # stale draws/brightness values that were skipped
 
     Parameters:
         controller (LEDMatrixController):
@@ -25,17 +32,22 @@ class ThreadedLEDMatrixController:
 
         num_workers (int, optional):
             Number of worker threads processing the queue. Defaults to 1.
+
+        coalesce_keys (Mapping[str, str], optional):
+            Method name → coalescing slot mapping passed to the mailbox.
+            Defaults to coalescing ``draw_grid`` and ``set_brightness``.
     """
 
     def __init__(
         self,
         controller: Any,
         max_queue_size: Optional[int] = None,
-        num_workers: int = 1
+        num_workers: int = 1,
+        coalesce_keys: Optional[Mapping[str, str]] = None,
     ):
         self._controller = controller
         # infinite size if you don't care about spam limits
-        self._queue = queue.Queue(maxsize=max_queue_size) if max_queue_size else queue.Queue()
+        self._queue = CommandMailbox(maxsize=max_queue_size, coalesce_keys=coalesce_keys)
         self._workers = []
         for i in range(max(1, num_workers)):
             t = threading.Thread(target=self._worker, daemon=True, name=f"LEDWorker-{i}")
@@ -53,11 +65,31 @@ class ThreadedLEDMatrixController:
             finally:
                 self._queue.task_done()
 
+    @property
+    def mailbox(self) -> CommandMailbox:
+        """The mailbox feeding the worker threads."""
+        return self._queue
+
+    @property
+    def coalesced_count(self) -> int:
+        """Number of pending calls that were replaced by a newer call of the same kind."""
+        return self._queue.coalesced
+
     def enqueue(self, method_name: str, /, *args, **kwargs):
         """
-        Enqueue a method call by name. Raises queue.Full if the queue is full.
+        Enqueue a method call by name. Blocks while a bounded mailbox is full.
+        """
+        self._queue.put(method_name, args, kwargs)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every enqueued call has been executed.
+
+        Returns:
+            bool:
+                False if ``timeout`` expired first.
         """
-        self._queue.put((method_name, args, kwargs))
+        return self._queue.join(timeout)
 
     def __getattr__(self, name: str):
         """
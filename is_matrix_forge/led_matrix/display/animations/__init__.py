@@ -3,7 +3,16 @@ from time import sleep
 from is_matrix_forge.led_matrix.hardware import brightness
 from .animation import Animation
 from .frame import Frame
-from .audio_visualizer import AudioVisualizer
+
+
+def __getattr__(name):
+    # The visualizer pulls in numpy and the optional audio libraries; import it
+    # only when it is asked for.
+    if name == 'AudioVisualizer':
+        from .audio_visualizer import AudioVisualizer
+        return AudioVisualizer
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 def clear(dev):
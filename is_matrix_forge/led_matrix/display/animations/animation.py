@@ -1,20 +1,30 @@
 import logging
 import threading
 from threading import Event
-from typing import List, Dict, Optional, Union, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 from time import sleep  # Potentially used by Frame.play()
 import time
 from pathlib import Path
 
 from serial.tools.list_ports_common import ListPortInfo
 
+from is_matrix_forge.common.scheduler import get_scheduler
+from is_matrix_forge.led_matrix.display.animations.container import AnimationFile, ContainerFrames, is_container
 from is_matrix_forge.led_matrix.display.animations.frame.base import Frame
 from is_matrix_forge.led_matrix.helpers import get_json_from_file
 from is_matrix_forge.led_matrix.display.animations.errors import AnimationFinishedError
+from is_matrix_forge.led_matrix.display.animations.scheduler import (
+    FrameScheduler,
+    LateFramePolicy,
+    PlaybackStats,
+)
 
 
 LOGGER = logging.getLogger(__name__)
 
+PAUSED_REDRAW_INTERVAL = 1.0
+"""float: Seconds between redraws of the current frame while paused."""
+
 
 class Animation:
     """
@@ -28,7 +38,9 @@ class Animation:
             loop: bool = False,
             thread_safe: bool = False,
             breathe_on_pause: bool = False,
-            devices: Optional[List[ListPortInfo]] = None
+            devices: Optional[List[ListPortInfo]] = None,
+            late_frame_policy: Union[LateFramePolicy, str] = LateFramePolicy.CATCH_UP,
+            frame_source: Optional[Union[Iterable[Frame], Callable[[], Iterable[Frame]]]] = None,
     ):
         """
         Initialize a new Animation instance.
@@ -40,13 +52,18 @@ class Animation:
             thread_safe: run in a separate thread if True.
             breathe_on_pause: breathe effect when paused.
             devices: list of ListPortInfo LED devices.
+            late_frame_policy: what `play()` does with frames that miss their deadline
+                ('catch_up', 'skip' or 'stretch'; see :class:`LateFramePolicy`).
+            frame_source: play frames pulled from this iterable as they are needed instead
+                of from `frame_data`. Pass a zero-argument callable returning a fresh
+                iterator (e.g. a generator function) to allow looping.
         """
         # 1) set all attributes to defaults
         self._stop_event = Event()
         self.__lock = None
         self.__thread_lock = None
         self.__pause_event = None
-        self.__breathing_thread = None
+        self.__paused_display_job = None
         self.__making_thread_safe = False
         self.__breathe_on_pause = False
         self.__thread_safe = False
@@ -55,6 +72,9 @@ class Animation:
         self.__frames: List[Frame] = []
         self.__devices: List[ListPortInfo] = []
         self.__loop = False
+        self.__late_frame_policy = LateFramePolicy.CATCH_UP
+        self.__last_play_stats: Optional[PlaybackStats] = None
+        self.__frame_source = frame_source
 
         # 2) configure devices & threading
         self._configure_devices(devices, thread_safe, breathe_on_pause)
@@ -62,6 +82,7 @@ class Animation:
         # 3) apply high-level settings
         self.fallback_frame_duration = fallback_frame_duration
         self.loop = loop
+        self.late_frame_policy = late_frame_policy
 
         # 4) load any provided frames
         if frame_data:
@@ -94,6 +115,11 @@ class Animation:
         Normalize incoming frame_data (dicts or Frame instances) into self.__frames.
         """
         # detect if they already handed us Frame objects
+        if isinstance(frame_data, ContainerFrames):
+            # Frames decoded on access from a memory-mapped container; keep it lazy.
+            self.__frames = frame_data
+            return
+
         first = frame_data[0]
         if isinstance(first, Frame):
             # print('received list of frames')
@@ -223,10 +249,54 @@ class Animation:
             raise TypeError("Loop must be a boolean value.")
         self.__loop = new_value
 
+    @property
+    def late_frame_policy(self) -> LateFramePolicy:
+        """How `play()` handles frames whose deadline has already passed."""
+        return self.__late_frame_policy
+
+    @late_frame_policy.setter
+    def late_frame_policy(self, new_value: Union[LateFramePolicy, str]) -> None:
+        try:
+            self.__late_frame_policy = LateFramePolicy(new_value)
+        except ValueError:
+            valid = ', '.join(p.value for p in LateFramePolicy)
+            raise ValueError(f'late_frame_policy must be one of: {valid}; got {new_value!r}') from None
+
+    @property
+    def last_play_stats(self) -> Optional[PlaybackStats]:
+        """Timing stats (actual vs. target FPS, lateness) from the most recent `play()`."""
+        return self.__last_play_stats
+
+    @property
+    def is_streaming(self) -> bool:
+        """Whether frames are pulled lazily from a frame source rather than stored."""
+        return self.__frame_source is not None
+
     @property
     def is_empty(self) -> bool:
         """Check if the animation has any frames."""
-        return not self.__frames
+        return not self.__frames and self.__frame_source is None
+
+    def iter_frames(self) -> Iterator[Frame]:
+        """
+        Yield one pass of frames.
+
+        Stored frames are yielded from the current cursor; a frame source is
+        (re)started, and frames left at the default duration receive
+        `fallback_frame_duration`.
+        """
+        if self.__frame_source is None:
+            for i in range(self.__cursor, len(self.__frames)):
+                yield self.__frames[i]
+                self.__cursor = i + 1
+            return
+
+        source = self.__frame_source
+        for count, frame in enumerate(source() if callable(source) else source, start=1):
+            if frame.duration == Frame.DEFAULT_DURATION:
+                frame.duration = self.fallback_frame_duration
+            yield frame
+            self.__cursor = count
 
     @property
     def is_playing(self) -> bool:
@@ -329,12 +399,13 @@ class Animation:
             self.__playing = False
             self.__pause_event.clear()
 
-            if keep_frame_displayed and not self.__breathing_thread:
-                self.__breathing_thread = threading.Thread(
-                    target=self._paused_display_loop,
-                    daemon=True
+            if keep_frame_displayed and not self.__paused_display_job:
+                self.__paused_display_job = get_scheduler().every(
+                    PAUSED_REDRAW_INTERVAL,
+                    self._paused_display_loop,
+                    delay=0.0,
+                    name='Animation-paused-display',
                 )
-                self.__breathing_thread.start()
 
     def play(self, devices: Optional[List['LEDMatrixController']] = None, skip_clear_screen: bool = False) -> None:
         """
@@ -343,9 +414,14 @@ class Animation:
         Plays all frames, starting from the current cursor position.
         If `loop` is True, this animation repeats indefinitely.
 
+        Frames are paced against a monotonic-clock deadline rather than by
+        sleeping each frame's full duration after drawing it; frames that miss
+        their deadline are handled per `late_frame_policy`. Timing for the run
+        is available afterwards from `last_play_stats`.
+
         Parameters:
             devices (Optional[List[LEDMatrixController]]):
-                Device to play on (passed to `Frame.play()`).
+                Devices to draw each frame on.
 
             skip_clear_screen (Optional[bool]):
                 Skip clearing screen before playing.
@@ -361,24 +437,36 @@ class Animation:
         devices = self.__normalize_devices(devices)
 
         self._stop_event.clear()
+        # Frame N is due at t0 + sum(durations[:N]); the scheduler only sleeps
+        # for what is left of each slot, so write time does not accumulate.
+        scheduler = FrameScheduler(self.__late_frame_policy)
+        scheduler.start()
+
         # The loop below will handle cursor advancement.
         self.is_playing = True
         try:
             while self.is_playing and not self._stop_event.is_set():
-                # Iterate from current cursor to the end of frames
-                for i in range(self.__cursor, len(self.__frames)):
+                # Iterate from current cursor to the end of frames (or the source)
+                shown = 0
+                for frame in self.iter_frames():
                     if self._stop_event.is_set():
                         break
 
-                    self.play_frame(
-                        i,
-                        devices,
-                        stop_event=self._stop_event,
-                    )  # Frame.play() is responsible for its own duration (e.g., sleep)
+                    if scheduler.begin_frame(frame.duration):
+                        for device in devices:
+                            frame.draw(device)
+
+                    shown += 1
+                    scheduler.end_frame(self._stop_event)
 
                 if self._stop_event.is_set():
                     break
 
+                if self.is_streaming and not shown:
+                    # A one-shot iterator is exhausted; there is nothing left to loop.
+                    self.is_playing = False
+                    break
+
                 if self.__loop:
                     self.rewind()
                 else:
@@ -391,6 +479,8 @@ class Animation:
         except KeyboardInterrupt:
             LOGGER.info('Animation playback interrupted by user input.')
             self.stop()
+        finally:
+            self.__last_play_stats = scheduler.finish()
 
     def play_frame(
         self,
@@ -419,9 +509,9 @@ class Animation:
             self.__playing = True
             self.__pause_event.set()
 
-        if self.__breathing_thread and self.__breathing_thread.is_alive():
-            self.__breathing_thread.join(timeout=0.1)
-            self.__breathing_thread = None
+        job, self.__paused_display_job = self.__paused_display_job, None
+        if job is not None:
+            job.cancel(wait=True, timeout=0.1)
 
     def rewind(self, pos=None):
         if pos:
@@ -467,17 +557,21 @@ class Animation:
             return False
 
     def _paused_display_loop(self):
-        """Keeps redrawing the current frame while paused. Adds breathing effect if enabled."""
-        breath_phase = 0.0
-        while not self.__pause_event.is_set():
-            current_frame = self.__frames[self.cursor]
-            for device in self.devices:
-                current_frame.play(device)
-                if self.breathe_on_pause:
-                    # Placeholder: replace with real brightness method for your device
-                    brightness = 0.5 + 0.5 * abs((time.time() % 2) - 1)  # triangle wave
-                    device.set_brightness(brightness)
-            sleep(1)  # re-draw interval
+        """
+        Redraw the current frame while paused. Adds breathing effect if enabled.
+
+        Runs as a job on the shared scheduler every ``PAUSED_REDRAW_INTERVAL``
+        seconds until :meth:`resume` cancels it.
+        """
+        if self.__pause_event.is_set():
+            return
+        current_frame = self.__frames[self.cursor]
+        for device in self.devices:
+            current_frame.draw(device)
+            if self.breathe_on_pause:
+                # Placeholder: replace with real brightness method for your device
+                brightness = 0.5 + 0.5 * abs((time.time() % 2) - 1)  # triangle wave
+                device.set_brightness(brightness)
 
     def next_frame(self, device: Any = None) -> None:
         """
@@ -555,6 +649,30 @@ class Animation:
         else:
             raise IndexError(f"Frame index {frame_index} out of bounds (0-{len(self.__frames) - 1}).")
 
+    def compile(self) -> 'CompiledAnimation':
+        """
+        Pack every frame once into ready-to-send ``Draw`` payloads.
+
+        Returns:
+            CompiledAnimation:
+                Payloads and durations; see
+                :mod:`~is_matrix_forge.led_matrix.display.animations.compiled`.
+        """
+        from is_matrix_forge.led_matrix.display.animations.compiled import compile_animation
+        return compile_animation(self)
+
+    def optimize(self, keyframe_interval: int = 32) -> 'OptimizedAnimation':
+        """
+        Merge repeated frames and delta-encode the rest.
+
+        Returns:
+            OptimizedAnimation:
+                See :mod:`~is_matrix_forge.led_matrix.display.animations.optimize`;
+                its ``report`` holds the compression ratio.
+        """
+        from is_matrix_forge.led_matrix.display.animations.optimize import optimize_animation
+        return optimize_animation(self, keyframe_interval)
+
     @classmethod
     def from_file(
             cls,
@@ -563,13 +681,18 @@ class Animation:
             loop: bool = False
     ) -> 'Animation':
         """
-        Create an Animation instance from a JSON file.
+        Create an Animation instance from a JSON file or an ``.lma`` container.
 
-        The file should contain a JSON array. Each element can be:
+        The JSON file should contain a JSON array. Each element can be:
         1. A 2D grid (list of lists of 0s and 1s) - duration will be this method's
            `fallback_frame_duration`.
         2. A dictionary with a 'grid' key and an optional 'duration' key.
 
+        A binary container (see
+        :mod:`~is_matrix_forge.led_matrix.display.animations.container`) is
+        memory-mapped and its frames are decoded only as they are played or
+        seeked to.
+
         Parameters:
             filename:
                 Path to the JSON file.
@@ -591,6 +714,12 @@ class Animation:
             ValueError:
                 If file content is not a valid JSON array or frame data is invalid.
         """
+        if is_container(filename):
+            return AnimationFile(filename).to_animation(
+                loop=loop,
+                fallback_frame_duration=fallback_frame_duration,
+            )
+
         raw_data = get_json_from_file(filename)  # Expected to raise FileNotFoundError etc.
 
         if not isinstance(raw_data, list):
@@ -0,0 +1,418 @@
+"""
+Precompiled animations: ready-to-send ``Draw`` payloads plus durations.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/animations/compiled.py
+
+Description:
+    Playing a preset through :meth:`Animation.from_file` parses the JSON,
+    builds a :class:`Frame` and validated :class:`Grid` for every entry, and
+    packs each grid again on every pass of a loop. :func:`compile_animation`
+    does that work once and keeps only what the device needs: one 39-byte
+    payload and one duration per frame. :meth:`CompiledAnimation.play` then
+    streams those bytes through the usual :class:`FrameScheduler`.
+
+    :func:`load_compiled` caches compiled presets in memory and on disk under
+    the user data directory, keyed by a hash of the source file's content (and
+    the fallback duration), so a preset is only parsed the first time it is
+    seen or after it changes.
+
+Example Usage:
+    from is_matrix_forge.led_matrix.display.animations.compiled import load_compiled
+
+    compiled = load_compiled(PRESETS_DIR / 'x_animation II.json')
+    compiled.play([controller], loop=True, stop_event=stop)
+"""
+from __future__ import annotations
+
+import collections
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Event
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from is_matrix_forge.led_matrix.display.animations.scheduler import (
+    FrameScheduler,
+    LateFramePolicy,
+    PlaybackStats,
+)
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.display.animations.compiled')
+
+
+PAYLOAD_SIZE = 39
+"""Bytes in one packed 9×34 ``Draw`` payload."""
+
+FORMAT_VERSION = 1
+
+MEMORY_CACHE_SIZE = 32
+"""Compiled animations kept in memory by :func:`load_compiled`."""
+
+_MAGIC = b'LMCA'
+_HEADER = struct.Struct('<4sHHI')
+
+_MEMORY_CACHE: 'collections.OrderedDict[str, CompiledAnimation]' = collections.OrderedDict()
+_MEMORY_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CompiledAnimation:
+    """
+    An animation reduced to packed payloads and durations.
+
+    Properties:
+        payloads (bytes):
+            ``PAYLOAD_SIZE`` bytes per frame, concatenated.
+
+        durations (Tuple[float, ...]):
+            Seconds per frame.
+
+        key (str):
+            Content hash identifying the source, if known.
+    """
+    payloads:  bytes
+    durations: Tuple[float, ...]
+    key:       str = ''
+    _frames:   Tuple[bytes, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if len(self.payloads) != PAYLOAD_SIZE * len(self.durations):
+            raise ValueError(
+                f'{len(self.durations)} durations need {PAYLOAD_SIZE * len(self.durations)} payload bytes, '
+                f'got {len(self.payloads)}'
+            )
+        # Slice once here so playback only hands out existing objects.
+        frames = tuple(
+            self.payloads[i:i + PAYLOAD_SIZE] for i in range(0, len(self.payloads), PAYLOAD_SIZE)
+        )
+        object.__setattr__(self, '_frames', frames)
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def __iter__(self) -> Iterator[Tuple[bytes, float]]:
+        return zip(self._frames, self.durations)
+
+    def payload(self, index: int) -> bytes:
+        """The packed ``Draw`` payload of frame ``index``."""
+        return self._frames[index]
+
+    @property
+    def total_duration(self) -> float:
+        return sum(self.durations)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Serialization
+    # ──────────────────────────────────────────────────────────────────────
+
+    def to_bytes(self) -> bytes:
+        """Serialize for the on-disk cache."""
+        count = len(self.durations)
+        return (
+            _HEADER.pack(_MAGIC, FORMAT_VERSION, PAYLOAD_SIZE, count)
+            + struct.pack(f'<{count}d', *self.durations)
+            + self.payloads
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes, key: str = '') -> 'CompiledAnimation':
+        """
+        Load what :meth:`to_bytes` produced.
+
+        Raises:
+            ValueError:
+                If the data is not a compiled animation of this version.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError('Truncated compiled animation')
+
+        magic, version, payload_size, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != FORMAT_VERSION or payload_size != PAYLOAD_SIZE:
+            raise ValueError('Not a compiled animation of a supported version')
+
+        offset = _HEADER.size + 8 * count
+        if len(data) != offset + PAYLOAD_SIZE * count:
+            raise ValueError('Truncated compiled animation')
+
+        durations = struct.unpack_from(f'<{count}d', data, _HEADER.size)
+        return cls(bytes(data[offset:]), durations, key)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Playback
+    # ──────────────────────────────────────────────────────────────────────
+
+    def play(
+            self,
+            devices:           Union[Any, Sequence[Any]],
+            *,
+            loop:              bool                          = False,
+            stop_event:        Optional[Event]               = None,
+            late_frame_policy: Union[LateFramePolicy, str]   = LateFramePolicy.CATCH_UP,
+    ) -> PlaybackStats:
+        """
+        Send the frames to one or more devices on the frame schedule.
+
+        Parameters:
+            devices (Union[Any, Sequence[Any]]):
+                Controllers (anything with ``draw_payload``) or ``ListPortInfo``
+                devices.
+
+            loop (bool, optional):
+                Repeat until ``stop_event`` is set. Defaults to False.
+
+            stop_event (Optional[Event], optional):
+                Stops playback when set. Defaults to None.
+
+            late_frame_policy (Union[LateFramePolicy, str], optional):
+                See :class:`LateFramePolicy`. Defaults to ``CATCH_UP``.
+
+        Returns:
+            PlaybackStats:
+                Timing for the run.
+
+        Raises:
+            ValueError:
+                If ``loop`` is set without a ``stop_event``.
+        """
+        if loop and stop_event is None:
+            raise ValueError('A looping compiled animation needs a stop_event to end it')
+
+        draws = [_draw_function(device) for device in _as_list(devices)]
+        stop_event = stop_event if stop_event is not None else Event()
+        scheduler = FrameScheduler(LateFramePolicy(late_frame_policy))
+        scheduler.start()
+
+        try:
+            while not stop_event.is_set():
+                for payload, duration in zip(self._frames, self.durations):
+                    if stop_event.is_set():
+                        break
+                    if scheduler.begin_frame(duration):
+                        for draw in draws:
+                            draw(payload)
+                    scheduler.end_frame(stop_event)
+
+                if not loop or not self._frames:
+                    break
+        finally:
+            stats = scheduler.finish()
+
+        return stats
+
+
+def _as_list(devices: Union[Any, Sequence[Any]]) -> List[Any]:
+    if isinstance(devices, (list, tuple)):
+        return list(devices)
+    return [devices]
+
+
+def _draw_function(device: Any) -> Callable[[bytes], None]:
+    draw_payload = getattr(device, 'draw_payload', None)
+    if callable(draw_payload):
+        return draw_payload
+
+    from is_matrix_forge.led_matrix.commands.map import CommandVals
+    from is_matrix_forge.led_matrix.hardware import send_command
+
+    return lambda payload: send_command(device, CommandVals.Draw, payload)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Compilation
+# ──────────────────────────────────────────────────────────────────────────────
+
+def compile_frames(frames: Iterable[Any], key: str = '') -> CompiledAnimation:
+    """
+    Pack frames (anything with ``grid`` and ``duration``) into a :class:`CompiledAnimation`.
+
+    Parameters:
+        frames (Iterable[Frame]):
+            The frames, in order.
+
+        key (str, optional):
+            Cache key to attach. Defaults to a hash of the compiled content.
+
+    Returns:
+        CompiledAnimation:
+            The compiled frames.
+    """
+    payloads = []
+    durations = []
+    for frame in frames:
+        payloads.append(frame.grid.to_draw_payload())
+        durations.append(frame.duration)
+
+    return compile_payloads(payloads, durations, key)
+
+
+def compile_payloads(
+        payloads:  Iterable[Union[bytes, bytearray, memoryview]],
+        durations: Iterable[float],
+        key:       str = '',
+) -> CompiledAnimation:
+    """
+    Build a :class:`CompiledAnimation` from ready-made ``Draw`` payloads.
+
+    Parameters:
+        payloads (Iterable[bytes-like]):
+            One ``PAYLOAD_SIZE``-byte payload per frame.
+
+        durations (Iterable[float]):
+            Seconds per frame.
+
+        key (str, optional):
+            Cache key to attach. Defaults to a hash of the compiled content.
+
+    Returns:
+        CompiledAnimation:
+            The compiled frames.
+    """
+    packed = bytearray()
+    for payload in payloads:
+        if len(payload) != PAYLOAD_SIZE:
+            raise ValueError(f'Only {PAYLOAD_SIZE}-byte (9×34) frames can be compiled; got {len(payload)} bytes')
+        packed += payload
+
+    payloads = bytes(packed)
+    durations = [float(d) for d in durations]
+    if not key:
+        key = content_key(payloads + struct.pack(f'<{len(durations)}d', *durations))
+    return CompiledAnimation(payloads, tuple(durations), key)
+
+
+def compile_animation(animation: Any) -> CompiledAnimation:
+    """
+    Compile every frame of an :class:`Animation`.
+
+    Stored frames are compiled from the first one regardless of the cursor; a
+    streaming animation is run through one pass of its frame source.
+    """
+    frames = animation.iter_frames() if animation.is_streaming else animation.frames
+    return compile_frames(frames)
+
+
+def content_key(data: bytes, *extra: Any) -> str:
+    """Hash ``data`` (and ``extra``) with the compile format version into a cache key."""
+    digest = hashlib.sha256(f'{FORMAT_VERSION}:{extra!r}:'.encode('utf-8'))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """Where :func:`load_compiled` keeps compiled presets (``<user data>/compiled``)."""
+    from is_matrix_forge.common.dirs import APP_DIR
+    return APP_DIR / 'compiled'
+
+
+def load_compiled(
+        filename:                Union[str, Path],
+        fallback_frame_duration: float                      = 0.33,
+        *,
+        cache_dir:               Optional[Union[str, Path]] = None,
+        use_disk_cache:          bool                       = True,
+) -> CompiledAnimation:
+    """
+    Return the compiled form of an animation file, compiling it only when needed.
+
+    Parameters:
+        filename (Union[str, Path]):
+            A JSON animation as accepted by :meth:`Animation.from_file`.
+
+        fallback_frame_duration (float, optional):
+            Passed to :meth:`Animation.from_file`; part of the cache key.
+            Defaults to 0.33.
+
+        cache_dir (Optional[Union[str, Path]], optional):
+            On-disk cache location. Defaults to :func:`default_cache_dir`.
+
+        use_disk_cache (bool, optional):
+            Read and write the on-disk cache. Defaults to True.
+
+    Returns:
+        CompiledAnimation:
+            The compiled animation.
+
+    Raises:
+        FileNotFoundError, ValueError:
+            As :meth:`Animation.from_file` when the file has to be compiled.
+    """
+    log = MOD_LOGGER.get_child('load_compiled')
+
+    path = Path(filename)
+    key = content_key(path.read_bytes(), float(fallback_frame_duration))
+
+    with _MEMORY_CACHE_LOCK:
+        compiled = _MEMORY_CACHE.get(key)
+        if compiled is not None:
+            _MEMORY_CACHE.move_to_end(key)
+            return compiled
+
+    cache_file = Path(cache_dir or default_cache_dir()) / f'{key}.lmca'
+    compiled = None
+    if use_disk_cache and cache_file.is_file():
+        try:
+            compiled = CompiledAnimation.from_bytes(cache_file.read_bytes(), key)
+        except (OSError, ValueError) as exc:
+            log.warning(f'Ignoring unreadable compiled cache {cache_file}: {exc}')
+
+    if compiled is None:
+        from is_matrix_forge.led_matrix.display.animations.animation import Animation
+
+        log.debug(f'Compiling {path}')
+        compiled = compile_frames(Animation.from_file(path, fallback_frame_duration).frames, key)
+
+        if use_disk_cache:
+            tmp = None
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                # A unique name per writer: threads (or processes) compiling the
+                # same preset must not share a temp file.
+                with tempfile.NamedTemporaryFile(
+                        dir=cache_file.parent, prefix=f'{cache_file.name}.', suffix='.tmp', delete=False,
+                ) as handle:
+                    tmp = Path(handle.name)
+                    handle.write(compiled.to_bytes())
+                os.replace(tmp, cache_file)
+            except OSError as exc:
+                log.warning(f'Could not write compiled cache {cache_file}: {exc}')
+                if tmp is not None:
+                    tmp.unlink(missing_ok=True)
+
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE[key] = compiled
+        while len(_MEMORY_CACHE) > MEMORY_CACHE_SIZE:
+            _MEMORY_CACHE.popitem(last=False)
+
+    return compiled
+
+
+def clear_memory_cache() -> None:
+    """Forget compiled animations held in memory (the disk cache is kept)."""
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE.clear()
+
+
+__all__ = [
+    'CompiledAnimation',
+    'PAYLOAD_SIZE',
+    'clear_memory_cache',
+    'compile_animation',
+    'compile_frames',
+    'compile_payloads',
+    'content_key',
+    'default_cache_dir',
+    'load_compiled',
+]
@@ -0,0 +1,737 @@
+"""
+Binary animation container with memory-mapped, lazily decoded frames.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/animations/container.py
+
+Description:
+    JSON presets store every pixel as a list element and have to be parsed in
+    full before the first frame can be shown. An ``.lma`` container stores the
+    same animation packed:
+
+    - a fixed header (magic ``LMAN``, version, pixel format, flags, canvas
+      size, frame count and the offset of the frame index);
+    - the frame data, one block per frame;
+    - the frame index, one ``(offset, length, duration)`` entry per frame.
+
+    ``mono`` frames are bit-packed with the ``Draw`` bit order (pixel
+    ``(x, y)`` is bit ``x + width * y``, so a 9×34 frame is exactly the 39-byte
+    payload). ``grey`` frames hold one brightness byte per pixel, column by
+    column, which is the order ``StageGreyCol`` sends them in.
+
+    :class:`AnimationFile` maps the file and only decodes the frame that is
+    asked for, so seeking or playing a long clip keeps a constant amount of
+    memory. :meth:`AnimationFile.frames` is a lazy sequence an
+    :class:`Animation` can hold directly, which keeps ``Animation.cursor``
+    seeks O(1) in memory too. :class:`ContainerWriter` writes frames as they
+    arrive, and :func:`json_to_container` / :func:`container_to_json` convert
+    between this format and the JSON presets.
+
+Example Usage:
+    from is_matrix_forge.led_matrix.display.animations.container import (
+        AnimationFile,
+        json_to_container,
+    )
+
+    json_to_container(PRESETS_DIR / 'x_animation II.json', 'x_animation.lma')
+
+    with AnimationFile('x_animation.lma') as clip:
+        animation = clip.to_animation(loop=True)
+        animation.cursor = 20
+        animation.play(controller)
+
+    python -m is_matrix_forge.led_matrix.display.animations.container in.json out.lma
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence as SequenceABC
+from pathlib import Path
+from threading import Event
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from is_matrix_forge.led_matrix.display.animations.frame.base import Frame
+from is_matrix_forge.led_matrix.display.animations.scheduler import (
+    FrameScheduler,
+    LateFramePolicy,
+    PlaybackStats,
+)
+from is_matrix_forge.led_matrix.display.grid.base import Grid, MATRIX_HEIGHT, MATRIX_WIDTH
+from is_matrix_forge.led_matrix.display.grid.packed import PackedGrid
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.display.animations.container')
+
+
+MAGIC = b'LMAN'
+
+FORMAT_VERSION = 1
+
+FILE_SUFFIX = '.lma'
+
+MONO = 1
+"""Pixel format: 1 bit per pixel, ``Draw`` bit order."""
+
+GREY = 8
+"""Pixel format: 1 brightness byte per pixel, column-major."""
+
+PIXEL_FORMATS: Dict[str, int] = {'mono': MONO, 'grey': GREY}
+
+FLAG_LOOP = 0x01
+
+_HEADER = struct.Struct('<4sHBBHHIQ')
+_INDEX_ENTRY = struct.Struct('<QId')
+
+
+def frame_size(pixel_format: int, width: int, height: int) -> int:
+    """Bytes one frame of ``pixel_format`` takes on a ``width``×``height`` canvas."""
+    if pixel_format == MONO:
+        return (width * height + 7) // 8
+    if pixel_format == GREY:
+        return width * height
+    raise ValueError(f'Unknown pixel format: {pixel_format!r}')
+
+
+def _pixel_format(value: Union[int, str]) -> int:
+    if isinstance(value, str):
+        try:
+            return PIXEL_FORMATS[value.lower()]
+        except KeyError:
+            raise ValueError(f'pixel_format must be one of: {", ".join(PIXEL_FORMATS)}; got {value!r}') from None
+    if value not in (MONO, GREY):
+        raise ValueError(f'Unknown pixel format: {value!r}')
+    return value
+
+
+def is_container(path: Union[str, Path]) -> bool:
+    """Whether ``path`` starts with the container magic."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Writing
+# ──────────────────────────────────────────────────────────────────────────────
+
+class ContainerWriter:
+    """
+    Write an animation container one frame at a time.
+
+    Frame data is written as it is added; the index and final header go out
+    on :meth:`close`, so only the 20-byte index entries are kept in memory.
+
+    Parameters:
+        path (Union[str, Path]):
+            The file to create (replaced if it exists).
+
+        pixel_format (Union[int, str], optional):
+            ``'mono'``/:data:`MONO` or ``'grey'``/:data:`GREY`. Defaults to mono.
+
+        width (int, optional):
+            Canvas width. Defaults to 9.
+
+        height (int, optional):
+            Canvas height. Defaults to 34.
+
+        loop (bool, optional):
+            Stored as a hint for readers. Defaults to False.
+    """
+
+    def __init__(
+            self,
+            path:         Union[str, Path],
+            pixel_format: Union[int, str] = MONO,
+            width:        int             = MATRIX_WIDTH,
+            height:       int             = MATRIX_HEIGHT,
+            loop:         bool            = False,
+    ):
+        self.path = Path(path)
+        self.pixel_format = _pixel_format(pixel_format)
+        self.width = width
+        self.height = height
+        self.loop = loop
+        self.frame_size = frame_size(self.pixel_format, width, height)
+        self._index: List[bytes] = []
+        self._file = open(self.path, 'wb')
+        self._file.write(b'\x00' * _HEADER.size)
+
+    def __enter__(self) -> 'ContainerWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+        if exc_type is not None:
+            self.path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add_payload(self, data: Union[bytes, bytearray, memoryview], duration: float) -> None:
+        """
+        Append one frame that is already encoded in this container's pixel format.
+
+        Raises:
+            ValueError:
+                If ``data`` is not exactly one frame long or ``duration`` is negative.
+        """
+        if len(data) != self.frame_size:
+            raise ValueError(f'Expected {self.frame_size}-byte frames, got {len(data)} bytes')
+        duration = float(duration)
+        if duration < 0:
+            raise ValueError(f'duration must be non-negative, not {duration}')
+
+        self._index.append(_INDEX_ENTRY.pack(self._file.tell(), len(data), duration))
+        self._file.write(data)
+
+    def add_frame(self, frame: Union[Frame, Grid, Sequence[Sequence[int]]], duration: Optional[float] = None) -> None:
+        """
+        Encode and append one frame.
+
+        Parameters:
+            frame (Union[Frame, Grid, Sequence[Sequence[int]]]):
+                A :class:`Frame`, a :class:`Grid`, or column-major pixel values
+                (0/1 for mono, 0-255 for grey). A mono frame or grid written to
+                a grey container is stored at full brightness.
+
+            duration (Optional[float], optional):
+                Seconds to show the frame. Defaults to ``frame.duration`` for a
+                :class:`Frame`, else ``Frame.DEFAULT_DURATION``.
+        """
+        if duration is None:
+            duration = frame.duration if isinstance(frame, Frame) else Frame.DEFAULT_DURATION
+        if isinstance(frame, Frame):
+            frame = frame.grid
+
+        if self.pixel_format == MONO:
+            grid = PackedGrid.from_grid(frame)
+            self._check_size(grid.width, grid.height)
+            self.add_payload(grid.bits.to_bytes(self.frame_size, 'little'), duration)
+            return
+
+        if isinstance(frame, Grid):
+            self._check_size(frame.width, frame.height)
+            columns = [[255 if value else 0 for value in col] for col in frame.grid]
+        else:
+            columns = frame
+        self.add_payload(encode_grey(columns, self.width, self.height), duration)
+
+    def _check_size(self, width: int, height: int) -> None:
+        if (width, height) != (self.width, self.height):
+            raise ValueError(f'Frame is {width}×{height}; this container is {self.width}×{self.height}')
+
+    def close(self) -> None:
+        """Write the index and header and close the file."""
+        if self._file.closed:
+            return
+
+        index_offset = self._file.tell()
+        self._file.write(b''.join(self._index))
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            self.pixel_format,
+            FLAG_LOOP if self.loop else 0,
+            self.width,
+            self.height,
+            len(self._index),
+            index_offset,
+        ))
+        self._file.close()
+
+
+def encode_grey(columns: Iterable[Sequence[int]], width: int = MATRIX_WIDTH, height: int = MATRIX_HEIGHT) -> bytes:
+    """
+    Pack column-major brightness values into one grey frame.
+
+    Columns are truncated or zero-padded to ``height`` values and missing
+    columns are blank, matching :func:`encode_greyscale_frame`.
+    """
+    buf = bytearray(width * height)
+    for x, values in enumerate(columns):
+        if x >= width:
+            break
+        column = bytes(values)[:height]
+        buf[x * height:x * height + len(column)] = column
+    return bytes(buf)
+
+
+def write_container(
+        path:         Union[str, Path],
+        frames:       Iterable[Union[Frame, Grid]],
+        pixel_format: Union[int, str] = MONO,
+        *,
+        width:        int             = MATRIX_WIDTH,
+        height:       int             = MATRIX_HEIGHT,
+        loop:         bool            = False,
+) -> Path:
+    """
+    Write ``frames`` to a new container.
+
+    Returns:
+        Path:
+            The written file.
+    """
+    with ContainerWriter(path, pixel_format, width, height, loop) as writer:
+        for frame in frames:
+            writer.add_frame(frame)
+    return writer.path
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Reading
+# ──────────────────────────────────────────────────────────────────────────────
+
+class AnimationFile:
+    """
+    Read-only, memory-mapped view of an animation container.
+
+    Opening the file reads only the header. Frame data and index entries are
+    read from the mapping when a frame is requested.
+
+    Parameters:
+        path (Union[str, Path]):
+            The container to open.
+
+    Properties:
+        pixel_format (int):
+            :data:`MONO` or :data:`GREY`.
+
+        width, height (int):
+            Canvas size.
+
+        loop (bool):
+            The loop hint stored by the writer.
+
+    Raises:
+        ValueError:
+            If the file is not a container of a supported version, or its
+            index does not fit in the file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f'{self.path} is not an animation container')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+
+        try:
+            (magic, version, pixel_format, flags,
+             self.width, self.height, self._count, self._index_offset) = _HEADER.unpack_from(self._map)
+            if magic != MAGIC:
+                raise ValueError(f'{self.path} is not an animation container')
+            if version != FORMAT_VERSION:
+                raise ValueError(f'Unsupported animation container version {version} in {self.path}')
+            self.pixel_format = _pixel_format(pixel_format)
+            if self._index_offset + self._count * _INDEX_ENTRY.size > size:
+                raise ValueError(f'Truncated animation container: {self.path}')
+        except BaseException:
+            self.close()
+            raise
+
+        self.loop = bool(flags & FLAG_LOOP)
+        self.frame_size = frame_size(self.pixel_format, self.width, self.height)
+
+    def __enter__(self) -> 'AnimationFile':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        fmt = 'mono' if self.pixel_format == MONO else 'grey'
+        return f'AnimationFile({str(self.path)!r}, {self._count} {fmt} frames, {self.width}×{self.height})'
+
+    def close(self) -> None:
+        """Unmap and close the file. Views returned by :meth:`payload` become invalid."""
+        mapping = getattr(self, '_map', None)
+        if mapping is not None and not mapping.closed:
+            mapping.close()
+        self._file.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def _entry(self, index: int):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f'Frame index out of range (0-{self._count - 1})')
+        offset, length, duration = _INDEX_ENTRY.unpack_from(self._map, self._index_offset + index * _INDEX_ENTRY.size)
+        if length != self.frame_size or offset + length > self._index_offset:
+            raise ValueError(f'Corrupt index entry {index} in {self.path}')
+        return offset, length, duration
+
+    def duration(self, index: int) -> float:
+        """Seconds frame ``index`` is shown for."""
+        return self._entry(index)[2]
+
+    @property
+    def durations(self) -> List[float]:
+        return [self.duration(i) for i in range(self._count)]
+
+    @property
+    def total_duration(self) -> float:
+        return sum(self.duration(i) for i in range(self._count))
+
+    def payload(self, index: int) -> memoryview:
+        """
+        The raw bytes of frame ``index``, without copying.
+
+        For a 9×34 mono container this is the ``Draw`` payload.
+        """
+        offset, length, _ = self._entry(index)
+        return memoryview(self._map)[offset:offset + length]
+
+    def grid(self, index: int) -> PackedGrid:
+        """Decode frame ``index`` to a grid (grey pixels above zero are lit)."""
+        data = self.payload(index)
+        if self.pixel_format == MONO:
+            return PackedGrid.from_payload(data, self.width, self.height)
+        height = self.height
+        return PackedGrid.from_columns(
+            [[1 if v else 0 for v in data[x * height:(x + 1) * height]] for x in range(self.width)],
+            self.width,
+            height,
+        )
+
+    def grey_columns(self, index: int) -> List[memoryview]:
+        """
+        Column-major brightness of frame ``index``, one view per column.
+
+        Raises:
+            ValueError:
+                If this is a mono container.
+        """
+        if self.pixel_format != GREY:
+            raise ValueError('grey_columns() needs a grey container')
+        data = self.payload(index)
+        height = self.height
+        return [data[x * height:(x + 1) * height] for x in range(self.width)]
+
+    def frame(self, index: int) -> Frame:
+        """Decode frame ``index`` to a :class:`Frame`."""
+        return Frame(grid=self.grid(index), duration=self.duration(index), width=self.width, height=self.height)
+
+    def __getitem__(self, index: int) -> Frame:
+        return self.frame(index)
+
+    def __iter__(self) -> Iterator[Frame]:
+        for i in range(self._count):
+            yield self.frame(i)
+
+    def frames(self) -> 'ContainerFrames':
+        """A lazy frame sequence suitable for ``Animation(frame_data=...)``."""
+        return ContainerFrames(self)
+
+    def to_animation(self, loop: Optional[bool] = None, **kwargs: Any):
+        """
+        Wrap the container in an :class:`Animation` without decoding it.
+
+        Parameters:
+            loop (Optional[bool], optional):
+                Defaults to the loop hint stored in the file.
+
+            **kwargs:
+                Passed on to :class:`Animation`.
+        """
+        from is_matrix_forge.led_matrix.display.animations.animation import Animation
+
+        if loop is None:
+            loop = self.loop
+        return Animation(frame_data=self.frames() if self._count else None, loop=loop, **kwargs)
+
+    def compile(self):
+        """Load a 9×34 mono container as a :class:`CompiledAnimation` without decoding its frames."""
+        from is_matrix_forge.led_matrix.display.animations.compiled import PAYLOAD_SIZE, compile_payloads
+
+        if self.pixel_format != MONO or self.frame_size != PAYLOAD_SIZE:
+            raise ValueError('Only 9×34 mono containers can be compiled')
+        return compile_payloads((self.payload(i) for i in range(self._count)), self.durations)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Playback
+    # ──────────────────────────────────────────────────────────────────────
+
+    def play(
+            self,
+            devices:           Union[Any, Sequence[Any]],
+            *,
+            start:             int                         = 0,
+            loop:              Optional[bool]              = None,
+            stop_event:        Optional[Event]             = None,
+            late_frame_policy: Union[LateFramePolicy, str] = LateFramePolicy.CATCH_UP,
+    ) -> PlaybackStats:
+        """
+        Stream frames straight from the mapping to one or more devices.
+
+        Mono frames go out as ``Draw`` payloads (through ``draw_payload`` on
+        controllers), grey frames as a staged greyscale frame. Each frame is
+        copied out of the mapping first, so the file can be closed whatever
+        the draw callbacks hold on to.
+
+        Parameters:
+            devices (Union[Any, Sequence[Any]]):
+                Controllers or ``ListPortInfo`` devices.
+
+            start (int, optional):
+                Frame to start from; loops restart at frame 0. Defaults to 0.
+
+            loop (Optional[bool], optional):
+                Repeat until ``stop_event`` is set. Defaults to the file's hint.
+
+            stop_event (Optional[Event], optional):
+                Stops playback when set. Defaults to None.
+
+            late_frame_policy (Union[LateFramePolicy, str], optional):
+                See :class:`LateFramePolicy`. Defaults to ``CATCH_UP``.
+
+        Returns:
+            PlaybackStats:
+                Timing for the run.
+
+        Raises:
+            ValueError:
+                If looping without a ``stop_event``.
+        """
+        loop = self.loop if loop is None else loop
+        if loop and stop_event is None:
+            raise ValueError('A looping container needs a stop_event to end it')
+
+        devices = list(devices) if isinstance(devices, (list, tuple)) else [devices]
+        if self.pixel_format == MONO:
+            from is_matrix_forge.led_matrix.display.animations.compiled import _draw_function
+            draws = [_draw_function(device) for device in devices]
+
+            def payload(index: int) -> bytes:
+                return bytes(self.payload(index))
+        else:
+            draws = [_grey_draw_function(device) for device in devices]
+
+            def payload(index: int) -> List[bytes]:
+                return [bytes(column) for column in self.grey_columns(index)]
+
+        stop_event = stop_event if stop_event is not None else Event()
+        scheduler = FrameScheduler(LateFramePolicy(late_frame_policy))
+        scheduler.start()
+
+        try:
+            first = start
+            while not stop_event.is_set():
+                for i in range(first, self._count):
+                    if stop_event.is_set():
+                        break
+                    if scheduler.begin_frame(self.duration(i)):
+                        data = payload(i)
+                        for draw in draws:
+                            draw(data)
+                    scheduler.end_frame(stop_event)
+
+                if not loop or not self._count:
+                    break
+                first = 0
+        finally:
+            stats = scheduler.finish()
+
+        return stats
+
+
+def _grey_draw_function(device: Any):
+    from serial.tools.list_ports_common import ListPortInfo
+
+    from is_matrix_forge.led_matrix.display.helpers.columns import send_greyscale_frame
+
+    port = device if isinstance(device, (str, ListPortInfo)) else device.device
+    return lambda columns: send_greyscale_frame(port, columns)
+
+
+class _ContainerFrame(Frame):
+    """A decoded frame whose duration changes are remembered by its sequence."""
+
+    def __init__(self, frames: 'ContainerFrames', index: int, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._frames = frames
+        self._index = index
+
+    @Frame.duration.setter
+    def duration(self, new: Union[float, int, str]) -> None:
+        Frame.duration.fset(self, new)
+        frames = getattr(self, '_frames', None)
+        if frames is not None:
+            frames._durations[self._index] = self.duration
+
+
+class ContainerFrames(SequenceABC):
+    """
+    The frames of an :class:`AnimationFile` as a lazy, read-only sequence.
+
+    Each access decodes one frame from the mapping; nothing is cached except
+    durations changed through the returned frames (e.g. by
+    ``Animation.set_all_frame_durations``), which apply to later accesses.
+    """
+
+    def __init__(self, source: AnimationFile):
+        self.source = source
+        self._durations: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        source = self.source
+        if index < 0:
+            index += len(source)
+        duration = self._durations.get(index)
+        if duration is None:
+            duration = source.duration(index)
+        return _ContainerFrame(
+            self,
+            index,
+            grid=source.grid(index),
+            duration=duration,
+            width=source.width,
+            height=source.height,
+        )
+
+    def __repr__(self) -> str:
+        return f'ContainerFrames({self.source!r})'
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# JSON conversion
+# ──────────────────────────────────────────────────────────────────────────────
+
+def json_to_container(
+        source:                  Union[str, Path],
+        destination:             Union[str, Path],
+        pixel_format:            Union[int, str] = MONO,
+        *,
+        fallback_frame_duration: float           = 0.33,
+        loop:                    bool            = False,
+) -> Path:
+    """
+    Convert a JSON preset (either format :meth:`Animation.from_file` reads) to a container.
+
+    Entries with a ``brightness`` list (as written by :func:`container_to_json`
+    for grey containers) keep their brightness in a grey container.
+
+    Returns:
+        Path:
+            The written container.
+    """
+    from is_matrix_forge.led_matrix.helpers import get_json_from_file
+
+    raw = get_json_from_file(source)
+    if not isinstance(raw, list):
+        raise ValueError(f"File '{source}' does not contain a valid JSON array of frames.")
+
+    with ContainerWriter(destination, pixel_format, loop=loop) as writer:
+        for i, item in enumerate(raw):
+            if isinstance(item, list):
+                item = {'grid': item, 'duration': fallback_frame_duration}
+            elif not (isinstance(item, dict) and 'grid' in item):
+                raise ValueError(f"Invalid frame data type at index {i} in file '{source}'.")
+
+            duration = item.get('duration', fallback_frame_duration)
+            if writer.pixel_format == GREY and 'brightness' in item:
+                writer.add_frame(item['brightness'], duration)
+            else:
+                writer.add_frame(Frame.from_dict({**item, 'duration': duration}))
+
+    return writer.path
+
+
+def container_to_json(source: Union[str, Path], destination: Union[str, Path]) -> Path:
+    """
+    Convert a container to a JSON preset of ``{"grid", "duration"}`` frames.
+
+    Grey frames also get a ``brightness`` key with their column-major values;
+    their ``grid`` marks every pixel above zero as lit.
+
+    Returns:
+        Path:
+            The written JSON file.
+    """
+    destination = Path(destination)
+    with AnimationFile(source) as clip, open(destination, 'w') as out:
+        # Written frame by frame so the JSON side never holds the whole clip either.
+        out.write('[')
+        for i in range(len(clip)):
+            entry: Dict[str, Any] = {'grid': clip.grid(i).grid, 'duration': clip.duration(i)}
+            if clip.pixel_format == GREY:
+                entry['brightness'] = [list(col) for col in clip.grey_columns(i)]
+            out.write((',\n ' if i else '\n ') + json.dumps(entry))
+        out.write('\n]\n')
+    return destination
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Convert LED matrix animations between JSON and .lma containers.')
+    parser.add_argument('source')
+    parser.add_argument('destination')
+    parser.add_argument('--format', choices=sorted(PIXEL_FORMATS), default='mono', help='Pixel format for new containers.')
+    parser.add_argument('--duration', type=float, default=0.33, help='Duration for JSON frames without one.')
+    parser.add_argument('--loop', action='store_true', help='Mark the container as looping.')
+    args = parser.parse_args(argv)
+
+    if is_container(args.source):
+        container_to_json(args.source, args.destination)
+    else:
+        json_to_container(
+            args.source,
+            args.destination,
+            args.format,
+            fallback_frame_duration=args.duration,
+            loop=args.loop,
+        )
+
+    print(f'Wrote {args.destination}')
+    return 0
+
+
+__all__ = [
+    'AnimationFile',
+    'ContainerFrames',
+    'ContainerWriter',
+    'FILE_SUFFIX',
+    'GREY',
+    'MONO',
+    'container_to_json',
+    'encode_grey',
+    'frame_size',
+    'is_container',
+    'json_to_container',
+    'write_container',
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,6 +7,8 @@ from typing import Any, List, Optional, Tuple, Union, Literal
 from .helpers import sleep_with_cancel
 
 from is_matrix_forge.led_matrix.display.grid.base import Grid, MATRIX_WIDTH, MATRIX_HEIGHT
+from is_matrix_forge.led_matrix.display.grid.array import ArrayGrid
+from is_matrix_forge.led_matrix.display.grid.packed import PackedGrid
 
 
 class Frame:
@@ -184,6 +186,9 @@ class Frame:
                 If `src` is larger than destination.
         """
         if src.width == dst_w and src.height == dst_h:
+            if isinstance(src, (PackedGrid, ArrayGrid)):
+                # Keep the storage backend; copying it is cheap.
+                return src.copy()
             return Grid(width=dst_w, height=dst_h, fill_value=fill_value, init_grid=src.grid)
 
         if src.width <= dst_w and src.height <= dst_h:
@@ -393,15 +398,16 @@ class Frame:
             height=data.get('height'),
         )
 
-    def play(self, device: Any, stop_event: Optional[Event] = None) -> None:
+    def draw(self, device: Any) -> None:
         """
-        Play the frame on the LED matrix device.
+        Show the frame on the LED matrix device without waiting for its duration.
+
+        Timing is left to the caller (see
+        :class:`~is_matrix_forge.led_matrix.display.animations.scheduler.FrameScheduler`).
 
         Parameters:
             device (Any):
                 An object exposing `draw_grid(Grid)`.
-            stop_event (Optional[Event], optional):
-                If provided, sleep will be cancellable via this event.
 
         Raises:
             AttributeError:
@@ -411,6 +417,23 @@ class Frame:
             raise AttributeError('device.draw_grid(grid) not available')
 
         device.draw_grid(self.grid)
+        self.__number_of_plays += 1
+
+    def play(self, device: Any, stop_event: Optional[Event] = None) -> None:
+        """
+        Play the frame on the LED matrix device.
+
+        Parameters:
+            device (Any):
+                An object exposing `draw_grid(Grid)`.
+            stop_event (Optional[Event], optional):
+                If provided, sleep will be cancellable via this event.
+
+        Raises:
+            AttributeError:
+                If `device.draw_grid` is missing or not callable.
+        """
+        self.draw(device)
 
         try:
             sleep_with_cancel(self.duration, stop_event)
@@ -426,8 +449,6 @@ class Frame:
                     time.sleep(min(step, remaining))
                     remaining -= step
 
-        self.__number_of_plays += 1
-
     # ──────────────────────────────────────────────────────────────────────
     # Dunder
     # ──────────────────────────────────────────────────────────────────────
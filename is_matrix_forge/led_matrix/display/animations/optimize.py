@@ -0,0 +1,384 @@
+"""
+Shrink animations by merging repeated frames and storing the rest as deltas.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/animations/optimize.py
+
+Description:
+    Scrollers, breathing faces and most hand-drawn presets repeat frames or
+    change only a few pixels between them. :func:`optimize_animation` packs
+    each frame into its ``Draw`` payload and then:
+
+    - merges runs of consecutive identical frames into one frame shown for the
+      summed duration, so the device gets one write instead of several;
+    - stores every other frame as the XOR of its payload with the previous
+      one, run-length encoded as ``(zero bytes skipped, xor byte)`` pairs.
+
+    A frame whose delta would not be smaller than its payload is stored whole
+    (a key frame), as is every ``keyframe_interval``-th frame so a single frame
+    can be decoded without replaying the whole clip. Playing the result
+    decodes one payload at a time and shows the same pixels for the same total
+    time as the source. :class:`OptimizationReport` gives the frame counts and
+    the compression ratio against plain packed payloads.
+
+Example Usage:
+    from is_matrix_forge.led_matrix.display.animations import Animation
+
+    optimized = Animation.from_file(PRESETS_DIR / 'test7.json').optimize()
+    print(optimized.report)
+    optimized.play([controller])
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Event
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from is_matrix_forge.led_matrix.display.animations.frame.base import Frame
+from is_matrix_forge.led_matrix.display.animations.scheduler import (
+    FrameScheduler,
+    LateFramePolicy,
+    PlaybackStats,
+)
+from is_matrix_forge.led_matrix.display.grid.base import MATRIX_HEIGHT, MATRIX_WIDTH
+from is_matrix_forge.led_matrix.display.grid.packed import PackedGrid
+
+
+DEFAULT_KEYFRAME_INTERVAL = 32
+"""Frames between forced key frames."""
+
+
+@dataclass(frozen=True)
+class OptimizationReport:
+    """
+    What :func:`optimize_animation` saved.
+
+    Properties:
+        frames_in (int):
+            Frames in the source animation.
+
+        frames_out (int):
+            Frames left after merging identical neighbours (device writes per pass).
+
+        key_frames (int):
+            Frames stored whole.
+
+        raw_bytes (int):
+            Size of the source as packed payloads (``frames_in`` × payload size).
+
+        encoded_bytes (int):
+            Size of the stored key frames and deltas.
+    """
+    frames_in:     int
+    frames_out:    int
+    key_frames:    int
+    raw_bytes:     int
+    encoded_bytes: int
+
+    @property
+    def merged_frames(self) -> int:
+        return self.frames_in - self.frames_out
+
+    @property
+    def compression_ratio(self) -> float:
+        """``raw_bytes / encoded_bytes`` (1.0 for an empty animation)."""
+        return self.raw_bytes / self.encoded_bytes if self.encoded_bytes else 1.0
+
+    def __str__(self) -> str:
+        return (
+            f'{self.frames_in} → {self.frames_out} frames ({self.merged_frames} merged, '
+            f'{self.key_frames} key), {self.raw_bytes} → {self.encoded_bytes} bytes '
+            f'({self.compression_ratio:.1f}×)'
+        )
+
+
+def encode_delta(previous: bytes, current: bytes) -> bytes:
+    """
+    Run-length encode ``previous XOR current``.
+
+    The result is a sequence of ``(skip, value)`` byte pairs: advance ``skip``
+    unchanged bytes, then XOR the next byte with ``value``. Gaps longer than
+    255 bytes are bridged with ``(255, 0)`` pairs.
+    """
+    out = bytearray()
+    skip = 0
+    for a, b in zip(previous, current):
+        diff = a ^ b
+        if not diff:
+            skip += 1
+            continue
+        while skip > 255:
+            out += b'\xff\x00'
+            skip -= 256
+        out.append(skip)
+        out.append(diff)
+        skip = 0
+    return bytes(out)
+
+
+def apply_delta(buffer: bytearray, delta: bytes) -> None:
+    """Apply an :func:`encode_delta` result to ``buffer`` in place."""
+    pos = 0
+    for i in range(0, len(delta), 2):
+        pos += delta[i]
+        buffer[pos] ^= delta[i + 1]
+        pos += 1
+
+
+@dataclass(frozen=True)
+class OptimizedAnimation:
+    """
+    An animation stored as key frames and run-length encoded XOR deltas.
+
+    Entries as long as a full payload are key frames; shorter ones are deltas
+    against the previous frame.
+
+    Properties:
+        entries (Tuple[bytes, ...]):
+            One key frame or delta per frame.
+
+        durations (Tuple[float, ...]):
+            Seconds per frame (merged frames carry the summed duration).
+
+        report (OptimizationReport):
+            Sizes before and after.
+
+        width, height (int):
+            Canvas size.
+    """
+    entries:   Tuple[bytes, ...]
+    durations: Tuple[float, ...]
+    report:    OptimizationReport
+    width:     int = MATRIX_WIDTH
+    height:    int = MATRIX_HEIGHT
+
+    @property
+    def payload_size(self) -> int:
+        return (self.width * self.height + 7) // 8
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def total_duration(self) -> float:
+        return sum(self.durations)
+
+    def is_key_frame(self, index: int) -> bool:
+        return len(self.entries[index]) == self.payload_size
+
+    def payload(self, index: int) -> bytes:
+        """Decode frame ``index``, starting from the nearest key frame before it."""
+        if index < 0:
+            index += len(self.entries)
+        if not 0 <= index < len(self.entries):
+            raise IndexError(f'Frame index out of range (0-{len(self.entries) - 1})')
+
+        start = index
+        while not self.is_key_frame(start):
+            start -= 1
+
+        buffer = bytearray(self.entries[start])
+        for entry in self.entries[start + 1:index + 1]:
+            apply_delta(buffer, entry)
+        return bytes(buffer)
+
+    def iter_payloads(self) -> Iterator[Tuple[bytes, float]]:
+        """Yield ``(payload, duration)`` for each frame, decoding incrementally."""
+        size = self.payload_size
+        buffer = bytearray(size)
+        for entry, duration in zip(self.entries, self.durations):
+            if len(entry) == size:
+                buffer[:] = entry
+            else:
+                apply_delta(buffer, entry)
+            yield bytes(buffer), duration
+
+    def iter_frames(self) -> Iterator[Frame]:
+        for payload, duration in self.iter_payloads():
+            yield Frame(
+                grid=PackedGrid.from_payload(payload, self.width, self.height),
+                duration=duration,
+                width=self.width,
+                height=self.height,
+            )
+
+    def to_animation(self, loop: bool = False, **kwargs: Any):
+        """
+        A streaming :class:`Animation` that decodes frames as it plays them.
+
+        Parameters:
+            loop (bool, optional):
+                Defaults to False.
+
+            **kwargs:
+                Passed on to :class:`Animation`.
+        """
+        from is_matrix_forge.led_matrix.display.animations.animation import Animation
+        return Animation(frame_source=self.iter_frames, loop=loop, **kwargs)
+
+    def compile(self):
+        """Expand to a :class:`CompiledAnimation` (9×34 only)."""
+        from is_matrix_forge.led_matrix.display.animations.compiled import compile_payloads
+
+        payloads = [payload for payload, _ in self.iter_payloads()]
+        return compile_payloads(payloads, self.durations)
+
+    def play(
+            self,
+            devices:           Union[Any, Sequence[Any]],
+            *,
+            loop:              bool                        = False,
+            stop_event:        Optional[Event]             = None,
+            late_frame_policy: Union[LateFramePolicy, str] = LateFramePolicy.CATCH_UP,
+    ) -> PlaybackStats:
+        """
+        Send the frames to one or more devices, decoding one payload at a time.
+
+        Parameters and errors are those of :meth:`CompiledAnimation.play`.
+        """
+        from is_matrix_forge.led_matrix.display.animations.compiled import _as_list, _draw_function
+
+        if loop and stop_event is None:
+            raise ValueError('A looping optimized animation needs a stop_event to end it')
+
+        draws = [_draw_function(device) for device in _as_list(devices)]
+        stop_event = stop_event if stop_event is not None else Event()
+        scheduler = FrameScheduler(LateFramePolicy(late_frame_policy))
+        scheduler.start()
+
+        try:
+            while not stop_event.is_set():
+                for payload, duration in self.iter_payloads():
+                    if stop_event.is_set():
+                        break
+                    if scheduler.begin_frame(duration):
+                        for draw in draws:
+                            draw(payload)
+                    scheduler.end_frame(stop_event)
+
+                if not loop or not self.entries:
+                    break
+        finally:
+            stats = scheduler.finish()
+
+        return stats
+
+
+def merge_identical_frames(frames: Iterable[Frame]) -> List[Frame]:
+    """
+    Merge runs of consecutive frames with identical pixels.
+
+    Each run becomes its first frame shown for the run's summed duration. The
+    input frames are not modified.
+    """
+    merged: List[Frame] = []
+    last: Optional[PackedGrid] = None
+    for frame in frames:
+        grid = PackedGrid.from_grid(frame.grid)
+        if last is not None and grid == last:
+            merged[-1].duration = merged[-1].duration + frame.duration
+            continue
+        merged.append(Frame(grid=grid, duration=frame.duration, width=grid.width, height=grid.height))
+        last = grid
+    return merged
+
+
+def optimize_frames(
+        frames:            Iterable[Frame],
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+) -> OptimizedAnimation:
+    """
+    Merge identical neighbours and delta-encode the remaining frames.
+
+    Parameters:
+        frames (Iterable[Frame]):
+            The frames, in order. All must share one canvas size.
+
+        keyframe_interval (int, optional):
+            Store at least every this many frames whole; 0 keeps only the first
+            frame (and any frame a delta would not shrink). Defaults to
+            :data:`DEFAULT_KEYFRAME_INTERVAL`.
+
+    Returns:
+        OptimizedAnimation:
+            The encoded animation, with its :class:`OptimizationReport`.
+
+    Raises:
+        ValueError:
+            If the frames do not all have the same size, or
+            ``keyframe_interval`` is negative.
+    """
+    if keyframe_interval < 0:
+        raise ValueError(f'keyframe_interval must be non-negative, not {keyframe_interval}')
+
+    entries: List[bytes] = []
+    durations: List[float] = []
+    size: Optional[Tuple[int, int]] = None
+    frames_in = 0
+    key_frames = 0
+    since_key = 0
+    previous = b''
+
+    for frame in frames:
+        frames_in += 1
+        grid = frame.grid
+        if size is None:
+            size = (grid.width, grid.height)
+        elif (grid.width, grid.height) != size:
+            raise ValueError(f'Frame {frames_in - 1} is {grid.width}×{grid.height}; expected {size[0]}×{size[1]}')
+
+        payload = grid.to_draw_payload()
+        if payload == previous:
+            durations[-1] += frame.duration
+            continue
+
+        since_key += 1
+        key = not previous or (keyframe_interval and since_key >= keyframe_interval)
+        entry = payload if key else encode_delta(previous, payload)
+        if key or len(entry) >= len(payload):
+            entry = payload
+            key_frames += 1
+            since_key = 0
+
+        entries.append(bytes(entry))
+        durations.append(frame.duration)
+        previous = payload
+
+    width, height = size or (MATRIX_WIDTH, MATRIX_HEIGHT)
+    report = OptimizationReport(
+        frames_in=frames_in,
+        frames_out=len(entries),
+        key_frames=key_frames,
+        raw_bytes=frames_in * ((width * height + 7) // 8),
+        encoded_bytes=sum(len(entry) for entry in entries),
+    )
+    return OptimizedAnimation(tuple(entries), tuple(durations), report, width, height)
+
+
+def optimize_animation(animation: Any, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> OptimizedAnimation:
+    """
+    Optimize every frame of an :class:`Animation` (see :func:`optimize_frames`).
+
+    Stored frames are read from the first one regardless of the cursor; a
+    streaming animation is run through one pass of its frame source.
+    """
+    frames = animation.iter_frames() if animation.is_streaming else animation.frames
+    return optimize_frames(frames, keyframe_interval)
+
+
+__all__ = [
+    'DEFAULT_KEYFRAME_INTERVAL',
+    'OptimizationReport',
+    'OptimizedAnimation',
+    'apply_delta',
+    'encode_delta',
+    'merge_identical_frames',
+    'optimize_animation',
+    'optimize_frames',
+]
@@ -0,0 +1,257 @@
+"""
+Deadline-based frame scheduler.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/animations/scheduler.py
+
+Description:
+    Playing a frame used to mean "draw, then sleep for ``duration``", so the time
+    spent writing to the serial port was added to every frame and long
+    animations drifted. :class:`FrameScheduler` instead pins frame *N* to the
+    monotonic deadline ``t0 + sum(durations[:N])`` and only sleeps for whatever
+    is left of the frame's slot after drawing.
+
+    When a frame is already late, :class:`LateFramePolicy` decides what to do:
+
+    * ``CATCH_UP`` (default) – draw it anyway without waiting, keeping the
+      original timeline so later frames get back on schedule.
+    * ``SKIP`` – drop frames whose whole slot has already passed.
+    * ``STRETCH`` – re-anchor the timeline at the late frame so it still gets its
+      full duration; total playback time grows instead of frames being rushed.
+
+    Each run produces :class:`PlaybackStats` with actual vs. target FPS and the
+    worst lateness observed.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+from threading import Event
+from typing import Callable, Iterable, Optional, Union
+
+from is_matrix_forge.led_matrix.display.animations.frame.helpers import sleep_with_cancel
+
+
+class LateFramePolicy(str, Enum):
+    """What to do with a frame whose start deadline has already passed."""
+    CATCH_UP = 'catch_up'
+    SKIP = 'skip'
+    STRETCH = 'stretch'
+
+
+@dataclass(frozen=True)
+class PlaybackStats:
+    """
+    Timing summary for one scheduler run.
+
+    Properties:
+        frames_drawn (int):
+            Frames actually sent to the device(s).
+
+        frames_skipped (int):
+            Frames dropped by :attr:`LateFramePolicy.SKIP`.
+
+        target_duration (float):
+            Sum of the scheduled frame durations, in seconds.
+
+        elapsed (float):
+            Wall-clock time from start to finish, in seconds.
+
+        max_lateness (float):
+            Largest delay between a frame's deadline and its draw, in seconds.
+
+        total_lateness (float):
+            Sum of per-frame delays, in seconds.
+    """
+    frames_drawn: int = 0
+    frames_skipped: int = 0
+    target_duration: float = 0.0
+    elapsed: float = 0.0
+    max_lateness: float = 0.0
+    total_lateness: float = 0.0
+
+    @property
+    def frames_scheduled(self) -> int:
+        return self.frames_drawn + self.frames_skipped
+
+    @property
+    def target_fps(self) -> float:
+        return self.frames_scheduled / self.target_duration if self.target_duration > 0 else 0.0
+
+    @property
+    def actual_fps(self) -> float:
+        return self.frames_drawn / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mean_lateness(self) -> float:
+        return self.total_lateness / self.frames_drawn if self.frames_drawn else 0.0
+
+    @property
+    def drift(self) -> float:
+        """How much longer (positive) or shorter playback took than scheduled."""
+        return self.elapsed - self.target_duration
+
+
+class FrameScheduler:
+    """
+    Pace frames against a monotonic-clock timeline.
+
+    Parameters:
+        policy (Union[LateFramePolicy, str], optional):
+            Late-frame policy. Defaults to ``LateFramePolicy.CATCH_UP``.
+
+        clock (Callable[[], float], optional):
+            Monotonic clock in seconds. Defaults to :func:`time.monotonic`.
+
+        sleeper (Callable[[float, Optional[Event]], None], optional):
+            Cancellable sleep used to wait out a frame's slot. Defaults to
+            :func:`~is_matrix_forge.led_matrix.display.animations.frame.helpers.sleep_with_cancel`.
+
+    Example Usage:
+        scheduler = FrameScheduler('skip')
+        stats = scheduler.run(animation.frames, lambda f: f.draw(controller))
+        print(f'{stats.actual_fps:.1f}/{stats.target_fps:.1f} fps')
+    """
+
+    def __init__(
+            self,
+            policy: Union[LateFramePolicy, str] = LateFramePolicy.CATCH_UP,
+            clock: Callable[[], float] = time.monotonic,
+            sleeper: Callable[[float, Optional[Event]], None] = sleep_with_cancel,
+    ):
+        self.policy = LateFramePolicy(policy)
+        self.clock = clock
+        self.sleeper = sleeper
+
+        self._t0: Optional[float] = None
+        self._t_end: Optional[float] = None
+        self._next_deadline = 0.0
+        self._slot_end = 0.0
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self._drawn = 0
+        self._skipped = 0
+        self._target = 0.0
+        self._max_late = 0.0
+        self._total_late = 0.0
+
+    @property
+    def started(self) -> bool:
+        return self._t0 is not None
+
+    @property
+    def stats(self) -> PlaybackStats:
+        """Stats for the current (or last finished) run."""
+        if self._t0 is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._t_end if self._t_end is not None else self.clock()) - self._t0
+        return PlaybackStats(
+            frames_drawn=self._drawn,
+            frames_skipped=self._skipped,
+            target_duration=self._target,
+            elapsed=elapsed,
+            max_lateness=self._max_late,
+            total_lateness=self._total_late,
+        )
+
+    def start(self) -> None:
+        """Anchor the timeline at the current time and reset the stats."""
+        self._t0 = self.clock()
+        self._t_end = None
+        self._next_deadline = self._t0
+        self._slot_end = self._t0
+        self._reset_counters()
+
+    def begin_frame(self, duration: float) -> bool:
+        """
+        Claim the next slot on the timeline.
+
+        Parameters:
+            duration (float):
+                The frame's duration in seconds.
+
+        Returns:
+            bool:
+                True if the frame should be drawn; False if the policy skips it.
+        """
+        if self._t0 is None:
+            self.start()
+
+        start = self._next_deadline
+        now = self.clock()
+        lateness = max(0.0, now - start)
+        self._target += duration
+
+        if lateness and self.policy is LateFramePolicy.SKIP and now >= start + duration:
+            self._skipped += 1
+            self._next_deadline = self._slot_end = start + duration
+            return False
+
+        if lateness and self.policy is LateFramePolicy.STRETCH:
+            start = now
+
+        self._drawn += 1
+        self._max_late = max(self._max_late, lateness)
+        self._total_late += lateness
+        self._next_deadline = self._slot_end = start + duration
+        return True
+
+    def end_frame(self, stop_event: Optional[Event] = None) -> None:
+        """Sleep until the end of the current slot (returns early if ``stop_event`` is set)."""
+        remaining = self._slot_end - self.clock()
+        if remaining > 0:
+            self.sleeper(remaining, stop_event)
+
+    def finish(self) -> PlaybackStats:
+        """Stop the clock and return the final stats."""
+        if self._t0 is not None and self._t_end is None:
+            self._t_end = self.clock()
+        return self.stats
+
+    def run(
+            self,
+            frames: Iterable,
+            draw: Callable[[object], None],
+            stop_event: Optional[Event] = None,
+    ) -> PlaybackStats:
+        """
+        Play ``frames`` (objects with a ``duration``) on a fresh timeline.
+
+        Parameters:
+            frames (Iterable):
+                Frames to play, in order.
+
+            draw (Callable[[object], None]):
+                Called with each frame that should be shown.
+
+            stop_event (Optional[Event], optional):
+                Stops playback early when set.
+
+        Returns:
+            PlaybackStats:
+                Timing for this run.
+        """
+        self.start()
+        for frame in frames:
+            if stop_event is not None and stop_event.is_set():
+                break
+            if self.begin_frame(frame.duration):
+                draw(frame)
+            self.end_frame(stop_event)
+        return self.finish()
+
+
+__all__ = [
+    'FrameScheduler',
+    'LateFramePolicy',
+    'PlaybackStats',
+]
@@ -0,0 +1,292 @@
+"""
+Synchronized multi-device playback.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/animations/sync.py
+
+Description:
+    An animation spanned across several matrices (e.g. a message scrolling from
+    one module onto the next) only looks right when every module shows frame *N*
+    at the same moment. Playing one :class:`Animation` per controller on its own
+    thread lets each timeline drift independently, and the halves tear apart.
+
+    :class:`SynchronizedPlayer` drives all of them from one
+    :class:`~is_matrix_forge.led_matrix.display.animations.scheduler.FrameScheduler`
+    timeline. At each frame deadline a barrier releases one writer thread per
+    device simultaneously, and no device starts frame *N + 1* until every device
+    has finished frame *N*. The spread between the first and last write of each
+    frame (the *skew*) is measured and reported in :class:`SyncStats`.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from threading import Event
+from typing import Any, Callable, List, Mapping, Optional, Union
+
+from is_matrix_forge.led_matrix.display.animations.animation import Animation
+from is_matrix_forge.led_matrix.display.animations.frame.helpers import sleep_with_cancel
+from is_matrix_forge.led_matrix.display.animations.scheduler import (
+    FrameScheduler,
+    LateFramePolicy,
+    PlaybackStats,
+)
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.display.animations.sync')
+
+DEFAULT_SKEW_BUDGET = 0.010
+"""float: Skew (seconds) above which a frame is counted as out of sync."""
+
+
+class _AnyEvent:
+    """Duck-typed ``Event`` that is set when any of the given events is."""
+
+    def __init__(self, *events: Optional[Event]):
+        self._events = [event for event in events if event is not None]
+
+    def is_set(self) -> bool:
+        return any(event.is_set() for event in self._events)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        # Callers poll in short slices (see sleep_with_cancel), so waiting on
+        # the first event and re-checking the rest is enough.
+        return self._events[0].wait(timeout) or self.is_set()
+
+
+@dataclass(frozen=True)
+class SyncStats:
+    """
+    Timing summary for one synchronized run.
+
+    Properties:
+        playback (PlaybackStats):
+            Timeline stats shared by all devices (FPS, lateness).
+
+        devices (int):
+            Number of devices driven.
+
+        max_skew (float):
+            Largest first-to-last write completion spread for any frame, in seconds.
+
+        mean_skew (float):
+            Average spread across drawn frames, in seconds.
+
+        skew_budget (float):
+            The configured budget.
+
+        frames_over_budget (int):
+            Frames whose skew exceeded ``skew_budget``.
+    """
+    playback: PlaybackStats
+    devices: int
+    max_skew: float
+    mean_skew: float
+    skew_budget: float
+    frames_over_budget: int
+
+    @property
+    def within_budget(self) -> bool:
+        return self.frames_over_budget == 0
+
+
+class SynchronizedPlayer:
+    """
+    Play one animation per device on a shared clock.
+
+    Parameters:
+        animations (Mapping[Any, Animation]):
+            Device → animation. Each device must expose a synchronous
+            ``draw_grid(grid)``; all animations must have the same number of
+            frames. Frame durations come from the first animation.
+
+        late_frame_policy (Union[LateFramePolicy, str], optional):
+            Policy for frames that miss their deadline. Defaults to the first
+            animation's ``late_frame_policy``.
+
+        skew_budget (float, optional):
+            Skew (seconds) considered in sync. Defaults to :data:`DEFAULT_SKEW_BUDGET`.
+
+        loop (Optional[bool], optional):
+            Repeat until stopped. Defaults to the first animation's ``loop``.
+
+        clock (Callable[[], float], optional):
+            Monotonic clock. Defaults to :func:`time.monotonic`.
+
+    Raises:
+        ValueError:
+            If no animations are given or their frame counts differ.
+    """
+
+    def __init__(
+            self,
+            animations: Mapping[Any, Animation],
+            *,
+            late_frame_policy: Optional[Union[LateFramePolicy, str]] = None,
+            skew_budget: float = DEFAULT_SKEW_BUDGET,
+            loop: Optional[bool] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        if not animations:
+            raise ValueError('SynchronizedPlayer needs at least one animation.')
+
+        self._devices: List[Any] = list(animations.keys())
+        self._animations: List[Animation] = list(animations.values())
+
+        counts = {len(anim.frames) for anim in self._animations}
+        if len(counts) != 1:
+            raise ValueError(f'All spanned animations must have the same frame count; got {sorted(counts)}')
+
+        leader = self._animations[0]
+        self.late_frame_policy = LateFramePolicy(late_frame_policy or leader.late_frame_policy)
+        self.skew_budget = skew_budget
+        self.loop = leader.loop if loop is None else loop
+        self.clock = clock
+
+        self._stop_event = Event()
+        self._last_stats: Optional[SyncStats] = None
+
+    @property
+    def devices(self) -> List[Any]:
+        return list(self._devices)
+
+    @property
+    def last_stats(self) -> Optional[SyncStats]:
+        return self._last_stats
+
+    def stop(self) -> None:
+        """Stop playback after the frame currently being written."""
+        self._stop_event.set()
+
+    def play(self, stop_event: Optional[Event] = None) -> SyncStats:
+        """
+        Play all animations in lockstep and block until done (or stopped).
+
+        Parameters:
+            stop_event (Optional[Event], optional):
+                An external event that also stops playback.
+
+        Returns:
+            SyncStats:
+                Timeline and skew stats for the run.
+
+        Raises:
+            Exception:
+                The first error raised by any device's ``draw_grid``.
+        """
+        log = MOD_LOGGER.get_child('play')
+
+        self._stop_event.clear()
+        stop = _AnyEvent(self._stop_event, stop_event)
+
+        n = len(self._devices)
+        frames_per_device = [anim.frames for anim in self._animations]
+        durations = [frame.duration for frame in frames_per_device[0]]
+
+        state = {'index': 0, 'halt': False}
+        done_at: List[float] = [0.0] * n
+        errors: List[Optional[BaseException]] = [None] * n
+        go = threading.Barrier(n + 1)
+        done = threading.Barrier(n + 1)
+
+        def _writer(slot: int) -> None:
+            device, frames = self._devices[slot], frames_per_device[slot]
+            try:
+                while True:
+                    go.wait()
+                    if state['halt']:
+                        return
+                    try:
+                        frames[state['index']].draw(device)
+                    except BaseException as exc:  # surfaced by the coordinator
+                        errors[slot] = exc
+                    done_at[slot] = self.clock()
+                    done.wait()
+            except threading.BrokenBarrierError:
+                # The coordinator aborted the barriers (finished, or interrupted mid-frame).
+                return
+
+        writers = [
+            threading.Thread(target=_writer, args=(i,), daemon=True, name=f'SyncWriter-{i}')
+            for i in range(n)
+        ]
+        for writer in writers:
+            writer.start()
+
+        scheduler = FrameScheduler(self.late_frame_policy, clock=self.clock, sleeper=sleep_with_cancel)
+        max_skew = total_skew = 0.0
+        over_budget = skewed_frames = 0
+        failure: Optional[BaseException] = None
+
+        scheduler.start()
+        try:
+            while not stop.is_set():
+                for index, duration in enumerate(durations):
+                    if stop.is_set():
+                        break
+
+                    if scheduler.begin_frame(duration):
+                        state['index'] = index
+                        go.wait()
+                        done.wait()
+
+                        failure = next((e for e in errors if e is not None), None)
+                        if failure is not None:
+                            break
+
+                        skew = max(done_at) - min(done_at)
+                        skewed_frames += 1
+                        total_skew += skew
+                        max_skew = max(max_skew, skew)
+                        if skew > self.skew_budget:
+                            over_budget += 1
+
+                    scheduler.end_frame(stop)
+
+                if failure is not None or not self.loop:
+                    break
+        finally:
+            # Abort rather than wait: after an interrupt the writers may be
+            # parked on either barrier, and waiting on ``go`` would deadlock.
+            state['halt'] = True
+            go.abort()
+            done.abort()
+            for writer in writers:
+                writer.join()
+
+        self._last_stats = SyncStats(
+            playback=scheduler.finish(),
+            devices=n,
+            max_skew=max_skew,
+            mean_skew=total_skew / skewed_frames if skewed_frames else 0.0,
+            skew_budget=self.skew_budget,
+            frames_over_budget=over_budget,
+        )
+
+        if failure is not None:
+            raise failure
+
+        if over_budget:
+            log.warning(
+                f'{over_budget} frame(s) exceeded the {self.skew_budget * 1000:.1f} ms skew budget '
+                f'(max {max_skew * 1000:.1f} ms across {n} devices)'
+            )
+        else:
+            log.debug(f'Synchronized playback on {n} devices; max skew {max_skew * 1000:.2f} ms')
+
+        return self._last_stats
+
+
+__all__ = [
+    'DEFAULT_SKEW_BUDGET',
+    'SyncStats',
+    'SynchronizedPlayer',
+]
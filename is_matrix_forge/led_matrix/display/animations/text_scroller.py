@@ -1,9 +1,11 @@
+import itertools
+from collections import deque
 from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Dict, List, Callable
+from typing import Deque, Dict, Iterator, List
 
 from is_matrix_forge.led_matrix.display.grid.base import MATRIX_WIDTH, MATRIX_HEIGHT
-from is_matrix_forge.led_matrix.display.grid import Grid
+from is_matrix_forge.led_matrix.display.grid import Grid, PackedGrid
 from is_matrix_forge.led_matrix.display.animations.animation import Animation, Frame
 from .text.glyph_normalizer import GlyphNormalizer, GlyphRows
 
@@ -38,7 +40,7 @@ class TextScrollerConfig:
 
 
 class TextScroller:
-    """Generates scrolling-text Animations in horizontal or vertical directions."""
+    """Generates scrolling-text Animations (eager or streamed) in horizontal or vertical directions."""
 
     VALID_DIRS = {"horizontal", "vertical_up", "vertical_down"}
     VALID_FIT_MODES = ("error", "truncate", "clip")
@@ -64,161 +66,224 @@ class TextScroller:
 
         self._rows_map = normalized_map
 
-    def generate_animation(self) -> Animation:
-        '''
-        Build and return the scrolling-text Animation.
-
-        Raises:
-            ValueError:
-                If any character is missing from the font_map, or if a glyph exceeds
-                MATRIX_HEIGHT and fit='error'.
-        '''
-        source_map = self._rows_map
+    # ──────────────────────────────────────────────────────────────────────────
+    # Glyph preparation
+    # ──────────────────────────────────────────────────────────────────────────
 
+    def _fit_mode(self) -> str:
         legacy_fit = {'crop': 'truncate', 'scale': 'clip'}
         fit_mode = legacy_fit.get(self.config.fit, self.config.fit)
         if fit_mode not in self.VALID_FIT_MODES:
             valid_str = ', '.join(self.VALID_FIT_MODES)
             raise ValueError(f"Invalid fit mode '{self.config.fit}'. Valid options are: {valid_str}")
+        return fit_mode
+
+    def _lookup_key(self, ch: str) -> str:
+        return ch if self.config.case_sensitive else ch.upper()
 
-        transform: Callable[[str], str]
-        transform = (lambda c: c) if self.config.case_sensitive else str.upper
-
-        def center_crop_rows(rows: GlyphRows, target_h: int) -> GlyphRows:
-            if len(rows) <= target_h:
-                return [r[:] for r in rows]
-            trim = len(rows) - target_h
-            top = trim // 2
-            return [row[:] for row in rows[top:top + target_h]]
-
-        def downscale_rows_or_pool(rows: GlyphRows, target_h: int) -> GlyphRows:
-            src_h = len(rows)
-            if src_h <= target_h:
-                return [r[:] for r in rows]
-            out: GlyphRows = []
-            width = len(rows[0]) if rows and rows[0] else 0
-            for t in range(target_h):
-                start = int(t * src_h / target_h)
-                end = int((t + 1) * src_h / target_h)
-                if end == start:
-                    end = min(start + 1, src_h)
-                pooled = [0] * width
-                for r in range(start, end):
-                    src_row = rows[r]
-                    for c in range(width):
-                        pooled[c] = 1 if (pooled[c] or src_row[c]) else 0
-                out.append(pooled)
-            return out
-
-        glyphs: List[GlyphRows] = []
-        for ch in self.config.text:
-            lookup = transform(ch)
-            raw = source_map.get(lookup)
+    def _validate_text(self, fit_mode: str) -> None:
+        """Fail before the first frame for missing or oversized glyphs (checks each distinct character once)."""
+        for ch in dict.fromkeys(self.config.text):
+            raw = self._rows_map.get(self._lookup_key(ch))
             if raw is None:
                 raise ValueError(f'Character {ch!r} not found in font_map')
-            glyph_rows = [row[:] for row in raw]
-            if len(glyph_rows) > MATRIX_HEIGHT:
-                if fit_mode == 'truncate':
-                    glyph_rows = center_crop_rows(glyph_rows, MATRIX_HEIGHT)
-                elif fit_mode == 'clip':
-                    glyph_rows = downscale_rows_or_pool(glyph_rows, MATRIX_HEIGHT)
-                else:
-                    raise ValueError(f'Font height {len(glyph_rows)} > display height {MATRIX_HEIGHT}')
-            glyphs.append(glyph_rows)
-
-        frames: List[Frame] = []
-
-        if not glyphs:
-            if self.config.text:
-                raise ValueError('No glyphs could be generated for the configured text')
-            blank = Grid()
-            frames.append(Frame(grid=blank))
-            anim = Animation(frame_data=frames)
-            anim.set_all_frame_durations(self.config.frame_duration)
-            return anim
-
-        # --- horizontal scroll ---------------------------------------------------
+            if len(raw) > MATRIX_HEIGHT and fit_mode == 'error':
+                raise ValueError(f'Font height {len(raw)} > display height {MATRIX_HEIGHT}')
+
+    @staticmethod
+    def _center_crop_rows(rows: GlyphRows, target_h: int) -> GlyphRows:
+        if len(rows) <= target_h:
+            return [r[:] for r in rows]
+        trim = len(rows) - target_h
+        top = trim // 2
+        return [row[:] for row in rows[top:top + target_h]]
+
+    @staticmethod
+    def _downscale_rows_or_pool(rows: GlyphRows, target_h: int) -> GlyphRows:
+        src_h = len(rows)
+        if src_h <= target_h:
+            return [r[:] for r in rows]
+        out: GlyphRows = []
+        width = len(rows[0]) if rows and rows[0] else 0
+        for t in range(target_h):
+            start = int(t * src_h / target_h)
+            end = int((t + 1) * src_h / target_h)
+            if end == start:
+                end = min(start + 1, src_h)
+            pooled = [0] * width
+            for r in range(start, end):
+                src_row = rows[r]
+                for c in range(width):
+                    pooled[c] = 1 if (pooled[c] or src_row[c]) else 0
+            out.append(pooled)
+        return out
+
+    def _glyph(self, ch: str, fit_mode: str) -> GlyphRows:
+        raw = self._rows_map.get(self._lookup_key(ch))
+        if raw is None:
+            raise ValueError(f'Character {ch!r} not found in font_map')
+        if len(raw) <= MATRIX_HEIGHT:
+            return raw
+        if fit_mode == 'truncate':
+            return self._center_crop_rows(raw, MATRIX_HEIGHT)
+        if fit_mode == 'clip':
+            return self._downscale_rows_or_pool(raw, MATRIX_HEIGHT)
+        raise ValueError(f'Font height {len(raw)} > display height {MATRIX_HEIGHT}')
+
+    @staticmethod
+    def _glyph_width(glyph: GlyphRows) -> int:
+        return len(glyph[0]) if glyph and glyph[0] else 0
+
+    def _frame(self, grid: Grid) -> Frame:
+        return Frame(grid=grid, duration=self.config.frame_duration)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Frame sources
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _iter_text_columns(self, fit_mode: str) -> Iterator[List[int]]:
+        """Yield the message's canvas columns left to right, one glyph at a time."""
+        spacing_col = [0] * MATRIX_HEIGHT
+        for index, ch in enumerate(self.config.text):
+            if index:
+                for _ in range(self.config.spacing):
+                    yield spacing_col
+            glyph = self._glyph(ch, fit_mode)
+            h = len(glyph)
+            vpad = max((MATRIX_HEIGHT - h) // 2, 0)
+            tail = [0] * (MATRIX_HEIGHT - vpad - h)
+            for c in range(self._glyph_width(glyph)):
+                yield [0] * vpad + [row[c] for row in glyph] + tail
+
+    def _iter_horizontal(self, fit_mode: str) -> Iterator[Frame]:
+        columns = self._iter_text_columns(fit_mode)
+        first = next(columns, None)
+        if first is None:
+            yield self._frame(Grid())
+            return
+        columns = itertools.chain([first], columns)
+
+        blank = [0] * MATRIX_HEIGHT
+        wrap = getattr(self.config, 'wrap', False)
+
+        # The ring holds exactly the MATRIX_WIDTH columns on screen; each step
+        # pushes one new column in on the right and drops one off the left.
+        ring: Deque[List[int]] = deque(maxlen=MATRIX_WIDTH)
+        if wrap:
+            # Start with the first screenful already visible and stop once the
+            # window's left edge reaches the last column.
+            ring.extend(itertools.islice(columns, MATRIX_WIDTH))
+            shown = len(ring)
+            ring.extend([blank] * (MATRIX_WIDTH - shown))
+            yield self._frame(PackedGrid.from_columns(ring))
+            trailing = MATRIX_WIDTH - 1 if shown == MATRIX_WIDTH else shown - 1
+            for col in itertools.chain(columns, itertools.repeat(blank, trailing)):
+                ring.append(col)
+                yield self._frame(PackedGrid.from_columns(ring))
+            return
+
+        ring.extend([blank] * MATRIX_WIDTH)
+        yield self._frame(PackedGrid.from_columns(ring))
+        for col in itertools.chain(columns, itertools.repeat(blank, MATRIX_WIDTH - 1)):
+            ring.append(col)
+            yield self._frame(PackedGrid.from_columns(ring))
+
+    def _iter_text_rows(self, fit_mode: str, render_w: int, reverse: bool) -> Iterator[List[int]]:
+        """Yield the stacked message's rows (top-down, or bottom-up if ``reverse``)."""
+        blank = [0] * render_w
+        text = reversed(self.config.text) if reverse else self.config.text
+        for index, ch in enumerate(text):
+            if index:
+                for _ in range(self.config.spacing):
+                    yield blank
+            glyph = self._glyph(ch, fit_mode)
+            gw = self._glyph_width(glyph)
+            x0 = (render_w - gw) // 2
+            rows = reversed(glyph) if reverse else glyph
+            for src in rows:
+                row = [0] * render_w
+                for c in range(gw):
+                    if src[c]:
+                        row[x0 + c] = 1
+                yield row
+
+    def _iter_vertical(self, fit_mode: str) -> Iterator[Frame]:
+        render_w = max(
+            (self._glyph_width(self._rows_map[self._lookup_key(ch)]) for ch in dict.fromkeys(self.config.text)),
+            default=0,
+        )
+        if render_w == 0:
+            yield self._frame(Grid())
+            return
+        if render_w > MATRIX_WIDTH:
+            raise ValueError(f'Glyph width {render_w} exceeds display width {MATRIX_WIDTH}')
+
+        blank = [0] * render_w
+        x_pad = (MATRIX_WIDTH - render_w) // 2
+        pad_cols = [[0] * MATRIX_HEIGHT for _ in range(x_pad)]
+        upward = self.config.direction == 'vertical_up'
+
+        def _grid(ring: Deque[List[int]]) -> Grid:
+            cols = [[row[c] for row in ring] for c in range(render_w)]
+            return PackedGrid.from_columns(pad_cols + cols)
+
+        # The ring holds the MATRIX_HEIGHT rows on screen. Scrolling up feeds
+        # rows in at the bottom; scrolling down feeds them in at the top.
+        ring: Deque[List[int]] = deque([blank] * MATRIX_HEIGHT, maxlen=MATRIX_HEIGHT)
+        push = ring.append if upward else ring.appendleft
+        yield self._frame(_grid(ring))
+        rows = self._iter_text_rows(fit_mode, render_w, reverse=not upward)
+        for row in itertools.chain(rows, itertools.repeat(blank, MATRIX_HEIGHT)):
+            push(row)
+            yield self._frame(_grid(ring))
+
+    def iter_frames(self) -> Iterator[Frame]:
+        """
+        Lazily yield the scrolling-text frames.
+
+        Only the glyph being scrolled in and a screen-sized ring buffer of
+        columns (or rows, for vertical scrolling) are kept, so time-to-first-frame
+        and memory use do not depend on the length of the text.
+
+        Raises:
+            ValueError:
+                If any character is missing from the font_map, or if a glyph exceeds
+                MATRIX_HEIGHT and fit='error'.
+        """
+        fit_mode = self._fit_mode()
+        self._validate_text(fit_mode)
+
+        if not self.config.text:
+            yield self._frame(Grid())
+            return
+
         if self.config.direction == 'horizontal':
-            glyph_ws = [len(g[0]) if g and g[0] else 0 for g in glyphs]
-            total_w = sum(glyph_ws) + self.config.spacing * (len(glyph_ws) - 1 if glyph_ws else 0)
-
-            # canvas is rows×total_w, height = MATRIX_HEIGHT
-            if total_w == 0:
-                frames.append(Frame())
-                anim = Animation(frame_data=frames)
-                anim.set_all_frame_durations(self.config.frame_duration)
-                return anim
-
-            canvas = [[0] * max(total_w, 1) for _ in range(MATRIX_HEIGHT)]
-            x = 0
-            for g, w in zip(glyphs, glyph_ws):
-                h = len(g)
-                vpad = max((MATRIX_HEIGHT - h) // 2, 0)
-                for r in range(h):
-                    if w:
-                        canvas[vpad + r][x:x + w] = g[r]
-                x += w + self.config.spacing
-
-            offsets = range(total_w) if getattr(self.config, 'wrap', False) else range(-MATRIX_WIDTH, total_w)
-            for off in offsets:
-                window = [
-                    [canvas[r][off + c] if 0 <= off + c < total_w else 0 for c in range(MATRIX_WIDTH)]
-                    for r in range(MATRIX_HEIGHT)
-                ]
-                cols = [[window[r][c] for r in range(MATRIX_HEIGHT)] for c in range(MATRIX_WIDTH)]
-                frames.append(Frame(grid=Grid(init_grid=cols)))
-
-        # --- vertical scroll -----------------------------------------------------
+            yield from self._iter_horizontal(fit_mode)
         else:
-            # Stack glyphs vertically with spacing, centered horizontally
-            # 1) compute per-glyph sizes
-            glyph_hs = [len(g) if g else 0 for g in glyphs]
-            glyph_ws = [len(g[0]) if g and g[0] else 0 for g in glyphs]
-            if all(w == 0 for w in glyph_ws):
-                blank_grid = Grid()
-                frames.append(Frame(grid=blank_grid))
-                anim = Animation(frame_data=frames)
-                anim.set_all_frame_durations(self.config.frame_duration)
-                return anim
-            render_w = max(glyph_ws)
-            total_h = sum(glyph_hs) + self.config.spacing * (len(glyphs) - 1 if glyphs else 0)
-
-            # 2) build a tall canvas (rows x cols)
-            canvas = [[0] * render_w for _ in range(max(total_h, 1))]
-
-            # 3) blit each glyph centered horizontally
-            y = 0
-            for g, gh, gw in zip(glyphs, glyph_hs, glyph_ws):
-                x0 = (render_w - gw) // 2  # center horizontally
-                for r in range(gh):
-                    yy = y + r
-                    if 0 <= yy < total_h and gw:
-                        row = canvas[yy]
-                        # OR the pixels in (no bounds issues because x0..x0+gw is inside render_w)
-                        for c in range(gw):
-                            if g[r][c]:
-                                row[x0 + c] = 1
-                y += gh + self.config.spacing
-
-            # 4) slide a MATRIX_HEIGHT window up or down over the tall canvas
-            if self.config.direction == 'vertical_up':
-                # Start fully above the top and slide down across the canvas,
-                # which makes the content appear to move upward on the display.
-                offsets = range(-MATRIX_HEIGHT, total_h + 1)
-            else:  # 'vertical_down'
-                # Start fully below the bottom and slide up across the canvas,
-                # which makes the content appear to move downward on the display.
-                offsets = range(total_h, -MATRIX_HEIGHT - 1, -1)
-
-            for off in offsets:
-                # Extract a MATRIX_HEIGHT x render_w window at vertical offset 'off'
-                window_rows = [
-                    [canvas[off + r][c] if 0 <= off + r < total_h else 0 for c in range(render_w)]
-                    for r in range(MATRIX_HEIGHT)
-                ]
-                cols = self._normalizer.rows_to_cols(window_rows)
-                frames.append(Frame(grid=Grid(init_grid=cols)))
-        anim = Animation(frame_data=frames)
+            yield from self._iter_vertical(fit_mode)
+
+    def stream_animation(self, loop: bool = False) -> Animation:
+        """
+        Return an Animation that pulls frames from :meth:`iter_frames` as it plays.
+
+        Parameters:
+            loop (bool, optional):
+                Restart the stream after the last frame. Defaults to False.
+        """
+        # Validate eagerly so errors surface here rather than mid-playback.
+        fit_mode = self._fit_mode()
+        self._validate_text(fit_mode)
+        return Animation(frame_source=self.iter_frames, loop=loop)
+
+    def generate_animation(self) -> Animation:
+        '''
+        Build and return the scrolling-text Animation.
+
+        Raises:
+            ValueError:
+                If any character is missing from the font_map, or if a glyph exceeds
+                MATRIX_HEIGHT and fit='error'.
+        '''
+        anim = Animation(frame_data=list(self.iter_frames()))
         anim.set_all_frame_durations(self.config.frame_duration)
         return anim
-
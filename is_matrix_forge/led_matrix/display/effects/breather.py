@@ -1,7 +1,8 @@
 import threading
-import time
 import contextlib
+from typing import Optional
 from is_matrix_forge.common.decorators.freeze_setter import freeze_setter
+from is_matrix_forge.common.scheduler import Job, get_scheduler
 from is_matrix_forge.log_engine import ROOT_LOGGER, Loggable
 
 
@@ -12,6 +13,12 @@ class Breather(Loggable):
     """
     Controls a “breathing” (fade in/out) effect on a controller’s brightness.
 
+    Breathing is a periodic job on the shared task scheduler: a paced stream of
+    brightness writes that shares the device transport with everything else.
+    It is never stopped to make room for other commands. Instead, :meth:`hold`
+    (used by ``@synchronized``) defers ticks while a command runs, and the next
+    tick fires as soon as the command returns.
+
     Parameters:
         controller:
             Any object with a mutable `brightness` attribute (0–100).
@@ -31,10 +38,13 @@ class Breather(Loggable):
     Methods:
 
         start():
-            Launch the breathing loop in a background thread.
+            Register the breathing job with the shared scheduler.
 
         stop():
-            Halt the breathing loop and join the thread.
+            Cancel the breathing job and restore the initial brightness.
+
+        hold():
+            Context manager that defers brightness ticks without cancelling the job.
     """
     def __init__(
             self,
@@ -51,6 +61,9 @@ class Breather(Loggable):
         self._step           = None
         self._fps            = None
         self._pause_event = threading.Event()
+        # One token per active hold. list.append/pop are atomic, so entering and
+        # leaving a hold never takes a lock.
+        self._holds: list = []
 
         self.controller = controller
         log = self.class_logger
@@ -68,7 +81,10 @@ class Breather(Loggable):
         )
 
         self._breathing = False
-        self._thread    = None
+        self._job: Optional[Job] = None
+        self._current   = 0
+        self._going_up  = True
+        self._deferred  = False
 
     @property
     def breathing(self) -> bool:
@@ -180,64 +196,91 @@ class Breather(Loggable):
 
         self._fps = float(new)
 
-    def _breath_loop(self):
-        interval = 1.0 / self._fps
-        current = max(self._min_brightness, min(self.controller.brightness, self._max_brightness))
-        going_up = True
-
-        def next_brightness(curr, up):
-            """Calculate next brightness value and direction."""
-
-            self.method_logger.debug("Getting next brightness value (up=%s)", up)
-            if up:
-                self.method_logger.debug("Getting next brightness value (up=%s)", up)
-                next_val = curr + self._step
-                if next_val >= self._max_brightness:
-                    return self._max_brightness, False
-                return next_val, True
-            else:
-                self.method_logger.debug("Getting next brightness value (up=%s)", up)
-                next_val = curr - self._step
-                if next_val <= self._min_brightness:
-                    return self._min_brightness, True
-                return next_val, False
-
-        while self._breathing:
-            # Handle pause
-            if self._pause_event.is_set():
-                self.method_logger.debug("Breathing paused, sleeping")
-                time.sleep(interval)
-                continue
-
-            # Update brightness
-            current, going_up = next_brightness(current, going_up)
-            self.controller.brightness = current
-
-            time.sleep(interval)
+    @property
+    def held(self) -> bool:
+        """Whether a command currently holds off brightness ticks."""
+        return bool(self._holds)
+
+    @contextlib.contextmanager
+    def hold(self):
+        """
+        Defer brightness ticks while the body runs.
+
+        Entering and leaving is lock-free and never sleeps or stops the
+        breathing job; a tick that came due during the hold is written as soon
+        as the last hold is released. A no-op when not breathing or when called
+        from the scheduler thread itself.
+        """
+        if not self._breathing or get_scheduler().in_scheduler_thread():
+            yield
+            return
+
+        self._holds.append(None)
+        try:
+            yield
+        finally:
+            self._holds.pop()
+            if not self._holds and self._deferred:
+                self._deferred = False
+                job = self._job
+                if job is not None:
+                    job.reschedule(0.0)
+
+    # ``@synchronized`` looks for ``breather.paused``.
+    paused = hold
+
+    def _next_brightness(self, curr, up):
+        """Calculate next brightness value and direction."""
+        self.method_logger.debug("Getting next brightness value (up=%s)", up)
+        if up:
+            next_val = curr + self._step
+            if next_val >= self._max_brightness:
+                return self._max_brightness, False
+            return next_val, True
+        else:
+            next_val = curr - self._step
+            if next_val <= self._min_brightness:
+                return self._min_brightness, True
+            return next_val, False
+
+    def _tick(self):
+        # Handle pause / a command in flight: the release reschedules us
+        if self._pause_event.is_set() or self._holds:
+            self._deferred = True
+            return
+
+        self._current, self._going_up = self._next_brightness(self._current, self._going_up)
+        self.controller.brightness = self._current
 
     def start(self):
         """
-        Begin the breathing effect in a background daemon thread.
+        Begin the breathing effect as a periodic job on the shared scheduler.
         No effect if already running.
         """
         self.method_logger.debug('Starting breathing effect')
 
         if not self._breathing:
             self._breathing = True
-            self._thread = threading.Thread(target=self._breath_loop, daemon=True)
-            self._thread.start()
+            self._current = max(self._min_brightness, min(self.controller.brightness, self._max_brightness))
+            self._going_up = True
+            self._deferred = False
+            self._job = get_scheduler().every(
+                1.0 / self._fps,
+                self._tick,
+                delay=0.0,
+                name=f'Breather-{id(self):x}',
+            )
 
         self.method_logger.debug('Breathing effect started')
 
     def stop(self):
         """
-        Stop the breathing effect and wait for the thread to finish.
+        Stop the breathing effect and wait for an in-flight tick to finish.
         """
         self._breathing = False
-        if self._thread:
-            if threading.current_thread() is not self._thread:
-                self._thread.join()
-            self._thread = None
+        job, self._job = self._job, None
+        if job is not None:
+            job.cancel(wait=True)
 
         self.method_logger.debug('Breathing effect stopped')
         self.method_logger.debug(f'Setting brightness to initial value {self.initial_brightness}.')
@@ -0,0 +1,397 @@
+"""
+Shared-memory framebuffers for external frame producers.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/framebuffer.py
+
+Description:
+    A producer (another process, a game loop, a shader toy) that wants to drive
+    a matrix used to go through a controller or the daemon socket, paying for
+    a round trip and the serial write on every frame. Instead it can map a
+    small per-device file and write raw 9×34 frames into it;
+    :class:`FrameBufferWriter` runs a thread in the library that picks up the
+    newest generation and sends it with
+    :func:`~is_matrix_forge.led_matrix.display.helpers.render_matrix`.
+    Producers never block on the serial port and frames they overwrite before
+    the writer gets to them are simply dropped.
+
+    File layout (little-endian)::
+
+        0   magic    b'LMFB'
+        4   version  uint16
+        6   width    uint16   (9)
+        8   height   uint16   (34)
+        10  reserved uint16
+        12  reserved uint32
+        16  sequence uint64   odd while a frame is being written
+        32  pixels   width * height bytes, pixel (x, y) at x + width * y
+
+    The sequence counter is a seqlock: the producer makes it odd, writes the
+    pixels, then makes it even. Readers retry while it is odd or if it moved
+    during the copy. There is one producer per buffer. A producer that dies
+    mid-write leaves the counter odd; the writer then reports it once and
+    waits for the next write (a restarted producer simply carries on).
+
+Example Usage:
+    # Producer process
+    from is_matrix_forge.led_matrix.display.framebuffer import SharedFrameBuffer
+
+    with SharedFrameBuffer.for_device(dev) as fb:
+        fb.write(frame_bytes)        # 306 bytes, row after row
+
+    # Library side
+    from is_matrix_forge.led_matrix.display.framebuffer import FrameBufferWriter
+
+    writer = FrameBufferWriter(dev).start()
+    ...
+    writer.stop()
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Sequence, Tuple, Union
+
+from is_matrix_forge.led_matrix.constants import HEIGHT, WIDTH
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.display.framebuffer')
+
+
+MAGIC = b'LMFB'
+VERSION = 1
+
+FRAME_SIZE = WIDTH * HEIGHT
+
+_HEADER = struct.Struct('<4sHHHHI')
+_SEQUENCE = struct.Struct('<Q')
+_SEQUENCE_OFFSET = 16
+PIXELS_OFFSET = 32
+FILE_SIZE = PIXELS_OFFSET + FRAME_SIZE
+
+FRAMEBUFFER_ENV_VAR = 'LED_MATRIX_FRAMEBUFFER_DIR'
+"""Environment variable overriding the directory framebuffers live in."""
+
+_READ_RETRIES = 100
+
+
+def framebuffer_path(dev: Any) -> Path:
+    """
+    Return the framebuffer file for a device.
+
+    The file is keyed by the device's serial number when it has one (so it
+    survives the port being renumbered), otherwise by its port name. It lives
+    in ``$LED_MATRIX_FRAMEBUFFER_DIR`` or the per-user runtime directory.
+
+    Parameters:
+        dev (ListPortInfo | str):
+            The device, or a name to use directly.
+
+    Returns:
+        Path:
+            The framebuffer path.
+    """
+    if isinstance(dev, str):
+        key = dev
+    else:
+        key = getattr(dev, 'serial_number', None) or getattr(dev, 'name', None) or getattr(dev, 'device', '')
+
+    key = re.sub(r'[^A-Za-z0-9_.-]+', '_', str(key)).strip('_.') or 'default'
+
+    override = os.environ.get(FRAMEBUFFER_ENV_VAR)
+    if override:
+        directory = Path(override).expanduser()
+    else:
+        from is_matrix_forge.common.dirs import APP_DIRS
+        directory = APP_DIRS.user_runtime_path / 'framebuffers'
+
+    return directory / f'{key}.fb'
+
+
+class SharedFrameBuffer:
+    """
+    A memory-mapped 9×34 framebuffer with a generation counter.
+
+    Opening a path that does not exist yet creates and initializes it, so the
+    producer and the writer may start in either order.
+
+    Parameters:
+        path (Union[str, Path]):
+            The backing file.
+
+    Raises:
+        ValueError:
+            If the file exists but is not a framebuffer of this version and size.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size < FILE_SIZE:
+                os.ftruncate(fd, FILE_SIZE)
+            self._map = mmap.mmap(fd, FILE_SIZE)
+        finally:
+            os.close(fd)
+
+        header = _HEADER.unpack_from(self._map, 0)
+        if header[0] == b'\x00' * 4:
+            _HEADER.pack_into(self._map, 0, MAGIC, VERSION, WIDTH, HEIGHT, 0, 0)
+        elif header[:4] != (MAGIC, VERSION, WIDTH, HEIGHT):
+            self._map.close()
+            raise ValueError(f'{self.path} is not a version {VERSION} {WIDTH}x{HEIGHT} framebuffer')
+
+    @classmethod
+    def for_device(cls, dev: Any) -> 'SharedFrameBuffer':
+        """Open the framebuffer for ``dev`` (see :func:`framebuffer_path`)."""
+        return cls(framebuffer_path(dev))
+
+    @property
+    def closed(self) -> bool:
+        return self._map.closed
+
+    @property
+    def sequence(self) -> int:
+        """The generation counter; even when no write is in progress."""
+        return _SEQUENCE.unpack_from(self._map, _SEQUENCE_OFFSET)[0]
+
+    def write(self, frame: Union[bytes, bytearray, memoryview]) -> int:
+        """
+        Publish a raw frame.
+
+        Parameters:
+            frame (bytes-like):
+                ``FRAME_SIZE`` bytes, pixel ``(x, y)`` at ``x + 9 * y``; any
+                non-zero byte is "on".
+
+        Returns:
+            int:
+                The new (even) sequence number.
+
+        Raises:
+            ValueError:
+                If ``frame`` is the wrong size.
+        """
+        view = memoryview(frame).cast('B')
+        if view.nbytes != FRAME_SIZE:
+            raise ValueError(f'A frame is {FRAME_SIZE} bytes, got {view.nbytes}')
+
+        seq = self.sequence | 1
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, seq)
+        self._map[PIXELS_OFFSET:FILE_SIZE] = view
+        seq += 1
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, seq)
+        return seq
+
+    def write_grid(self, grid: Sequence[Sequence[int]]) -> int:
+        """
+        Publish a column-major grid (``grid[x][y]``), as used elsewhere in the library.
+
+        Pixels outside the grid are off.
+
+        Returns:
+            int:
+                The new sequence number.
+        """
+        frame = bytearray(FRAME_SIZE)
+        for x, column in enumerate(grid[:WIDTH]):
+            frame[x:FRAME_SIZE:WIDTH] = bytes(1 if v else 0 for v in column[:HEIGHT]).ljust(HEIGHT, b'\x00')
+        return self.write(frame)
+
+    def read(self) -> Tuple[int, bytes]:
+        """
+        Copy out a consistent frame.
+
+        Returns:
+            Tuple[int, bytes]:
+                The frame's sequence number and its pixel bytes.
+
+        Raises:
+            TimeoutError:
+                If the producer kept the buffer mid-write for the whole retry budget.
+        """
+        for _ in range(_READ_RETRIES):
+            before = self.sequence
+            if before & 1:
+                time.sleep(0)
+                continue
+            frame = self._map[PIXELS_OFFSET:FILE_SIZE]
+            if self.sequence == before:
+                return before, frame
+        raise TimeoutError(f'{self.path} stayed mid-write for {_READ_RETRIES} attempts')
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+
+    def __enter__(self) -> 'SharedFrameBuffer':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class FrameBufferWriter:
+    """
+    Send new framebuffer generations to a device from a background thread.
+
+    The writer polls the sequence counter, which is a single 8-byte read, and
+    only copies and sends when it changed. Generations published faster than
+    the serial link can take them are skipped; the device always gets the
+    newest one.
+
+    This runs on its own thread rather than the shared scheduler because each
+    send is a blocking serial write.
+
+    Parameters:
+        dev (ListPortInfo):
+            The device to draw on.
+
+        framebuffer (Optional[SharedFrameBuffer], optional):
+            The buffer to follow. Defaults to the device's own
+            (:meth:`SharedFrameBuffer.for_device`).
+
+        poll_interval (float, optional):
+            Seconds between checks for a new generation. Defaults to 0.005.
+
+        stale_after (float, optional):
+            Seconds the sequence may stay odd (mid-write) before the producer
+            is considered dead. Defaults to 1.0.
+    """
+
+    def __init__(
+            self,
+            dev:           Any,
+            framebuffer:   Optional[SharedFrameBuffer] = None,
+            poll_interval: float                       = 0.005,
+            stale_after:   float                       = 1.0,
+    ):
+        self.dev           = dev
+        self.framebuffer   = framebuffer if framebuffer is not None else SharedFrameBuffer.for_device(dev)
+        self.poll_interval = poll_interval
+        self.stale_after   = stale_after
+        self.frames_sent   = 0
+        self.last_sequence = 0
+        self.producer_dead = False
+        self._last_frame: Optional[bytes] = None
+        self._odd_sequence: Optional[int] = None
+        self._odd_since    = 0.0
+        self._timeout_reported = False
+        self._stop         = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def poll(self) -> bool:
+        """
+        Send the current generation if it is new.
+
+        Returns:
+            bool:
+                Whether a frame was sent.
+        """
+        from is_matrix_forge.led_matrix.display.helpers import render_matrix
+
+        seq = self.framebuffer.sequence
+        if seq & 1:
+            self._note_mid_write(seq)
+            return False
+
+        if self._odd_sequence is not None:
+            if self.producer_dead:
+                MOD_LOGGER.get_child('FrameBufferWriter.poll').info(
+                    f'{self.framebuffer.path} is being written again'
+                )
+            self._odd_sequence = None
+            self.producer_dead = False
+
+        if seq == self.last_sequence:
+            return False
+
+        seq, frame = self.framebuffer.read()
+        self.last_sequence = seq
+        if frame == self._last_frame:
+            return False
+
+        render_matrix(self.dev, frame)
+        self._last_frame = frame
+        self.frames_sent += 1
+        return True
+
+    def _note_mid_write(self, seq: int) -> None:
+        """Track how long ``seq`` has been odd; declare the producer dead past ``stale_after``."""
+        now = time.monotonic()
+        if seq != self._odd_sequence:
+            self._odd_sequence, self._odd_since = seq, now
+            return
+
+        if not self.producer_dead and now - self._odd_since >= self.stale_after:
+            self.producer_dead = True
+            MOD_LOGGER.get_child('FrameBufferWriter.poll').warning(
+                f'{self.framebuffer.path} has been mid-write (sequence {seq}) for '
+                f'{now - self._odd_since:.1f}s; assuming its producer died and waiting for a new write'
+            )
+
+    def _run(self) -> None:
+        log = MOD_LOGGER.get_child('FrameBufferWriter._run')
+
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except TimeoutError as exc:
+                # Report once per episode rather than on every poll.
+                if not self._timeout_reported:
+                    log.warning(str(exc))
+                    self._timeout_reported = True
+            except Exception as exc:  # noqa: BLE001 - keep following the buffer
+                log.error(f'Could not send frame to {getattr(self.dev, "device", self.dev)}: {exc!r}')
+            else:
+                self._timeout_reported = False
+            self._stop.wait(self.poll_interval)
+
+    def start(self) -> 'FrameBufferWriter':
+        """Start the writer thread (no-op if it is already running) and return ``self``."""
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f'framebuffer-writer-{getattr(self.dev, "name", self.dev)}',
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """Stop the writer thread. The framebuffer stays open."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+
+__all__ = [
+    'FILE_SIZE',
+    'FRAME_SIZE',
+    'FrameBufferWriter',
+    'HEIGHT',
+    'MAGIC',
+    'SharedFrameBuffer',
+    'WIDTH',
+    'framebuffer_path',
+]
@@ -7,3 +7,5 @@ loading, and modifying grid patterns.
 """
 from is_matrix_forge.led_matrix.display.grid.helpers import generate_blank_grid
 from is_matrix_forge.led_matrix.display.grid.base import Grid
+from is_matrix_forge.led_matrix.display.grid.packed import PackedGrid
+from is_matrix_forge.led_matrix.display.grid.array import ArrayGrid
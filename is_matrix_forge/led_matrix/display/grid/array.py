@@ -0,0 +1,420 @@
+"""
+NumPy-backed Grid backend.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/grid/array.py
+
+Description:
+    :class:`ArrayGrid` stores pixels in a ``numpy.ndarray`` of ``uint8`` with
+    shape ``(width, height)`` – the same column-major ``[x][y]`` orientation the
+    rest of the package uses – so overlay, invert, shift/roll, crop/place and
+    thresholding are single vectorized operations. Converting to and from the
+    list-of-lists representation is lossless.
+
+    NumPy is optional and imported on first use; importing this module never
+    fails (or loads NumPy), but constructing an :class:`ArrayGrid` without
+    NumPy installed raises :class:`ImportError`.
+"""
+from __future__ import annotations
+
+from importlib.util import find_spec
+from typing import Any, Iterator, List, Optional, Union
+
+from .base import Grid, MATRIX_HEIGHT, MATRIX_WIDTH, _ColumnView
+
+
+np = None  # ``numpy``, bound by ``_require_numpy`` the first time an ArrayGrid is built
+
+HAS_NUMPY = find_spec('numpy') is not None
+"""bool: Whether :class:`ArrayGrid` can be used in this environment."""
+
+
+def _require_numpy() -> None:
+    global np
+    if np is not None:
+        return
+
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('ArrayGrid requires numpy; install it with `pip install numpy`.') from None
+
+    np = numpy
+
+
+def _offset(align: str, src_len: int, dst_len: int) -> int:
+    if align in ('left', 'top'):
+        return 0
+    if align in ('right', 'bottom'):
+        return dst_len - src_len
+    if align == 'center':
+        return (dst_len - src_len) // 2
+    raise ValueError(f'Invalid alignment: {align}')
+
+
+class ArrayGrid(Grid):
+    """
+    A :class:`Grid` whose pixels live in a ``(width, height)`` uint8 array.
+
+    Parameters:
+        width (int, optional):
+            Canvas width (columns). Defaults to 9.
+
+        height (int, optional):
+            Canvas height (rows). Defaults to 34.
+
+        fill_value (int, optional):
+            Pixel value for blank/padded areas (0 or 1). Defaults to 0.
+
+        init_grid (numpy.ndarray | List[List[int]] | List[int] | None, optional):
+            Initial data. Arrays must be column-major ``(w, h)``; lists accept
+            every form :class:`Grid` accepts.
+
+        align_x (str, optional):
+            Horizontal placement for under-sized ``init_grid``.
+
+        align_y (str, optional):
+            Vertical placement for under-sized ``init_grid``.
+
+    Properties:
+        array (numpy.ndarray):
+            The live backing array (``array[x, y]``). Writes go straight to the grid.
+
+    Raises:
+        ImportError:
+            If NumPy is not installed.
+    """
+
+    def __init__(
+        self,
+        width: int = MATRIX_WIDTH,
+        height: int = MATRIX_HEIGHT,
+        fill_value: int = 0,
+        init_grid: Any = None,
+        align_x: str = 'center',
+        align_y: str = 'center',
+    ) -> None:
+        _require_numpy()
+
+        if not isinstance(init_grid, np.ndarray):
+            super().__init__(
+                width=width,
+                height=height,
+                fill_value=fill_value,
+                init_grid=init_grid,
+                align_x=align_x,
+                align_y=align_y,
+            )
+            return
+
+        if fill_value not in (0, 1):
+            raise ValueError('fill_value must be 0 or 1')
+        if init_grid.ndim != 2:
+            raise ValueError(f'init_grid array must be 2-D, not {init_grid.ndim}-D')
+
+        self._width = width
+        self._height = height
+        self._fill_value = fill_value
+
+        src = (init_grid != 0).astype(np.uint8)
+        src_w, src_h = src.shape
+        if src_w > width or src_h > height:
+            raise ValueError(
+                f'init_grid size {src_w}×{src_h} exceeds canvas {width}×{height}. '
+                'Resize or supply a proper target width/height.'
+            )
+
+        self._array = self._placed(src, width, height, fill_value, align_x, align_y)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Construction
+    # ──────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def _wrap(cls, array: 'np.ndarray', fill_value: int = 0) -> 'ArrayGrid':
+        new = cls.__new__(cls)
+        new._width, new._height = array.shape
+        new._fill_value = fill_value
+        new._array = array
+        return new
+
+    @staticmethod
+    def _placed(
+        src: 'np.ndarray',
+        dst_w: int,
+        dst_h: int,
+        pad_value: int,
+        align_x: str = 'center',
+        align_y: str = 'center',
+    ) -> 'np.ndarray':
+        src_w, src_h = src.shape
+        if (src_w, src_h) == (dst_w, dst_h):
+            return src.copy()
+        ox = _offset(align_x, src_w, dst_w)
+        oy = _offset(align_y, src_h, dst_h)
+        out = np.full((dst_w, dst_h), pad_value, dtype=np.uint8)
+        out[ox:ox + src_w, oy:oy + src_h] = src
+        return out
+
+    @classmethod
+    def from_grid(cls, grid: Union[Grid, List[List[int]]]) -> 'ArrayGrid':
+        """
+        Wrap an existing :class:`Grid` (or column-major list) in an array.
+
+        Returns:
+            ArrayGrid:
+                A copy backed by a NumPy array.
+        """
+        _require_numpy()
+        if isinstance(grid, ArrayGrid):
+            return grid.copy()
+        if isinstance(grid, Grid):
+            return cls._wrap(np.array(grid.grid, dtype=np.uint8), grid.fill_value)
+        return cls(init_grid=grid)
+
+    @classmethod
+    def from_numpy(
+        cls,
+        array: 'np.ndarray',
+        *,
+        row_major: bool = False,
+        fill_value: int = 0,
+    ) -> 'ArrayGrid':
+        """
+        Build a grid from any 2-D array; non-zero values are lit.
+
+        Parameters:
+            array (numpy.ndarray):
+                Pixel data, column-major ``(w, h)`` unless ``row_major``.
+
+            row_major (bool, optional):
+                Treat ``array`` as ``(h, w)`` (image order). Defaults to False.
+
+            fill_value (int, optional):
+                Fill value recorded on the new grid. Defaults to 0.
+
+        Returns:
+            ArrayGrid:
+                The new grid (same size as ``array``).
+        """
+        _require_numpy()
+        arr = np.asarray(array)
+        if row_major:
+            arr = arr.T
+        return cls._wrap((arr != 0).astype(np.uint8), fill_value)
+
+    @classmethod
+    def threshold(
+        cls,
+        values: Any,
+        level: float = 0.5,
+        *,
+        row_major: bool = False,
+        invert: bool = False,
+    ) -> 'ArrayGrid':
+        """
+        Binarize greyscale data: pixels ``>= level`` are lit.
+
+        Parameters:
+            values (array-like):
+                Intensities, column-major ``(w, h)`` unless ``row_major``.
+
+            level (float, optional):
+                Cut-off, in the same units as ``values``. Defaults to 0.5.
+
+            row_major (bool, optional):
+                Treat ``values`` as ``(h, w)`` (image order). Defaults to False.
+
+            invert (bool, optional):
+                Light pixels *below* ``level`` instead. Defaults to False.
+
+        Returns:
+            ArrayGrid:
+                The binarized grid.
+        """
+        _require_numpy()
+        arr = np.asarray(values)
+        if row_major:
+            arr = arr.T
+        lit = arr < level if invert else arr >= level
+        return cls._wrap(lit.astype(np.uint8))
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Storage (keeps Grid's internals working on top of the array)
+    # ──────────────────────────────────────────────────────────────────────────
+
+    @property
+    def _grid(self) -> List[List[int]]:
+        """Column-major list snapshot of the array."""
+        return self._array.tolist()
+
+    @_grid.setter
+    def _grid(self, columns: List[List[int]]) -> None:
+        self._array = np.array(columns, dtype=np.uint8).reshape(self._width, self._height)
+
+    @property
+    def array(self) -> 'np.ndarray':
+        return self._array
+
+    def to_numpy(self, *, row_major: bool = False) -> 'np.ndarray':
+        """Return a copy of the pixels, ``(w, h)`` or ``(h, w)`` if ``row_major``."""
+        return (self._array.T if row_major else self._array).copy()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Grid API
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def copy(self) -> 'ArrayGrid':
+        """Return an independent copy."""
+        return self._wrap(self._array.copy(), self._fill_value)
+
+    def get_pixel_value(self, x: int, y: int) -> int:
+        """Return the value at column x, row y."""
+        if x < 0 or x >= self._width or y < 0 or y >= self._height:
+            raise IndexError(f"({x},{y}) out of bounds {self._width}×{self._height}")
+        return int(self._array[x, y])
+
+    def set_pixel(self, x: int, y: int, value: int) -> None:
+        """Set the value at column x, row y (0 or 1)."""
+        if x < 0 or x >= self._width or y < 0 or y >= self._height:
+            raise IndexError(f"({x},{y}) out of bounds {self._width}×{self._height}")
+        self._array[x, y] = 1 if value else 0
+
+    def get_shifted(self, dx: int = 0, dy: int = 0, wrap: bool = False) -> 'ArrayGrid':
+        """
+        Return a new grid shifted by (dx, dy):
+          - dx > 0 moves right, dx < 0 moves left
+          - dy > 0 moves down, dy < 0 moves up
+        If wrap=True, shifts wrap around edges; otherwise, out-of-bounds fill with fill_value.
+        """
+        if wrap:
+            return self._wrap(np.roll(self._array, (dx, dy), axis=(0, 1)), self._fill_value)
+
+        w, h = self._width, self._height
+        out = np.full((w, h), self._fill_value, dtype=np.uint8)
+        if abs(dx) < w and abs(dy) < h:
+            out[max(dx, 0):w + min(dx, 0), max(dy, 0):h + min(dy, 0)] = \
+                self._array[max(-dx, 0):w - max(dx, 0), max(-dy, 0):h - max(dy, 0)]
+        return self._wrap(out, self._fill_value)
+
+    def overlay(self, other: Union[Grid, Any], invert_on_overlap: bool = False) -> 'ArrayGrid':
+        """
+        Draw ``other`` over this grid.
+
+        Parameters:
+            other (Grid | array-like):
+                Foreground of the same size.
+
+            invert_on_overlap (bool, optional):
+                Turn off pixels lit in both grids. Defaults to False.
+
+        Returns:
+            ArrayGrid:
+                The composited grid.
+        """
+        fg = self._coerce(other)
+        out = self._array ^ fg if invert_on_overlap else self._array | fg
+        return self._wrap(out, self._fill_value)
+
+    def inverted(self) -> 'ArrayGrid':
+        """Return a copy with every pixel flipped."""
+        return self._wrap(1 - self._array, self._fill_value)
+
+    def crop(self, x: int, y: int, width: int, height: int) -> 'ArrayGrid':
+        """
+        Return the ``width``×``height`` region whose top-left pixel is ``(x, y)``.
+
+        Raises:
+            ValueError:
+                If the region does not fit inside this grid.
+        """
+        if x < 0 or y < 0 or x + width > self._width or y + height > self._height:
+            raise ValueError(
+                f'crop {width}×{height} at ({x},{y}) exceeds {self._width}×{self._height}'
+            )
+        return self._wrap(self._array[x:x + width, y:y + height].copy(), self._fill_value)
+
+    def place(
+        self,
+        width: int = MATRIX_WIDTH,
+        height: int = MATRIX_HEIGHT,
+        align_x: str = 'center',
+        align_y: str = 'center',
+        fill_value: Optional[int] = None,
+    ) -> 'ArrayGrid':
+        """
+        Return this grid placed on a larger ``width``×``height`` canvas.
+
+        Raises:
+            ValueError:
+                If this grid is larger than the canvas.
+        """
+        if self._width > width or self._height > height:
+            raise ValueError('Source grid larger than destination canvas.')
+        pad = self._fill_value if fill_value is None else fill_value
+        return self._wrap(self._placed(self._array, width, height, pad, align_x, align_y), pad)
+
+    def to_draw_payload(self) -> bytes:
+        """Return the 39-byte firmware ``Draw`` payload (bit ``x + 9 * y``)."""
+        if self._width != MATRIX_WIDTH or self._height != MATRIX_HEIGHT:
+            return super().to_draw_payload()
+        # Row-major flatten gives index y * width + x, the Draw bit order.
+        bits = np.zeros(39 * 8, dtype=np.uint8)
+        bits[:self._array.size] = self._array.T.ravel()
+        return np.packbits(bits, bitorder='little').tobytes()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Dunder
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _coerce(self, other: Any) -> 'np.ndarray':
+        if isinstance(other, ArrayGrid):
+            arr = other._array
+        elif isinstance(other, Grid):
+            arr = np.array(other.grid, dtype=np.uint8)
+        else:
+            arr = (np.asarray(other) != 0).astype(np.uint8)
+        if arr.shape != self._array.shape:
+            raise ValueError(f'grid shape {arr.shape} does not match {self._array.shape}')
+        return arr
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        if (other.width, other.height) != (self._width, self._height):
+            return False
+        return bool(np.array_equal(self._array, self._coerce(other)))
+
+    def __hash__(self) -> int:
+        return hash((self._width, self._height, self._array.tobytes()))
+
+    def __or__(self, other: Any) -> 'ArrayGrid':
+        return self.overlay(other)
+
+    def __xor__(self, other: Any) -> 'ArrayGrid':
+        return self.overlay(other, invert_on_overlap=True)
+
+    def __and__(self, other: Any) -> 'ArrayGrid':
+        return self._wrap(self._array & self._coerce(other), self._fill_value)
+
+    def __invert__(self) -> 'ArrayGrid':
+        return self.inverted()
+
+    def __getitem__(self, index: int) -> _ColumnView:
+        """Column ``index``; ``grid[x][y] = v`` sets the pixel, as on :class:`Grid`."""
+        return _ColumnView.for_grid(self, index)
+
+    def __len__(self) -> int:
+        return self._width
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return iter(self._array.tolist())
+
+    def __repr__(self) -> str:
+        return f'ArrayGrid({self._width}×{self._height}, lit={int(self._array.sum())})'
@@ -17,7 +17,7 @@ Description:
     loading from files.
 """
 
-import itertools
+from collections.abc import Sequence
 from pathlib import Path
 from typing import List, Optional, Union, ClassVar, Type, Any, Dict  # Added Any, Dict
 from ...constants import WIDTH as __WIDTH, HEIGHT as __HEIGHT, PRESETS_DIR
@@ -56,6 +56,60 @@ def load_from_file(
     )
 
 
+class _ColumnView(Sequence):
+    """
+    One column of a grid that does not store lists of columns (:class:`PackedGrid`,
+    :class:`ArrayGrid`). Reads and ``column[y] = v`` go through the grid's
+    ``get_pixel_value`` / ``set_pixel``, so ``grid[x][y] = v`` behaves as on :class:`Grid`.
+    """
+
+    __slots__ = ('_grid', '_x')
+
+    def __init__(self, grid: 'Grid', x: int) -> None:
+        self._grid = grid
+        self._x = x
+
+    @classmethod
+    def for_grid(cls, grid: 'Grid', index):
+        """``grid[index]`` for such grids: one view, or a list of views for a slice."""
+        width = grid.width
+        if isinstance(index, slice):
+            return [cls(grid, x) for x in range(*index.indices(width))]
+        if index < 0:
+            index += width
+        if not 0 <= index < width:
+            raise IndexError('grid index out of range')
+        return cls(grid, index)
+
+    def __len__(self) -> int:
+        return self._grid.height
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._grid.get_pixel_value(self._x, y) for y in range(*index.indices(len(self)))]
+        return self._grid.get_pixel_value(self._x, self._index(index))
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self._grid.set_pixel(self._x, self._index(index), value)
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('column index out of range')
+        return index
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class Grid:
     """
     Represents a 2D column-major grid for the LED display (grid[x][y], 9×34).
@@ -174,10 +228,9 @@ class Grid:
         oy = _off(align_y, src_h, dst_h)
 
         out = generate_blank_grid(width=dst_w, height=dst_h, fill_value=pad_value)
-        # Copy pixels
+        # Copy pixels one column slice at a time
         for x in range(src_w):
-            for y in range(src_h):
-                out[x + ox][y + oy] = src[x][y]
+            out[x + ox][oy:oy + src_h] = src[x]
         return out
 
     @staticmethod
@@ -372,6 +425,16 @@ class Grid:
             raise AttributeError("device.draw_grid(grid) not available")
         device.draw_grid(self)
 
+    def to_draw_payload(self) -> bytes:
+        """Return the 39-byte firmware ``Draw`` payload for this grid."""
+        from is_matrix_forge.led_matrix.display.helpers import pack_matrix
+        return bytes(pack_matrix(self._grid))
+
+    def to_packed(self) -> 'Grid':
+        """Return a bit-packed copy of this grid (see :class:`PackedGrid`)."""
+        from is_matrix_forge.led_matrix.display.grid.packed import PackedGrid
+        return PackedGrid.from_grid(self)
+
     def get_pixel_value(self, x: int, y: int) -> int:
         """Return the value at column x, row y."""
         if x < 0 or x >= self._width or y < 0 or y >= self._height:
@@ -390,14 +453,25 @@ class Grid:
           - dy > 0 moves down, dy < 0 moves up
         If wrap=True, shifts wrap around edges; otherwise, out-of-bounds fill with fill_value.
         """
-        new = generate_blank_grid(self._width, self._height, self._fill_value)
-
-        for c, r in itertools.product(range(self._width), range(self._height)):
-            dest_c = (c + dx) % self._width if wrap else c + dx
-            dest_r = (r + dy) % self._height if wrap else r + dy
-
-            if 0 <= dest_c < self._width and 0 <= dest_r < self._height:
-                new[dest_c][dest_r] = self._grid[c][r]
+        w, h = self._width, self._height
+        new = generate_blank_grid(w, h, self._fill_value)
+        src = self._grid
+
+        # Shift whole columns with slices instead of visiting every pixel.
+        for c in range(w):
+            dest_c = (c + dx) % w if wrap else c + dx
+            if not 0 <= dest_c < w:
+                continue
+
+            col = src[c]
+            if wrap:
+                k = dy % h
+                new[dest_c] = col[-k:] + col[:-k] if k else col[:]
+            elif dy >= 0:
+                if dy < h:
+                    new[dest_c][dy:] = col[:h - dy]
+            elif -dy < h:
+                new[dest_c][:h + dy] = col[-dy:]
 
         return self.__class__(width=self._width, height=self._height, fill_value=self._fill_value, init_grid=new)
 
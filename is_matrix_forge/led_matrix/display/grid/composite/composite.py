@@ -1,5 +1,7 @@
 from typing import List, Union
 from is_matrix_forge.led_matrix.display.grid.base import Grid
+from is_matrix_forge.led_matrix.display.grid.array import ArrayGrid
+from is_matrix_forge.led_matrix.display.grid.packed import PackedGrid
 from inspyre_toolbox.syntactic_sweets.classes.decorators import validate_type
 
 
@@ -77,6 +79,13 @@ class CompositeGrid(Grid):
         base = self.background.copy()
         fg = self.foreground
 
+        if isinstance(base, ArrayGrid):
+            return base.overlay(fg, invert_on_overlap=self.invert_on_overlap)
+
+        if isinstance(base, PackedGrid):
+            # Overlap inversion is exactly XOR; plain overlay is OR.
+            return base ^ fg if self.invert_on_overlap else base | fg
+
         for y in range(base.height):
             for x in range(base.width):
                 if (fg_val := fg._grid[x][y]):
@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-import threading
 from typing import Any, List
 
-try:
-    from inspyre_toolbox.chrono import sleep as ist_sleep
-except ModuleNotFoundError:  # pragma: no cover - fallback when dependency missing
-    from time import sleep as ist_sleep
 from serial.tools.list_ports_common import ListPortInfo
 
 from is_matrix_forge.common.helpers import coerce_to_int
+from is_matrix_forge.common.scheduler import Job, get_scheduler
 from is_matrix_forge.led_matrix.helpers.device import get_devices
 from is_matrix_forge.led_matrix.constants import HEIGHT, WIDTH
 from is_matrix_forge.led_matrix.display.helpers import render_matrix
@@ -94,12 +90,13 @@ def is_valid_grid(grid, width, height):
 
 
 
-def hold_pattern(dev, grid: List[List[int]], reapply_interval: float = 55.00) -> None:
+def hold_pattern(dev, grid: List[List[int]], reapply_interval: float = 55.00) -> Job:
     """
     Hold the state of the LED matrix indefinitely, only updating the display every `reapply_interval` seconds.
 
     This is useful for maintaining a static display on the LED matrix without having a constant refresh/computation
-    load.
+    load. The grid is drawn immediately and then re-applied by a job on the shared scheduler, so holding a pattern
+    does not cost a thread.
 
     Parameters:
         dev (ListPortInfo):
@@ -114,7 +111,8 @@ def hold_pattern(dev, grid: List[List[int]], reapply_interval: float = 55.00) ->
             applied)
 
     Returns:
-        None
+        Job:
+            The scheduler job re-applying the pattern; call ``cancel()`` on it to stop holding.
     """
     if not isinstance(dev, ListPortInfo):
         raise TypeError(f"dev must be a ListPortInfo object, not {type(dev)}")
@@ -122,12 +120,9 @@ def hold_pattern(dev, grid: List[List[int]], reapply_interval: float = 55.00) ->
     if not isinstance(grid, list) or not is_valid_grid(grid, 9, 34):
         raise MalformedGridError(f"grid must be a 9x34 list of 0/1, not {type(grid)}")
 
-    def worker(interval):
-        global running
-        running.state = True
-        while running:
-            ist_sleep(interval)
-            render_matrix(dev, grid)
-
-    thread = threading.Thread(target=worker, args=(reapply_interval,), daemon=True)
-    thread.start()
+    return get_scheduler().every(
+        reapply_interval,
+        lambda: render_matrix(dev, grid),
+        delay=0.0,
+        name=f'hold_pattern-{dev.name}',
+    )
@@ -0,0 +1,367 @@
+"""
+Bit-packed Grid backend.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/grid/packed.py
+
+Description:
+    :class:`PackedGrid` stores the whole canvas in a single Python integer, one
+    bit per pixel, using the same bit order as the firmware ``Draw`` command
+    (pixel ``(x, y)`` is bit ``x + width * y``). Whole-grid operations –
+    ``copy``, ``get_shifted``, equality, hashing and conversion to the 39-byte
+    ``Draw`` payload – become a handful of integer operations instead of
+    walking 306 cells in Python.
+
+    Reads keep the familiar column-major API (``grid[x][y]``, ``grid.grid``,
+    iteration over columns); those views are materialized on demand, so writing
+    through them does not modify the packed data. Use :meth:`PackedGrid.set_pixel`
+    or assign ``grid.grid`` to change pixels.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .base import Grid, MATRIX_HEIGHT, MATRIX_WIDTH, _ColumnView
+
+
+DRAW_PAYLOAD_SIZE = 39
+"""int: Length of the firmware ``Draw`` payload (312 bits ≥ 9×34 pixels)."""
+
+
+@lru_cache(maxsize=32)
+def _column_masks(width: int, height: int) -> Tuple[int, ...]:
+    """Bit masks selecting each column of a ``width``×``height`` canvas."""
+    masks = []
+    for x in range(width):
+        mask = 0
+        for y in range(height):
+            mask |= 1 << (x + width * y)
+        masks.append(mask)
+    return tuple(masks)
+
+
+@lru_cache(maxsize=256)
+def _columns_mask(width: int, height: int, start: int, stop: int) -> int:
+    """Bit mask selecting columns ``start <= x < stop``."""
+    mask = 0
+    for col in _column_masks(width, height)[max(0, start):max(0, stop)]:
+        mask |= col
+    return mask
+
+
+def _shift_bits(bits: int, width: int, height: int, dx: int, dy: int, wrap: bool) -> int:
+    """Shift a packed canvas by ``(dx, dy)``; vacated pixels are 0 unless wrapping."""
+    size = width * height
+    full = (1 << size) - 1
+
+    if dx:
+        if wrap:
+            dx %= width
+            if dx:
+                bits = (
+                    ((bits << dx) & _columns_mask(width, height, dx, width))
+                    | ((bits >> (width - dx)) & _columns_mask(width, height, 0, dx))
+                )
+        elif dx > 0:
+            bits = (bits << dx) & _columns_mask(width, height, dx, width)
+        else:
+            bits = (bits >> -dx) & _columns_mask(width, height, 0, width + dx)
+
+    if dy:
+        if wrap:
+            offset = (dy % height) * width
+            if offset:
+                bits = (bits << offset) | (bits >> (size - offset))
+        elif dy > 0:
+            bits <<= dy * width
+        else:
+            bits >>= -dy * width
+
+    return bits & full
+
+
+class PackedGrid(Grid):
+    """
+    A :class:`Grid` whose pixels live in one packed integer.
+
+    Parameters:
+        width (int, optional):
+            Canvas width (columns). Defaults to 9.
+
+        height (int, optional):
+            Canvas height (rows). Defaults to 34.
+
+        fill_value (int, optional):
+            Pixel value for blank/padded areas (0 or 1). Defaults to 0.
+
+        init_grid (List[List[int]] | List[int] | None, optional):
+            Initial data, accepted in every form :class:`Grid` accepts.
+
+        align_x (str, optional):
+            Horizontal placement for under-sized ``init_grid``.
+
+        align_y (str, optional):
+            Vertical placement for under-sized ``init_grid``.
+
+    Properties:
+        bits (int):
+            The packed pixels (bit ``x + width * y``).
+
+        lit_pixels (int):
+            Number of pixels that are on.
+    """
+
+    def __init__(
+        self,
+        width: int = MATRIX_WIDTH,
+        height: int = MATRIX_HEIGHT,
+        fill_value: int = 0,
+        init_grid: List[List[int]] | List[int] | None = None,
+        align_x: str = 'center',
+        align_y: str = 'center',
+    ) -> None:
+        self._bits = 0
+        self._payload: Optional[bytes] = None
+        super().__init__(
+            width=width,
+            height=height,
+            fill_value=fill_value,
+            init_grid=init_grid,
+            align_x=align_x,
+            align_y=align_y,
+        )
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Construction
+    # ──────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def _from_bits(cls, bits: int, width: int, height: int, fill_value: int = 0) -> 'PackedGrid':
+        new = cls.__new__(cls)
+        new._width = width
+        new._height = height
+        new._fill_value = fill_value
+        new._bits = bits & ((1 << (width * height)) - 1)
+        new._payload = None
+        return new
+
+    @classmethod
+    def from_grid(cls, grid: Union[Grid, List[List[int]]]) -> 'PackedGrid':
+        """
+        Pack an existing :class:`Grid` (or column-major list) without re-validating it.
+
+        Parameters:
+            grid (Union[Grid, List[List[int]]]):
+                The source grid.
+
+        Returns:
+            PackedGrid:
+                A packed copy.
+        """
+        if isinstance(grid, PackedGrid):
+            return grid.copy()
+        if isinstance(grid, Grid):
+            return cls._from_bits(
+                cls._pack(grid.grid, grid.width, grid.height),
+                grid.width,
+                grid.height,
+                grid.fill_value,
+            )
+        return cls(init_grid=grid)
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Iterable[List[int]],
+        width: int = MATRIX_WIDTH,
+        height: int = MATRIX_HEIGHT,
+    ) -> 'PackedGrid':
+        """
+        Pack trusted column-major data without validation or placement.
+
+        Meant for generators that already produce ``width`` columns of
+        ``height`` 0/1 values; missing columns/rows are treated as off.
+
+        Parameters:
+            columns (Iterable[List[int]]):
+                Column-major pixel data (``columns[x][y]``).
+
+        Returns:
+            PackedGrid:
+                The packed grid.
+        """
+        return cls._from_bits(cls._pack(list(columns), width, height), width, height)
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Union[bytes, bytearray, memoryview, List[int]],
+        width: int = MATRIX_WIDTH,
+        height: int = MATRIX_HEIGHT,
+    ) -> 'PackedGrid':
+        """
+        Build a grid from a firmware ``Draw`` payload.
+
+        Parameters:
+            payload (bytes-like | List[int]):
+                The packed pixel bytes (39 bytes for a 9×34 canvas).
+
+        Returns:
+            PackedGrid:
+                The decoded grid.
+        """
+        return cls._from_bits(int.from_bytes(bytes(payload), 'little'), width, height)
+
+    @staticmethod
+    def _pack(columns: List[List[int]], width: int, height: int) -> int:
+        bits = 0
+        for x, col in enumerate(columns[:width]):
+            for y, val in enumerate(col[:height]):
+                if val:
+                    bits |= 1 << (x + width * y)
+        return bits
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Storage (keeps Grid's internals working on top of the packed int)
+    # ──────────────────────────────────────────────────────────────────────────
+
+    @property
+    def _grid(self) -> List[List[int]]:
+        """Column-major snapshot of the packed pixels."""
+        width = self._width
+        size = width * self._height
+        # Bit i of the int is char -(i+1) of its binary string; reverse once so
+        # each column is a simple stride slice.
+        chars = format(self._bits, f'0{size}b')[::-1]
+        return [list(map(int, chars[x::width])) for x in range(width)]
+
+    @_grid.setter
+    def _grid(self, columns: List[List[int]]) -> None:
+        self._bits = self._pack(columns, self._width, self._height)
+        self._payload = None
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    @property
+    def lit_pixels(self) -> int:
+        return self._bits.bit_count()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Grid API
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def copy(self) -> 'PackedGrid':
+        """Return an independent copy (O(1))."""
+        return self._from_bits(self._bits, self._width, self._height, self._fill_value)
+
+    def to_packed(self) -> 'PackedGrid':
+        return self.copy()
+
+    def get_pixel_value(self, x: int, y: int) -> int:
+        """Return the value at column x, row y."""
+        if x < 0 or x >= self._width or y < 0 or y >= self._height:
+            raise IndexError(f"({x},{y}) out of bounds {self._width}×{self._height}")
+        return (self._bits >> (x + self._width * y)) & 1
+
+    def set_pixel(self, x: int, y: int, value: int) -> None:
+        """Set the value at column x, row y (0 or 1)."""
+        if x < 0 or x >= self._width or y < 0 or y >= self._height:
+            raise IndexError(f"({x},{y}) out of bounds {self._width}×{self._height}")
+        bit = 1 << (x + self._width * y)
+        self._bits = (self._bits | bit) if value else (self._bits & ~bit)
+        self._payload = None
+
+    def get_shifted(self, dx: int = 0, dy: int = 0, wrap: bool = False) -> 'PackedGrid':
+        """
+        Return a new grid shifted by (dx, dy) using integer bit operations:
+          - dx > 0 moves right, dx < 0 moves left
+          - dy > 0 moves down, dy < 0 moves up
+        If wrap=True, shifts wrap around edges; otherwise, out-of-bounds fill with fill_value.
+        """
+        w, h = self._width, self._height
+        bits = _shift_bits(self._bits, w, h, dx, dy, wrap)
+
+        if self._fill_value and not wrap:
+            full = (1 << (w * h)) - 1
+            bits |= full & ~_shift_bits(full, w, h, dx, dy, wrap=False)
+
+        return self._from_bits(bits, w, h, self._fill_value)
+
+    def inverted(self) -> 'PackedGrid':
+        """Return a copy with every pixel flipped."""
+        full = (1 << (self._width * self._height)) - 1
+        return self._from_bits(~self._bits & full, self._width, self._height, self._fill_value)
+
+    def to_draw_payload(self) -> bytes:
+        """
+        Return the 39-byte firmware ``Draw`` payload.
+
+        For a 9×34 canvas this is the packed integer's little-endian bytes and
+        is cached until the grid changes.
+        """
+        if self._width != MATRIX_WIDTH or self._height != MATRIX_HEIGHT:
+            return super().to_draw_payload()
+        if self._payload is None:
+            self._payload = self._bits.to_bytes(DRAW_PAYLOAD_SIZE, 'little')
+        return self._payload
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Dunder
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _coerce_other(self, other: Any) -> Optional[int]:
+        if isinstance(other, PackedGrid):
+            if (other.width, other.height) != (self._width, self._height):
+                return None
+            return other._bits
+        if isinstance(other, Grid):
+            if (other.width, other.height) != (self._width, self._height):
+                return None
+            return self._pack(other.grid, self._width, self._height)
+        return None
+
+    def __eq__(self, other: Any) -> bool:
+        bits = self._coerce_other(other)
+        if bits is None:
+            return NotImplemented if not isinstance(other, Grid) else False
+        return bits == self._bits
+
+    def __hash__(self) -> int:
+        return hash((self._width, self._height, self._bits))
+
+    def _binary_op(self, other: Any, op) -> 'PackedGrid':
+        bits = self._coerce_other(other)
+        if bits is None:
+            return NotImplemented
+        return self._from_bits(op(self._bits, bits), self._width, self._height, self._fill_value)
+
+    def __or__(self, other: Any) -> 'PackedGrid':
+        return self._binary_op(other, int.__or__)
+
+    def __and__(self, other: Any) -> 'PackedGrid':
+        return self._binary_op(other, int.__and__)
+
+    def __xor__(self, other: Any) -> 'PackedGrid':
+        return self._binary_op(other, int.__xor__)
+
+    def __getitem__(self, index: int) -> _ColumnView:
+        """Column ``index``; ``grid[x][y] = v`` sets the pixel, as on :class:`Grid`."""
+        return _ColumnView.for_grid(self, index)
+
+    def __len__(self) -> int:
+        return self._width
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return iter(self._grid)
+
+    def __repr__(self) -> str:
+        return f'PackedGrid({self._width}×{self._height}, lit={self.lit_pixels})'
@@ -1,5 +1,11 @@
 import time
 import math
+from is_matrix_forge.led_matrix.commands.encoder import (
+    DRAW_PAYLOAD_SIZE,
+    get_encoder,
+    pack_frame_into,
+    pack_matrix_into,
+)
 from is_matrix_forge.led_matrix.commands.map import CommandVals
 
 
@@ -77,46 +83,98 @@ def light_leds(dev, leds):
     send_command(dev, CommandVals.Draw, vals)
 
 
-def render_matrix(dev, matrix):
-    """Show a black/white matrix.
+def pack_matrix(matrix) -> list[int]:
+    """Pack a black/white matrix into the 39-byte ``Draw`` payload.
 
     Accepts matrices smaller than 9×34 and treats out-of-bounds pixels as
     "off" so that callers can render compact glyphs without padding.
+
+    Parameters:
+        matrix (List[List[int]]):
+            Column-major pixel data (``matrix[x][y]``).
+
+    Returns:
+        list[int]:
+            The 39 payload bytes.
     """
-    # Initialize a byte array to hold the binary representation of the matrix
     # 39 bytes = 312 bits, which is enough for 9x34 = 306 pixels
-    vals = [0x00 for _ in range(39)]
+    vals = bytearray(DRAW_PAYLOAD_SIZE)
+    pack_matrix_into(vals, matrix)
+    return list(vals)
 
-    # Determine provided matrix dimensions (column-major)
-    width = len(matrix)
-    height = len(matrix[0]) if width and isinstance(matrix[0], list) else 0
-
-    # Iterate through each position in the 9x34 matrix
-    for x in range(9):
-        for y in range(34):
-            # Convert 2D coordinates to a linear index
-            # The matrix is stored in column-major order (y changes faster than x)
-            i = x + 9 * y
-
-            # Only read from matrix if within bounds and the pixel is on
-            if (
-                x < width
-                and isinstance(matrix[x], list)
-                and y < len(matrix[x])
-                and matrix[x][y]
-            ):
-                # Calculate which byte in the vals array this pixel belongs to
-                byte_index = int(i / 8)
-
-                # Calculate which bit within that byte represents this pixel
-                bit_position = i % 8
-
-                # Set the corresponding bit in the appropriate byte
-                # This efficiently packs 8 pixels into each byte
-                vals[byte_index] = vals[byte_index] | (1 << bit_position)
-
-    # Send the packed binary data to the device
-    send_command(dev, CommandVals.Draw, vals)
+
+def unpack_matrix(payload, width: int = 9, height: int = 34) -> list[list[int]]:
+    """Unpack a ``Draw`` payload back into a column-major matrix.
+
+    The inverse of :func:`pack_matrix`.
+
+    Parameters:
+        payload (bytes-like | List[int]):
+            The packed pixel bytes (39 bytes for a 9×34 matrix).
+
+        width (int, optional):
+            Matrix width. Defaults to 9.
+
+        height (int, optional):
+            Matrix height. Defaults to 34.
+
+    Returns:
+        list[list[int]]:
+            Column-major pixel data (``matrix[x][y]``).
+    """
+    size = width * height
+    bits = int.from_bytes(bytes(payload), 'little')
+    # Bit i is char -(i+1) of the binary string; reverse once so each column
+    # is a simple stride slice.
+    chars = format(bits, f'0{size}b')[::-1][:size]
+    return [list(map(int, chars[x::width])) for x in range(width)]
+
+
+def pack_frame(frame) -> list[int]:
+    """Pack a raw 9×34 frame into the 39-byte ``Draw`` payload.
+
+    A raw frame holds one byte per pixel in the firmware's own bit order:
+    pixel ``(x, y)`` is byte ``x + 9 * y`` (34 rows of 9). Any non-zero byte
+    is "on". This is the layout external producers write into a
+    :mod:`~is_matrix_forge.led_matrix.display.framebuffer`.
+
+    Parameters:
+        frame (bytes-like):
+            306 pixel bytes.
+
+    Returns:
+        list[int]:
+            The 39 payload bytes.
+
+    Raises:
+        ValueError:
+            If ``frame`` is not 306 bytes long.
+    """
+    vals = bytearray(DRAW_PAYLOAD_SIZE)
+    pack_frame_into(vals, frame)
+    return list(vals)
+
+
+def render_matrix(dev, matrix):
+    """Show a black/white matrix.
+
+    Accepts matrices smaller than 9×34 and treats out-of-bounds pixels as
+    "off" so that callers can render compact glyphs without padding. A
+    bytes-like ``matrix`` is taken as a raw frame (see :func:`pack_frame`).
+
+    The frame is packed into the device's reusable ``Draw`` buffer, so
+    repeated calls build no new payload lists.
+    """
+    encoder = get_encoder(dev)
+    with encoder.lock:
+        payload = encoder.draw_buffer
+        if isinstance(matrix, (bytes, bytearray, memoryview)):
+            pack_frame_into(payload, matrix)
+        else:
+            pack_matrix_into(payload, matrix)
+
+        # Send the packed binary data to the device
+        send_command(dev, CommandVals.Draw, payload)
 
 
 from is_matrix_forge.led_matrix.hardware import (
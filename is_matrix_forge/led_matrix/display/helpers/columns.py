@@ -16,24 +16,78 @@ Description:
 
 """
 from is_matrix_forge.led_matrix.commands.map import CommandVals
-from is_matrix_forge.led_matrix.constants import FWK_MAGIC
-from is_matrix_forge.led_matrix.hardware import send_serial, send_command
+from is_matrix_forge.led_matrix.constants import FWK_MAGIC, HEIGHT
+from is_matrix_forge.led_matrix.transport import get_pool
 from is_matrix_forge.log_engine import ROOT_LOGGER
 
 
 MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.display.helpers.columns')
 
 
-def send_col(dev, x, vals):
+def send_col(dev, s, x, vals):
+    """Stage greyscale values for a single column. Must be committed with commit_cols()
+
+    Prefer :func:`send_greyscale_frame`, which stages every column and commits
+    in a single write.
+    """
     log = MOD_LOGGER.get_child('send_col')
-    """Stage greyscale values for a single column. Must be committed with commit_cols()"""
-    command = FWK_MAGIC + [CommandVals.StageGreyCol, x] + vals
+    command = FWK_MAGIC + [CommandVals.StageGreyCol, x] + list(vals)
     log.debug(f'Sending command: {command}')
-    send_command(dev, *command)
+    s.write(bytes(command))
 
 
 def commit_cols(dev, s):
     """Commit the changes from sending individual cols with send_col(), displaying the matrix.
     This makes sure that the matrix isn't partially updated."""
-    command = FWK_MAGIC + [CommandVals.DrawGreyColBuffer, 0x00]
-    send_serial(dev, s, command)
+    s.write(bytes(FWK_MAGIC + [CommandVals.DrawGreyColBuffer, 0x00]))
+
+
+def encode_greyscale_frame(columns) -> bytes:
+    """
+    Encode a full greyscale frame as one contiguous command buffer.
+
+    The buffer holds one ``StageGreyCol`` command per column followed by the
+    ``DrawGreyColBuffer`` commit, so the whole frame can go out in a single
+    ``write``.
+
+    Parameters:
+        columns (Iterable[Sequence[int]]):
+            Column-major brightness values (0-255), one sequence per column.
+            Columns are truncated or zero-padded to ``HEIGHT`` values.
+            NumPy ``uint8`` rows are accepted as-is (pass ``frame.T`` for a
+            row-major image).
+
+    Returns:
+        bytes:
+            The staged columns and commit, ready to write to the port.
+    """
+    buf = bytearray()
+    for x, vals in enumerate(columns):
+        buf += bytes(FWK_MAGIC + [CommandVals.StageGreyCol, x])
+        # Exactly HEIGHT bytes per column, or the next command would be misread
+        buf += bytes(vals)[:HEIGHT].ljust(HEIGHT, b'\x00')
+    buf += bytes(FWK_MAGIC + [CommandVals.DrawGreyColBuffer, 0x00])
+    return bytes(buf)
+
+
+def send_greyscale_frame(dev, columns, s=None) -> None:
+    """
+    Stage and display a greyscale frame with a single write.
+
+    Parameters:
+        dev (ListPortInfo):
+            The target device.
+
+        columns (Iterable[Sequence[int]]):
+            Column-major brightness values (see :func:`encode_greyscale_frame`).
+
+        s (serial.Serial, optional):
+            An already-open handle to write to (e.g. one borrowed with
+            ``get_pool().connection(dev)`` for a whole video). When omitted the
+            frame goes out through the shared connection pool.
+    """
+    buf = encode_greyscale_frame(columns)
+    if s is None:
+        get_pool().write(dev, buf)
+    else:
+        s.write(buf)
@@ -0,0 +1,569 @@
+"""
+Vectorized image conversion for the LED matrix and the B1 display.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/image_convert.py
+
+Description:
+    The image helpers used to require an exact 9×34 (or 300×400) image and
+    walk ``im.getdata()`` pixel by pixel, thresholding the RGB mean or bending
+    it through a piecewise brightness curve. This module does the work on
+    whole arrays:
+
+    - the image is decoded from sRGB to linear light (``gamma``) and reduced to
+      Rec. 709 luminance, so scaling and dithering average real brightness;
+    - :func:`fit` resizes to the target canvas by cropping (``crop``),
+      letterboxing (``pad``) or stretching (``stretch``);
+    - greyscale output is the linear luminance as PWM levels, which the LEDs
+      reproduce linearly;
+    - 1-bit output is a plain ``threshold`` (on perceived brightness, like the
+      old helpers), a 4×4 Bayer ``ordered`` dither, or ``floyd-steinberg``
+      error diffusion.
+
+    Results come out as ready-to-send payloads: :func:`draw_payload` returns
+    the 39-byte ``Draw`` payload, :func:`greyscale_columns` the column-major
+    levels :func:`encode_greyscale_frame` takes, and :func:`b1_columns` the
+    50-byte column blocks of the B1 display.
+
+    :func:`convert_directory` turns a directory of images into one animation
+    (``.lma`` container or JSON preset), converting the images in a process
+    pool.
+
+    NumPy is imported on first use; converting without it raises
+    :class:`ImportError`.
+
+Example Usage:
+    from is_matrix_forge.led_matrix.display.image_convert import convert_directory, draw_payload
+
+    controller.draw_payload(draw_payload('photo.jpg', dither='floyd-steinberg'))
+    convert_directory('frames/', 'clip.lma', frame_duration=0.05)
+
+    python -m is_matrix_forge.led_matrix.display.image_convert frames/ clip.lma --dither ordered
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Union
+
+from is_matrix_forge.led_matrix.constants import HEIGHT, WIDTH
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.display.image_convert')
+
+
+np = None     # ``numpy``, bound by ``_require_numpy`` on first use
+Image = None  # ``PIL.Image``, bound by ``_require_pil`` on first use
+
+B1_WIDTH = 300
+B1_HEIGHT = 400
+
+DEFAULT_GAMMA = 2.2
+"""Exponent used to decode image values to linear light."""
+
+FIT_MODES = ('crop', 'pad', 'stretch')
+
+DITHER_MODES = ('threshold', 'ordered', 'floyd-steinberg')
+
+IMAGE_EXTENSIONS = ('.png', '.gif', '.bmp', '.jpg', '.jpeg', '.webp', '.tif', '.tiff')
+"""File types :func:`convert_directory` picks up."""
+
+_REC709 = (0.2126, 0.7152, 0.0722)
+
+_BAYER_4 = ((0, 8, 2, 10), (12, 4, 14, 6), (3, 11, 1, 9), (15, 7, 13, 5))
+
+ImageSource = Union[str, Path, 'Image.Image', Any]
+
+
+def _require_numpy() -> None:
+    global np
+    if np is not None:
+        return
+
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('Image conversion requires numpy; install it with `pip install numpy`.') from None
+
+    np = numpy
+
+
+def _require_pil() -> None:
+    global Image
+    if Image is not None:
+        return
+
+    try:
+        from PIL import Image as pil_image
+    except ImportError:
+        raise ImportError('Image conversion requires Pillow; install it with `pip install pillow`.') from None
+
+    Image = pil_image
+
+
+def _check_choice(name: str, value: str, choices: Sequence[str]) -> None:
+    if value not in choices:
+        raise ValueError(f'{name} must be one of: {", ".join(choices)}; got {value!r}')
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Luminance, fitting and dithering
+# ──────────────────────────────────────────────────────────────────────────────
+
+def luminance(image: ImageSource, gamma: float = DEFAULT_GAMMA):
+    """
+    Linear-light luminance of an image.
+
+    Parameters:
+        image (ImageSource):
+            A path, a PIL image, or an ``(h, w)`` / ``(h, w, 3|4)`` ``uint8`` array
+            in RGB order.
+
+        gamma (float, optional):
+            Decoding exponent. Defaults to :data:`DEFAULT_GAMMA`.
+
+    Returns:
+        numpy.ndarray:
+            ``float32`` array of shape ``(h, w)`` with values in 0-1.
+    """
+    _require_numpy()
+    _require_pil()
+
+    if isinstance(image, (str, Path)):
+        with Image.open(image) as im:
+            return luminance(im, gamma)
+
+    if isinstance(image, Image.Image):
+        if image.mode not in ('L', 'RGB'):
+            image = image.convert('RGB')
+        image = np.asarray(image)
+
+    values = np.asarray(image, dtype=np.float32) / 255.0
+    linear = values ** gamma
+    if linear.ndim == 3:
+        linear = linear[..., :3] @ np.asarray(_REC709, dtype=np.float32)
+    return linear.astype(np.float32, copy=False)
+
+
+def _resize(values, width: int, height: int):
+    if values.shape == (height, width):
+        return values
+
+    _require_pil()
+    shrinking = width <= values.shape[1] and height <= values.shape[0]
+    resample = Image.Resampling.BOX if shrinking else Image.Resampling.NEAREST
+    resized = Image.fromarray(values, mode='F').resize((width, height), resample)
+    return np.asarray(resized, dtype=np.float32)
+
+
+def fit(values, width: int = WIDTH, height: int = HEIGHT, mode: str = 'crop'):
+    """
+    Resize a luminance array to ``width``×``height``.
+
+    Parameters:
+        values (numpy.ndarray):
+            ``(h, w)`` luminance, e.g. from :func:`luminance`.
+
+        width, height (int, optional):
+            Target size. Defaults to the LED matrix (9×34).
+
+        mode (str, optional):
+            ``crop`` scales to cover the canvas and crops the centre, ``pad``
+            scales to fit inside it with black borders, ``stretch`` ignores the
+            aspect ratio. Defaults to ``crop``.
+
+    Returns:
+        numpy.ndarray:
+            ``float32`` array of shape ``(height, width)``.
+    """
+    _require_numpy()
+    _check_choice('fit', mode, FIT_MODES)
+
+    src_h, src_w = values.shape
+    if (src_h, src_w) == (height, width) or mode == 'stretch':
+        return _resize(values, width, height)
+
+    pick = max if mode == 'crop' else min
+    scale = pick(width / src_w, height / src_h)
+    scaled_w = max(1, round(src_w * scale))
+    scaled_h = max(1, round(src_h * scale))
+    scaled = _resize(values, scaled_w, scaled_h)
+
+    if mode == 'crop':
+        top = (scaled_h - height) // 2
+        left = (scaled_w - width) // 2
+        return scaled[top:top + height, left:left + width]
+
+    canvas = np.zeros((height, width), dtype=np.float32)
+    top = (height - scaled_h) // 2
+    left = (width - scaled_w) // 2
+    canvas[top:top + scaled_h, left:left + scaled_w] = scaled
+    return canvas
+
+
+def dither(values, method: str = 'floyd-steinberg', threshold: float = 0.5, gamma: float = DEFAULT_GAMMA):
+    """
+    Reduce linear luminance to on/off pixels.
+
+    Parameters:
+        values (numpy.ndarray):
+            ``(h, w)`` linear luminance in 0-1.
+
+        method (str, optional):
+            ``threshold`` lights pixels whose perceived brightness is above
+            ``threshold``. ``ordered`` compares against a tiled Bayer matrix.
+            ``floyd-steinberg`` diffuses the error to later pixels. The two
+            dithers keep the lit fraction equal to the mean luminance.
+            Defaults to ``floyd-steinberg``.
+
+        threshold (float, optional):
+            Cut-off for ``threshold``, 0-1. Defaults to 0.5.
+
+        gamma (float, optional):
+            Used to re-encode luminance for ``threshold``. Defaults to
+            :data:`DEFAULT_GAMMA`.
+
+    Returns:
+        numpy.ndarray:
+            ``bool`` array, ``True`` where the pixel is lit.
+    """
+    _require_numpy()
+    _check_choice('dither', method, DITHER_MODES)
+
+    if method == 'threshold':
+        return values ** (1.0 / gamma) > threshold
+
+    if method == 'ordered':
+        bayer = (np.asarray(_BAYER_4, dtype=np.float32) + 0.5) / 16.0
+        h, w = values.shape
+        tiles = np.tile(bayer, (h // 4 + 1, w // 4 + 1))[:h, :w]
+        return values > tiles
+
+    # Error diffusion is inherently sequential; run it on plain floats, which
+    # is several times faster than indexing the array element by element.
+    h, w = values.shape
+    rows = values.astype(np.float64).tolist()
+    out = np.zeros((h, w), dtype=bool)
+    for y in range(h):
+        row = rows[y]
+        below = rows[y + 1] if y + 1 < h else None
+        for x in range(w):
+            old = row[x]
+            lit = old >= 0.5
+            err = old - (1.0 if lit else 0.0)
+            if lit:
+                out[y, x] = True
+            if x + 1 < w:
+                row[x + 1] += err * 0.4375
+            if below is not None:
+                if x:
+                    below[x - 1] += err * 0.1875
+                below[x] += err * 0.3125
+                if x + 1 < w:
+                    below[x + 1] += err * 0.0625
+    return out
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Payloads
+# ──────────────────────────────────────────────────────────────────────────────
+
+def to_mono(
+        image:     ImageSource,
+        width:     int   = WIDTH,
+        height:    int   = HEIGHT,
+        *,
+        dither:    str   = 'floyd-steinberg',
+        fit:       str   = 'crop',
+        gamma:     float = DEFAULT_GAMMA,
+        threshold: float = 0.5,
+):
+    """
+    Convert an image to a ``(height, width)`` boolean array of lit pixels.
+
+    See :func:`luminance`, :func:`fit` and :func:`dither` for the parameters.
+    """
+    values = _fit(luminance(image, gamma), width, height, fit)
+    return _dither(values, dither, threshold, gamma)
+
+
+def to_greyscale(
+        image:  ImageSource,
+        width:  int   = WIDTH,
+        height: int   = HEIGHT,
+        *,
+        fit:    str   = 'crop',
+        gamma:  float = DEFAULT_GAMMA,
+):
+    """
+    Convert an image to ``(height, width)`` ``uint8`` PWM levels.
+
+    Levels are proportional to linear luminance, so the LEDs show the
+    image's relative brightness rather than its encoded values.
+    """
+    values = _fit(luminance(image, gamma), width, height, fit)
+    return np.rint(np.clip(values, 0.0, 1.0) * 255.0).astype(np.uint8)
+
+
+# ``to_mono`` takes ``fit`` and ``dither`` as keyword names; keep module-level handles.
+_fit = fit
+_dither = dither
+
+
+def pack_draw_payload(lit) -> bytes:
+    """
+    Pack a ``(34, 9)`` boolean array into the 39-byte ``Draw`` payload.
+
+    Pixel ``(x, y)`` is bit ``x + 9 * y``, least significant bit first.
+    """
+    _require_numpy()
+    return np.packbits(np.asarray(lit, dtype=bool).reshape(-1), bitorder='little').tobytes()
+
+
+def draw_payload(image: ImageSource, **options: Any) -> bytes:
+    """
+    Convert an image straight to the 39-byte ``Draw`` payload.
+
+    Parameters:
+        image (ImageSource):
+            See :func:`luminance`.
+
+        **options:
+            ``dither``, ``fit``, ``gamma`` and ``threshold`` as for :func:`to_mono`.
+    """
+    return pack_draw_payload(to_mono(image, WIDTH, HEIGHT, **options))
+
+
+def greyscale_columns(image: ImageSource, **options: Any):
+    """
+    Convert an image to column-major levels for :func:`encode_greyscale_frame`.
+
+    Returns:
+        numpy.ndarray:
+            ``uint8`` array of shape ``(9, 34)``; row ``x`` is column ``x``.
+    """
+    return np.ascontiguousarray(to_greyscale(image, WIDTH, HEIGHT, **options).T)
+
+
+def b1_columns(image: ImageSource, **options: Any):
+    """
+    Convert an image to the B1 display's 1-bit column blocks.
+
+    Each of the 300 columns is 50 bytes; bit ``y % 8`` of byte ``y // 8`` is
+    set where the pixel is black.
+
+    Parameters:
+        image (ImageSource):
+            See :func:`luminance`.
+
+        **options:
+            As for :func:`to_mono`.
+
+    Returns:
+        numpy.ndarray:
+            ``uint8`` array of shape ``(300, 50)``.
+    """
+    lit = to_mono(image, B1_WIDTH, B1_HEIGHT, **options)
+    return np.packbits(~lit.T, axis=1, bitorder='little')
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Batch conversion
+# ──────────────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class ConversionOptions:
+    """
+    How :func:`convert_directory` converts each image.
+
+    Properties:
+        greyscale (bool):
+            Produce greyscale frames instead of 1-bit ones.
+
+        dither, fit (str):
+            See :func:`dither` and :func:`fit`.
+
+        gamma, threshold (float):
+            See :func:`luminance` and :func:`dither`.
+    """
+    greyscale: bool  = False
+    dither:    str   = 'floyd-steinberg'
+    fit:       str   = 'crop'
+    gamma:     float = DEFAULT_GAMMA
+    threshold: float = 0.5
+
+    def __post_init__(self):
+        _check_choice('dither', self.dither, DITHER_MODES)
+        _check_choice('fit', self.fit, FIT_MODES)
+
+
+def convert_image(path: Union[str, Path], options: ConversionOptions = ConversionOptions()) -> bytes:
+    """
+    Convert one image to a container frame: the ``Draw`` payload, or 306
+    column-major greyscale levels.
+    """
+    if options.greyscale:
+        return greyscale_columns(path, fit=options.fit, gamma=options.gamma).tobytes()
+    return draw_payload(path, dither=options.dither, fit=options.fit, gamma=options.gamma, threshold=options.threshold)
+
+
+def list_images(directory: Union[str, Path], extensions: Iterable[str] = IMAGE_EXTENSIONS) -> List[Path]:
+    """The images in ``directory``, sorted by file name."""
+    extensions = {ext.lower() for ext in extensions}
+    return sorted(p for p in Path(directory).iterdir() if p.is_file() and p.suffix.lower() in extensions)
+
+
+def convert_directory(
+        source:         Union[str, Path],
+        destination:    Union[str, Path],
+        options:        ConversionOptions = ConversionOptions(),
+        *,
+        frame_duration: float             = 0.1,
+        loop:           bool              = False,
+        workers:        Optional[int]     = None,
+) -> Path:
+    """
+    Convert every image in a directory, in name order, into one animation.
+
+    Parameters:
+        source (Union[str, Path]):
+            Directory of images (see :data:`IMAGE_EXTENSIONS`).
+
+        destination (Union[str, Path]):
+            A ``.json`` preset, or an ``.lma`` container for any other suffix.
+
+        options (ConversionOptions, optional):
+            Per-image conversion settings.
+
+        frame_duration (float, optional):
+            Seconds per frame. Defaults to 0.1.
+
+        loop (bool, optional):
+            Loop hint for containers. Defaults to False.
+
+        workers (Optional[int], optional):
+            Processes to convert with; ``None`` uses one per CPU and ``1``
+            converts in this process. Defaults to None.
+
+    Returns:
+        Path:
+            The written file.
+
+    Raises:
+        ValueError:
+            If ``source`` contains no images.
+    """
+    from is_matrix_forge.led_matrix.display.animations.container import ContainerWriter
+
+    paths = list_images(source)
+    if not paths:
+        raise ValueError(f'No images found in {source}')
+
+    destination = Path(destination)
+    MOD_LOGGER.debug(f'Converting {len(paths)} images from {source} to {destination}')
+
+    if workers == 1:
+        frames = map(convert_image, paths, repeat(options))
+        return _write_frames(destination, frames, options, frame_duration, loop, ContainerWriter)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() keeps the input order; chunks cut the per-image IPC overhead.
+        chunksize = max(1, len(paths) // (4 * (workers or os.cpu_count() or 1)))
+        frames = pool.map(convert_image, paths, repeat(options), chunksize=chunksize)
+        return _write_frames(destination, frames, options, frame_duration, loop, ContainerWriter)
+
+
+def _write_frames(destination: Path, frames: Iterable[bytes], options, frame_duration, loop, writer_cls) -> Path:
+    if destination.suffix.lower() != '.json':
+        with writer_cls(destination, 'grey' if options.greyscale else 'mono', loop=loop) as writer:
+            for frame in frames:
+                writer.add_payload(frame, frame_duration)
+        return destination
+
+    from is_matrix_forge.led_matrix.display.helpers import unpack_matrix
+
+    entries = []
+    for frame in frames:
+        if options.greyscale:
+            columns = [list(frame[x * HEIGHT:(x + 1) * HEIGHT]) for x in range(WIDTH)]
+            entries.append({
+                'grid': [[1 if v else 0 for v in col] for col in columns],
+                'brightness': columns,
+                'duration': frame_duration,
+            })
+        else:
+            entries.append({'grid': unpack_matrix(frame), 'duration': frame_duration})
+
+    destination.write_text(json.dumps(entries))
+    return destination
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Convert a directory of images into an LED matrix animation.')
+    parser.add_argument('source', help='Directory of images, converted in name order.')
+    parser.add_argument('destination', help='Output .lma container or .json preset.')
+    parser.add_argument('--greyscale', action='store_true', help='Greyscale frames instead of 1-bit.')
+    parser.add_argument('--dither', choices=DITHER_MODES, default='floyd-steinberg')
+    parser.add_argument('--fit', choices=FIT_MODES, default='crop')
+    parser.add_argument('--gamma', type=float, default=DEFAULT_GAMMA)
+    parser.add_argument('--threshold', type=float, default=0.5)
+    parser.add_argument('--duration', type=float, default=0.1, help='Seconds per frame.')
+    parser.add_argument('--loop', action='store_true', help='Mark the container as looping.')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: one per CPU).')
+    args = parser.parse_args(argv)
+
+    options = ConversionOptions(
+        greyscale=args.greyscale,
+        dither=args.dither,
+        fit=args.fit,
+        gamma=args.gamma,
+        threshold=args.threshold,
+    )
+    out = convert_directory(
+        args.source,
+        args.destination,
+        options,
+        frame_duration=args.duration,
+        loop=args.loop,
+        workers=args.workers,
+    )
+    print(f'Wrote {out}')
+    return 0
+
+
+__all__ = [
+    'B1_HEIGHT',
+    'B1_WIDTH',
+    'ConversionOptions',
+    'DITHER_MODES',
+    'FIT_MODES',
+    'b1_columns',
+    'convert_directory',
+    'convert_image',
+    'dither',
+    'draw_payload',
+    'fit',
+    'greyscale_columns',
+    'list_images',
+    'luminance',
+    'pack_draw_payload',
+    'to_greyscale',
+    'to_mono',
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -15,50 +15,40 @@ Description:
     $DESCRIPTION
 
 """
-import serial
-
 from is_matrix_forge.led_matrix.constants import WIDTH, HEIGHT
-from is_matrix_forge.led_matrix.display.helpers.columns import send_col, commit_cols
-from is_matrix_forge.led_matrix.hardware import send_command
-from is_matrix_forge.led_matrix.hardware import CommandVals
+from is_matrix_forge.led_matrix.display.helpers.columns import send_greyscale_frame
 
 
 def all_brightnesses(dev):
     """Increase the brightness with each pixel.
     Only 0-255 available, so it can't fill all 306 LEDs"""
-    with serial.Serial(dev.device, 115200) as s:
-        for x in range(0, WIDTH):
-            vals = [0 for _ in range(HEIGHT)]
-
-            for y in range(HEIGHT):
-                brightness = x + WIDTH * y
-                if brightness > 255:
-                    vals[y] = 0
-                else:
-                    vals[y] = brightness
+    columns = []
+    for x in range(0, WIDTH):
+        vals = [0 for _ in range(HEIGHT)]
 
-            send_col(dev, s, x, vals)
-        commit_cols(dev, s)
+        for y in range(HEIGHT):
+            brightness = x + WIDTH * y
+            if brightness > 255:
+                vals[y] = 0
+            else:
+                vals[y] = brightness
 
+        columns.append(vals)
+    send_greyscale_frame(dev, columns)
 
 
 def every_nth_row(dev, n):
-    for x in range(WIDTH):
-        vals = [(0xFF if y % n == 0 else 0) for y in range(HEIGHT)]
-
-        send_command(dev, CommandVals.StageGreyCol, [x] + vals)
-    send_command(dev, CommandVals.DrawGreyColBuffer, [])
+    columns = [[(0xFF if y % n == 0 else 0) for y in range(HEIGHT)] for _ in range(WIDTH)]
+    send_greyscale_frame(dev, columns)
 
 
 def every_nth_col(dev, n):
-    for x in range(WIDTH):
-        vals = [(0xFF if x % n == 0 else 0) for _ in range(HEIGHT)]
-
-        send_command(dev, CommandVals.StageGreyCol, [x] + vals)
-    send_command(dev, CommandVals.DrawGreyColBuffer, [])
+    columns = [[(0xFF if x % n == 0 else 0) for _ in range(HEIGHT)] for x in range(WIDTH)]
+    send_greyscale_frame(dev, columns)
 
 
 def checkerboard(dev, n):
+    columns = []
     for x in range(WIDTH):
         vals = []
         col_phase = (x // n) % 2  # alternate every n columns
@@ -68,5 +58,5 @@ def checkerboard(dev, n):
                 vals.append(0xFF)
             else:
                 vals.append(0x00)
-        send_command(dev, CommandVals.StageGreyCol, [x] + vals)
-    send_command(dev, CommandVals.DrawGreyColBuffer, [])
+        columns.append(vals)
+    send_greyscale_frame(dev, columns)
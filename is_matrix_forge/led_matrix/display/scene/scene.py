@@ -1,5 +1,7 @@
 from __future__ import annotations
+
 from is_matrix_forge.led_matrix.display.grid import Grid
+from is_matrix_forge.led_matrix.display.grid.array import HAS_NUMPY
 from is_matrix_forge.led_matrix.display.scene.errors import SceneNotBuiltError
 
 
@@ -60,6 +62,11 @@ class Scene:
         fg = self.__foreground
         if bg is None:
             raise ValueError("Scene.background must be set before building")
+        # ``numpy`` is optional and imported on first use; it composites without per-pixel loops.
+        if HAS_NUMPY:
+            self.__grid = Grid(init_grid=self._compose_vectorized(bg, fg, self.invert))
+            return self.__grid
+
         width = len(bg)
         height = len(bg[0]) if width else 0
         result = [[0 for _ in range(height)] for _ in range(width)]
@@ -73,6 +80,18 @@ class Scene:
         self.__grid = Grid(init_grid=result)
         return self.__grid
 
+    @staticmethod
+    def _compose_vectorized(bg: list, fg: list, invert: bool) -> list:
+        import numpy as np
+
+        bg_arr = np.asarray(bg, dtype=np.uint8)
+        if not fg:
+            return bg_arr.tolist()
+
+        fg_arr = np.asarray(fg, dtype=np.uint8)
+        top = 1 - bg_arr if invert else fg_arr
+        return np.where(fg_arr != 0, top, bg_arr).tolist()
+
     def render(self, controller):
         """
         Use a controller to render the composed grid.
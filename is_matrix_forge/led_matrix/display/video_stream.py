@@ -0,0 +1,321 @@
+"""
+Streaming video playback.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/display/video_stream.py
+
+Description:
+    Video used to be decoded, greyscaled, resized and cropped up-front into one
+    big list before the first frame was shown, so start-up latency and memory
+    grew with the clip length.
+
+    :class:`VideoStreamer` splits playback into two stages. A decoder thread
+    reads and prepares frames into a bounded queue, and the writer drains that
+    queue at the source FPS. Pacing uses a
+    :class:`~is_matrix_forge.led_matrix.display.animations.scheduler.FrameScheduler`
+    with the ``skip`` policy, so when the writer falls behind, frames whose slot
+    has already passed are dropped instead of slowing the whole clip down.
+    Each frame goes to the port as one buffered write (all ``StageGreyCol``
+    commands plus the ``DrawGreyColBuffer`` commit).
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from threading import Event
+from typing import Any, Callable, Optional
+
+from is_matrix_forge.led_matrix.constants import HEIGHT, WIDTH
+from is_matrix_forge.led_matrix.display.animations.frame.helpers import sleep_with_cancel
+from is_matrix_forge.led_matrix.display.animations.scheduler import FrameScheduler, LateFramePolicy
+from is_matrix_forge.led_matrix.display.helpers.columns import encode_greyscale_frame
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.display.video_stream')
+
+DEFAULT_QUEUE_SIZE = 8
+"""int: Prepared frames buffered ahead of the writer."""
+
+FALLBACK_FPS = 30.0
+"""float: Frame rate used when the source does not report a usable one."""
+
+_END = object()
+
+
+@dataclass(frozen=True)
+class VideoStats:
+    """
+    Summary of one streamed playback.
+
+    Properties:
+        fps (float):
+            The frame rate playback was paced at.
+
+        frames_decoded (int):
+            Frames read and prepared by the decoder.
+
+        frames_shown (int):
+            Frames written to the device.
+
+        frames_dropped (int):
+            Frames skipped because their slot had already passed.
+    """
+    fps: float
+    frames_decoded: int
+    frames_shown: int
+    frames_dropped: int
+
+
+def source_fps(capture: Any) -> float:
+    """
+    Return the capture's reported FPS, or :data:`FALLBACK_FPS` if it is unusable.
+
+    Parameters:
+        capture (Any):
+            A ``cv2.VideoCapture``-like object.
+
+    Returns:
+        float:
+            Frames per second.
+    """
+    import cv2
+
+    try:
+        fps = float(capture.get(cv2.CAP_PROP_FPS))
+        if fps <= 0 or fps != fps:
+            raise ValueError
+    except Exception:
+        fps = FALLBACK_FPS
+    return fps
+
+
+class FramePreparer:
+    """
+    Convert source frames to 34-row greyscale, centre-cropped to the matrix width.
+
+    The output size is fixed from the first frame seen; later frames are scaled
+    the same way.
+
+    Parameters:
+        color_conversion (Optional[int], optional):
+            ``cv2`` colour conversion code. Defaults to ``cv2.COLOR_BGR2GRAY``.
+    """
+
+    def __init__(self, color_conversion: Optional[int] = None):
+        self.color_conversion = color_conversion
+        self._dim = None
+        self._start_x = 0
+        self._end_x = WIDTH
+
+    def _size_from(self, frame) -> None:
+        scale_y = HEIGHT / frame.shape[0]
+
+        # Scale the video to 34 pixels height
+        self._dim = (HEIGHT, int(round(frame.shape[1] * scale_y)))
+        # Find the starting position to crop the width to be centered
+        # For very narrow videos, make sure to stay in bounds
+        self._start_x = max(0, int(round(self._dim[1] / 2 - WIDTH / 2)))
+        self._end_x = min(self._dim[1], self._start_x + WIDTH)
+
+    def __call__(self, frame):
+        import cv2
+
+        if self._dim is None:
+            self._size_from(frame)
+
+        code = cv2.COLOR_BGR2GRAY if self.color_conversion is None else self.color_conversion
+        gray = cv2.cvtColor(frame, code)
+        resized = cv2.resize(gray, (self._dim[1], self._dim[0]))
+        return resized[0:HEIGHT, self._start_x:self._end_x]
+
+
+class VideoStreamer:
+    """
+    Decode a video on a background thread and play it back at the source FPS.
+
+    Parameters:
+        capture (Any):
+            A ``cv2.VideoCapture``-like object (``read()`` and ``get(prop)``).
+
+        write (Callable[[bytes], Any]):
+            Writes one encoded frame to the device (e.g. ``serial.write``).
+
+        keep_running (Optional[Callable[[], bool]], optional):
+            Polled by both stages; playback ends once it returns False.
+
+        fps (Optional[float], optional):
+            Playback rate. Defaults to the capture's FPS (see :func:`source_fps`).
+
+        queue_size (int, optional):
+            Prepared frames buffered ahead of the writer. Defaults to
+            :data:`DEFAULT_QUEUE_SIZE`.
+
+        prepare (Optional[Callable[[Any], Any]], optional):
+            Turns a decoded frame into a ``HEIGHT``×``<=WIDTH`` greyscale array.
+            Defaults to a :class:`FramePreparer`.
+
+        clock (Callable[[], float], optional):
+            Monotonic clock. Defaults to :func:`time.monotonic`.
+
+        sleeper (Callable[[float, Optional[Event]], None], optional):
+            Cancellable sleep used for pacing.
+    """
+
+    def __init__(
+            self,
+            capture: Any,
+            write: Callable[[bytes], Any],
+            *,
+            keep_running: Optional[Callable[[], bool]] = None,
+            fps: Optional[float] = None,
+            queue_size: int = DEFAULT_QUEUE_SIZE,
+            prepare: Optional[Callable[[Any], Any]] = None,
+            clock: Callable[[], float] = time.monotonic,
+            sleeper: Callable[[float, Optional[Event]], None] = sleep_with_cancel,
+    ):
+        if queue_size < 1:
+            raise ValueError('queue_size must be at least 1')
+
+        self.capture = capture
+        self.write = write
+        self.keep_running = keep_running or (lambda: True)
+        self.fps = float(fps) if fps else source_fps(capture)
+        self.queue_size = queue_size
+        self.prepare = prepare or FramePreparer()
+        self.clock = clock
+        self.sleeper = sleeper
+
+        self._stop_event = Event()
+        self._decoded = 0
+        self._decode_error: Optional[BaseException] = None
+
+    def stop(self) -> None:
+        """Stop both stages after the frame currently being handled."""
+        self._stop_event.set()
+
+    def _running(self) -> bool:
+        return not self._stop_event.is_set() and self.keep_running()
+
+    def _put(self, frames: queue.Queue, item: Any) -> bool:
+        # Block while the writer is behind, but keep checking for a stop so the
+        # thread never hangs on a full queue.
+        while True:
+            try:
+                frames.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                if self._stop_event.is_set():
+                    return False
+
+    def _decode(self, frames: queue.Queue) -> None:
+        log = MOD_LOGGER.get_child('VideoStreamer._decode')
+        try:
+            while self._running():
+                ret, frame = self.capture.read()
+                if not ret:
+                    log.debug(f'End of stream after {self._decoded} frames')
+                    break
+
+                if not self._put(frames, self.prepare(frame)):
+                    return
+                self._decoded += 1
+        except BaseException as exc:  # surfaced by the writer
+            self._decode_error = exc
+        finally:
+            self._put(frames, _END)
+
+    def play(self) -> VideoStats:
+        """
+        Stream the capture to the device and block until it ends or is stopped.
+
+        Returns:
+            VideoStats:
+                Frame counts for the run.
+
+        Raises:
+            Exception:
+                Any error raised while decoding or writing.
+        """
+        log = MOD_LOGGER.get_child('VideoStreamer.play')
+
+        self._stop_event.clear()
+        self._decoded = 0
+        self._decode_error = None
+
+        frames: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        decoder = threading.Thread(target=self._decode, args=(frames,), daemon=True, name='VideoDecoder')
+        decoder.start()
+
+        scheduler = FrameScheduler(LateFramePolicy.SKIP, clock=self.clock, sleeper=self.sleeper)
+        frame_delay = 1.0 / self.fps
+
+        try:
+            while self._running():
+                frame = frames.get()
+                if frame is _END:
+                    break
+
+                if scheduler.begin_frame(frame_delay):
+                    self.write(encode_greyscale_frame(frame.T))
+                scheduler.end_frame(self._stop_event)
+        finally:
+            self._stop_event.set()
+            decoder.join()
+
+        stats = scheduler.finish()
+
+        if self._decode_error is not None:
+            raise self._decode_error
+
+        result = VideoStats(
+            fps=self.fps,
+            frames_decoded=self._decoded,
+            frames_shown=stats.frames_drawn,
+            frames_dropped=stats.frames_skipped,
+        )
+
+        if result.frames_dropped:
+            log.debug(f'Dropped {result.frames_dropped}/{result.frames_decoded} frames to hold {self.fps:.2f} fps')
+
+        return result
+
+
+def stream_video(capture: Any, write: Callable[[bytes], Any], **kwargs) -> VideoStats:
+    """
+    Convenience wrapper: build a :class:`VideoStreamer` and play it.
+
+    Parameters:
+        capture (Any):
+            A ``cv2.VideoCapture``-like object.
+
+        write (Callable[[bytes], Any]):
+            Writes one encoded frame to the device.
+
+        **kwargs:
+            Passed to :class:`VideoStreamer`.
+
+    Returns:
+        VideoStats:
+            Frame counts for the run.
+    """
+    return VideoStreamer(capture, write, **kwargs).play()
+
+
+__all__ = [
+    'DEFAULT_QUEUE_SIZE',
+    'FALLBACK_FPS',
+    'FramePreparer',
+    'VideoStats',
+    'VideoStreamer',
+    'source_fps',
+    'stream_video',
+]
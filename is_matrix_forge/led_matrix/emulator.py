@@ -0,0 +1,420 @@
+"""
+Virtual LED matrix that speaks the firmware protocol over a pseudo-terminal.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/emulator.py
+
+Description:
+    CI machines have no LED matrix, so nothing below the controller layer
+    could be exercised or benchmarked there. :class:`VirtualMatrixDevice`
+    opens a pty, decodes the commands the library writes to it with
+    :class:`~is_matrix_forge.led_matrix.commands.parser.CommandParser`, keeps
+    an emulated framebuffer in :class:`EmulatedMatrix` and answers queries
+    with the same response sizes as the firmware (``RESPONSE_SIZE`` bytes,
+    or one byte per pixel for ``GetAllBrightness``).
+
+    :class:`LinkModel` adds a configurable per-command latency and a baud-rate
+    transfer time, so throughput measured against the emulator is bounded the
+    way a real link is instead of by how fast a pty can shuffle bytes.
+
+    Registering the device (the default) makes :func:`get_devices
+    <is_matrix_forge.led_matrix.helpers.device.get_devices>` discover it.
+    Run the module directly to serve a device for other processes; it prints
+    the ``LED_MATRIX_VIRTUAL_PORTS`` setting they need.
+
+    Requires a POSIX system (``os.openpty``).
+
+Example Usage:
+    from is_matrix_forge.led_matrix.emulator import VirtualMatrixDevice
+    from is_matrix_forge.led_matrix.helpers.device import list_devices
+
+    with VirtualMatrixDevice(baudrate=115200, latency=0.001) as emu:
+        dev = list_devices(refresh=True)[0]
+        ...
+        print(emu.matrix.grid)
+
+    $ python -m is_matrix_forge.led_matrix.emulator --baudrate 115200 --latency 0.001
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import os
+import select
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.commands.parser import Command, CommandParser
+from is_matrix_forge.led_matrix.constants import HEIGHT, RESPONSE_SIZE, WIDTH
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.emulator')
+
+HAS_PTY = hasattr(os, 'openpty')
+
+FRAMEBUFFER_SIZE = WIDTH * HEIGHT
+
+DEFAULT_VERSION: Tuple[int, int, int] = (0, 2, 0)
+"""Firmware version reported by default (major, minor, patch)."""
+
+DEFAULT_BRIGHTNESS = 51
+
+
+class LinkModel:
+    """
+    Timing model for the emulated serial link.
+
+    Parameters:
+        baudrate (Optional[int], optional):
+            Line rate in baud; each byte costs 10 bit times (8N1). ``None``
+            models an unlimited link. Defaults to None.
+
+        latency (float, optional):
+            Fixed seconds added to every command, e.g. USB polling and
+            firmware handling. Defaults to 0.
+    """
+
+    def __init__(self, baudrate: Optional[int] = None, latency: float = 0.0):
+        if baudrate is not None and baudrate <= 0:
+            raise ValueError('baudrate must be positive')
+        if latency < 0:
+            raise ValueError('latency must not be negative')
+
+        self.baudrate = baudrate
+        self.latency = latency
+
+    def transfer_time(self, nbytes: int) -> float:
+        """Seconds needed to move ``nbytes`` over the line."""
+        if not self.baudrate:
+            return 0.0
+        return nbytes * 10 / self.baudrate
+
+    def command_time(self, nbytes: int) -> float:
+        """Seconds a command of ``nbytes`` (magic and opcode included) occupies the link."""
+        return self.latency + self.transfer_time(nbytes)
+
+    def __repr__(self) -> str:
+        return f'LinkModel(baudrate={self.baudrate!r}, latency={self.latency!r})'
+
+
+class EmulatedMatrix:
+    """
+    Device-side state of a 9×34 LED matrix.
+
+    Pixels are stored one brightness byte each, row after row (pixel
+    ``(x, y)`` at ``x + 9 * y``), which is also the layout ``GetAllBrightness``
+    returns.
+
+    Parameters:
+        version (Tuple[int, int, int], optional):
+            Firmware version to report. Defaults to :data:`DEFAULT_VERSION`.
+
+        brightness (int, optional):
+            Initial global brightness. Defaults to 51.
+    """
+
+    def __init__(self, version: Tuple[int, int, int] = DEFAULT_VERSION, brightness: int = DEFAULT_BRIGHTNESS):
+        self.version    = version
+        self.brightness = brightness
+        self.animate    = False
+        self.pixels     = bytearray(FRAMEBUFFER_SIZE)
+        self.frames     = 0
+        self.commands: Dict[str, int] = collections.Counter()
+        self._staged    = bytearray(FRAMEBUFFER_SIZE)
+
+    @property
+    def grid(self) -> List[List[int]]:
+        """Column-major brightness values (``grid[x][y]``), as the library's grids are laid out."""
+        return [list(self.pixels[x::WIDTH]) for x in range(WIDTH)]
+
+    @property
+    def lit(self) -> List[List[int]]:
+        """Column-major on/off values."""
+        return [[1 if v else 0 for v in column] for column in self.grid]
+
+    def apply(self, command: Command) -> Optional[bytes]:
+        """
+        Execute one command.
+
+        Parameters:
+            command (Command):
+                The decoded command.
+
+        Returns:
+            Optional[bytes]:
+                The response to send back, or ``None`` for commands that do not
+                answer.
+        """
+        self.commands[command.name] += 1
+        handler = _HANDLERS.get(command.opcode)
+        if handler is None:
+            return None
+        return handler(self, command.params)
+
+    # ——— handlers ———
+
+    def _draw(self, params: bytes) -> None:
+        bits = int.from_bytes(params, 'little')
+        self.pixels[:] = bytes(0xFF if bits >> i & 1 else 0 for i in range(FRAMEBUFFER_SIZE))
+        self.animate = False
+        self.frames += 1
+
+    def _stage_grey_col(self, params: bytes) -> None:
+        column = params[0]
+        if column < WIDTH:
+            self._staged[column::WIDTH] = params[1:1 + HEIGHT]
+
+    def _draw_grey_col_buffer(self, _params: bytes) -> None:
+        self.pixels[:] = self._staged
+        self.animate = False
+        self.frames += 1
+
+    def _brightness(self, params: bytes) -> Optional[bytes]:
+        if params:
+            self.brightness = params[0]
+            return None
+        return _response([self.brightness])
+
+    def _animate(self, params: bytes) -> Optional[bytes]:
+        if params:
+            self.animate = bool(params[0])
+            return None
+        return _response([int(self.animate)])
+
+    def _version(self, _params: bytes) -> bytes:
+        major, minor, patch = self.version
+        return _response([major, (minor & 0xF) << 4 | (patch & 0xF), 0])
+
+    def _get_all_brightness(self, _params: bytes) -> bytes:
+        return bytes(self.pixels)
+
+
+def _response(values: Sequence[int]) -> bytes:
+    return bytes(values).ljust(RESPONSE_SIZE, b'\x00')
+
+
+_HANDLERS = {
+    CommandVals.Draw:              EmulatedMatrix._draw,
+    CommandVals.StageGreyCol:      EmulatedMatrix._stage_grey_col,
+    CommandVals.DrawGreyColBuffer: EmulatedMatrix._draw_grey_col_buffer,
+    CommandVals.Brightness:        EmulatedMatrix._brightness,
+    CommandVals.Animate:           EmulatedMatrix._animate,
+    CommandVals.Version:           EmulatedMatrix._version,
+    CommandVals.GetAllBrightness:  EmulatedMatrix._get_all_brightness,
+}
+
+
+class VirtualMatrixDevice:
+    """
+    Serve an :class:`EmulatedMatrix` on a pseudo-terminal.
+
+    Parameters:
+        baudrate (Optional[int], optional):
+            See :class:`LinkModel`. Defaults to None.
+
+        latency (float, optional):
+            See :class:`LinkModel`. Defaults to 0.
+
+        serial_number (Optional[str], optional):
+            Serial number reported to discovery. Defaults to one derived from
+            the pty name.
+
+        location (str, optional):
+            USB location reported to discovery, which picks the keyboard slot
+            (``'1-3.2'``/``'1-3.3'`` right, ``'1-4.2'``/``'1-4.3'`` left).
+            Defaults to ``'1-3.2'``.
+
+        register (bool, optional):
+            Make :func:`get_devices` in this process return the device while it
+            runs. Defaults to True.
+
+        matrix (Optional[EmulatedMatrix], optional):
+            The state to serve. Defaults to a fresh one.
+
+    Raises:
+        RuntimeError:
+            On platforms without ``os.openpty`` (when started).
+    """
+
+    READ_SIZE = 64
+    """Bytes read per chunk; a USB full-speed bulk packet."""
+
+    def __init__(
+            self,
+            baudrate:      Optional[int]            = None,
+            latency:       float                    = 0.0,
+            *,
+            serial_number: Optional[str]            = None,
+            location:      str                      = '1-3.2',
+            register:      bool                     = True,
+            matrix:        Optional[EmulatedMatrix] = None,
+    ):
+        self.link           = LinkModel(baudrate, latency)
+        self.matrix         = matrix if matrix is not None else EmulatedMatrix()
+        self.serial_number  = serial_number
+        self.location       = location
+        self.register       = register
+        self.bytes_received = 0
+        self.port: Optional[str] = None
+        self.port_info      = None
+
+        self._parser = CommandParser()
+        self._lock   = threading.Lock()
+        self._stop   = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._master: Optional[int] = None
+        self._slave:  Optional[int] = None
+        self._link_free_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def lock(self) -> threading.Lock:
+        """Hold while reading :attr:`matrix` to get a consistent view."""
+        return self._lock
+
+    def start(self) -> 'VirtualMatrixDevice':
+        """Open the pty, start serving and (optionally) register the device. Returns ``self``."""
+        if self.running:
+            return self
+
+        if not HAS_PTY:
+            raise RuntimeError('The virtual LED matrix requires os.openpty (POSIX).')
+
+        import tty
+        from is_matrix_forge.led_matrix.helpers.device import register_virtual_device, virtual_port_info
+
+        self._master, self._slave = os.openpty()
+        # Raw mode: no echo, no line editing, no newline translation.
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self.port_info = virtual_port_info(self.port, self.serial_number, self.location)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._serve, name=f'virtual-matrix-{self.port}', daemon=True)
+        self._thread.start()
+
+        if self.register:
+            register_virtual_device(self.port_info)
+
+        MOD_LOGGER.get_child('VirtualMatrixDevice.start').info(
+            f'Virtual LED matrix on {self.port} ({self.link!r})'
+        )
+        return self
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """Stop serving, unregister and close the pty."""
+        from is_matrix_forge.led_matrix.helpers.device import unregister_virtual_device
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+        if self.port_info is not None and self.register:
+            unregister_virtual_device(self.port_info)
+
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def __enter__(self) -> 'VirtualMatrixDevice':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ——— serving ———
+
+    def _occupy_link(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        # Book time on a virtual timeline so sleep overshoot does not accumulate.
+        now = time.monotonic()
+        self._link_free_at = max(now, self._link_free_at) + seconds
+        delay = self._link_free_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def _serve(self) -> None:
+        log = MOD_LOGGER.get_child('VirtualMatrixDevice._serve')
+
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._master], [], [], 0.05)
+            if not ready:
+                continue
+
+            try:
+                data = os.read(self._master, self.READ_SIZE)
+            except OSError as exc:
+                log.debug(f'pty read failed: {exc}')
+                continue
+
+            self.bytes_received += len(data)
+            for command in self._parser.feed(data):
+                self._occupy_link(self.link.command_time(3 + len(command.params)))
+
+                with self._lock:
+                    response = self.matrix.apply(command)
+
+                if response is not None:
+                    self._occupy_link(self.link.transfer_time(len(response)))
+                    os.write(self._master, response)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m is_matrix_forge.led_matrix.emulator',
+        description='Serve a virtual LED matrix on a pseudo-terminal until interrupted.',
+    )
+    parser.add_argument('--baudrate', type=int, default=None, help='Model a line of this many baud (default: unlimited).')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every command (default: 0).')
+    parser.add_argument('--serial-number', default=None, help='Serial number reported to discovery.')
+    parser.add_argument('--location', default='1-3.2', help="USB location, which picks the slot (default: '1-3.2', right 1).")
+    args = parser.parse_args(argv)
+
+    from is_matrix_forge.led_matrix.helpers.device import VIRTUAL_PORTS_ENV_VAR
+
+    emulator = VirtualMatrixDevice(
+        args.baudrate,
+        args.latency,
+        serial_number=args.serial_number,
+        location=args.location,
+    ).start()
+    print(f'{VIRTUAL_PORTS_ENV_VAR}={emulator.port}@{emulator.location}', flush=True)
+    try:
+        while emulator.running:
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.stop()
+
+    counts = ', '.join(f'{name}={n}' for name, n in sorted(emulator.matrix.commands.items()))
+    print(f'{emulator.matrix.frames} frames, {emulator.bytes_received} bytes ({counts or "no commands"})', file=sys.stderr)
+    return 0
+
+
+__all__ = [
+    'EmulatedMatrix',
+    'HAS_PTY',
+    'LinkModel',
+    'VirtualMatrixDevice',
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
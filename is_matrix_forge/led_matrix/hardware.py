@@ -10,10 +10,13 @@ from typing import List, Optional, ByteString, Union
 import serial
 from serial.tools.list_ports_common import ListPortInfo
 
+from is_matrix_forge.led_matrix.commands.encoder import get_encoder
 from is_matrix_forge.led_matrix.commands.map import CommandVals
 
 from is_matrix_forge.led_matrix.constants import RESPONSE_SIZE, FWK_MAGIC, WIDTH, HEIGHT
 from is_matrix_forge.led_matrix.helpers import disconnect_dev, DISCONNECTED_DEVS
+from is_matrix_forge.led_matrix.transport import get_pool
+from is_matrix_forge.led_matrix.transport.aio import get_async_transport
 
 from is_matrix_forge.log_engine import ROOT_LOGGER
 
@@ -101,6 +104,8 @@ def get_version(dev):
 
 def get_pwm_freq(dev):
     res = send_command(dev, CommandVals.PwmFreq, with_response=True)
+    if not res:
+        return None
 
     freq = int(res[0])
     if freq == 0:
@@ -140,9 +145,11 @@ def brightness(dev, b: int):
     send_command(dev, CommandVals.Brightness, [b])
 
 
-def get_brightness(dev):
-    """Retrieve the current brightness value."""
+def get_brightness(dev) -> Optional[int]:
+    """Retrieve the current brightness value (``None`` if the device did not answer)."""
     res = send_command(dev, CommandVals.Brightness, with_response=True)
+    if not res:
+        return None
     return int(res[0])
 
 
@@ -203,6 +210,9 @@ def send_serial(
     """
     Sends raw bytes over serial and prints exactly what is sent.
 
+    The bytes are written through the shared connection pool, so the port
+    stays open for subsequent commands.
+
     Args:
         controller (LEDMatrixController):
             The controller to use.
@@ -234,35 +244,46 @@ def send_serial(
         print(f"[send_serial] Raw bytes:    {cmd_bytes!r}")
 
     try:
-        with serial.Serial(str(controller.device), baud) as ser:
-            ser.write(cmd_bytes)
+        with get_pool().connection(controller.device) as ser:
+            # The handle is shared; put its baud rate back for the next user.
+            previous = ser.baudrate
+            if previous != baud:
+                ser.baudrate = baud
+            try:
+                ser.write(cmd_bytes)
+            finally:
+                if ser.baudrate != previous:
+                    ser.baudrate = previous
     except (IOError, OSError) as _ex:
-        disconnect_dev(controller.device)
+        disconnect_dev(str(controller.device))
 
 
 def send_command_raw(
     dev: ListPortInfo,
-    command: List[int],
+    command: Union[List[int], bytes, bytearray, memoryview],
     with_response: bool = False,
     response_size: Optional[int] = None,
     response_timeout: Optional[float] = None,
 ) -> Optional[ByteString]:
     """
-    Send a command to the device using a new serial connection.
+    Send a command to the device over its pooled serial connection.
 
     Args:
         dev (ListPortInfo): The device to send the command to.
-        command (List[int]): The command to send.
+        command (Union[List[int], bytes-like]): The encoded command. Bytes-like commands
+            (e.g. a view from a :class:`CommandEncoder`) are written without copying.
         with_response (bool, optional): Whether to wait for a response from the device. Defaults to False.
         response_size (Optional[int], optional): The size of the response to expect. Defaults to None.
 
     Returns:
         Optional[ByteString]: The response from the device, if any, or None if no response or an error occurred.
 
-    Raises:
-        IOError, OSError: If there is an error communicating with the device.
+    Note:
+        Communication errors are not raised; the device is recorded in
+        ``DISCONNECTED_DEVS`` and ``None`` is returned. The pool reopens the
+        port on the next command.
     """
-    cmd_bytes = bytes(command)
+    cmd_bytes = command if isinstance(command, (bytes, bytearray, memoryview)) else bytes(command)
     #print(f"Sending command (int): {list(cmd_bytes)}")
     #print(f"Sending command (hex):  {[f'0x{b:02X}' for b in cmd_bytes]}")
     #print(f"Raw bytes: {cmd_bytes!r}")
@@ -271,30 +292,32 @@ def send_command_raw(
     if timeout is None and with_response:
         timeout = 1.0
     try:
-        with serial.Serial(str(dev.device), 115200, timeout=timeout) as s:
-            s.write(cmd_bytes)
-            if not with_response:
-                return None
-
-            if timeout is not None:
-                s.timeout = timeout
-            return s.read(res_size)
+        return get_pool().exchange(
+            dev,
+            cmd_bytes,
+            with_response=with_response,
+            response_size=res_size,
+            timeout=timeout,
+        )
     except (IOError, OSError) as _ex:
         disconnect_dev(dev.device)
         return None
-        # print("Error: ", ex)
 
 
 def send_command(
         dev:           ListPortInfo,
         command:       int,
-        parameters:    Optional[List[int]] = None,
+        parameters:    Optional[Union[List[int], bytes, bytearray, memoryview]] = None,
         with_response: bool                = False,
         response_size: Optional[int]       = None,
         response_timeout: Optional[float]  = None,
 ) -> Optional[ByteString]:
     """
-    Send a command to the device using a new serial connection.
+    Send a command to the device over its pooled serial connection.
+
+    The command is encoded into the device's reusable buffer (see
+    :mod:`~is_matrix_forge.led_matrix.commands.encoder`), so sending a
+    bytes-like payload builds no intermediate lists or ``bytes``.
 
     Parameters:
         dev (ListPortInfo):
@@ -303,7 +326,7 @@ def send_command(
         command (int):
             The command to send.
 
-        parameters (Optional[List[int]], optional):
+        parameters (Optional[Union[List[int], bytes-like]], optional):
             The parameters to send with the command. Defaults to None.
 
         with_response (bool, optional):
@@ -317,15 +340,95 @@ def send_command(
             How long to wait for a response before giving up. Defaults to 1s
             when a response is requested.
 
+    Returns:
+        Optional[ByteString]:
+            The response from the device, if any, or None if no response or an error occurred.
+    """
+    encoder = get_encoder(dev)
+    with encoder.lock:
+        return send_command_raw(
+            dev,
+            encoder.encode(command, parameters),
+            with_response,
+            response_size=response_size,
+            response_timeout=response_timeout,
+        )
+
+
+async def send_command_raw_async(
+    dev: ListPortInfo,
+    command: List[int],
+    with_response: bool = False,
+    response_size: Optional[int] = None,
+    response_timeout: Optional[float] = None,
+) -> Optional[ByteString]:
+    """
+    Awaitable counterpart of :func:`send_command_raw`.
+
+    Uses the event loop's :class:`~is_matrix_forge.led_matrix.transport.aio.AsyncSerialTransport`
+    for the device, so the loop is never blocked on serial I/O.
+
+    Args:
+        dev (ListPortInfo): The device to send the command to.
+        command (List[int]): The command to send.
+        with_response (bool, optional): Whether to wait for a response from the device. Defaults to False.
+        response_size (Optional[int], optional): The size of the response to expect. Defaults to None.
+        response_timeout (Optional[float], optional): How long to wait for a response. Defaults to 1s.
+
+    Returns:
+        Optional[ByteString]: The response from the device, if any, or None if no response or an error occurred.
+    """
+    try:
+        return await get_async_transport(dev).exchange(
+            bytes(command),
+            with_response=with_response,
+            response_size=response_size or RESPONSE_SIZE,
+            timeout=response_timeout,
+        )
+    except (IOError, OSError) as _ex:
+        disconnect_dev(dev.device)
+        return None
+
+
+async def send_command_async(
+        dev:              ListPortInfo,
+        command:          int,
+        parameters:       Optional[List[int]] = None,
+        with_response:    bool                = False,
+        response_size:    Optional[int]       = None,
+        response_timeout: Optional[float]     = None,
+) -> Optional[ByteString]:
+    """
+    Awaitable counterpart of :func:`send_command`.
+
+    Parameters:
+        dev (ListPortInfo):
+            The device to send the command to.
+
+        command (int):
+            The command to send.
+
+        parameters (Optional[List[int]], optional):
+            The parameters to send with the command. Defaults to None.
+
+        with_response (bool, optional):
+            Whether to wait for a response from the device. Defaults to False.
+
+        response_size (Optional[int], optional):
+            Number of bytes to read when awaiting a response.
+
+        response_timeout (Optional[float], optional):
+            How long to wait for a response before giving up. Defaults to 1s.
+
     Returns:
         Optional[ByteString]:
             The response from the device, if any, or None if no response or an error occurred.
     """
     if parameters is None:
         parameters = []
-    return send_command_raw(
+    return await send_command_raw_async(
         dev,
-        FWK_MAGIC + [command] + parameters,
+        FWK_MAGIC + [command] + list(parameters),
         with_response,
         response_size=response_size,
         response_timeout=response_timeout,
@@ -1,14 +1,4 @@
 import serial
-try:
-    from inspyre_toolbox.chrono.sleep import NegateSwitch
-except ModuleNotFoundError:  # pragma: no cover - fallback when dependency missing
-    class NegateSwitch:
-        def __init__(self, initial: bool = False):
-            self.value = initial
-
-        def __call__(self, *_):
-            self.value = not self.value
-            return self.value
 
 try:
     from inspyre_toolbox.path_man import provision_path
@@ -140,6 +130,10 @@ def send_serial(dev: ListPortInfo, s: 'serial.Serial', command: ByteString) -> N
     try:
         s.write(command)
     except (IOError, OSError) as _ex:
+        from is_matrix_forge.led_matrix.transport import get_pool
+
+        # Drop the (possibly pooled) handle so the next command reopens the port.
+        get_pool().discard(dev)
         disconnect_dev(dev.device)
         # print("Error: ", ex)
 
@@ -182,4 +176,27 @@ def identify_devices(devices: Optional[List[ListPortInfo]] = None) -> None:
         t.join()
 
 
-running = NegateSwitch(False)
+def _negate_switch_class():
+    # ``inspyre_toolbox.chrono`` takes ~0.5 s to import; only pay for it when
+    # ``running`` is actually used.
+    try:
+        from inspyre_toolbox.chrono.sleep import NegateSwitch
+    except ModuleNotFoundError:  # pragma: no cover - fallback when dependency missing
+        class NegateSwitch:
+            def __init__(self, initial: bool = False):
+                self.value = initial
+
+            def __call__(self, *_):
+                self.value = not self.value
+                return self.value
+
+    return NegateSwitch
+
+
+def __getattr__(name):
+    if name == 'running':
+        switch = _negate_switch_class()(False)
+        globals()['running'] = switch
+        return switch
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -3,8 +3,22 @@ Device helper functions for LED matrix hardware.
 
 This module provides utility functions for working with LED matrix devices,
 including functions to convert between different device location formats.
+
+Serial ports are not enumerated at import time. ``DEVICES`` is resolved on
+first access through :func:`list_devices`, which caches the result until
+:func:`refresh_devices` is called.
+
+Virtual devices (such as the pty emulator in
+:mod:`is_matrix_forge.led_matrix.emulator`) are not USB ports, so they are
+added to discovery explicitly: in-process with
+:func:`register_virtual_device`, or from another process through the
+``LED_MATRIX_VIRTUAL_PORTS`` environment variable (``port[@location]``
+entries separated by ``os.pathsep``).
 """
 from __future__ import annotations
+import os
+import threading
+from typing import List, Optional
 from serial import Serial, SerialException
 from serial.tools import list_ports
 from is_matrix_forge.log_engine import ROOT_LOGGER
@@ -13,6 +27,17 @@ from is_matrix_forge.led_matrix.constants import VID as EXPECTED_VID, PID as EXP
 
 MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.helpers.device')
 
+_DEVICE_CACHE: Optional[List['ListPortInfo']] = None
+_DEVICE_CACHE_LOCK = threading.Lock()
+
+VIRTUAL_PORTS_ENV_VAR = 'LED_MATRIX_VIRTUAL_PORTS'
+"""Environment variable listing virtual device ports to include in discovery."""
+
+VIRTUAL_DEFAULT_LOCATION = '1-3.2'
+"""USB location virtual devices report unless told otherwise (right-hand slot 1)."""
+
+_VIRTUAL_DEVICES: List['ListPortInfo'] = []
+
 
 def find_device_by_serial_number(serial_number: str) -> 'ListPortInfo':
     """
@@ -111,10 +136,85 @@ def get_devices():
 
     log.debug(f'Found {len(ports)} devices.')
     log.debug('Filtering and returning devices...')
-    return [
+    devices = [
         port for port in ports if port.vid == 0x32AC and port.pid == 0x20
     ]
 
+    known = {port.device for port in devices}
+    for port in _virtual_devices():
+        if port.device not in known:
+            log.debug(f'Adding virtual device {port.device}')
+            devices.append(port)
+            known.add(port.device)
+
+    return devices
+
+
+def virtual_port_info(
+        port:          str,
+        serial_number: Optional[str] = None,
+        location:      Optional[str] = VIRTUAL_DEFAULT_LOCATION,
+) -> 'ListPortInfo':
+    """
+    Describe a virtual device the way enumeration describes a real LED matrix.
+
+    Parameters:
+        port (str):
+            The device path (e.g. a pty such as ``/dev/pts/4``).
+
+        serial_number (Optional[str], optional):
+            Serial number to report. Defaults to one derived from ``port``.
+
+        location (Optional[str], optional):
+            USB location to report; it decides the keyboard slot and side the
+            controller believes it is in (see ``SLOT_MAP``). Defaults to
+            ``'1-3.2'`` (right, slot 1).
+
+    Returns:
+        ListPortInfo:
+            Port info carrying the LED matrix VID/PID.
+    """
+    from serial.tools.list_ports_common import ListPortInfo
+
+    info = ListPortInfo(port, skip_link_detection=True)
+    info.vid = EXPECTED_VID
+    info.pid = EXPECTED_PID
+    info.serial_number = serial_number or f'VIRTUAL-{os.path.basename(port)}'
+    info.location = location
+    info.manufacturer = 'Inspyre Softworks'
+    info.product = 'Virtual LED Matrix'
+    info.description = 'Virtual LED Matrix'
+    return info
+
+
+def register_virtual_device(info: 'ListPortInfo') -> None:
+    """
+    Include a virtual device in :func:`get_devices` for this process.
+
+    The cached device list is invalidated so :func:`list_devices` picks it up.
+    """
+    global _DEVICE_CACHE
+
+    if all(dev.device != info.device for dev in _VIRTUAL_DEVICES):
+        _VIRTUAL_DEVICES.append(info)
+    _DEVICE_CACHE = None
+
+
+def unregister_virtual_device(info: 'ListPortInfo') -> None:
+    """Remove a device added with :func:`register_virtual_device`."""
+    global _DEVICE_CACHE
+
+    _VIRTUAL_DEVICES[:] = [dev for dev in _VIRTUAL_DEVICES if dev.device != info.device]
+    _DEVICE_CACHE = None
+
+
+def _virtual_devices() -> List['ListPortInfo']:
+    devices = list(_VIRTUAL_DEVICES)
+    for entry in filter(None, os.environ.get(VIRTUAL_PORTS_ENV_VAR, '').split(os.pathsep)):
+        port, _, location = entry.partition('@')
+        devices.append(virtual_port_info(port, location=location or VIRTUAL_DEFAULT_LOCATION))
+    return devices
+
 
 def test_connection(port_name):
     """
@@ -141,7 +241,48 @@ def test_connection(port_name):
         return False
 
 
-DEVICES = get_devices()
+def list_devices(refresh: bool = False) -> List['ListPortInfo']:
+    """
+    Return the connected LED matrix devices, enumerating serial ports only once.
+
+    Parameters:
+        refresh (bool, optional):
+            Enumerate the ports again instead of returning the cached list
+            (e.g. after a device was plugged in). Defaults to False.
+
+    Returns:
+        List[ListPortInfo]:
+            The supported devices found. The same list object is returned until
+            the cache is refreshed.
+    """
+    global _DEVICE_CACHE
+
+    if _DEVICE_CACHE is None or refresh:
+        with _DEVICE_CACHE_LOCK:
+            if _DEVICE_CACHE is None or refresh:
+                devices = get_devices()
+                if len(devices) == 0:
+                    MOD_LOGGER.warning('No devices found. Please connect a device and try again.')
+                _DEVICE_CACHE = devices
+
+    return _DEVICE_CACHE
+
+
+def refresh_devices() -> List['ListPortInfo']:
+    """
+    Enumerate serial ports again and replace the cached device list.
+
+    Returns:
+        List[ListPortInfo]:
+            The freshly enumerated devices.
+    """
+    return list_devices(refresh=True)
+
+
+def __getattr__(name: str):
+    # ``DEVICES`` used to be computed at import time; keep it importable but
+    # only enumerate ports the first time somebody actually asks for it.
+    if name == 'DEVICES':
+        return list_devices()
 
-if len(DEVICES) == 0:
-    MOD_LOGGER.warning('No devices found. Please connect a device and try again.')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,5 +1,5 @@
 from is_matrix_forge.led_matrix import LEDMatrixController
-from is_matrix_forge.led_matrix.helpers.device import DEVICES
+from is_matrix_forge.led_matrix.helpers.device import list_devices
 from threading import Thread
 
 
@@ -10,7 +10,7 @@ def identify_devices(devices=None):
     global threads
 
     if devices is None:
-        devices = DEVICES
+        devices = list_devices()
 
     controllers = []
 
@@ -0,0 +1,28 @@
+"""
+Transport layer for LED matrix devices.
+
+This package owns the serial ports used to talk to the LED matrix modules. The
+higher-level helpers in :mod:`is_matrix_forge.led_matrix.hardware` build
+commands and hand the encoded bytes to the transport instead of opening a port
+for every write.
+"""
+from is_matrix_forge.led_matrix.transport.pool import (
+    DEFAULT_IDLE_TIMEOUT,
+    PooledConnection,
+    SerialConnectionPool,
+    clear_disconnected,
+    get_pool,
+    is_disconnected,
+    port_name,
+)
+
+
+__all__ = [
+    'DEFAULT_IDLE_TIMEOUT',
+    'PooledConnection',
+    'SerialConnectionPool',
+    'clear_disconnected',
+    'get_pool',
+    'is_disconnected',
+    'port_name',
+]
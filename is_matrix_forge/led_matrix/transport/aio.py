@@ -0,0 +1,251 @@
+"""
+asyncio-native serial transport.
+
+Description:
+    :class:`AsyncSerialTransport` lets an event loop drive LED matrices without
+    blocking on serial I/O and without a thread per device. On POSIX systems the
+    port is opened with pyserial (for termios setup), switched to non-blocking
+    mode and then serviced through the event loop's ``add_reader`` /
+    ``add_writer`` readiness callbacks. Platforms without selectable serial
+    handles (Windows) fall back to running the pooled blocking exchange in the
+    loop's default executor.
+
+    Each transport serializes its exchanges with an :class:`asyncio.Lock`, so a
+    request/response pair is never interleaved with another command to the same
+    device.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import weakref
+from typing import Any, Callable, Dict, Optional
+
+import serial
+
+from is_matrix_forge.led_matrix.constants import DEFAULT_BAUDRATE, RESPONSE_SIZE
+from is_matrix_forge.led_matrix.transport.pool import clear_disconnected, get_pool, port_name
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.transport.aio')
+
+SUPPORTS_FD_IO = os.name == 'posix'
+"""Whether serial handles can be registered with the event loop directly."""
+
+
+class AsyncSerialTransport:
+    """
+    Non-blocking serial transport bound to one port.
+
+    Parameters:
+        port (str):
+            The port name (``ListPortInfo.device``).
+
+        baudrate (int, optional):
+            Baud rate used when opening the port. Defaults to
+            :data:`~is_matrix_forge.led_matrix.constants.DEFAULT_BAUDRATE`.
+
+        serial_factory (Optional[Callable[..., serial.Serial]], optional):
+            Callable used to open the port. Defaults to :class:`serial.Serial`.
+    """
+
+    def __init__(
+            self,
+            port:           str,
+            baudrate:       int                                    = DEFAULT_BAUDRATE,
+            serial_factory: Optional[Callable[..., serial.Serial]] = None,
+    ):
+        self.port           = port
+        self.baudrate       = baudrate
+        self.serial_factory = serial_factory or serial.Serial
+
+        self._serial: Optional[serial.Serial] = None
+        self._fd: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._serial is not None
+
+    # ——— lifecycle ———
+    def _open(self) -> None:
+        log = MOD_LOGGER.get_child('_open')
+
+        handle = self.serial_factory(self.port, self.baudrate, timeout=0)
+        fd = handle.fileno()
+        os.set_blocking(fd, False)
+
+        self._serial, self._fd = handle, fd
+        log.debug(f'Opened async connection to {self.port}')
+
+        if clear_disconnected(self.port):
+            log.info(f'Reconnected to {self.port}')
+
+    def _close(self) -> None:
+        handle, self._serial, self._fd = self._serial, None, None
+        if handle is None:
+            return
+        try:
+            handle.close()
+        except Exception as exc:  # pragma: no cover - best effort cleanup
+            MOD_LOGGER.debug(f'Ignoring error while closing {self.port}: {exc}')
+
+    async def close(self) -> None:
+        """Close the underlying port."""
+        async with self._lock:
+            self._close()
+
+    # ——— fd readiness ———
+    async def _wait(self, add: Callable, remove: Callable) -> None:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+
+        def _ready():
+            if not fut.done():
+                fut.set_result(None)
+
+        add(self._fd, _ready)
+        try:
+            await fut
+        finally:
+            remove(self._fd)
+
+    async def _write(self, data: Any) -> None:
+        loop = asyncio.get_running_loop()
+        view = memoryview(data).cast('B')
+        while view:
+            try:
+                written = os.write(self._fd, view)
+            except BlockingIOError:
+                await self._wait(loop.add_writer, loop.remove_writer)
+                continue
+            view = view[written:]
+
+    async def _read(self, size: int, timeout: float) -> bytes:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        buf = bytearray()
+
+        while len(buf) < size:
+            try:
+                chunk = os.read(self._fd, size - len(buf))
+            except BlockingIOError:
+                chunk = b''
+
+            if chunk:
+                buf += chunk
+                continue
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._wait(loop.add_reader, loop.remove_reader), remaining)
+            except asyncio.TimeoutError:
+                break
+
+        return bytes(buf)
+
+    # ——— I/O ———
+    async def exchange(
+            self,
+            data:          Any,
+            with_response: bool            = False,
+            response_size: int             = RESPONSE_SIZE,
+            timeout:       Optional[float] = None,
+    ) -> Optional[bytes]:
+        """
+        Write ``data`` and optionally await a response.
+
+        A stale handle is retried once on a freshly opened port before the
+        error is propagated.
+
+        Parameters:
+            data (bytes-like):
+                The encoded command.
+
+            with_response (bool, optional):
+                Read ``response_size`` bytes after writing. Defaults to False.
+
+            response_size (int, optional):
+                Number of bytes to read. Defaults to ``RESPONSE_SIZE``.
+
+            timeout (Optional[float], optional):
+                Read timeout in seconds. Defaults to 1 second.
+
+        Returns:
+            Optional[bytes]:
+                The response, or ``None`` when no response was requested.
+
+        Raises:
+            IOError, OSError:
+                If the device could not be reached even on a fresh port.
+        """
+        timeout = 1.0 if timeout is None else timeout
+
+        if not SUPPORTS_FD_IO:
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: get_pool().exchange(
+                    self.port, bytes(data), with_response, response_size, timeout
+                ),
+            )
+
+        async with self._lock:
+            for attempt in (0, 1):
+                reused = self.is_open
+                try:
+                    if not self.is_open:
+                        self._open()
+                    if with_response:
+                        self._serial.reset_input_buffer()
+                    await self._write(data)
+                    if not with_response:
+                        return None
+                    return await self._read(response_size, timeout)
+                except (IOError, OSError) as exc:
+                    self._close()
+                    if attempt or not reused:
+                        raise
+                    MOD_LOGGER.debug(f'Stale async connection to {self.port} ({exc}); reopening')
+
+        return None  # pragma: no cover - loop always returns or raises
+
+
+_TRANSPORTS: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncSerialTransport]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_transport(dev: Any) -> AsyncSerialTransport:
+    """
+    Return the transport for a device on the running event loop.
+
+    Transports are cached per event loop and port, so every coroutine driving
+    the same device shares one connection and one lock.
+
+    Parameters:
+        dev (Any):
+            A ``ListPortInfo``, a controller exposing ``.device``, or a port name.
+
+    Returns:
+        AsyncSerialTransport:
+            The transport for ``dev``.
+    """
+    loop = asyncio.get_running_loop()
+    transports = _TRANSPORTS.setdefault(loop, {})
+    port = port_name(dev)
+
+    transport = transports.get(port)
+    if transport is None:
+        transport = transports[port] = AsyncSerialTransport(port)
+
+    return transport
+
+
+async def close_async_transports() -> None:
+    """Close every transport bound to the running event loop."""
+    transports = _TRANSPORTS.pop(asyncio.get_running_loop(), {})
+    for transport in transports.values():
+        await transport.close()
@@ -0,0 +1,563 @@
+"""
+Record and replay serial traffic.
+
+Author:
+    Inspyre Softworks
+
+Project:
+    IS-Matrix-Forge
+
+File:
+    is_matrix_forge/led_matrix/transport/capture.py
+
+Description:
+    :class:`TrafficRecorder` installs itself as the connection pool's
+    ``serial_factory``, so every port the pool opens while it is active is
+    wrapped in a :class:`RecordingSerial` that logs each write and read, with
+    a monotonic timestamp, to a capture file. :func:`replay` pushes a capture
+    back to a device (or the emulator) at the original pace, scaled, or as
+    fast as possible, and :func:`summarize` / :func:`command_stream` turn a
+    capture into numbers and a diffable command listing.
+
+    Capture file layout (little-endian)::
+
+        header  magic b'LMCAP', version uint8, start uint64 (wall-clock ns)
+        record  kind uint8, port id uint8, time uint64 (ns since start),
+                length uint32, data
+
+    Record kinds are :data:`PORT` (declares a port id; data is its name),
+    :data:`WRITE` and :data:`READ`.
+
+    Traffic from :class:`~is_matrix_forge.led_matrix.transport.aio.AsyncSerialTransport`
+    does not go through the pool and is not recorded.
+
+Example Usage:
+    from is_matrix_forge.led_matrix.transport.capture import TrafficRecorder, summarize
+
+    with TrafficRecorder('scroll.lmcap'):
+        controller.scroll_text('Hello')
+
+    print(summarize('scroll.lmcap'))
+"""
+from __future__ import annotations
+
+import collections
+import io
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.transport.capture')
+
+
+MAGIC = b'LMCAP'
+VERSION = 1
+
+PORT = 0
+WRITE = 1
+READ = 2
+
+_FILE_HEADER = struct.Struct('<5sBQ')
+_RECORD = struct.Struct('<BBQI')
+
+FRAME_COMMANDS = frozenset({'Draw', 'DrawGreyColBuffer'})
+"""Commands that put a new frame on the matrix."""
+
+
+class CaptureRecord(NamedTuple):
+    """One captured write or read."""
+
+    kind:      int
+    port:      str
+    timestamp: float
+    data:      bytes
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# File format
+# ──────────────────────────────────────────────────────────────────────────────
+
+class CaptureWriter:
+    """
+    Append records to a capture file. Safe to share between threads.
+
+    Parameters:
+        path (Union[str, Path]):
+            The file to create (overwritten if it exists).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path    = Path(path)
+        self._file: BinaryIO = open(self.path, 'wb')
+        self._lock   = threading.Lock()
+        self._ports: Dict[str, int] = {}
+        self._start  = time.monotonic_ns()
+        self.records = 0
+
+        self._file.write(_FILE_HEADER.pack(MAGIC, VERSION, time.time_ns()))
+
+    def _write(self, kind: int, port_id: int, elapsed: int, data: bytes) -> None:
+        self._file.write(_RECORD.pack(kind, port_id, elapsed, len(data)))
+        self._file.write(data)
+
+    def record(self, kind: int, port: str, data: bytes, timestamp_ns: Optional[int] = None) -> None:
+        """
+        Append one record.
+
+        Parameters:
+            kind (int):
+                :data:`WRITE` or :data:`READ`.
+
+            port (str):
+                The port name.
+
+            data (bytes):
+                The bytes moved.
+
+            timestamp_ns (Optional[int], optional):
+                ``time.monotonic_ns()`` of the transfer. Defaults to now.
+        """
+        now = time.monotonic_ns() if timestamp_ns is None else timestamp_ns
+        elapsed = max(0, now - self._start)
+
+        with self._lock:
+            if self._file.closed:
+                return
+
+            port_id = self._ports.get(port)
+            if port_id is None:
+                if len(self._ports) > 0xFF:
+                    raise ValueError('A capture holds at most 256 ports')
+                port_id = self._ports[port] = len(self._ports)
+                self._write(PORT, port_id, elapsed, port.encode('utf-8'))
+
+            self._write(kind, port_id, elapsed, bytes(data))
+            self.records += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self) -> 'CaptureWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_capture(source: Union[str, Path, BinaryIO]) -> Iterator[CaptureRecord]:
+    """
+    Iterate over the writes and reads in a capture.
+
+    Parameters:
+        source (Union[str, Path, BinaryIO]):
+            A capture file path or an open binary stream.
+
+    Yields:
+        CaptureRecord:
+            The records in the order they were captured. Timestamps are seconds
+            since the capture started.
+
+    Raises:
+        ValueError:
+            If the data is not a capture of a supported version, or is truncated.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as stream:
+            yield from read_capture(stream)
+        return
+
+    stream = source if isinstance(source, io.BufferedIOBase) else io.BufferedReader(source)
+    header = stream.read(_FILE_HEADER.size)
+    if len(header) != _FILE_HEADER.size or header[:len(MAGIC)] != MAGIC:
+        raise ValueError('Not a serial capture')
+
+    _, version, _ = _FILE_HEADER.unpack(header)
+    if version != VERSION:
+        raise ValueError(f'Unsupported capture version {version}')
+
+    ports: Dict[int, str] = {}
+    while True:
+        head = stream.read(_RECORD.size)
+        if not head:
+            return
+        if len(head) != _RECORD.size:
+            raise ValueError('Truncated capture record')
+
+        kind, port_id, elapsed, length = _RECORD.unpack(head)
+        data = stream.read(length)
+        if len(data) != length:
+            raise ValueError('Truncated capture record')
+
+        if kind == PORT:
+            ports[port_id] = data.decode('utf-8')
+            continue
+
+        yield CaptureRecord(kind, ports.get(port_id, f'#{port_id}'), elapsed / 1e9, data)
+
+
+def _records(source: Union[str, Path, BinaryIO, Iterable[CaptureRecord]]) -> List[CaptureRecord]:
+    if isinstance(source, (str, Path, io.IOBase)):
+        return list(read_capture(source))
+    return list(source)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Recording
+# ──────────────────────────────────────────────────────────────────────────────
+
+class RecordingSerial:
+    """
+    Wrap an open serial handle and log what passes through ``write``/``read``.
+
+    Everything else (``timeout``, ``reset_input_buffer``, ``close`` …) is
+    forwarded to the wrapped handle.
+    """
+
+    _OWN = frozenset({'_serial', '_port', '_writer'})
+
+    def __init__(self, handle: Any, port: str, writer: CaptureWriter):
+        object.__setattr__(self, '_serial', handle)
+        object.__setattr__(self, '_port', port)
+        object.__setattr__(self, '_writer', writer)
+
+    def write(self, data: Any) -> Optional[int]:
+        stamp = time.monotonic_ns()
+        written = self._serial.write(data)
+        self._writer.record(WRITE, self._port, bytes(data), stamp)
+        return written
+
+    def read(self, size: int = 1) -> bytes:
+        data = self._serial.read(size)
+        if data:
+            self._writer.record(READ, self._port, data)
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._serial, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._OWN:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._serial, name, value)
+
+
+class TrafficRecorder:
+    """
+    Record all pooled serial traffic to a capture file while active.
+
+    Starting and stopping close the pool's open ports, so every connection in
+    between is opened, and recorded, through the recorder.
+
+    Parameters:
+        path (Union[str, Path]):
+            The capture file to write.
+
+        pool (Optional[SerialConnectionPool], optional):
+            The pool to record. Defaults to :func:`get_pool`.
+    """
+
+    def __init__(self, path: Union[str, Path], pool: Any = None):
+        self.path    = Path(path)
+        self._pool   = pool
+        self.writer: Optional[CaptureWriter] = None
+        self._original_factory: Optional[Callable[..., Any]] = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            from is_matrix_forge.led_matrix.transport.pool import get_pool
+            self._pool = get_pool()
+        return self._pool
+
+    @property
+    def active(self) -> bool:
+        return self.writer is not None
+
+    def _factory(self, port: str, *args: Any, **kwargs: Any) -> RecordingSerial:
+        return RecordingSerial(self._original_factory(port, *args, **kwargs), port, self.writer)
+
+    def start(self) -> 'TrafficRecorder':
+        """Begin recording and return ``self``."""
+        if self.active:
+            return self
+
+        self.writer = CaptureWriter(self.path)
+        self._original_factory = self.pool.serial_factory
+        self.pool.serial_factory = self._factory
+        self.pool.close_all()
+        MOD_LOGGER.get_child('TrafficRecorder.start').debug(f'Recording serial traffic to {self.path}')
+        return self
+
+    def stop(self) -> None:
+        """Stop recording and close the capture file."""
+        if not self.active:
+            return
+
+        self.pool.serial_factory = self._original_factory
+        self.pool.close_all()
+        self.writer.close()
+        MOD_LOGGER.get_child('TrafficRecorder.stop').debug(
+            f'Recorded {self.writer.records} transfers to {self.path}'
+        )
+        self.writer = None
+
+    def __enter__(self) -> 'TrafficRecorder':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Analysis
+# ──────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class CaptureStats:
+    """
+    Traffic summary for one port.
+
+    Properties:
+        port (str):
+            The port name.
+
+        duration (float):
+            Seconds from the first to the last transfer.
+
+        bytes_written (int):
+            Bytes sent to the device.
+
+        bytes_read (int):
+            Bytes received from the device.
+
+        frames (int):
+            Commands that drew a frame (``Draw``, ``DrawGreyColBuffer``).
+
+        commands (Dict[str, int]):
+            Command counts by name.
+    """
+    port:          str
+    duration:      float = 0.0
+    bytes_written: int   = 0
+    bytes_read:    int   = 0
+    frames:        int   = 0
+    commands:      Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def fps(self) -> float:
+        """Frames per second over the capture; 0 if fewer than two transfers."""
+        return self.frames / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def bytes_per_frame(self) -> float:
+        """Bytes written per frame drawn; 0 if nothing was drawn."""
+        return self.bytes_written / self.frames if self.frames else 0.0
+
+
+def _commands(records: Iterable[CaptureRecord]) -> Iterator[tuple]:
+    from is_matrix_forge.led_matrix.commands.parser import CommandParser
+
+    parsers: Dict[str, CommandParser] = {}
+    for record in records:
+        if record.kind != WRITE:
+            continue
+        parser = parsers.setdefault(record.port, CommandParser())
+        for command in parser.feed(record.data):
+            yield record, command
+
+
+def summarize(source: Union[str, Path, BinaryIO, Iterable[CaptureRecord]]) -> Dict[str, CaptureStats]:
+    """
+    Compute per-port traffic statistics.
+
+    Parameters:
+        source:
+            A capture path, stream, or records from :func:`read_capture`.
+
+    Returns:
+        Dict[str, CaptureStats]:
+            Statistics keyed by port name, in order of first appearance.
+    """
+    records = _records(source)
+    stats: Dict[str, CaptureStats] = {}
+    first: Dict[str, float] = {}
+
+    for record in records:
+        entry = stats.setdefault(record.port, CaptureStats(record.port))
+        first.setdefault(record.port, record.timestamp)
+        entry.duration = record.timestamp - first[record.port]
+        if record.kind == WRITE:
+            entry.bytes_written += len(record.data)
+        elif record.kind == READ:
+            entry.bytes_read += len(record.data)
+
+    for record, command in _commands(records):
+        entry = stats[record.port]
+        entry.commands[command.name] = entry.commands.get(command.name, 0) + 1
+        if command.name in FRAME_COMMANDS:
+            entry.frames += 1
+
+    return stats
+
+
+def command_stream(
+        source: Union[str, Path, BinaryIO, Iterable[CaptureRecord]],
+        port:   Optional[str] = None,
+) -> List[str]:
+    """
+    List the commands in a capture, one ``"<name> <params hex>"`` line each.
+
+    Timing is left out so two captures of the same workload compare equal
+    unless the bytes sent differ.
+
+    Parameters:
+        source:
+            A capture path, stream, or records from :func:`read_capture`.
+
+        port (Optional[str], optional):
+            Only this port. Defaults to all ports, each line prefixed with the
+            port name when there is more than one.
+
+    Returns:
+        List[str]:
+            The command lines.
+    """
+    records = [r for r in _records(source) if port is None or r.port == port]
+    prefix = len({r.port for r in records}) > 1
+
+    lines = []
+    for record, command in _commands(records):
+        line = f'{command.name} {command.params.hex()}'.rstrip()
+        lines.append(f'{record.port}: {line}' if prefix else line)
+    return lines
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Replay
+# ──────────────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """
+    Outcome of :func:`replay`.
+
+    Properties:
+        writes (int):
+            Writes sent.
+
+        bytes_written (int):
+            Bytes sent.
+
+        elapsed (float):
+            Wall-clock seconds the replay took.
+    """
+    writes:        int
+    bytes_written: int
+    elapsed:       float
+
+
+def replay(
+        source:      Union[str, Path, BinaryIO, Iterable[CaptureRecord]],
+        dev:         Any,
+        *,
+        speed:       Optional[float] = 1.0,
+        source_port: Optional[str]   = None,
+        pool:        Any             = None,
+) -> ReplayResult:
+    """
+    Send the writes in a capture to a device.
+
+    A write that was followed by a read on the same port is sent as a query and
+    its response (of the recorded size) is read and discarded, so the device is
+    driven exactly as it was during the capture.
+
+    Parameters:
+        source:
+            A capture path, stream, or records from :func:`read_capture`.
+
+        dev (Any):
+            The target device (``ListPortInfo`` or port name).
+
+        speed (Optional[float], optional):
+            Playback rate relative to the original timing (2.0 = twice as
+            fast). ``None`` or ``0`` sends as fast as possible. Defaults to 1.0.
+
+        source_port (Optional[str], optional):
+            Which captured port to replay. Required when the capture has
+            traffic for more than one port.
+
+        pool (Optional[SerialConnectionPool], optional):
+            Pool to send through. Defaults to :func:`get_pool`.
+
+    Returns:
+        ReplayResult:
+            What was sent and how long it took.
+
+    Raises:
+        ValueError:
+            If ``source_port`` is needed but missing, or names no captured port.
+    """
+    if pool is None:
+        from is_matrix_forge.led_matrix.transport.pool import get_pool
+        pool = get_pool()
+
+    records = _records(source)
+    ports = list(collections.OrderedDict.fromkeys(r.port for r in records))
+    if source_port is None:
+        if len(ports) > 1:
+            raise ValueError(f'Capture has several ports ({", ".join(ports)}); pick one with source_port')
+    elif source_port not in ports:
+        raise ValueError(f'Port {source_port!r} is not in the capture')
+    else:
+        records = [r for r in records if r.port == source_port]
+
+    writes = 0
+    sent = 0
+    origin = records[0].timestamp if records else 0.0
+    start = time.monotonic()
+
+    for index, record in enumerate(records):
+        if record.kind != WRITE:
+            continue
+
+        if speed:
+            delay = start + (record.timestamp - origin) / speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        following = records[index + 1] if index + 1 < len(records) else None
+        if following is not None and following.kind == READ:
+            pool.exchange(dev, record.data, with_response=True, response_size=len(following.data))
+        else:
+            pool.write(dev, record.data)
+
+        writes += 1
+        sent += len(record.data)
+
+    return ReplayResult(writes, sent, time.monotonic() - start)
+
+
+__all__ = [
+    'CaptureRecord',
+    'CaptureStats',
+    'CaptureWriter',
+    'FRAME_COMMANDS',
+    'READ',
+    'RecordingSerial',
+    'ReplayResult',
+    'TrafficRecorder',
+    'WRITE',
+    'command_stream',
+    'read_capture',
+    'replay',
+    'summarize',
+]
@@ -0,0 +1,440 @@
+"""
+Persistent serial connection pool.
+
+Description:
+    Opening a serial port is by far the most expensive part of talking to an LED
+    matrix; a fade, a breather tick or a single animation frame used to pay for
+    a full open/close cycle on every command. The :class:`SerialConnectionPool`
+    keeps one open :class:`serial.Serial` per port (keyed by
+    ``ListPortInfo.device``), serializes access to it with a per-port lock, and
+    closes ports that have been idle for longer than ``idle_timeout`` seconds.
+
+    When a pooled handle goes stale (for example after the module was unplugged
+    and plugged back in) the pool drops it and retries the operation once on a
+    freshly opened port. A successful (re)open also clears the port from the
+    ``DISCONNECTED_DEVS`` registries so callers see the device as connected
+    again.
+"""
+from __future__ import annotations
+
+import atexit
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import serial
+
+from is_matrix_forge.led_matrix.constants import DEFAULT_BAUDRATE, RESPONSE_SIZE
+from is_matrix_forge.log_engine import ROOT_LOGGER
+
+
+MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.transport.pool')
+
+DEFAULT_IDLE_TIMEOUT = 30.0
+"""Seconds a pooled port may stay unused before it is closed."""
+
+
+def port_name(dev: Any) -> str:
+    """
+    Resolve the port name used as the pool key.
+
+    Parameters:
+        dev (Any):
+            A ``ListPortInfo``, a controller exposing ``.device``, or a port
+            name string.
+
+    Returns:
+        str:
+            The port name (e.g. ``'/dev/ttyACM0'`` or ``'COM3'``).
+    """
+    seen = 0
+    while not isinstance(dev, str) and hasattr(dev, 'device') and seen < 4:
+        dev = dev.device
+        seen += 1
+
+    return str(dev)
+
+
+def _disconnect_registries() -> List[list]:
+    """Return every ``DISCONNECTED_DEVS`` list currently in use."""
+    from is_matrix_forge.led_matrix import constants, helpers
+
+    registries = [constants.DISCONNECTED_DEVS, helpers.DISCONNECTED_DEVS]
+
+    inputmodule = sys.modules.get('is_matrix_forge.inputmodule')
+    if inputmodule is not None:
+        registries.append(inputmodule.DISCONNECTED_DEVS)
+
+    return registries
+
+
+def is_disconnected(dev: Any) -> bool:
+    """
+    Check whether a device is in any ``DISCONNECTED_DEVS`` registry.
+
+    The send helpers record failed writes there instead of raising, so this is
+    how callers learn that their last write did not reach the device.
+
+    Parameters:
+        dev (Any):
+            A ``ListPortInfo``, controller or port name (see :func:`port_name`).
+    """
+    port = port_name(dev)
+    return any(port in registry for registry in _disconnect_registries())
+
+
+def clear_disconnected(port: str) -> bool:
+    """
+    Remove a port from every ``DISCONNECTED_DEVS`` registry.
+
+    Parameters:
+        port (str):
+            The port name that was successfully (re)opened.
+
+    Returns:
+        bool:
+            True if the port had previously been marked as disconnected.
+    """
+    was_disconnected = False
+    for registry in _disconnect_registries():
+        while port in registry:
+            registry.remove(port)
+            was_disconnected = True
+
+    return was_disconnected
+
+
+class PooledConnection:
+    """
+    A single open port owned by the pool.
+
+    Properties:
+        port (str):
+            The port name.
+
+        serial (serial.Serial):
+            The open serial handle.
+
+        lock (threading.RLock):
+            Serializes every exchange on the port.
+
+        last_used (float):
+            Monotonic timestamp of the last exchange.
+
+        closed (bool):
+            Whether the pool has already closed this handle.
+    """
+    __slots__ = ('port', 'serial', 'lock', 'last_used', 'closed')
+
+    def __init__(self, port: str, handle: serial.Serial):
+        self.port      = port
+        self.serial    = handle
+        self.lock      = threading.RLock()
+        self.last_used = time.monotonic()
+        self.closed    = False
+
+    def touch(self) -> None:
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+        try:
+            self.serial.close()
+        except Exception as exc:  # pragma: no cover - best effort cleanup
+            MOD_LOGGER.debug(f'Ignoring error while closing {self.port}: {exc}')
+
+
+class SerialConnectionPool:
+    """
+    Keep serial ports open between commands.
+
+    Parameters:
+        baudrate (int, optional):
+            Baud rate used when opening ports. Defaults to
+            :data:`~is_matrix_forge.led_matrix.constants.DEFAULT_BAUDRATE`.
+
+        idle_timeout (Optional[float], optional):
+            Close ports unused for this many seconds. ``None`` or ``0`` keeps
+            ports open until :meth:`close_all` is called.
+
+        serial_factory (Optional[Callable[..., serial.Serial]], optional):
+            Callable used to open a port; receives ``(port, baudrate, timeout=...)``.
+            Defaults to :class:`serial.Serial`.
+    """
+
+    def __init__(
+            self,
+            baudrate:       int                                    = DEFAULT_BAUDRATE,
+            idle_timeout:   Optional[float]                        = DEFAULT_IDLE_TIMEOUT,
+            serial_factory: Optional[Callable[..., serial.Serial]] = None,
+    ):
+        self.baudrate       = baudrate
+        self.idle_timeout   = idle_timeout
+        self.serial_factory = serial_factory or serial.Serial
+
+        self._connections: Dict[str, PooledConnection] = {}
+        self._lock         = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._reaper_stop  = threading.Event()
+
+    # ——— introspection ———
+    @property
+    def open_ports(self) -> List[str]:
+        """Names of the ports that currently have an open handle."""
+        with self._lock:
+            return [port for port, conn in self._connections.items() if not conn.closed]
+
+    def is_open(self, dev: Any) -> bool:
+        conn = self._connections.get(port_name(dev))
+        return conn is not None and not conn.closed
+
+    # ——— lifecycle ———
+    def _open(self, port: str) -> PooledConnection:
+        log = MOD_LOGGER.get_child('_open')
+
+        handle = self.serial_factory(port, self.baudrate, timeout=1.0)
+        conn = PooledConnection(port, handle)
+        log.debug(f'Opened pooled connection to {port}')
+
+        if clear_disconnected(port):
+            log.info(f'Reconnected to {port}')
+
+        return conn
+
+    def _get(self, port: str) -> PooledConnection:
+        with self._lock:
+            conn = self._connections.get(port)
+            if conn is not None and not conn.closed:
+                return conn
+
+        # Open outside the pool lock so a slow port does not stall the others.
+        fresh = self._open(port)
+
+        with self._lock:
+            conn = self._connections.get(port)
+            if conn is not None and not conn.closed:
+                fresh.close()
+                return conn
+
+            self._connections[port] = fresh
+            self._ensure_reaper()
+            return fresh
+
+    def discard(self, dev: Any) -> None:
+        """
+        Close and forget the pooled handle for a device, if any.
+
+        Parameters:
+            dev (Any):
+                The device (or port name) whose handle should be dropped.
+        """
+        port = port_name(dev)
+        with self._lock:
+            conn = self._connections.pop(port, None)
+        if conn is not None:
+            with conn.lock:
+                conn.close()
+
+    close = discard
+
+    def close_all(self) -> None:
+        """Close every pooled port."""
+        with self._lock:
+            conns = list(self._connections.values())
+            self._connections.clear()
+        self._reaper_stop.set()
+
+        for conn in conns:
+            with conn.lock:
+                conn.close()
+
+    def close_idle(self, now: Optional[float] = None) -> int:
+        """
+        Close ports that have been idle for longer than ``idle_timeout``.
+
+        Ports that are in use at the moment of the sweep are left alone.
+
+        Parameters:
+            now (Optional[float], optional):
+                Monotonic timestamp to compare against. Defaults to now.
+
+        Returns:
+            int:
+                The number of ports closed.
+        """
+        if not self.idle_timeout:
+            return 0
+
+        now = time.monotonic() if now is None else now
+        closed = 0
+
+        with self._lock:
+            for port, conn in list(self._connections.items()):
+                if now - conn.last_used < self.idle_timeout:
+                    continue
+                if not conn.lock.acquire(blocking=False):
+                    continue
+                try:
+                    conn.close()
+                    del self._connections[port]
+                    closed += 1
+                finally:
+                    conn.lock.release()
+
+        if closed:
+            MOD_LOGGER.debug(f'Closed {closed} idle serial connection(s)')
+
+        return closed
+
+    def _ensure_reaper(self) -> None:
+        if not self.idle_timeout:
+            return
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+
+        self._reaper_stop.clear()
+        self._reaper = threading.Thread(
+            target=self._reap_loop,
+            name='SerialPoolReaper',
+            daemon=True,
+        )
+        self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        interval = max(0.5, min(self.idle_timeout / 2, 5.0))
+        while not self._reaper_stop.wait(interval):
+            self.close_idle()
+            with self._lock:
+                if not self._connections:
+                    self._reaper = None
+                    return
+
+    # ——— I/O ———
+    @contextmanager
+    def connection(self, dev: Any) -> Iterator[serial.Serial]:
+        """
+        Borrow the open serial handle for a device.
+
+        The port lock is held for the duration of the ``with`` block, so a
+        multi-command sequence (e.g. staging greyscale columns) is not
+        interleaved with writes from other threads. If the block raises an
+        ``IOError``/``OSError`` the handle is dropped so the next caller gets
+        a fresh port.
+
+        Parameters:
+            dev (Any):
+                The device (``ListPortInfo``), controller, or port name.
+
+        Yields:
+            serial.Serial:
+                The open handle.
+        """
+        port = port_name(dev)
+        while True:
+            conn = self._get(port)
+            conn.lock.acquire()
+            if not conn.closed:
+                break
+            conn.lock.release()
+
+        try:
+            yield conn.serial
+        except (IOError, OSError):
+            self._drop(conn)
+            raise
+        finally:
+            conn.touch()
+            conn.lock.release()
+
+    def _drop(self, conn: PooledConnection) -> None:
+        conn.close()
+        with self._lock:
+            if self._connections.get(conn.port) is conn:
+                del self._connections[conn.port]
+
+    def exchange(
+            self,
+            dev:           Any,
+            data:          Any,
+            with_response: bool            = False,
+            response_size: int             = RESPONSE_SIZE,
+            timeout:       Optional[float] = None,
+    ) -> Optional[bytes]:
+        """
+        Write ``data`` to the device and optionally read a response.
+
+        A stale pooled handle is retried once on a freshly opened port before
+        the error is propagated.
+
+        Parameters:
+            dev (Any):
+                The device (``ListPortInfo``), controller, or port name.
+
+            data (bytes-like):
+                The encoded command.
+
+            with_response (bool, optional):
+                Read ``response_size`` bytes after writing. Defaults to False.
+
+            response_size (int, optional):
+                Number of bytes to read. Defaults to ``RESPONSE_SIZE``.
+
+            timeout (Optional[float], optional):
+                Read timeout in seconds. Defaults to 1 second.
+
+        Returns:
+            Optional[bytes]:
+                The response, or ``None`` when no response was requested.
+
+        Raises:
+            IOError, OSError:
+                If the device could not be reached even on a fresh port.
+        """
+        port = port_name(dev)
+        for attempt in (0, 1):
+            reused = self.is_open(port)
+            try:
+                with self.connection(port) as s:
+                    if with_response:
+                        s.reset_input_buffer()
+                    s.write(data)
+                    if not with_response:
+                        return None
+                    s.timeout = 1.0 if timeout is None else timeout
+                    return s.read(response_size)
+            except (IOError, OSError) as exc:
+                if attempt or not reused:
+                    raise
+                MOD_LOGGER.debug(f'Stale connection to {port} ({exc}); reopening')
+
+        return None  # pragma: no cover - loop always returns or raises
+
+    def write(self, dev: Any, data: Any) -> None:
+        """Write ``data`` to the device without waiting for a response."""
+        self.exchange(dev, data)
+
+
+_POOL: Optional[SerialConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> SerialConnectionPool:
+    """
+    Return the process-wide connection pool, creating it on first use.
+
+    Returns:
+        SerialConnectionPool:
+            The shared pool.
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = SerialConnectionPool()
+                atexit.register(_POOL.close_all)
+    return _POOL
@@ -9,6 +9,7 @@ from inspy_logger import Loggable
 from inspyre_toolbox.syntactic_sweets.classes import validate_type
 from serial.tools.list_ports_common import ListPortInfo
 from is_matrix_forge.common.helpers import percentage_to_value
+from is_matrix_forge.common.scheduler import Job, get_scheduler
 from is_matrix_forge.led_matrix import pattern, get_animate, animate, percentage, LEDMatrixController
 from is_matrix_forge.led_matrix.display.animations import goodbye_animation
 from is_matrix_forge.led_matrix.helpers.device import check_device
@@ -42,6 +43,7 @@ class PowerMonitor(Loggable):
         self.__start_time             = None
         self.__stop_time              = None
         self.__thread                 = None
+        self.__job                    = None
         self.__unplugged_alert        = None
         self.__controller             = None
 
@@ -236,6 +238,17 @@ class PowerMonitor(Loggable):
 
         return self.__thread
 
+    @property
+    def job(self) -> Optional[Job]:
+        """
+        The scheduler job running the checks when the monitor was started with ``threaded=True``.
+
+        Returns:
+            Optional[Job]:
+                The job; `None` if the monitor is not running in the background.
+        """
+        return self.__job
+
     @property
     def unplugged(self):
         """
@@ -324,7 +337,6 @@ class PowerMonitor(Loggable):
         Note:
             This method is called by the `start` method and should not be called directly.
         """
-        from .events import handle_event
         log = self.method_logger
         if not self._running:
             log.error('Monitor is not running')
@@ -333,18 +345,41 @@ class PowerMonitor(Loggable):
         log.debug('Running monitor...')
 
         while self.running:
-            
-            state = 'plugged' if self.plugged_in else 'unplugged'
-            handle_event(state, self)
-
-            if not self.running:
-                self.controller.clear()
+            if not self._check_once():
                 break
 
-            self.__cycles += 1
-
             sleep(self.battery_check_interval)
 
+    def _scheduled_check(self) -> None:
+        """Scheduler job body: one check, cancelling the job once the monitor has stopped."""
+        if not self._check_once():
+            job = self.__job
+            if job is not None:
+                job.cancel()
+
+    def _check_once(self) -> bool:
+        """
+        Run a single power check; one cycle of :meth:`run`, also used as the scheduler job in threaded mode.
+
+        Returns:
+            bool:
+                Whether the monitor is still running after the check.
+        """
+        from .events import handle_event
+
+        if not self.running:
+            return False
+
+        state = 'plugged' if self.plugged_in else 'unplugged'
+        handle_event(state, self)
+
+        if not self.running:
+            self.controller.clear()
+            return False
+
+        self.__cycles += 1
+        return True
+
     def set_device(self, device):
 
         if isinstance(device, LEDMatrixController):
@@ -365,11 +400,12 @@ class PowerMonitor(Loggable):
 
         Parameters:
             threaded (bool):
-                If True, run the monitor in a separate thread.
+                If True, run the checks in the background as a job on the shared scheduler
+                and return immediately; otherwise block in :meth:`run`.
 
         Returns:
-            Optional[Thread]:
-                The thread that is running the monitor loop; if `threaded` is True.
+            Optional[Job]:
+                The scheduler job running the checks; if `threaded` is True.
                 None otherwise.
 
         """
@@ -385,9 +421,14 @@ class PowerMonitor(Loggable):
         self.__start_time = time.time()
 
         if threaded:
-            t = Thread(target=self.run, daemon=True)
-            t.start()
+            self.__job = get_scheduler().every(
+                float(self.battery_check_interval),
+                self._scheduled_check,
+                delay=0.0,
+                name='PowerMonitor',
+            )
             ECH.register_handler(self.stop, kwargs={'reason': 'Program exited.'})
+            return self.__job
 
         try:
             self.run()
@@ -415,6 +456,10 @@ class PowerMonitor(Loggable):
         self.running = False
         log.debug('"running" flag set to False...waiting for thread to finish')
 
+        job, self.__job = self.__job, None
+        if job is not None:
+            job.cancel(wait=True, timeout=self.battery_check_interval)
+
         if reason:
             log.info(f'Stopping monitor due to: {reason}')
         else:
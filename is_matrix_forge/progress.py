@@ -39,7 +39,7 @@ Constants:
 
 Dependencies:
     tqdm
-    is_matrix_forge.led_matrix.helpers.device.DEVICES
+    is_matrix_forge.led_matrix.helpers.device.list_devices
     is_matrix_forge.led_matrix.controller.controller.LEDMatrixController
 
 Example Usage:
@@ -56,26 +56,40 @@ import itertools
 import threading
 import time
 import weakref
-from typing import Optional, Any, Iterable, List, Callable, Union, Protocol, Dict, Tuple, cast
+from typing import Optional, Any, Iterable, Iterator, List, Callable, Union, Protocol, Dict, Tuple, cast
 
 from tqdm import tqdm as _tqdm
 
+from is_matrix_forge.common.scheduler import Job, get_scheduler
+
 try:
-    from is_matrix_forge.led_matrix.helpers.device import DEVICES
+    from is_matrix_forge.led_matrix.helpers.device import list_devices
     from is_matrix_forge.led_matrix.controller.controller import LEDMatrixController
 except Exception:  # pragma: no cover - dependency issues / optional runtime
-    DEVICES = []
+    def list_devices(refresh: bool = False) -> list:  # type: ignore[misc]
+        return []
+
     LEDMatrixController = None  # type: ignore[misc,assignment]
 
 
 # -- Controller cache ---------------------------------------------------------
 
-if 'LEDMatrixController' in globals() and LEDMatrixController is not None:
-    _CONTROLLERS: List[Optional[LEDMatrixController]] = [None for _ in range(len(DEVICES))]
-else:  # pragma: no cover - when dependencies missing
-    _CONTROLLERS = []  # type: ignore[var-annotated]
+# Sized on first use so importing this module does not enumerate serial ports.
+_CONTROLLERS: List[Optional[Any]] = []
+_DEVICE_INDEXES: Optional[Iterator[int]] = None
+_CACHE_READY = False
+
+
+def _next_device_index() -> Optional[int]:
+    global _CONTROLLERS, _DEVICE_INDEXES, _CACHE_READY
 
-_DEVICE_INDEXES = itertools.cycle(range(len(DEVICES))) if DEVICES else None
+    if not _CACHE_READY:
+        devices = list_devices() if LEDMatrixController is not None else []
+        _CONTROLLERS = [None for _ in range(len(devices))]
+        _DEVICE_INDEXES = itertools.cycle(range(len(devices))) if devices else None
+        _CACHE_READY = True
+
+    return next(_DEVICE_INDEXES) if _DEVICE_INDEXES is not None else None
 
 
 # -- Active bars (weak) -------------------------------------------------------
@@ -192,9 +206,10 @@ class LEDTqdm(_tqdm):
         completed_clear:
             Clear the matrix when the animation finishes. Default: False.
         keepalive_sec:
-            If set (> 0), start a heartbeat thread that periodically re-renders
-            the last known percentage (or calls ctrl.ping() if available) to
-            prevent controller auto-dimming. Stops on .close().
+            If set (> 0), register a heartbeat on the shared scheduler that
+            periodically re-renders the last known percentage (or calls
+            ctrl.ping() if available) to prevent controller auto-dimming.
+            Stops on .close().
 
     Notes:
         - This class intentionally does not override tqdm's internal lock.
@@ -202,6 +217,9 @@ class LEDTqdm(_tqdm):
         - Exceptions from hardware paths are swallowed; your progress keeps going.
     """
 
+    KEEPALIVE_RETRY: float = 1.0
+    """Seconds before retrying a heartbeat skipped because the controller was busy."""
+
     def __init__(
             self,
             *args: Any,
@@ -227,9 +245,8 @@ class LEDTqdm(_tqdm):
         self._completed_fired = False
         self._keepalive_sec = keepalive_sec if keepalive_sec and keepalive_sec > 0 else None
 
-        # Threads / flags
-        self._keepalive_thread: Optional[threading.Thread] = None
-        self._stop_keepalive = threading.Event()
+        # Jobs / flags
+        self._keepalive_job: Optional[Job] = None
 
         # Controller
         self._matrix = self._init_controller(use_led, matrix)
@@ -256,21 +273,23 @@ class LEDTqdm(_tqdm):
             if LEDMatrixController and isinstance(matrix, LEDMatrixController):
                 return matrix
             return self._init_matrix(matrix, 0)
-        if _DEVICE_INDEXES is not None:
-            return self._get_controller(next(_DEVICE_INDEXES))
+        index = _next_device_index()
+        if index is not None:
+            return self._get_controller(index)
         return None
 
     # -- Controller helpers ---------------------------------------------------
 
     @staticmethod
     def _get_controller(index: int) -> Optional[Any]:
-        if LEDMatrixController is None or index >= len(DEVICES):  # pragma: no cover
+        devices = list_devices()
+        if LEDMatrixController is None or index >= len(devices) or index >= len(_CONTROLLERS):  # pragma: no cover
             return None
         ctrl = _CONTROLLERS[index]
         if ctrl is None:
             try:
                 ctrl = LEDMatrixController(
-                    DEVICES[index],
+                    devices[index],
                     100,
                     thread_safe=True,
                     skip_all_init_animations=True,
@@ -368,21 +387,36 @@ class LEDTqdm(_tqdm):
         if not (self._matrix and self._keepalive_sec):
             return
 
-        def _hb() -> None:
-            while not self._stop_keepalive.wait(self._keepalive_sec):
-                with self._led_lock:
-                    try:
-                        if self._last_percent >= 0:
-                            self._matrix.draw_percentage(self._last_percent)
-                        else:
-                            getattr(self._matrix, 'ping', lambda: None)()
-                    except Exception:
-                        pass
-
-        self._keepalive_thread = threading.Thread(
-            target=_hb, name='LEDTqdmKeepAlive', daemon=True
+        self._keepalive_job = get_scheduler().every(
+            self._keepalive_sec, self._keepalive_tick, name='LEDTqdmKeepAlive'
         )
-        self._keepalive_thread.start()
+
+    def _keepalive_tick(self) -> None:
+        # Runs on the shared scheduler thread; if an update is rendering right
+        # now the device is being refreshed anyway, so skip instead of waiting.
+        if not self._led_lock.acquire(blocking=False):
+            return
+        try:
+            # Likewise for the controller's own command lock: a long identify,
+            # animation or fade would otherwise stall every other scheduled job.
+            cmd_lock = getattr(self._matrix, 'cmd_lock', None)
+            if cmd_lock is not None and not cmd_lock.acquire(blocking=False):
+                job = self._keepalive_job
+                if job is not None:
+                    job.reschedule(self.KEEPALIVE_RETRY)
+                return
+            try:
+                if self._last_percent >= 0:
+                    self._matrix.draw_percentage(self._last_percent)
+                else:
+                    getattr(self._matrix, 'ping', lambda: None)()
+            finally:
+                if cmd_lock is not None:
+                    cmd_lock.release()
+        except Exception:
+            pass
+        finally:
+            self._led_lock.release()
 
     # -- tqdm overrides -------------------------------------------------------
 
@@ -414,11 +448,9 @@ class LEDTqdm(_tqdm):
         try:
             super().close()
         finally:
-            self._stop_keepalive.set()
-            th = self._keepalive_thread
-
-            if th and th.is_alive() and not th.daemon:
-                th.join(timeout=0.25)
+            job, self._keepalive_job = self._keepalive_job, None
+            if job is not None:
+                job.cancel(wait=True, timeout=0.25)
 
             _ACTIVE_BARS.discard(self)
 
@@ -0,0 +1,197 @@
+import json
+import tracemalloc
+
+import pytest
+
+from is_matrix_forge.led_matrix.display.animations import Animation, Frame
+from is_matrix_forge.led_matrix.display.animations import container as container_cli
+from is_matrix_forge.led_matrix.display.animations.container import (
+    GREY,
+    AnimationFile,
+    ContainerWriter,
+    container_to_json,
+    json_to_container,
+    write_container,
+)
+from is_matrix_forge.led_matrix import hardware
+from is_matrix_forge.led_matrix.controller.base import DeviceBase
+from is_matrix_forge.led_matrix.controller.components.drawing import DrawingManager
+from is_matrix_forge.led_matrix.display.grid import Grid
+
+
+def _grid(x, y=0):
+    grid = [[0] * 34 for _ in range(9)]
+    grid[x][y] = 1
+    return grid
+
+
+class RecordingDevice:
+    def __init__(self):
+        self.payloads = []
+
+    def draw_payload(self, payload):
+        self.payloads.append(bytes(payload))
+
+
+class KeepingDevice:
+    """Holds on to whatever it was handed, as a controller caching its last frame does."""
+
+    def __init__(self):
+        self.last = None
+
+    def draw_payload(self, payload):
+        self.last = payload
+
+
+class DummyPort:
+    device = '/dev/ttyTEST'
+    name = 'Test Device'
+    serial_number = 'TEST1234'
+    location = '1-3.2'
+
+
+class DummyDrawingController(DrawingManager, DeviceBase):
+    def __init__(self, **kwargs):
+        super().__init__(device=DummyPort(), **kwargs)
+
+
+@pytest.fixture
+def clip(tmp_path):
+    path = tmp_path / 'clip.lma'
+    frames = [Frame(grid=_grid(x % 9, x % 34), duration=0.01 * (x + 1)) for x in range(40)]
+    write_container(path, frames, loop=True)
+    with AnimationFile(path) as opened:
+        yield opened, frames
+
+
+def test_mono_frames_are_draw_payloads(clip):
+    opened, frames = clip
+
+    assert len(opened) == 40
+    assert opened.loop is True
+    assert opened.path.stat().st_size == 24 + 40 * (39 + 20)
+    assert bytes(opened.payload(5)) == frames[5].grid.to_draw_payload()
+    assert opened[-1].grid == frames[-1].grid
+    assert opened.duration(3) == pytest.approx(0.04)
+    with pytest.raises(IndexError):
+        opened.frame(40)
+
+    compiled = opened.compile()
+    assert compiled.payload(7) == frames[7].grid.to_draw_payload()
+    assert compiled.durations == pytest.approx([f.duration for f in frames])
+
+
+def test_animation_seeks_without_decoding_everything(clip):
+    opened, frames = clip
+    animation = opened.to_animation()
+
+    assert animation.loop is True
+    assert len(animation) == 40
+    animation.cursor = 30
+    assert [f.grid for f in animation.iter_frames()] == [f.grid for f in frames[30:]]
+
+    # Duration changes made through Animation stick even though frames are decoded per access.
+    animation.set_all_frame_durations(0.5)
+    animation.set_frame_duration(2, 0.25)
+    assert animation.frames[2].duration == 0.25
+    assert animation.frames[39].duration == 0.5
+
+
+def test_reading_a_long_clip_uses_constant_memory(tmp_path):
+    path = tmp_path / 'long.lma'
+    with ContainerWriter(path) as writer:
+        payload = Grid(init_grid=_grid(3, 3)).to_draw_payload()
+        for _ in range(20000):
+            writer.add_payload(payload, 0.01)
+
+    with AnimationFile(path) as opened:
+        animation = Animation.from_file(path)
+        tracemalloc.start()
+        for i in range(0, 20000, 7):
+            animation.cursor = i
+            animation.frames[animation.cursor].grid
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    assert len(opened) == 20000
+    assert peak < 64 * 1024
+
+
+def test_grey_container_and_json_round_trip(tmp_path):
+    columns = [[x * 10 + y for y in range(34)] for x in range(9)]
+    path = tmp_path / 'grey.lma'
+    with ContainerWriter(path, 'grey') as writer:
+        writer.add_frame(columns, 0.2)
+        writer.add_frame(Grid(init_grid=_grid(1)), 0.3)
+
+    with AnimationFile(path) as opened:
+        assert opened.pixel_format == GREY
+        assert [list(c) for c in opened.grey_columns(0)] == columns
+        assert list(opened.grey_columns(1)[1])[:2] == [255, 0]
+        assert opened.grid(0).get_pixel_value(0, 0) == 0
+        assert opened.grid(0).get_pixel_value(0, 1) == 1
+
+    exported = container_to_json(path, tmp_path / 'grey.json')
+    data = json.loads(exported.read_text())
+    assert data[0]['brightness'] == columns and data[1]['duration'] == 0.3
+
+    again = json_to_container(exported, tmp_path / 'again.lma', 'grey')
+    assert again.read_bytes() == path.read_bytes()
+
+
+def test_json_presets_convert_both_ways(tmp_path):
+    source = tmp_path / 'anim.json'
+    source.write_text(json.dumps([_grid(0), {'grid': _grid(1, 5), 'duration': 0.1}]))
+
+    assert container_cli.main([str(source), str(tmp_path / 'anim.lma'), '--duration', '0.2']) == 0
+    original = Animation.from_file(source, 0.2)
+    converted = Animation.from_file(tmp_path / 'anim.lma')
+    assert [(f.grid, f.duration) for f in converted.frames] == [(f.grid, f.duration) for f in original.frames]
+
+    assert container_cli.main([str(tmp_path / 'anim.lma'), str(tmp_path / 'back.json')]) == 0
+    back = json.loads((tmp_path / 'back.json').read_text())
+    assert back == [{'grid': _grid(0), 'duration': 0.2}, {'grid': _grid(1, 5), 'duration': 0.1}]
+
+
+def test_play_streams_from_start(clip):
+    opened, frames = clip
+    device = RecordingDevice()
+
+    stats = opened.play(device, start=37, loop=False, late_frame_policy='skip')
+
+    assert device.payloads == [f.grid.to_draw_payload() for f in frames[37:]]
+    assert stats.frames_drawn == 3
+    with pytest.raises(ValueError, match='stop_event'):
+        opened.play(device)
+
+
+def test_file_closes_after_playing_to_a_controller(tmp_path, monkeypatch):
+    sent = []
+    monkeypatch.setattr(hardware, 'send_command', lambda dev, cmd, vals: sent.append(bytes(vals)))
+    path = write_container(tmp_path / 'clip.lma', [Frame(grid=_grid(x), duration=0.001) for x in range(3)])
+    controller, keeper = DummyDrawingController(), KeepingDevice()
+
+    with AnimationFile(path) as opened:
+        opened.play([controller, keeper], loop=False)
+    # Leaving the block closes the mapping; a live export would raise BufferError.
+
+    assert opened.closed
+    assert sent[-1] == keeper.last == Grid(init_grid=_grid(2)).to_draw_payload()
+    assert controller.grid.to_draw_payload() == keeper.last
+
+
+def test_rejects_bad_files(tmp_path):
+    junk = tmp_path / 'junk.lma'
+    junk.write_bytes(b'not an animation container at all')
+    with pytest.raises(ValueError, match='not an animation container'):
+        AnimationFile(junk)
+
+    good = write_container(tmp_path / 'good.lma', [Frame(grid=_grid(0))])
+    truncated = tmp_path / 'cut.lma'
+    truncated.write_bytes(good.read_bytes()[:-4])
+    with pytest.raises(ValueError, match='Truncated'):
+        AnimationFile(truncated)
+
+    with ContainerWriter(tmp_path / 'x.lma') as writer:
+        with pytest.raises(ValueError, match='39-byte'):
+            writer.add_payload(b'\x00', 0.1)
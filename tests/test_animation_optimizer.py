@@ -0,0 +1,117 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from is_matrix_forge.led_matrix.display.animations import Animation, Frame
+from is_matrix_forge.led_matrix.display.animations.optimize import (
+    apply_delta,
+    encode_delta,
+    merge_identical_frames,
+    optimize_frames,
+)
+from is_matrix_forge.led_matrix.display.grid.packed import PackedGrid
+
+
+PRESETS = Path(__file__).resolve().parents[1] / 'presets'
+
+
+def _grid(*pixels):
+    grid = [[0] * 34 for _ in range(9)]
+    for x, y in pixels:
+        grid[x][y] = 1
+    return grid
+
+
+class RecordingDevice:
+    def __init__(self):
+        self.payloads = []
+
+    def draw_payload(self, payload):
+        self.payloads.append(bytes(payload))
+
+
+def _expected_draws(frames):
+    """(payload, duration) pairs a device sees, with identical neighbours merged."""
+    draws = []
+    for frame in frames:
+        payload = frame.grid.to_draw_payload()
+        if draws and draws[-1][0] == payload:
+            draws[-1][1] += frame.duration
+        else:
+            draws.append([payload, frame.duration])
+    return [(p, pytest.approx(d)) for p, d in draws]
+
+
+def test_delta_round_trip():
+    rng = random.Random(7)
+    for size in (39, 600):
+        previous = bytes(rng.randrange(256) for _ in range(size))
+        current = bytearray(previous)
+        for pos in rng.sample(range(size), 5):
+            current[pos] ^= 0x10
+        delta = encode_delta(previous, bytes(current))
+
+        assert len(delta) <= 5 * 2 + 2 * (size // 256)
+        buffer = bytearray(previous)
+        apply_delta(buffer, delta)
+        assert buffer == current
+
+    assert encode_delta(b'\x01\x02', b'\x01\x02') == b''
+
+
+def test_merges_repeats_and_encodes_deltas():
+    frames = [
+        Frame(grid=_grid((0, 0)), duration=0.1),
+        Frame(grid=_grid((0, 0)), duration=0.2),
+        Frame(grid=_grid((0, 0), (1, 1)), duration=0.1),
+        Frame(grid=_grid((0, 0), (1, 1)), duration=0.0),
+        Frame(grid=_grid((8, 33)), duration=0.3),
+    ]
+
+    optimized = optimize_frames(frames)
+    report = optimized.report
+
+    assert (report.frames_in, report.frames_out, report.merged_frames, report.key_frames) == (5, 3, 2, 1)
+    assert optimized.durations == pytest.approx((0.3, 0.1, 0.3))
+    assert [len(e) for e in optimized.entries][1:] == [2, 6]
+    assert report.compression_ratio == pytest.approx(5 * 39 / (39 + 2 + 6))
+    assert [(p, d) for p, d in optimized.iter_payloads()] == _expected_draws(frames)
+    assert optimized.payload(2) == frames[4].grid.to_draw_payload()
+
+    merged = merge_identical_frames(frames)
+    assert [f.duration for f in merged] == pytest.approx([0.3, 0.1, 0.3])
+    assert frames[0].duration == 0.1
+
+
+def test_keyframe_interval_bounds_random_access():
+    frames = [Frame(grid=_grid((i % 9, i % 34)), duration=0.01) for i in range(100)]
+
+    optimized = optimize_frames(frames, keyframe_interval=10)
+
+    assert optimized.report.key_frames == 10
+    assert all(optimized.is_key_frame(i) == (i % 10 == 0) for i in range(100))
+    assert [optimized.payload(i) for i in range(100)] == [f.grid.to_draw_payload() for f in frames]
+    assert optimize_frames(frames, keyframe_interval=0).report.key_frames == 1
+    with pytest.raises(ValueError):
+        optimize_frames(frames, keyframe_interval=-1)
+
+
+@pytest.mark.parametrize('preset', ['test7.json', 'x_animation II.json', 'shock_face.json'])
+def test_presets_play_the_same_with_fewer_writes(preset):
+    animation = Animation.from_file(PRESETS / preset)
+    for i, frame in enumerate(animation.frames):
+        frame.duration = 0.001 * (i % 3)
+
+    optimized = animation.optimize()
+    device = RecordingDevice()
+    optimized.play(device)
+
+    expected = _expected_draws(animation.frames)
+    assert device.payloads == [p for p, _ in expected]
+    assert optimized.total_duration == pytest.approx(sum(f.duration for f in animation.frames))
+    assert optimized.report.frames_out <= len(animation)
+    assert optimized.report.compression_ratio > 1
+    assert [f.grid for f in optimized.to_animation().iter_frames()] == [
+        PackedGrid.from_payload(p) for p, _ in expected
+    ]
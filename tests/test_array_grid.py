@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from is_matrix_forge.led_matrix.display.grid import ArrayGrid, Grid
+from is_matrix_forge.led_matrix.display.grid.composite.composite import CompositeGrid
+from is_matrix_forge.led_matrix.display.helpers import pack_matrix
+from is_matrix_forge.led_matrix.display.scene.scene import Scene
+
+
+def _random_columns(seed, width=9, height=34):
+    rnd = random.Random(seed)
+    return [[rnd.randint(0, 1) for _ in range(height)] for _ in range(width)]
+
+
+def test_round_trips_lists_and_arrays():
+    cols = _random_columns(1)
+    grid = ArrayGrid(init_grid=cols)
+
+    assert grid.grid == cols
+    assert grid[2] == cols[2]
+    assert grid.get_pixel_value(4, 9) == cols[4][9]
+    assert ArrayGrid(init_grid=grid.to_numpy()).grid == cols
+    assert ArrayGrid.from_numpy(grid.to_numpy(row_major=True), row_major=True) == grid
+
+
+def test_small_array_is_placed_on_canvas():
+    glyph = np.ones((3, 4), dtype=np.uint8)
+    grid = ArrayGrid(init_grid=glyph, align_x='left', align_y='top')
+
+    assert grid.array[:3, :4].all()
+    assert grid.array.sum() == 12
+    assert grid.crop(0, 0, 3, 4).place(align_x='left', align_y='top') == grid
+
+
+@pytest.mark.parametrize('dx,dy,wrap', [
+    (1, 0, False), (-2, 3, False), (0, -5, False), (20, 0, False),
+    (3, 0, True), (-1, 40, True), (0, -7, True),
+])
+def test_get_shifted_matches_list_grid(dx, dy, wrap):
+    cols = _random_columns(2)
+    expected = Grid(init_grid=cols).get_shifted(dx, dy, wrap=wrap)
+
+    assert ArrayGrid(init_grid=cols).get_shifted(dx, dy, wrap=wrap).grid == expected.grid
+
+
+def test_overlay_invert_and_payload():
+    bg = ArrayGrid(init_grid=_random_columns(3))
+    fg = Grid(init_grid=_random_columns(4))
+
+    expected = CompositeGrid(Grid(init_grid=bg.grid), fg, invert_on_overlap=True).render()
+    assert bg.overlay(fg, invert_on_overlap=True).grid == expected.grid
+    assert CompositeGrid(bg, fg, invert_on_overlap=True).render().grid == expected.grid
+    assert (~bg).array.sum() == 9 * 34 - bg.array.sum()
+    assert bg.to_draw_payload() == bytes(pack_matrix(bg.grid))
+
+
+def test_threshold():
+    values = np.linspace(0, 1, 9 * 34).reshape(9, 34)
+    grid = ArrayGrid.threshold(values, 0.5)
+
+    assert grid.array.sum() == (values >= 0.5).sum()
+
+
+def test_scene_build_vectorized_matches_rule():
+    bg, fg = _random_columns(5), _random_columns(6)
+    built = Scene(bg, fg, invert=True).build()
+
+    assert built.grid == [
+        [(1 - b) if f else b for b, f in zip(bc, fc)] for bc, fc in zip(bg, fg)
+    ]
+
+
+def test_column_writes_reach_the_grid():
+    grid = ArrayGrid()
+    grid[1][2] = 1
+
+    assert grid[1][2] == 1
+    assert grid.to_numpy()[1, 2] == 1
+    assert grid.grid[1] == grid[1]
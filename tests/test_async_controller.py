@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.controller import async_controller as async_controller_module
+from is_matrix_forge.led_matrix.controller.async_controller import AsyncLEDMatrixController
+from is_matrix_forge.led_matrix.display.animations import Animation
+from is_matrix_forge.led_matrix.display.animations.frame.base import Frame
+from is_matrix_forge.led_matrix.display.grid import Grid
+
+
+class DummyPort:
+    device = '/dev/ttyTEST'
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    calls = []
+
+    async def fake_send_command_async(dev, command, parameters=None, **kwargs):
+        calls.append((command, list(parameters or [])))
+
+    monkeypatch.setattr(async_controller_module, 'send_command_async', fake_send_command_async)
+    return calls
+
+
+def test_draw_grid_sends_packed_payload(sent):
+    ctrl = AsyncLEDMatrixController(DummyPort())
+
+    asyncio.run(ctrl.draw_grid(Grid(init_grid=[[1] * 34 for _ in range(9)])))
+
+    command, payload = sent[-1]
+    assert command == CommandVals.Draw
+    assert len(payload) == 39
+    assert payload[0] == 0xFF
+
+
+def test_fade_to_reaches_target(sent):
+    ctrl = AsyncLEDMatrixController(DummyPort(), default_brightness=0)
+
+    asyncio.run(ctrl.fade_to(50, duration=0.05))
+
+    levels = [params[0] for cmd, params in sent if cmd == CommandVals.Brightness]
+    assert levels == sorted(levels)
+    assert ctrl.brightness == 50
+
+
+def test_play_animation_draws_every_frame(sent):
+    frames = [Frame(duration=0.0), Frame(duration=0.0)]
+    anim = Animation(frame_data=frames)
+    ctrl = AsyncLEDMatrixController(DummyPort())
+
+    asyncio.run(ctrl.play_animation(anim, skip_clear_screen=True))
+
+    assert [cmd for cmd, _ in sent] == [CommandVals.Draw, CommandVals.Draw]
+    assert all(frame.number_of_plays == 1 for frame in frames)
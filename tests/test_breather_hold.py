@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from is_matrix_forge.led_matrix.controller.helpers.threading import synchronized
+from is_matrix_forge.led_matrix.display.effects.breather import Breather
+
+
+class FakeController:
+    def __init__(self):
+        self._brightness = 50
+        self.writes = []
+        self.breather = None
+        self._warn_on_thread_misuse = False
+
+    @property
+    def brightness(self):
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value):
+        self._brightness = value
+        self.writes.append((time.monotonic(), value))
+
+    @synchronized
+    def draw_grid(self):
+        self.writes.append((time.monotonic(), 'draw'))
+        return threading.current_thread()
+
+
+@pytest.fixture
+def breather(monkeypatch):
+    monkeypatch.setattr(
+        Breather,
+        'controller',
+        property(lambda self: self._controller, lambda self, new: setattr(self, '_controller', new)),
+    )
+    ctrl = FakeController()
+    b = Breather(ctrl, breathe_fps=200)
+    ctrl.breather = b
+    yield b
+    b.breathing = False
+
+
+def test_synchronized_call_does_not_stop_or_sleep(breather):
+    ctrl = breather.controller
+    breather.breathing = True
+    job = breather._job
+
+    start = time.monotonic()
+    for _ in range(20):
+        ctrl.draw_grid()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.05
+    assert breather._job is job and not job.cancelled
+    assert breather.breathing
+
+
+def test_ticks_are_deferred_while_held_and_resume_on_release(breather):
+    ctrl = breather.controller
+    breather.breathing = True
+    time.sleep(0.03)
+
+    with breather.hold():
+        time.sleep(0.01)  # let an in-flight tick land
+        held_at = time.monotonic()
+        time.sleep(0.05)
+        assert not any(t > held_at and v != 'draw' for t, v in ctrl.writes)
+        released_at = time.monotonic()
+
+    time.sleep(0.03)
+    assert any(t >= released_at for t, _ in ctrl.writes)
+
+
+def test_hold_is_noop_when_not_breathing(breather):
+    with breather.hold():
+        assert not breather.held
+
+
+def test_stop_is_prompt(breather):
+    breather.fps = 1
+    breather.breathing = True
+    time.sleep(0.01)
+
+    start = time.monotonic()
+    breather.breathing = False
+    assert time.monotonic() - start < 0.5
+    assert breather.controller.brightness == breather.initial_brightness
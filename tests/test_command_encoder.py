@@ -0,0 +1,103 @@
+import pytest
+
+from is_matrix_forge.led_matrix import hardware
+from is_matrix_forge.led_matrix.commands.encoder import (
+    CommandEncoder,
+    get_encoder,
+    pack_frame_into,
+    pack_matrix_into,
+)
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.display import helpers
+from is_matrix_forge.led_matrix.display.grid import Grid
+from is_matrix_forge.led_matrix.transport import SerialConnectionPool
+
+
+class FakeSerial:
+    def __init__(self, port, baudrate, timeout=None):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append((bytes(data), getattr(data, 'obj', None)))
+        return len(data)
+
+    def read(self, size):
+        return bytes(size)
+
+    def reset_input_buffer(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    handles = []
+
+    def factory(*args, **kwargs):
+        handles.append(FakeSerial(*args, **kwargs))
+        return handles[-1]
+
+    pool = SerialConnectionPool(idle_timeout=None, serial_factory=factory)
+    pool.handles = handles
+    monkeypatch.setattr(hardware, 'get_pool', lambda: pool)
+    yield pool
+    pool.close_all()
+
+
+def _grid(pixels, width=9, height=34):
+    grid = [[0] * height for _ in range(width)]
+    for x, y in pixels:
+        grid[x][y] = 1
+    return grid
+
+
+def test_encode_reuses_prefilled_templates():
+    encoder = CommandEncoder()
+
+    first = encoder.encode(CommandVals.Brightness, [10])
+    assert bytes(first) == b'\x32\xac\x00\x0a'
+    second = encoder.encode(CommandVals.Brightness, b'\x40')
+    assert second is first and bytes(first) == b'\x32\xac\x00\x40'
+
+    assert bytes(encoder.encode(CommandVals.Version)) == b'\x32\xac\x20'
+    assert bytes(encoder.encode_draw(bytes(range(39)))) == b'\x32\xac\x06' + bytes(range(39))
+
+
+def test_packing_into_buffers_matches_grid_payloads():
+    pixels = [(0, 0), (8, 0), (3, 7), (4, 33), (8, 33)]
+    buffer = bytearray(b'\xff' * 41)
+
+    pack_matrix_into(buffer, _grid(pixels), offset=2)
+    assert bytes(buffer[2:]) == Grid(init_grid=_grid(pixels)).to_draw_payload()
+    assert buffer[:2] == b'\xff\xff'
+
+    # Compact glyphs leave the rest of the canvas off.
+    pack_matrix_into(buffer, _grid([(1, 1)], width=5, height=6))
+    assert bytes(buffer[:39]) == Grid(init_grid=_grid([(1, 1)])).to_draw_payload()
+
+    frame = bytearray(9 * 34)
+    for x, y in pixels:
+        frame[x + 9 * y] = 7
+    pack_frame_into(buffer, memoryview(frame))
+    assert bytes(buffer[:39]) == Grid(init_grid=_grid(pixels)).to_draw_payload()
+    with pytest.raises(ValueError, match='306'):
+        pack_frame_into(buffer, b'\x00')
+
+
+def test_send_command_writes_one_reused_buffer_per_device(pool):
+    payloads = [Grid(init_grid=_grid([(x, x)])).to_draw_payload() for x in range(3)]
+
+    for payload in payloads:
+        hardware.send_command('/dev/a', CommandVals.Draw, payload)
+    helpers.render_matrix('/dev/a', _grid([(5, 5)]))
+    hardware.send_command('/dev/b', CommandVals.Draw, payloads[0])
+
+    writes = pool.handles[0].writes
+    assert [data for data, _ in writes] == [b'\x32\xac\x06' + p for p in payloads] + [
+        b'\x32\xac\x06' + Grid(init_grid=_grid([(5, 5)])).to_draw_payload()
+    ]
+    assert len({id(buffer) for _, buffer in writes}) == 1
+    assert writes[0][1] is not pool.handles[1].writes[0][1]
+    assert get_encoder('/dev/a') is get_encoder('/dev/a')
@@ -0,0 +1,172 @@
+import json
+from threading import Barrier, Event, Thread
+
+import pytest
+
+from is_matrix_forge.led_matrix import hardware
+from is_matrix_forge.led_matrix.controller.base import DeviceBase
+from is_matrix_forge.led_matrix.controller.components.drawing import DrawingManager
+from is_matrix_forge.led_matrix.display.animations import Animation, Frame
+from is_matrix_forge.led_matrix.display.animations.compiled import (
+    CompiledAnimation,
+    clear_memory_cache,
+    load_compiled,
+)
+from is_matrix_forge.led_matrix.display.grid import Grid
+
+
+def _grid(x):
+    grid = [[0] * 34 for _ in range(9)]
+    grid[x][0] = 1
+    return grid
+
+
+class RecordingDevice:
+    def __init__(self):
+        self.payloads = []
+
+    def draw_payload(self, payload):
+        self.payloads.append(bytes(payload))
+
+
+class DummyPort:
+    device = '/dev/ttyTEST'
+    name = 'Test Device'
+    serial_number = 'TEST1234'
+    location = '1-3.2'
+
+
+class DummyDrawingController(DrawingManager, DeviceBase):
+    def __init__(self, **kwargs):
+        super().__init__(device=DummyPort(), **kwargs)
+
+
+@pytest.fixture
+def preset(tmp_path):
+    path = tmp_path / 'anim.json'
+    path.write_text(json.dumps([_grid(0), {'grid': _grid(1), 'duration': 0.0}]))
+    clear_memory_cache()
+    yield path
+    clear_memory_cache()
+
+
+def test_compile_matches_grid_payloads():
+    frames = [Frame(grid=_grid(x), duration=0.1 * (x + 1)) for x in range(3)]
+    compiled = Animation(frame_data=frames).compile()
+
+    assert len(compiled) == 3
+    assert compiled.durations == pytest.approx((0.1, 0.2, 0.3))
+    assert [p for p, _ in compiled] == [f.grid.to_draw_payload() for f in frames]
+    assert compiled.key
+
+
+def test_round_trip_and_validation():
+    compiled = Animation(frame_data=[Frame(grid=_grid(4), duration=0.5)]).compile()
+
+    assert CompiledAnimation.from_bytes(compiled.to_bytes(), compiled.key) == compiled
+    with pytest.raises(ValueError):
+        CompiledAnimation.from_bytes(compiled.to_bytes()[:-1])
+    with pytest.raises(ValueError):
+        CompiledAnimation(b'\x00' * 10, (0.1,))
+
+
+def test_load_compiled_uses_memory_then_disk(preset, tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    first = load_compiled(preset, 0.0, cache_dir=cache_dir)
+
+    assert first.durations == (0.0, 0.0)
+    assert load_compiled(preset, 0.0, cache_dir=cache_dir) is first
+    assert [p.name for p in cache_dir.iterdir()] == [f'{first.key}.lmca']
+
+    # A fresh process (empty memory cache) loads from disk without parsing JSON.
+    clear_memory_cache()
+    monkeypatch.setattr(Animation, 'from_file', pytest.fail)
+    assert load_compiled(preset, 0.0, cache_dir=cache_dir) == first
+
+    # Different settings or content mean a different key.
+    monkeypatch.undo()
+    assert load_compiled(preset, 0.25, cache_dir=cache_dir).key != first.key
+
+
+def test_play_streams_payloads(preset, tmp_path):
+    compiled = load_compiled(preset, 0.0, cache_dir=tmp_path)
+    device = RecordingDevice()
+
+    stats = compiled.play(device)
+
+    assert device.payloads == [compiled.payload(0), compiled.payload(1)]
+    assert stats.frames_drawn == 2
+
+
+def test_play_loops_until_stopped(preset, tmp_path):
+    compiled = load_compiled(preset, 0.0, cache_dir=tmp_path)
+    stop = Event()
+
+    class StopAfter(RecordingDevice):
+        def draw_payload(self, payload):
+            super().draw_payload(payload)
+            if len(self.payloads) == 5:
+                stop.set()
+
+    device = StopAfter()
+    compiled.play([device], loop=True, stop_event=stop)
+
+    assert len(device.payloads) == 5
+    with pytest.raises(ValueError, match='stop_event'):
+        compiled.play(device, loop=True)
+
+
+def test_controller_draw_payload_dedups_and_decodes_lazily(monkeypatch):
+    sent = []
+    monkeypatch.setattr(hardware, 'send_command', lambda dev, cmd, vals: sent.append(list(vals)))
+    ctrl = DummyDrawingController()
+    payload = Grid(init_grid=_grid(2)).to_draw_payload()
+
+    ctrl.draw_payload(payload)
+    ctrl.draw_payload(payload)
+
+    assert sent == [list(payload)]
+    assert ctrl._grid is None
+    assert ctrl.grid.to_draw_payload() == payload
+
+    with pytest.raises(ValueError, match='39 bytes'):
+        ctrl.draw_payload(payload[:-1])
+    assert len(sent) == 1
+
+
+def test_concurrent_compiles_share_the_cache_safely(preset, tmp_path, monkeypatch):
+    from is_matrix_forge.led_matrix.display.animations import compiled as compiled_mod
+
+    cache_dir = tmp_path / 'cache'
+    barrier, replaced = Barrier(8), Barrier(8)
+    results, errors = [], []
+    real_replace = compiled_mod.os.replace
+
+    def replace_together(src, dst):
+        # Every thread has written its temp file before any of them renames it.
+        replaced.wait(timeout=5)
+        try:
+            real_replace(src, dst)
+        except OSError as exc:
+            errors.append(exc)
+            raise
+
+    monkeypatch.setattr(compiled_mod.os, 'replace', replace_together)
+
+    def compile_once():
+        barrier.wait()
+        try:
+            results.append(load_compiled(preset, 0.0, cache_dir=cache_dir))
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [Thread(target=compile_once) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert [p.name for p in cache_dir.iterdir()] == [f'{results[0].key}.lmca']
+    clear_memory_cache()
+    assert load_compiled(preset, 0.0, cache_dir=cache_dir) == results[0]
@@ -0,0 +1,111 @@
+import pytest
+
+from is_matrix_forge.led_matrix import constants
+from is_matrix_forge.led_matrix.transport.pool import SerialConnectionPool
+
+
+class DummyPort:
+    device = '/dev/ttyTEST'
+
+
+class FakeSerial:
+    opened = []
+
+    def __init__(self, port, baudrate, timeout=None):
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.is_open = True
+        self.written = []
+        self.fail_next_write = False
+        FakeSerial.opened.append(self)
+
+    def reset_input_buffer(self):
+        pass
+
+    def write(self, data):
+        if self.fail_next_write:
+            self.fail_next_write = False
+            raise OSError('device went away')
+        self.written.append(bytes(data))
+        return len(data)
+
+    def read(self, size):
+        return bytes(range(size))
+
+    def close(self):
+        self.is_open = False
+
+
+@pytest.fixture
+def pool():
+    FakeSerial.opened = []
+    pool = SerialConnectionPool(idle_timeout=None, serial_factory=FakeSerial)
+    yield pool
+    pool.close_all()
+
+
+def test_pool_reuses_open_port(pool):
+    pool.write(DummyPort(), b'\x32\xac\x00\x10')
+    pool.write(DummyPort(), b'\x32\xac\x00\x20')
+
+    assert len(FakeSerial.opened) == 1
+    assert FakeSerial.opened[0].written == [b'\x32\xac\x00\x10', b'\x32\xac\x00\x20']
+
+
+def test_pool_exchange_reads_response(pool):
+    res = pool.exchange(DummyPort(), b'\x32\xac\x20', with_response=True, response_size=4)
+
+    assert res == b'\x00\x01\x02\x03'
+
+
+def test_pool_reopens_stale_connection(pool):
+    pool.write(DummyPort(), b'\x01')
+    FakeSerial.opened[0].fail_next_write = True
+
+    pool.write(DummyPort(), b'\x02')
+
+    assert len(FakeSerial.opened) == 2
+    assert not FakeSerial.opened[0].is_open
+    assert FakeSerial.opened[1].written == [b'\x02']
+
+
+def test_pool_reconnect_clears_disconnected_devs(pool, monkeypatch):
+    monkeypatch.setattr(constants, 'DISCONNECTED_DEVS', [DummyPort.device])
+
+    pool.write(DummyPort(), b'\x01')
+
+    assert DummyPort.device not in constants.DISCONNECTED_DEVS
+
+
+def test_pool_closes_idle_ports():
+    FakeSerial.opened = []
+    pool = SerialConnectionPool(idle_timeout=5.0, serial_factory=FakeSerial)
+    pool.write(DummyPort(), b'\x01')
+
+    conn_time = pool._connections[DummyPort.device].last_used
+
+    assert pool.close_idle(now=conn_time + 1.0) == 0
+    assert pool.close_idle(now=conn_time + 6.0) == 1
+    assert not FakeSerial.opened[0].is_open
+    assert pool.open_ports == []
+
+    pool.close_all()
+
+
+def test_send_serial_restores_the_pooled_baud_rate(pool, monkeypatch):
+    from is_matrix_forge.led_matrix import hardware
+
+    class Controller:
+        device = DummyPort()
+
+    monkeypatch.setattr(hardware, 'get_pool', lambda: pool)
+    pool.write(DummyPort(), b'\x01')
+    handle = FakeSerial.opened[0]
+    baudrates = []
+    monkeypatch.setattr(handle, 'write', lambda data: baudrates.append(handle.baudrate))
+
+    hardware.send_serial(Controller(), b'\x02', baud=9600, print_debug=False)
+
+    assert baudrates == [9600]
+    assert handle.baudrate == pool.baudrate
@@ -0,0 +1,127 @@
+from is_matrix_forge.led_matrix.controller import base as base_mod
+from is_matrix_forge.led_matrix.controller.base import DeviceBase
+from is_matrix_forge.led_matrix.controller.components.brightness import manager as brightness_mod
+from is_matrix_forge.led_matrix.controller.components.brightness.manager import BrightnessManager
+from is_matrix_forge.led_matrix.controller.components.history import DisplayHistoryManager
+from is_matrix_forge.led_matrix.controller.helpers.device_state import DeviceStateCache
+
+
+class DummyPort:
+    device = '/dev/ttyTEST'
+    name = 'Test Device'
+    serial_number = 'TEST1234'
+    location = '1-3.2'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DummyController(DeviceBase, DisplayHistoryManager, BrightnessManager):
+    def __init__(self, **kwargs):
+        super().__init__(device=DummyPort(), skip_init_brightness_set=True, **kwargs)
+
+    def draw_grid(self, grid=None):
+        pass
+
+
+def test_cache_respects_ttl_and_invalidation():
+    clock = Clock()
+    cache = DeviceStateCache(ttl=2.0, clock=clock)
+    loads = []
+
+    def load():
+        loads.append(clock.now)
+        return len(loads)
+
+    assert cache.get('animate', load) == 1
+    assert cache.get('animate', load) == 1
+    clock.now = 2.0
+    assert cache.get('animate', load) == 2
+
+    cache.invalidate('animate')
+    assert cache.peek('animate') is None
+    assert cache.get('animate', load) == 3
+    assert cache.get('animate', load, refresh=True) == 4
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_version_never_expires_by_default():
+    clock = Clock()
+    cache = DeviceStateCache(ttl=1.0, clock=clock)
+    cache.set('version', '0.2.0')
+    clock.now = 1e6
+
+    assert cache.peek('version') == '0.2.0'
+
+
+def test_animating_is_cached_and_ping_refreshes(monkeypatch):
+    queries = []
+
+    def fake_send(dev, command, with_response=False, **kwargs):
+        queries.append(command)
+        return bytes([1])
+
+    monkeypatch.setattr(base_mod, 'send_command', fake_send)
+    ctrl = DummyController(state_ttl=None)
+
+    assert ctrl.animating and ctrl.animating
+    assert len(queries) == 1
+
+    ctrl._ping()
+    assert len(queries) == 2
+
+    ctrl.invalidate_device_state()
+    assert ctrl.animating
+    assert len(queries) == 3
+
+
+def test_brightness_writes_through_and_history_never_queries(monkeypatch):
+    reads = []
+    monkeypatch.setattr(brightness_mod, '_set_brightness_raw', lambda dev, raw: None)
+    monkeypatch.setattr(brightness_mod, '_get_brightness_raw', lambda dev: reads.append(dev) or 255)
+
+    ctrl = DummyController()
+    ctrl.set_brightness(40)
+    ctrl.draw_grid()
+    ctrl._record_event('grid')
+
+    assert ctrl.get_brightness() == 40
+    assert ctrl.current_display.meta['brightness'] == 40
+    assert reads == []
+
+    assert ctrl.get_brightness(refresh=True) == 100
+    assert len(reads) == 1
+
+
+def test_missing_responses_are_not_cached(monkeypatch):
+    from is_matrix_forge.led_matrix import hardware
+
+    responses = [None, None, bytes([128]), None, bytes([0, 0x21, 0])]
+    sent = []
+
+    def fake_send(dev, command, with_response=False, **kwargs):
+        sent.append(command)
+        return responses.pop(0)
+
+    monkeypatch.setattr(hardware, 'send_command', fake_send)
+    monkeypatch.setattr(base_mod, 'get_version', hardware.get_version)
+    monkeypatch.setattr(brightness_mod, '_get_brightness_raw', hardware.get_brightness)
+
+    ctrl = DummyController(state_ttl=None)
+
+    # A disconnected device answers nothing: no TypeError, and nothing sticks.
+    assert ctrl.get_brightness() is None
+    assert ctrl.get_brightness() is None
+    assert ctrl.get_brightness() == 50
+    assert ctrl.get_brightness() == 50
+    assert len(sent) == 3
+
+    assert ctrl.firmware_version == 'Unknown'
+    assert ctrl.firmware_version == '0.2.1'
+    assert ctrl.firmware_version == '0.2.1'
+    assert len(sent) == 5
@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from is_matrix_forge.led_matrix.controller.components.history import DisplayHistoryManager
+from is_matrix_forge.led_matrix.controller.components.history.journal import HistoryJournal
+from is_matrix_forge.led_matrix.controller.components.history.ring import HistoryRing
+from is_matrix_forge.led_matrix.display.grid import Grid
+from is_matrix_forge.led_matrix.display.helpers import pack_matrix, unpack_matrix
+
+
+class Base:
+    def __init__(self, **kwargs):
+        self._grid = None
+        self.drawn = []
+
+    def draw_grid(self, grid=None, *args, **kwargs):
+        g = grid if isinstance(grid, Grid) else Grid(init_grid=grid)
+        self._grid = g
+        self.drawn.append(g.grid)
+
+    def clear_grid(self):
+        self._grid = Grid()
+
+
+class Controller(DisplayHistoryManager, Base):
+    brightness = 50
+
+
+def _random_cols(seed):
+    rnd = random.Random(seed)
+    return [[rnd.randint(0, 1) for _ in range(34)] for _ in range(9)]
+
+
+def test_unpack_matrix_inverts_pack_matrix():
+    cols = _random_cols(1)
+    assert unpack_matrix(pack_matrix(cols)) == cols
+
+
+def test_ring_overwrites_oldest_and_stores_packed_frames():
+    ring = HistoryRing(3)
+    for i in range(5):
+        ring.append(float(i), 'grid', {'i': i}, bytes([i]) * 39)
+
+    assert len(ring) == 3
+    assert [e.meta['i'] for e in ring] == [2, 3, 4]
+    assert ring[-1].payload == bytes([4]) * 39
+    assert ring.payload_at(0) == bytes([2]) * 39
+    with pytest.raises(IndexError):
+        ring[3]
+
+
+def test_history_decodes_snapshots_lazily():
+    ctrl = Controller(history_maxlen=4)
+    first, second = _random_cols(2), _random_cols(3)
+
+    ctrl.draw_grid(Grid(init_grid=first))
+    ctrl.draw_grid(Grid(init_grid=second))
+    ctrl.set_brightness(30)
+
+    assert len(ctrl.display_history[-2].payload) == 39
+    assert ctrl.current_grid is None
+    assert ctrl.display_history[-2].grid == second
+
+    ctrl.go_back(3)
+    assert ctrl.drawn[-1] == first
+    assert ctrl.current_display.kind == 'restore'
+    assert ctrl.current_grid == first
+
+
+def test_journal_replays_history_across_restarts(tmp_path):
+    path = tmp_path / 'history.bin'
+    cols = _random_cols(4)
+
+    ctrl = Controller(history_maxlen=2, history_journal=path)
+    ctrl.draw_grid(Grid(init_grid=_random_cols(5)))
+    ctrl.draw_grid(Grid(init_grid=cols))
+    ctrl._record_event('text', meta={'text': 'HI'})
+    ctrl.history_journal.close()
+
+    # A torn trailing record is ignored.
+    with open(path, 'ab') as fh:
+        fh.write(b'\x00\x01')
+
+    restored = Controller(history_maxlen=2, history_journal=path)
+    assert [e.kind for e in restored.display_history] == ['grid', 'text']
+    assert restored.display_history[0].grid == cols
+    assert restored.current_display.meta['text'] == 'HI'
+    assert len(HistoryJournal(path).load()) == 2
@@ -0,0 +1,114 @@
+import pytest
+
+from is_matrix_forge.led_matrix import hardware
+from is_matrix_forge.led_matrix.controller.base import DeviceBase
+from is_matrix_forge.led_matrix.controller.components.drawing import DrawingManager
+from is_matrix_forge.led_matrix.controller.helpers.draw_cache import DrawCache
+from is_matrix_forge.led_matrix.display.grid import Grid
+
+
+class DummyPort:
+    device = '/dev/ttyTEST'
+    name = 'Test Device'
+    serial_number = 'TEST1234'
+    location = '1-3.2'
+
+
+class DummyDrawingController(DrawingManager, DeviceBase):
+    def __init__(self, **kwargs):
+        super().__init__(device=DummyPort(), **kwargs)
+
+
+def test_draw_cache_refreshes_after_interval():
+    now = [0.0]
+    cache = DrawCache(refresh_after=10.0, clock=lambda: now[0])
+    cache.record(b'\x01')
+
+    assert cache.is_redundant(b'\x01')
+    assert not cache.is_redundant(b'\x02')
+
+    now[0] = 10.0
+    assert not cache.is_redundant(b'\x01')
+    assert cache.skipped == 1
+
+
+def test_draw_grid_skips_identical_frames(monkeypatch):
+    sent = []
+    monkeypatch.setattr(hardware, 'send_command', lambda dev, cmd, vals: sent.append(vals))
+
+    ctrl = DummyDrawingController()
+    grid = Grid(init_grid=[[1] * 34 for _ in range(9)])
+
+    ctrl.draw_grid(grid)
+    ctrl.draw_grid(grid.copy())
+    assert len(sent) == 1
+
+    ctrl.draw_grid(grid, force=True)
+    assert len(sent) == 2
+
+    ctrl.invalidate_draw_cache()
+    ctrl.draw_grid(grid)
+    assert len(sent) == 3
+
+
+def test_draw_grid_dedup_can_be_disabled(monkeypatch):
+    sent = []
+    monkeypatch.setattr(hardware, 'send_command', lambda dev, cmd, vals: sent.append(vals))
+
+    ctrl = DummyDrawingController(dedup_draws=False)
+    grid = Grid()
+
+    ctrl.draw_grid(grid)
+    ctrl.draw_grid(grid)
+    assert len(sent) == 2
+
+
+def test_failed_draws_are_not_cached(monkeypatch):
+    from is_matrix_forge.led_matrix import constants
+
+    sent = []
+    fail = ['raise']
+
+    def send_command(dev, cmd, vals):
+        if fail and fail[0] == 'raise':
+            fail.pop()
+            raise OSError('write failed')
+        if fail and fail[0] == 'swallow':
+            fail.pop()
+            constants.DISCONNECTED_DEVS.append(dev.device)
+            return None
+        sent.append(vals)
+
+    monkeypatch.setattr(hardware, 'send_command', send_command)
+    monkeypatch.setattr(constants, 'DISCONNECTED_DEVS', [])
+
+    ctrl = DummyDrawingController()
+    grid = Grid(init_grid=[[1] * 34 for _ in range(9)])
+
+    with pytest.raises(OSError):
+        ctrl.draw_grid(grid)
+    assert ctrl.draw_cache.payload is None
+
+    # A write the transport swallowed (device marked disconnected) is not cached either.
+    fail.append('swallow')
+    ctrl.draw_grid(grid)
+    assert ctrl.draw_cache.payload is None
+
+    constants.DISCONNECTED_DEVS.clear()
+    ctrl.draw_grid(grid)
+    ctrl.draw_grid(grid)
+    assert len(sent) == 1
+
+
+def test_draw_payload_does_not_pin_the_callers_buffer(monkeypatch):
+    monkeypatch.setattr(hardware, 'send_command', lambda dev, cmd, vals: None)
+
+    ctrl = DummyDrawingController()
+    buffer = bytearray(Grid(init_grid=[[1] * 34 for _ in range(9)]).to_draw_payload())
+    view = memoryview(buffer)
+
+    ctrl.draw_payload(view)
+    view.release()
+    buffer.extend(b'\x00')      # raises BufferError while an export is alive
+
+    assert ctrl.grid.to_draw_payload() == bytes(buffer[:-1])
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from is_matrix_forge.led_matrix.display.animations.scheduler import (
+    FrameScheduler,
+    LateFramePolicy,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds, stop_event=None):
+        self.now += seconds
+
+
+def _run(policy, write_costs, duration=0.1):
+    clock = FakeClock()
+    frames = [SimpleNamespace(duration=duration, cost=c) for c in write_costs]
+    drawn = []
+
+    def draw(frame):
+        drawn.append(clock.now)
+        clock.now += frame.cost
+
+    scheduler = FrameScheduler(policy, clock=clock, sleeper=clock.sleep)
+    stats = scheduler.run(frames, draw)
+    return stats, drawn
+
+
+def test_write_time_does_not_accumulate():
+    stats, drawn = _run('catch_up', [0.03] * 10)
+
+    assert drawn == pytest.approx([100.0 + 0.1 * i for i in range(10)])
+    assert stats.elapsed == pytest.approx(1.0)
+    assert stats.drift == pytest.approx(0.0)
+    assert stats.actual_fps == pytest.approx(stats.target_fps) == pytest.approx(10.0)
+    assert stats.max_lateness == 0
+
+
+def test_catch_up_keeps_original_timeline():
+    stats, drawn = _run(LateFramePolicy.CATCH_UP, [0.25, 0.0, 0.0, 0.0, 0.0])
+
+    assert drawn == pytest.approx([100.0, 100.25, 100.25, 100.3, 100.4])
+    assert stats.frames_drawn == 5
+    assert stats.max_lateness == pytest.approx(0.15)
+    assert stats.elapsed == pytest.approx(0.5)
+
+
+def test_skip_drops_frames_whose_slot_passed():
+    stats, drawn = _run('skip', [0.25, 0.0, 0.0, 0.0, 0.0])
+
+    # Frame 1's slot (100.1–100.2) is gone; frame 2 is late but still in its slot.
+    assert drawn == pytest.approx([100.0, 100.25, 100.3, 100.4])
+    assert stats.frames_skipped == 1
+    assert stats.frames_drawn == 4
+    assert stats.elapsed == pytest.approx(0.5)
+
+
+def test_stretch_reanchors_timeline():
+    stats, drawn = _run('stretch', [0.25, 0.0, 0.0, 0.0])
+
+    assert drawn == pytest.approx([100.0, 100.25, 100.35, 100.45])
+    assert stats.elapsed == pytest.approx(0.55)
+    assert stats.drift == pytest.approx(0.15)
+
+
+def test_invalid_policy_rejected():
+    with pytest.raises(ValueError):
+        FrameScheduler('rush')
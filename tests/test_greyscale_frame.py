@@ -0,0 +1,100 @@
+import pytest
+
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.constants import FWK_MAGIC, HEIGHT, WIDTH
+from is_matrix_forge.led_matrix.display.helpers import columns as columns_mod
+from is_matrix_forge.led_matrix.display.helpers.columns import (
+    commit_cols,
+    encode_greyscale_frame,
+    send_col,
+    send_greyscale_frame,
+)
+from is_matrix_forge.led_matrix.display.patterns.built_in import stencils
+
+
+STAGE = bytes(FWK_MAGIC + [CommandVals.StageGreyCol])
+COMMIT = bytes(FWK_MAGIC + [CommandVals.DrawGreyColBuffer, 0x00])
+
+
+class FakeSerial:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+
+class FakePool:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, dev, data):
+        self.writes.append((dev, bytes(data)))
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    fake = FakePool()
+    monkeypatch.setattr(columns_mod, 'get_pool', lambda: fake)
+    return fake
+
+
+def _split(buf):
+    """Return the staged columns of an encoded frame."""
+    assert buf.endswith(COMMIT)
+    body = buf[:-len(COMMIT)]
+    step = len(STAGE) + 1 + HEIGHT
+    assert len(body) % step == 0
+    cols = {}
+    for i in range(0, len(body), step):
+        assert body[i:i + len(STAGE)] == STAGE
+        cols[body[i + len(STAGE)]] = list(body[i + len(STAGE) + 1:i + step])
+    return cols
+
+
+def test_single_buffer_matches_per_column_commands():
+    cols = [[(x * 7 + y) % 256 for y in range(HEIGHT)] for x in range(WIDTH)]
+    s = FakeSerial()
+    for x, vals in enumerate(cols):
+        send_col(None, s, x, vals)
+    commit_cols(None, s)
+
+    assert encode_greyscale_frame(cols) == b''.join(s.writes)
+
+
+def test_columns_are_normalized_to_height():
+    buf = encode_greyscale_frame([[1] * (HEIGHT + 6), [2] * 3])
+    cols = _split(buf)
+
+    assert cols[0] == [1] * HEIGHT
+    assert cols[1] == [2] * 3 + [0] * (HEIGHT - 3)
+
+
+def test_send_uses_given_handle_or_pool(pool):
+    s = FakeSerial()
+    send_greyscale_frame('dev', [[0] * HEIGHT], s)
+    assert len(s.writes) == 1 and not pool.writes
+
+    send_greyscale_frame('dev', [[0] * HEIGHT])
+    assert len(pool.writes) == 1
+
+
+@pytest.mark.parametrize('pattern, arg', [
+    (stencils.every_nth_row, 2),
+    (stencils.every_nth_col, 3),
+    (stencils.checkerboard, 2),
+    (stencils.all_brightnesses, None),
+])
+def test_stencils_write_one_frame(pool, pattern, arg):
+    pattern('dev', arg) if arg is not None else pattern('dev')
+
+    assert len(pool.writes) == 1
+    cols = _split(pool.writes[0][1])
+    assert sorted(cols) == list(range(WIDTH))
+
+
+def test_every_nth_row_pattern(pool):
+    stencils.every_nth_row('dev', 2)
+    cols = _split(pool.writes[0][1])
+
+    assert all(col == [0xFF if y % 2 == 0 else 0 for y in range(HEIGHT)] for col in cols.values())
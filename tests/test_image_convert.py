@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from is_matrix_forge.led_matrix.display.animations.container import AnimationFile
+from is_matrix_forge.led_matrix.display.grid import Grid
+from is_matrix_forge.led_matrix.display.image_convert import (
+    ConversionOptions,
+    b1_columns,
+    convert_directory,
+    dither,
+    draw_payload,
+    fit,
+    greyscale_columns,
+    luminance,
+    to_mono,
+)
+
+
+def _pattern_image(width=9, height=34):
+    """A white-on-black image with pixel (x, y) lit when (x + y) % 3 == 0."""
+    pixels = np.zeros((height, width, 3), dtype=np.uint8)
+    for y in range(height):
+        for x in range(width):
+            if (x + y) % 3 == 0:
+                pixels[y, x] = 255
+    return Image.fromarray(pixels, 'RGB')
+
+
+def test_threshold_payload_matches_grid_packing():
+    grid = [[1 if (x + y) % 3 == 0 else 0 for y in range(34)] for x in range(9)]
+
+    assert draw_payload(_pattern_image(), dither='threshold') == Grid(init_grid=grid).to_draw_payload()
+    # Scaling a larger copy down by whole blocks gives the same pixels.
+    big = _pattern_image().resize((36, 136), Image.Resampling.NEAREST)
+    assert draw_payload(big, dither='threshold') == Grid(init_grid=grid).to_draw_payload()
+
+
+def test_fit_modes_keep_the_target_size():
+    wide = np.ones((10, 100), dtype=np.float32)
+
+    assert fit(wide, 9, 34, 'crop').shape == (34, 9)
+    assert fit(wide, 9, 34, 'crop').min() == pytest.approx(1.0)
+
+    padded = fit(wide, 9, 34, 'pad')
+    assert padded.shape == (34, 9)
+    # Scaled to 9×1 and centred, with black bars above and below.
+    assert padded.sum(axis=1).nonzero()[0].tolist() == [16]
+    assert padded[16].min() == pytest.approx(1.0)
+
+    assert fit(wide, 9, 34, 'stretch').shape == (34, 9)
+    with pytest.raises(ValueError, match='fit'):
+        fit(wide, 9, 34, 'zoom')
+
+
+def test_dithers_preserve_average_brightness():
+    grey = np.full((34, 9), 0.25, dtype=np.float32)
+
+    # 25% linear light looks about half bright, so a plain threshold lights it.
+    assert dither(grey, 'threshold').all()
+    assert not dither(grey * 0.5, 'threshold').any()
+    for method in ('ordered', 'floyd-steinberg'):
+        lit = dither(grey, method)
+        assert lit.mean() == pytest.approx(0.25, abs=0.03)
+    with pytest.raises(ValueError, match='dither'):
+        dither(grey, 'random')
+
+
+def test_greyscale_is_gamma_correct_and_column_major():
+    pixels = np.zeros((34, 9), dtype=np.uint8)
+    pixels[:, 2] = 128
+    pixels[5, :] = 255
+
+    columns = greyscale_columns(Image.fromarray(pixels, 'L'))
+
+    assert columns.shape == (9, 34) and columns.dtype == np.uint8
+    assert columns[2, 0] == round((128 / 255) ** 2.2 * 255)
+    assert columns[0, 5] == 255 and columns[0, 0] == 0
+    assert luminance(np.array([[[255, 0, 0]]], dtype=np.uint8))[0, 0] == pytest.approx(0.2126)
+
+
+def test_b1_columns_set_bits_for_black_pixels():
+    pixels = np.full((400, 300), 255, dtype=np.uint8)
+    pixels[9, 3] = 0
+
+    columns = b1_columns(Image.fromarray(pixels, 'L'), dither='threshold')
+
+    assert columns.shape == (300, 50)
+    assert columns[3, 1] == 1 << 1
+    assert columns.sum() == 2
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_convert_directory_to_container(tmp_path, workers):
+    source = tmp_path / 'frames'
+    source.mkdir()
+    expected = []
+    for i in range(4):
+        image = _pattern_image().transpose(Image.Transpose.FLIP_TOP_BOTTOM) if i % 2 else _pattern_image()
+        image.save(source / f'{i:02}.png')
+        expected.append(draw_payload(image, dither='threshold'))
+    (source / 'notes.txt').write_text('not an image')
+
+    options = ConversionOptions(dither='threshold')
+    out = convert_directory(source, tmp_path / 'clip.lma', options, frame_duration=0.05, workers=workers)
+
+    with AnimationFile(out) as clip:
+        assert len(clip) == 4
+        assert [bytes(clip.payload(i)) for i in range(4)] == expected
+        assert clip.duration(0) == pytest.approx(0.05)
+
+
+def test_convert_directory_to_greyscale_json(tmp_path):
+    import json
+
+    source = tmp_path / 'frames'
+    source.mkdir()
+    _pattern_image().save(source / 'a.png')
+
+    out = convert_directory(source, tmp_path / 'clip.json', ConversionOptions(greyscale=True), workers=1)
+    frame = json.loads(out.read_text())[0]
+
+    assert frame['brightness'][0][0] == 255 and frame['brightness'][1][0] == 0
+    assert frame['grid'][0][0] == 1
+    with pytest.raises(ValueError, match='No images'):
+        convert_directory(tmp_path, tmp_path / 'x.lma', workers=1)
+
+
+def test_mono_output_shape():
+    assert to_mono(_pattern_image(), 300, 400).shape == (400, 300)
@@ -0,0 +1,96 @@
+import json
+import os
+import subprocess
+import sys
+
+import is_matrix_forge.led_matrix.helpers.device as device_helpers
+from is_matrix_forge.dev_tools.startup_bench import HEAVY_MODULES, parse_importtime
+
+
+PROBE = '''
+import json, sys
+import is_matrix_forge.led_matrix.constants
+import is_matrix_forge.led_matrix.helpers.device as device
+import is_matrix_forge.led_matrix.display.image_convert
+import is_matrix_forge.led_matrix.display.media
+import is_matrix_forge.inputmodule.ledmatrix
+print(json.dumps({
+    'heavy': [m for m in ('cv2', 'PIL', 'numpy', 'PySimpleGUI') if m in sys.modules],
+    'enumerated': device._DEVICE_CACHE is not None,
+}))
+'''
+
+
+def test_import_has_no_heavy_modules_or_side_effects(tmp_path):
+    env = {**os.environ, 'XDG_DATA_HOME': str(tmp_path)}
+    proc = subprocess.run([sys.executable, '-c', PROBE], capture_output=True, text=True, env=env)
+    assert proc.returncode == 0, proc.stderr
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert result == {'heavy': [], 'enumerated': False}
+    # The package no longer writes memory.ini on import.
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_scene_imports_numpy_only_when_building():
+    probe = (
+        'import sys\n'
+        'from is_matrix_forge.led_matrix.display.scene.scene import Scene\n'
+        'before = "numpy" in sys.modules\n'
+        'Scene([[0] * 34 for _ in range(9)], [[1] * 34 for _ in range(9)]).build()\n'
+        'print(before, "numpy" in sys.modules)\n'
+    )
+    proc = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == ['False', 'True']
+
+
+def test_list_devices_enumerates_once_until_refreshed(monkeypatch):
+    calls = []
+
+    def fake_get_devices():
+        calls.append(1)
+        return ['port-%d' % len(calls)]
+
+    monkeypatch.setattr(device_helpers, 'get_devices', fake_get_devices)
+    monkeypatch.setattr(device_helpers, '_DEVICE_CACHE', None)
+
+    first = device_helpers.list_devices()
+    assert device_helpers.list_devices() is first
+    assert device_helpers.DEVICES is first
+    assert len(calls) == 1
+
+    assert device_helpers.refresh_devices() == ['port-2']
+    assert device_helpers.DEVICES == ['port-2']
+
+
+def test_star_import_of_constants_does_not_enumerate(tmp_path):
+    probe = (
+        'import json\n'
+        'from is_matrix_forge.led_matrix.constants import *\n'
+        'import is_matrix_forge.led_matrix.helpers.device as device\n'
+        'print(json.dumps(device._DEVICE_CACHE is not None))\n'
+    )
+    env = {**os.environ, 'XDG_DATA_HOME': str(tmp_path)}
+    proc = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, env=env)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip().splitlines()[-1] == 'false'
+
+
+def test_constants_devices_is_lazy(monkeypatch):
+    import is_matrix_forge.led_matrix.constants as constants
+
+    monkeypatch.setattr(device_helpers, '_DEVICE_CACHE', ['cached'])
+    assert constants.DEVICES == ['cached']
+
+
+def test_parse_importtime_sums_top_level_entries():
+    output = '\n'.join([
+        'import time: self [us] | cumulative | imported package',
+        'import time:       100 |        100 |   child',
+        'import time:       200 |        300 | parent',
+        'import time:        50 |         50 | other',
+        'unrelated line',
+    ])
+    assert parse_importtime(output) == (300 + 50) / 1_000_000
+    assert 'cv2' in HEAVY_MODULES
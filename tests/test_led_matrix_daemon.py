@@ -0,0 +1,234 @@
+import argparse
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from is_matrix_forge.led_matrix.Scripts import led_matrix as cli
+from is_matrix_forge.led_matrix.Scripts.led_matrix.daemon import (
+    DaemonClient,
+    DaemonCommandError,
+    DaemonUnavailableError,
+    MatrixDaemon,
+)
+from is_matrix_forge.led_matrix.Scripts.led_matrix.daemon.protocol import encode_message
+
+
+class FakeController:
+    def __init__(self, name, side=None):
+        self.name = name
+        self.side_of_keyboard = side
+        self.slot = 1
+        self.keep_alive = False
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def show_text(self, text):
+        self.calls.append(('show_text', text))
+
+    def scroll_text(self, text, direction=None):
+        self.calls.append(('scroll_text', text, direction))
+
+    def clear_grid(self):
+        self.calls.append(('clear_grid',))
+
+    def identify(self, skip_clear=False, duration=0.0, cycles=1, stop_event=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        if stop_event is None:
+            time.sleep(duration)
+        else:
+            stop_event.wait(duration)
+        with self._lock:
+            self.active -= 1
+        self.calls.append(('identify', duration, cycles))
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes; pytest's tmp_path can be longer.
+    directory = tempfile.mkdtemp(prefix='lm-', dir='/tmp')
+    yield Path(directory) / 'd.sock'
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running(socket_path):
+    controllers = [FakeController('left', 'left'), FakeController('right', 'right')]
+    daemon = MatrixDaemon(socket_path, controllers=controllers)
+    thread = daemon.start()
+    yield daemon, controllers, DaemonClient(socket_path)
+    daemon.shutdown()
+    thread.join(2)
+
+
+def _args(subcommand, **kwargs):
+    defaults = {'only_left': False, 'only_right': False, 'no_daemon': False, 'socket': None}
+    return argparse.Namespace(subcommand=subcommand, **{**defaults, **kwargs})
+
+
+def test_ping_reports_status(running):
+    daemon, _, client = running
+    status = client.call('ping')
+
+    assert status['devices'] == ['left', 'right']
+    assert status['busy'] is False
+    assert client.is_running()
+
+
+def test_display_text_runs_in_daemon_and_returns(running, socket_path):
+    _, controllers, _ = running
+    args = _args('display-text', text='HI', run_for=None, skip_clear=False, sequential=False, socket=str(socket_path))
+
+    start = time.monotonic()
+    cli.display_text_command(args)
+
+    assert time.monotonic() - start < 1.0
+    assert all(('show_text', 'HI') in c.calls for c in controllers)
+    assert all(c.keep_alive for c in controllers)
+
+
+def test_selection_flags_are_honoured(running):
+    _, controllers, client = running
+    client.call('identify-matrices', only_left=True, only_right=False,
+                skip_clear=True, runtime='0.1', cycle_count=1)
+
+    left, right = controllers
+    assert left.calls == [('identify', 0.1, 1)]
+    assert right.calls == []
+
+
+def test_concurrent_clients_are_serialized(running):
+    _, controllers, client = running
+    errors = []
+
+    def call():
+        try:
+            client.call('identify-matrices', only_left=True, only_right=False,
+                        skip_clear=True, runtime='0', cycle_count=1)
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert controllers[0].max_active == 1
+    assert len(controllers[0].calls) == 4
+
+
+def test_command_errors_reach_the_client(running):
+    _, _, client = running
+    with pytest.raises(DaemonCommandError, match='--span-matrices requires --direction h'):
+        client.call('scroll-text', input='x', direction='up', sequential=False, span_matrices=True)
+
+    # The daemon keeps serving after a failed command.
+    assert client.call('ping')['commands'] == 0
+
+
+def test_unknown_command(running):
+    _, _, client = running
+    with pytest.raises(DaemonCommandError, match='Unknown command'):
+        client.call('format-disk')
+
+
+def test_forward_falls_back_without_daemon(socket_path):
+    args = _args('display-text', text='HI', socket=str(socket_path))
+    assert cli._forward_to_daemon(args) is False
+
+    with pytest.raises(DaemonUnavailableError):
+        DaemonClient(socket_path).call('ping')
+
+
+def test_no_daemon_flag_skips_forwarding(running, socket_path):
+    _, controllers, _ = running
+    args = _args('display-text', text='HI', socket=str(socket_path), no_daemon=True)
+
+    assert cli._forward_to_daemon(args) is False
+    assert all(c.calls == [] for c in controllers)
+
+
+def test_shutdown_releases_controllers_and_socket(socket_path):
+    controllers = [FakeController('only')]
+    daemon = MatrixDaemon(socket_path, controllers=controllers)
+    thread = daemon.start()
+
+    DaemonClient(socket_path).call('shutdown')
+    thread.join(2)
+
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+    assert controllers[0].calls[-1] == ('clear_grid',)
+
+
+def test_stale_socket_is_replaced(socket_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()  # leaves the file behind with nobody listening
+
+    daemon = MatrixDaemon(socket_path, controllers=[FakeController('only')])
+    thread = daemon.start()
+    try:
+        assert DaemonClient(socket_path).is_running()
+        with pytest.raises(RuntimeError, match='already listening'):
+            MatrixDaemon(socket_path, controllers=[]).bind()
+    finally:
+        daemon.shutdown()
+        thread.join(2)
+
+
+def test_scroll_text_rejects_sequential_with_span(running):
+    _, _, client = running
+    with pytest.raises(DaemonCommandError, match='cannot be combined'):
+        client.call('scroll-text', input='x', direction='h', sequential=True, span_matrices=True)
+
+
+def test_span_report_is_printed_by_the_client(running, socket_path, monkeypatch, capsys):
+    from types import SimpleNamespace
+
+    stats = SimpleNamespace(devices=2, playback=SimpleNamespace(actual_fps=19.5, target_fps=20.0), max_skew=0.0012)
+    monkeypatch.setattr(cli, '_build_horizontal_span_animations', lambda text, ctrls: {c: None for c in ctrls})
+    monkeypatch.setattr(cli, '_play_span_animations', lambda devices, animations, stop_event=None: stats)
+
+    args = _args('scroll-text', input='hi', direction='h', sequential=False, span_matrices=True,
+                 socket=str(socket_path))
+    cli.scroll_text_command(args)
+
+    # Printed once, by the client (the daemon runs in this process too).
+    spanned = [line for line in capsys.readouterr().out.splitlines() if line.startswith('Spanned')]
+    assert spanned == ['Spanned 2 matrices at 19.5/20.0 fps; max skew 1.2 ms']
+
+
+def test_client_disconnect_cancels_running_command(running, socket_path):
+    daemon, controllers, client = running
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(str(socket_path))
+    sock.sendall(encode_message({'command': 'identify-matrices', 'args': {
+        'only_left': True, 'only_right': False, 'skip_clear': True, 'runtime': '30', 'cycle_count': 1,
+    }}))
+
+    deadline = time.monotonic() + 2
+    while controllers[0].active == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert controllers[0].active == 1
+
+    sock.close()
+
+    deadline = time.monotonic() + 2
+    while client.call('ping')['busy'] and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert client.call('ping')['busy'] is False
+    assert controllers[0].calls == [('identify', 30.0, 1)]
@@ -0,0 +1,82 @@
+import queue
+import threading
+
+import pytest
+
+from is_matrix_forge.led_matrix.controller.helpers.mailbox import CommandMailbox
+from is_matrix_forge.led_matrix.controller.threaded import ThreadedLEDMatrixController
+
+
+def drain(mailbox):
+    out = []
+    while True:
+        try:
+            out.append(mailbox.get(block=False))
+        except queue.Empty:
+            return out
+
+
+def test_draw_calls_coalesce_to_latest():
+    mailbox = CommandMailbox()
+    for i in range(5):
+        mailbox.put('draw_grid', (i,))
+
+    assert drain(mailbox) == [('draw_grid', (4,), {})]
+    assert mailbox.coalesced == 4
+
+
+def test_ordered_commands_act_as_barriers():
+    mailbox = CommandMailbox()
+    mailbox.put('draw_grid', ('a',))
+    mailbox.put('set_brightness', (10,))
+    mailbox.put('clear')
+    mailbox.put('draw_grid', ('b',))
+    mailbox.put('set_brightness', (20,))
+    mailbox.put('draw_grid', ('c',))
+    mailbox.put('clear')
+
+    names = [(name, args) for name, args, _ in drain(mailbox)]
+    assert names == [
+        ('draw_grid', ('a',)),
+        ('set_brightness', (10,)),
+        ('clear', ()),
+        ('draw_grid', ('c',)),
+        ('set_brightness', (20,)),
+        ('clear', ()),
+    ]
+    assert mailbox.coalesced == 1
+
+
+def test_bounded_mailbox_raises_when_full():
+    mailbox = CommandMailbox(maxsize=1)
+    mailbox.put('clear')
+
+    with pytest.raises(queue.Full):
+        mailbox.put('animate', (True,), block=False)
+
+    # Coalescing never needs room
+    mailbox2 = CommandMailbox(maxsize=1)
+    mailbox2.put('draw_grid', (1,))
+    assert mailbox2.put('draw_grid', (2,), block=False) is True
+
+
+def test_threaded_controller_skips_stale_draws():
+    gate = threading.Event()
+    drawn = []
+
+    class SlowController:
+        def clear(self):
+            gate.wait(timeout=2)
+
+        def draw_grid(self, grid):
+            drawn.append(grid)
+
+    threaded = ThreadedLEDMatrixController(SlowController())
+    threaded.clear()
+    for i in range(10):
+        threaded.draw_grid(i)
+    gate.set()
+
+    assert threaded.join(timeout=2)
+    assert drawn[-1] == 9
+    assert len(drawn) + threaded.coalesced_count == 10
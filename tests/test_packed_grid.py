@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from is_matrix_forge.led_matrix.display.grid import Grid, PackedGrid
+from is_matrix_forge.led_matrix.display.helpers import pack_matrix
+
+
+def _random_columns(seed, width=9, height=34):
+    rnd = random.Random(seed)
+    return [[rnd.randint(0, 1) for _ in range(height)] for _ in range(width)]
+
+
+def test_round_trips_column_major_data():
+    cols = _random_columns(1)
+    packed = PackedGrid(init_grid=cols)
+
+    assert packed.grid == cols
+    assert packed[3] == cols[3]
+    assert [packed.get_pixel_value(x, 7) for x in range(9)] == [c[7] for c in cols]
+    assert list(packed) == cols
+    assert len(packed) == 9
+
+
+def test_draw_payload_matches_pack_matrix():
+    cols = _random_columns(2)
+    packed = PackedGrid(init_grid=cols)
+
+    assert packed.to_draw_payload() == bytes(pack_matrix(cols))
+    assert Grid(init_grid=cols).to_draw_payload() == packed.to_draw_payload()
+    assert PackedGrid.from_payload(packed.to_draw_payload()) == packed
+
+
+@pytest.mark.parametrize('dx,dy,wrap', [
+    (1, 0, False), (-2, 0, False), (0, 3, False), (0, -5, False),
+    (4, -7, False), (3, 0, True), (-1, 0, True), (0, 40, True), (-10, 12, True),
+])
+def test_get_shifted_matches_list_grid(dx, dy, wrap):
+    cols = _random_columns(3)
+    expected = Grid(init_grid=cols).get_shifted(dx, dy, wrap=wrap)
+    shifted = PackedGrid(init_grid=cols).get_shifted(dx, dy, wrap=wrap)
+
+    assert isinstance(shifted, PackedGrid)
+    assert shifted.grid == expected.grid
+
+
+def test_get_shifted_pads_with_fill_value():
+    cols = _random_columns(4)
+    expected = Grid(fill_value=1, init_grid=cols).get_shifted(2, -3)
+    shifted = PackedGrid(fill_value=1, init_grid=cols).get_shifted(2, -3)
+
+    assert shifted.grid == expected.grid
+
+
+def test_copy_equality_and_hash():
+    packed = PackedGrid(init_grid=_random_columns(5))
+    clone = packed.copy()
+
+    assert clone == packed
+    assert hash(clone) == hash(packed)
+    assert clone == Grid(init_grid=packed.grid)
+
+    clone.set_pixel(0, 0, 1 - clone.get_pixel_value(0, 0))
+    assert clone != packed
+    assert clone.to_draw_payload() != packed.to_draw_payload()
+
+
+def test_bitwise_composition():
+    a = PackedGrid(init_grid=_random_columns(6))
+    b = Grid(init_grid=_random_columns(7))
+
+    assert (a | b).grid == [[x | y for x, y in zip(ca, cb)] for ca, cb in zip(a.grid, b.grid)]
+    assert (a ^ b).grid == [[x ^ y for x, y in zip(ca, cb)] for ca, cb in zip(a.grid, b.grid)]
+    assert a.inverted().lit_pixels == 9 * 34 - a.lit_pixels
+
+
+def test_to_packed_from_base_grid():
+    grid = Grid(init_grid=_random_columns(8))
+    assert grid.to_packed().grid == grid.grid
+
+
+def test_column_writes_reach_the_grid():
+    grid = PackedGrid()
+    grid[1][2] = 1
+    grid[-1][-1] = 1
+
+    assert grid[1][2] == 1
+    assert grid.get_pixel_value(8, 33) == 1
+    assert grid.lit_pixels == 2
+    assert grid[1] == Grid(init_grid=grid.grid)[1]
+
+    grid[1][2] = 0
+    assert grid.lit_pixels == 1
+    with pytest.raises(IndexError):
+        grid[1][34] = 1
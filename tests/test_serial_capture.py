@@ -0,0 +1,148 @@
+import io
+
+import pytest
+
+from is_matrix_forge.dev_tools import capture as capture_cli
+from is_matrix_forge.led_matrix.emulator import HAS_PTY
+from is_matrix_forge.led_matrix.transport import SerialConnectionPool
+from is_matrix_forge.led_matrix.transport.capture import (
+    READ,
+    WRITE,
+    CaptureRecord,
+    CaptureWriter,
+    TrafficRecorder,
+    command_stream,
+    read_capture,
+    replay,
+    summarize,
+)
+
+
+MAGIC = b'\x32\xac'
+DRAW = MAGIC + b'\x06' + bytes(39)
+VERSION_QUERY = MAGIC + b'\x20'
+
+
+class FakeSerial:
+    def __init__(self, port, baudrate, timeout=None):
+        self.port = port
+        self.timeout = timeout
+        self.written = []
+        self.closed = False
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        return len(data)
+
+    def read(self, size):
+        return b'\x00\x25\x00'.ljust(size, b'\x00')
+
+    def reset_input_buffer(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    handles = []
+
+    def factory(*args, **kwargs):
+        handles.append(FakeSerial(*args, **kwargs))
+        return handles[-1]
+
+    pool = SerialConnectionPool(idle_timeout=None, serial_factory=factory)
+    pool.handles = handles
+    yield pool
+    pool.close_all()
+
+
+def test_recorder_captures_writes_and_reads(tmp_path, pool):
+    path = tmp_path / 'run.lmcap'
+
+    with TrafficRecorder(path, pool=pool):
+        pool.write('/dev/a', DRAW)
+        assert pool.exchange('/dev/a', VERSION_QUERY, with_response=True, response_size=32, timeout=0.5)[:2] == b'\x00\x25'
+        with pool.connection('/dev/a') as handle:
+            assert handle.timeout == 0.5  # attribute writes reach the real handle
+
+    records = list(read_capture(path))
+    assert [(r.kind, r.port, r.data[:3]) for r in records] == [
+        (WRITE, '/dev/a', DRAW[:3]),
+        (WRITE, '/dev/a', VERSION_QUERY),
+        (READ, '/dev/a', b'\x00\x25\x00'),
+    ]
+    assert records[0].timestamp <= records[1].timestamp <= records[2].timestamp
+    assert pool.handles[0].written == [DRAW, VERSION_QUERY]
+
+    # Stopping restores the plain factory.
+    pool.write('/dev/a', DRAW)
+    assert len(list(read_capture(path))) == 3
+
+
+def test_summarize_and_command_stream():
+    records = [
+        CaptureRecord(WRITE, 'a', 0.0, DRAW),
+        CaptureRecord(WRITE, 'a', 0.5, MAGIC + b'\x00\x20'),
+        CaptureRecord(WRITE, 'a', 1.0, DRAW),
+        CaptureRecord(WRITE, 'b', 1.0, VERSION_QUERY),
+        CaptureRecord(READ, 'b', 1.1, bytes(32)),
+    ]
+
+    stats = summarize(records)
+
+    assert stats['a'].frames == 2
+    assert stats['a'].fps == 2.0
+    assert stats['a'].bytes_per_frame == (2 * len(DRAW) + 4) / 2
+    assert stats['a'].commands == {'Draw': 2, 'Brightness': 1}
+    assert stats['b'].bytes_read == 32
+    assert command_stream(records, port='a')[1] == 'Brightness 20'
+    assert command_stream(records)[-1] == 'b: Version'
+
+
+def test_file_round_trip_and_validation(tmp_path):
+    path = tmp_path / 'x.lmcap'
+    with CaptureWriter(path) as writer:
+        writer.record(WRITE, 'COM3', DRAW)
+
+    assert [r.data for r in read_capture(path)] == [DRAW]
+    with pytest.raises(ValueError, match='Not a serial capture'):
+        list(read_capture(io.BytesIO(b'garbage')))
+    with pytest.raises(ValueError, match='Truncated'):
+        list(read_capture(io.BytesIO(path.read_bytes()[:-5])))
+
+
+def test_replay_sends_queries_as_exchanges(pool):
+    records = [
+        CaptureRecord(WRITE, 'a', 0.0, DRAW),
+        CaptureRecord(WRITE, 'a', 0.01, VERSION_QUERY),
+        CaptureRecord(READ, 'a', 0.02, bytes(32)),
+        CaptureRecord(WRITE, 'a', 0.05, DRAW),
+    ]
+
+    result = replay(records, '/dev/z', speed=1.0, pool=pool)
+
+    assert pool.handles[0].written == [DRAW, VERSION_QUERY, DRAW]
+    assert result.writes == 3
+    assert result.elapsed >= 0.05
+
+    with pytest.raises(ValueError, match='several ports'):
+        replay(records + [CaptureRecord(WRITE, 'b', 0.1, DRAW)], '/dev/z', pool=pool)
+
+
+def test_record_and_diff_workload_on_emulator(tmp_path, capsys):
+    if not HAS_PTY:
+        pytest.skip('needs a pty')
+
+    first, second = tmp_path / 'a.lmcap', tmp_path / 'b.lmcap'
+    for path, text in ((first, 'Hi'), (second, 'Ho')):
+        assert capture_cli.main(['record', str(path), '--workload', 'scroll_text', '--text', text, '--emulator']) == 0
+
+    stats = next(iter(summarize(first).values()))
+    assert stats.frames > 0 and stats.commands['Draw'] == stats.frames
+
+    assert capture_cli.main(['diff', str(first), str(first)]) == 0
+    assert capture_cli.main(['diff', str(first), str(second)]) == 1
+    assert capture_cli.main(['replay', str(first), '--emulator', '--fast']) == 0
+    assert 'Replayed' in capsys.readouterr().out
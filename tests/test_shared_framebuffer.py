@@ -0,0 +1,190 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+from is_matrix_forge.led_matrix.display import helpers
+from is_matrix_forge.led_matrix.display.framebuffer import (
+    FRAME_SIZE,
+    FrameBufferWriter,
+    SharedFrameBuffer,
+    framebuffer_path,
+)
+from is_matrix_forge.led_matrix.display.helpers import pack_frame, pack_matrix
+
+
+class FakeDev:
+    name = 'COM7'
+    device = '/dev/ttyACM7'
+    serial_number = 'FRAK:01/23'
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    calls = []
+    monkeypatch.setattr(helpers, 'send_command', lambda dev, cmd, params: calls.append((dev, cmd, list(params))))
+    return calls
+
+
+def _grid(pixels):
+    grid = [[0] * 34 for _ in range(9)]
+    for x, y in pixels:
+        grid[x][y] = 1
+    return grid
+
+
+def test_pack_frame_matches_pack_matrix():
+    pixels = [(0, 0), (8, 0), (3, 7), (4, 33), (8, 33)]
+    frame = bytearray(FRAME_SIZE)
+    for x, y in pixels:
+        frame[x + 9 * y] = 255
+
+    assert pack_frame(frame) == pack_matrix(_grid(pixels))
+    with pytest.raises(ValueError):
+        pack_frame(b'\x00' * 10)
+
+
+def test_write_and_read_round_trip(tmp_path):
+    with SharedFrameBuffer(tmp_path / 'fb') as fb:
+        assert fb.sequence == 0
+        frame = bytes(range(256)) + bytes(FRAME_SIZE - 256)
+
+        seq = fb.write(frame)
+
+        assert seq == 2
+        assert fb.read() == (2, frame)
+
+
+def test_write_grid_is_column_major(tmp_path):
+    with SharedFrameBuffer(tmp_path / 'fb') as fb:
+        fb.write_grid([[0, 1], [], [1]])
+        _, frame = fb.read()
+
+    assert [i for i, v in enumerate(frame) if v] == [2 + 9 * 0, 0 + 9 * 1]
+
+
+def test_second_mapping_sees_writes(tmp_path):
+    path = tmp_path / 'fb'
+    with SharedFrameBuffer(path) as producer, SharedFrameBuffer(path) as reader:
+        producer.write(b'\x01' * FRAME_SIZE)
+        assert reader.read() == (2, b'\x01' * FRAME_SIZE)
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / 'fb'
+    path.write_bytes(b'NOPE' + bytes(400))
+    with pytest.raises(ValueError, match='not a version'):
+        SharedFrameBuffer(path)
+
+
+def test_framebuffer_path_uses_serial(monkeypatch, tmp_path):
+    monkeypatch.setenv('LED_MATRIX_FRAMEBUFFER_DIR', str(tmp_path))
+    assert framebuffer_path(FakeDev()) == tmp_path / 'FRAK_01_23.fb'
+
+
+def test_writer_sends_only_new_generations(tmp_path, sent):
+    dev = FakeDev()
+    fb = SharedFrameBuffer(tmp_path / 'fb')
+    writer = FrameBufferWriter(dev, fb)
+
+    assert writer.poll() is False          # nothing published yet
+
+    frame = bytearray(FRAME_SIZE)
+    frame[0] = 1
+    fb.write(frame)
+    assert writer.poll() is True
+    assert writer.poll() is False          # same generation
+
+    fb.write(frame)
+    assert writer.poll() is False          # new generation, same pixels
+
+    assert sent == [(dev, helpers.CommandVals.Draw, pack_frame(frame))]
+    fb.close()
+
+
+def test_writer_thread_follows_external_producer(tmp_path, sent):
+    path = tmp_path / 'fb'
+    writer = FrameBufferWriter(FakeDev(), SharedFrameBuffer(path), poll_interval=0.001).start()
+    try:
+        producer = (
+            'import sys\n'
+            'from is_matrix_forge.led_matrix.display.framebuffer import SharedFrameBuffer\n'
+            'with SharedFrameBuffer(sys.argv[1]) as fb:\n'
+            '    fb.write(b"\\x01" * 306)\n'
+        )
+        subprocess.run([sys.executable, '-c', producer, str(path)], check=True, timeout=60)
+
+        deadline = time.monotonic() + 2
+        while not sent and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        writer.stop()
+
+    assert not writer.running
+    assert sent and sent[-1][2] == [0xFF] * 38 + [0x03]
+
+
+class _LogSpy:
+    def __init__(self):
+        self.records = []
+
+    def get_child(self, _name):
+        return self
+
+    def warning(self, msg):
+        self.records.append(('warning', msg))
+
+    def info(self, msg):
+        self.records.append(('info', msg))
+
+
+def test_writer_reports_dead_producer_once(tmp_path, sent, monkeypatch):
+    from is_matrix_forge.led_matrix.display import framebuffer
+
+    spy = _LogSpy()
+    monkeypatch.setattr(framebuffer, 'MOD_LOGGER', spy)
+
+    fb = SharedFrameBuffer(tmp_path / 'fb')
+    writer = FrameBufferWriter(FakeDev(), fb, stale_after=0.05)
+
+    # A producer that crashed between making the sequence odd and finishing.
+    framebuffer._SEQUENCE.pack_into(fb._map, framebuffer._SEQUENCE_OFFSET, 3)
+
+    deadline = time.monotonic() + 0.3
+    while time.monotonic() < deadline:
+        assert writer.poll() is False
+
+    assert writer.producer_dead
+    assert [level for level, _ in spy.records] == ['warning']
+
+    # A restarted producer picks up from the odd sequence and recovers the buffer.
+    frame = bytearray(FRAME_SIZE)
+    frame[0] = 1
+    assert fb.write(frame) == 4
+    assert writer.poll() is True
+    assert not writer.producer_dead
+    assert len(sent) == 1
+    fb.close()
+
+
+def test_writer_thread_reports_read_timeouts_once(tmp_path, sent, monkeypatch):
+    from is_matrix_forge.led_matrix.display import framebuffer
+
+    spy = _LogSpy()
+    monkeypatch.setattr(framebuffer, 'MOD_LOGGER', spy)
+
+    fb = SharedFrameBuffer(tmp_path / 'fb')
+    fb.write(bytes(FRAME_SIZE))
+    writer = FrameBufferWriter(FakeDev(), fb, poll_interval=0.001)
+
+    def busy_read():
+        raise TimeoutError('mid-write')
+
+    monkeypatch.setattr(fb, 'read', busy_read)
+    writer.start()
+    time.sleep(0.1)
+    writer.stop()
+    fb.close()
+
+    assert spy.records == [('warning', 'mid-write')]
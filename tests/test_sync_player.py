@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from is_matrix_forge.led_matrix.display.animations.animation import Animation
+from is_matrix_forge.led_matrix.display.animations.frame.base import Frame
+from is_matrix_forge.led_matrix.display.animations.sync import SynchronizedPlayer
+from is_matrix_forge.led_matrix.display.grid import Grid
+
+
+class RecordingDevice:
+    def __init__(self, write_time=0.0):
+        self.write_time = write_time
+        self.frames = []
+        self.lock = threading.Lock()
+
+    def draw_grid(self, grid):
+        time.sleep(self.write_time)
+        with self.lock:
+            self.frames.append(grid)
+
+
+def _animation(count, duration=0.01, marker=0):
+    frames = []
+    for i in range(count):
+        cols = [[0] * 34 for _ in range(9)]
+        cols[marker][i % 34] = 1
+        frames.append(Frame(grid=Grid(init_grid=cols), duration=duration))
+    return Animation(frame_data=frames)
+
+
+def test_all_devices_receive_every_frame_in_lockstep():
+    fast, slow = RecordingDevice(), RecordingDevice(write_time=0.004)
+    anims = {fast: _animation(6, marker=0), slow: _animation(6, marker=1)}
+
+    stats = SynchronizedPlayer(anims, skew_budget=0.05).play()
+
+    assert [g.grid for g in fast.frames] == [f.grid.grid for f in anims[fast].frames]
+    assert [g.grid for g in slow.frames] == [f.grid.grid for f in anims[slow].frames]
+    assert stats.devices == 2
+    assert stats.playback.frames_drawn == 6
+    assert 0.0 <= stats.max_skew < 0.05
+    assert stats.within_budget
+
+
+def test_mismatched_frame_counts_rejected():
+    with pytest.raises(ValueError):
+        SynchronizedPlayer({RecordingDevice(): _animation(2), RecordingDevice(): _animation(3)})
+
+
+def test_draw_errors_propagate_and_writers_exit():
+    class Broken(RecordingDevice):
+        def draw_grid(self, grid):
+            raise RuntimeError('unplugged')
+
+    before = threading.active_count()
+    player = SynchronizedPlayer({RecordingDevice(): _animation(3), Broken(): _animation(3)})
+
+    with pytest.raises(RuntimeError):
+        player.play()
+
+    assert threading.active_count() == before
+
+
+def test_interrupt_mid_frame_does_not_deadlock(monkeypatch):
+    import is_matrix_forge.led_matrix.display.animations.sync as sync
+
+    real_barrier = threading.Barrier
+    barriers = []
+
+    class InterruptingBarrier(real_barrier):
+        def wait(self, timeout=None):
+            # Interrupt the coordinator while it waits for the first frame to finish.
+            if self is barriers[1] and not threading.current_thread().name.startswith('SyncWriter'):
+                raise KeyboardInterrupt
+            return super().wait(timeout)
+
+    def make_barrier(parties):
+        barriers.append(InterruptingBarrier(parties))
+        return barriers[-1]
+
+    monkeypatch.setattr(sync.threading, 'Barrier', make_barrier)
+    player = SynchronizedPlayer({RecordingDevice(write_time=0.02): _animation(3), RecordingDevice(): _animation(3)})
+    result = []
+
+    def run():
+        try:
+            player.play()
+        except KeyboardInterrupt:
+            result.append('interrupted')
+
+    before = threading.active_count()
+    runner = threading.Thread(target=run, daemon=True)
+    runner.start()
+    runner.join(timeout=5)
+
+    assert not runner.is_alive()
+    assert result == ['interrupted']
+    assert threading.active_count() == before
+
+
+def test_stop_works_with_an_external_stop_event():
+    device = RecordingDevice()
+    player = SynchronizedPlayer({device: _animation(2, duration=5.0)}, loop=True)
+    external = threading.Event()
+
+    threading.Timer(0.1, player.stop).start()
+    started = time.monotonic()
+    player.play(external)
+
+    assert time.monotonic() - started < 1.0
+    assert not external.is_set()
@@ -0,0 +1,190 @@
+import threading
+import time
+
+import pytest
+
+from is_matrix_forge.common.scheduler import TaskScheduler
+
+
+@pytest.fixture
+def scheduler():
+    sched = TaskScheduler(idle_timeout=0.2)
+    yield sched
+    with sched._cond:
+        for _, _, _, job in list(sched._heap):
+            job._cancelled = True
+        sched._cond.notify()
+
+
+def test_periodic_job_keeps_a_fixed_rate(scheduler):
+    stamps = []
+
+    def tick():
+        stamps.append(time.monotonic())
+        time.sleep(0.004)  # work inside the callback must not add drift
+
+    job = scheduler.every(0.02, tick, delay=0.0)
+    time.sleep(0.43)
+    job.cancel(wait=True)
+
+    assert len(stamps) >= 18
+    # Fixed-rate: the nth run lands near start + n * interval, not later.
+    drift = stamps[-1] - (stamps[0] + (len(stamps) - 1) * 0.02)
+    assert abs(drift) < 0.02
+
+
+def test_one_shot_runs_once(scheduler):
+    calls = []
+    job = scheduler.after(0.01, lambda: calls.append(1))
+    time.sleep(0.08)
+
+    assert calls == [1]
+    assert job.cancelled and job.runs == 1
+
+
+def test_cancel_prevents_further_runs(scheduler):
+    calls = []
+    job = scheduler.every(0.01, lambda: calls.append(1), delay=0.0)
+    time.sleep(0.035)
+    job.cancel(wait=True)
+    seen = len(calls)
+    time.sleep(0.05)
+
+    assert seen >= 1
+    assert len(calls) == seen
+    assert scheduler.pending == 0
+
+
+def test_reschedule_brings_next_run_forward(scheduler):
+    calls = []
+    job = scheduler.every(10.0, lambda: calls.append(time.monotonic()))
+    time.sleep(0.02)
+    assert calls == []
+
+    job.reschedule(0.0)
+    time.sleep(0.05)
+    assert len(calls) == 1
+    job.cancel()
+
+
+def test_exceptions_do_not_kill_the_job(scheduler):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        raise RuntimeError('boom')
+
+    job = scheduler.every(0.01, flaky, delay=0.0)
+    time.sleep(0.05)
+    job.cancel(wait=True)
+
+    assert len(calls) >= 2
+
+
+def test_many_jobs_share_one_thread(scheduler):
+    before = threading.active_count()
+    seen = set()
+    jobs = [
+        scheduler.every(0.01, lambda: seen.add(threading.current_thread().ident), delay=0.0)
+        for _ in range(50)
+    ]
+    time.sleep(0.05)
+
+    assert threading.active_count() <= before + 1
+    assert len(seen) == 1
+    for job in jobs:
+        job.cancel()
+
+
+def test_thread_exits_when_idle(scheduler):
+    job = scheduler.after(0.0, lambda: None)
+    time.sleep(0.02)
+    thread = scheduler._thread
+    assert job.runs == 1
+
+    time.sleep(0.35)
+    assert thread is None or not thread.is_alive()
+
+
+def test_rejects_non_positive_interval(scheduler):
+    with pytest.raises(ValueError):
+        scheduler.every(0, lambda: None)
+
+
+def test_keep_alive_skips_ticks_while_the_device_is_busy(scheduler, monkeypatch):
+    from is_matrix_forge.led_matrix.controller.base import DeviceBase
+    from is_matrix_forge.led_matrix.controller.components import keep_alive as keep_alive_mod
+    from is_matrix_forge.led_matrix.controller.components.keep_alive import KeepAliveManager
+
+    class Port:
+        device = '/dev/ttyTEST'
+        name = 'Test Device'
+
+    class Controller(KeepAliveManager, DeviceBase):
+        KEEP_ALIVE_RETRY = 0.02
+
+        def __init__(self):
+            super().__init__(device=Port(), thread_safe=True, keep_alive_interval=10.0)
+            self.pings = 0
+
+        def _ping(self):
+            self.pings += 1
+
+    monkeypatch.setattr(keep_alive_mod, 'get_scheduler', lambda: scheduler)
+    ctrl = Controller()
+    other = []
+
+    ctrl.cmd_lock.acquire()
+    try:
+        ctrl.keep_alive = True
+        scheduler.every(0.01, lambda: other.append(1), delay=0.0)
+        time.sleep(0.1)
+        # The busy controller does not hold up the other job.
+        assert ctrl.pings == 0
+        assert len(other) >= 5
+    finally:
+        ctrl.cmd_lock.release()
+
+    time.sleep(0.1)
+    assert ctrl.pings == 1
+    ctrl.keep_alive = False
+
+
+def test_progress_heartbeat_skips_busy_controllers(scheduler, monkeypatch):
+    from is_matrix_forge import progress
+
+    class Matrix:
+        def __init__(self):
+            self.cmd_lock = threading.RLock()
+            self.drawn = []
+
+        def clear(self):
+            pass
+
+        def draw_percentage(self, percent):
+            with self.cmd_lock:
+                self.drawn.append(percent)
+
+    matrix = Matrix()
+    monkeypatch.setattr(progress, 'get_scheduler', lambda: scheduler)
+    monkeypatch.setattr(progress.LEDTqdm, '_setup_matrix', lambda self, use_led, m: matrix)
+    monkeypatch.setattr(progress.LEDTqdm, 'KEEPALIVE_RETRY', 0.02)
+
+    bar = progress.LEDTqdm(total=4, keepalive_sec=10.0, disable=True)
+    other = []
+    try:
+        bar._last_percent = 50
+        matrix.cmd_lock.acquire()
+        try:
+            bar._keepalive_job.reschedule(0.0)
+            scheduler.every(0.01, lambda: other.append(1), delay=0.0)
+            time.sleep(0.1)
+            assert matrix.drawn == []
+            assert len(other) >= 5
+        finally:
+            matrix.cmd_lock.release()
+
+        time.sleep(0.1)
+        assert matrix.drawn == [50]
+    finally:
+        bar.close()
@@ -0,0 +1,78 @@
+import itertools
+from unittest import mock
+
+import pytest
+
+from is_matrix_forge.led_matrix.display.animations.animation import Animation
+from is_matrix_forge.led_matrix.display.animations.frame.base import Frame
+from is_matrix_forge.led_matrix.display.animations.text_scroller import (
+    TextScroller,
+    TextScrollerConfig,
+)
+from is_matrix_forge.led_matrix.display.grid import Grid
+
+
+FONT = {
+    'A': [[0, 1, 0], [1, 0, 1], [1, 1, 1], [1, 0, 1]],
+    'B': [[1, 1], [1, 1], [1, 0], [1, 1]],
+    ' ': [[0], [0], [0], [0]],
+}
+
+
+class Device:
+    def __init__(self):
+        self.drawn = []
+
+    def draw_grid(self, grid):
+        self.drawn.append(grid.grid)
+
+    def clear(self):
+        pass
+
+
+def _scroller(text, **kwargs):
+    return TextScroller(TextScrollerConfig(text=text, font_map=FONT, frame_duration=0, **kwargs))
+
+
+def _play(anim, device):
+    with mock.patch.object(Animation, '_Animation__normalize_devices', lambda self, devs: devs):
+        anim.play(devices=[device])
+
+
+def test_frames_are_generated_lazily():
+    scroller = _scroller('AB ' * 5000)
+
+    with mock.patch.object(TextScroller, '_glyph', wraps=scroller._glyph) as glyph:
+        frames = scroller.iter_frames()
+        first_ten = list(itertools.islice(frames, 10))
+
+    assert len(first_ten) == 10
+    assert glyph.call_count <= 5
+
+
+@pytest.mark.parametrize('direction', ['horizontal', 'vertical_up', 'vertical_down'])
+def test_streamed_animation_plays_same_frames(direction):
+    scroller = _scroller('AB A', direction=direction)
+    expected = [f.grid.grid for f in scroller.generate_animation().frames]
+
+    device = Device()
+    anim = scroller.stream_animation()
+    assert anim.is_streaming and not anim.frames
+
+    _play(anim, device)
+    assert device.drawn == expected
+
+
+def test_missing_glyph_fails_before_streaming():
+    with pytest.raises(ValueError):
+        _scroller('AZ').stream_animation()
+
+
+def test_one_shot_iterator_does_not_spin_when_looping():
+    frames = (Frame(grid=Grid(), duration=0) for _ in range(3))
+    anim = Animation(frame_source=frames, loop=True)
+    device = Device()
+
+    _play(anim, device)
+
+    assert len(device.drawn) == 3
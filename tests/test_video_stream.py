@@ -0,0 +1,103 @@
+import threading
+
+import numpy as np
+import pytest
+
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.constants import FWK_MAGIC
+from is_matrix_forge.led_matrix.display.helpers.columns import encode_greyscale_frame
+from is_matrix_forge.led_matrix.display.video_stream import VideoStreamer
+
+
+class FakeCapture:
+    def __init__(self, count, on_read=None):
+        self.count = count
+        self.reads = 0
+        self.on_read = on_read
+
+    def read(self):
+        if self.reads >= self.count:
+            return False, None
+        self.reads += 1
+        if self.on_read:
+            self.on_read(self.reads)
+        return True, np.full((34, 9), self.reads, dtype=np.uint8)
+
+    def get(self, prop):
+        return 0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            return self.now
+
+    def sleep(self, seconds, stop_event=None):
+        with self.lock:
+            self.now += seconds
+
+
+def _streamer(capture, writes, clock, write_cost=0.0, **kwargs):
+    def write(buf):
+        writes.append(buf)
+        clock.sleep(write_cost)
+
+    return VideoStreamer(
+        capture, write, fps=10, prepare=lambda f: f, clock=clock, sleeper=clock.sleep, **kwargs
+    )
+
+
+def test_encoded_frame_is_one_buffer_of_staged_columns_and_commit():
+    frame = np.arange(34 * 9, dtype=np.uint8).reshape(34, 9)
+    buf = encode_greyscale_frame(frame.T)
+
+    col = bytes(FWK_MAGIC + [CommandVals.StageGreyCol])
+    assert buf.count(col) == 9
+    assert buf.startswith(col + bytes([0]) + bytes(frame[:, 0]))
+    assert buf.endswith(bytes(FWK_MAGIC + [CommandVals.DrawGreyColBuffer, 0]))
+    assert len(buf) == 9 * (4 + 34) + 4
+
+
+def test_every_frame_shown_with_one_write_each_when_on_time():
+    writes, clock = [], FakeClock()
+    stats = _streamer(FakeCapture(5), writes, clock).play()
+
+    assert stats.frames_decoded == stats.frames_shown == 5
+    assert stats.frames_dropped == 0
+    assert len(writes) == 5
+    assert [w[5] for w in writes] == [1, 2, 3, 4, 5]
+    assert clock.now == pytest.approx(0.5)
+
+
+def test_slow_writer_drops_late_frames():
+    writes, clock = [], FakeClock()
+    stats = _streamer(FakeCapture(6), writes, clock, write_cost=0.25).play()
+
+    assert stats.frames_shown + stats.frames_dropped == 6
+    assert stats.frames_dropped > 0
+    assert clock.now == pytest.approx(0.75, abs=0.25)
+
+
+def test_decoder_does_not_read_ahead_of_queue():
+    writes, clock = [], FakeClock()
+    seen = []
+    capture = FakeCapture(50, on_read=seen.append)
+    streamer = _streamer(capture, writes, clock, queue_size=2)
+
+    streamer.keep_running = lambda: len(writes) < 1
+    streamer.play()
+
+    # One frame written, at most queue_size queued, one in flight.
+    assert capture.reads <= 1 + 2 + 1
+
+
+def test_decode_errors_are_raised():
+    def boom(n):
+        raise RuntimeError('bad frame')
+
+    with pytest.raises(RuntimeError):
+        _streamer(FakeCapture(3, on_read=boom), [], FakeClock()).play()
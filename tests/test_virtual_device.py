@@ -0,0 +1,116 @@
+import time
+
+import pytest
+
+from is_matrix_forge.led_matrix import hardware
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.commands.parser import Command, CommandParser
+from is_matrix_forge.led_matrix.display.helpers import pack_matrix
+from is_matrix_forge.led_matrix.emulator import HAS_PTY, EmulatedMatrix, LinkModel, VirtualMatrixDevice
+from is_matrix_forge.led_matrix.helpers.device import get_devices, list_devices
+from is_matrix_forge.led_matrix.transport import get_pool
+
+
+MAGIC = b'\x32\xac'
+
+
+def test_parser_splits_fixed_and_variable_commands():
+    draw = bytes(range(39))
+    stream = b'\x00' * 16 + MAGIC + b'\x06' + draw + MAGIC + b'\x00\x40' + MAGIC + b'\x00'
+
+    parser = CommandParser()
+    commands = parser.feed(stream[:30]) + parser.feed(stream[30:])
+
+    assert commands == [Command(0x06, draw), Command(0x00, b'\x40'), Command(0x00, b'')]
+    assert parser.skipped == 16
+    assert parser.pending == 0
+    assert commands[0].command is CommandVals.Draw
+
+
+def test_parser_keeps_greyscale_commit_padding():
+    parser = CommandParser()
+    commit = MAGIC + b'\x08\x00'
+    assert parser.feed(commit + commit) == [Command(0x08, b'\x00')] * 2
+    assert parser.skipped == 0
+
+
+def test_parser_waits_for_split_magic():
+    parser = CommandParser()
+    assert parser.feed(b'junk\x32') == []
+    assert parser.feed(b'\xac\x20') == [Command(0x20, b'')]
+
+
+def test_emulated_matrix_commands():
+    matrix = EmulatedMatrix(version=(0, 2, 5))
+    grid = [[0] * 34 for _ in range(9)]
+    grid[2][5] = 1
+
+    matrix.apply(Command(CommandVals.Draw, bytes(pack_matrix(grid))))
+    assert matrix.lit == grid
+
+    matrix.apply(Command(CommandVals.StageGreyCol, bytes([1]) + bytes(range(34))))
+    matrix.apply(Command(CommandVals.DrawGreyColBuffer, b''))
+    assert matrix.grid[1] == list(range(34))
+    assert matrix.grid[2] == [0] * 34
+
+    assert matrix.apply(Command(CommandVals.Brightness, b'\x10')) is None
+    assert matrix.apply(Command(CommandVals.Brightness, b''))[:1] == b'\x10'
+    assert matrix.apply(Command(CommandVals.Version, b'')) == bytes([0, 0x25, 0]).ljust(32, b'\x00')
+    assert len(matrix.apply(Command(CommandVals.GetAllBrightness, b''))) == 306
+    assert matrix.commands['Brightness'] == 2
+
+
+def test_link_model():
+    assert LinkModel().command_time(42) == 0
+    assert LinkModel(baudrate=10_000, latency=0.001).command_time(100) == pytest.approx(0.101)
+    with pytest.raises(ValueError):
+        LinkModel(baudrate=0)
+
+
+@pytest.fixture
+def emulator():
+    if not HAS_PTY:
+        pytest.skip('needs a pty')
+    with VirtualMatrixDevice(serial_number='EMU1') as emu:
+        yield emu
+    get_pool().discard(emu.port)
+    list_devices(refresh=True)
+
+
+def test_discovered_and_driven_through_hardware_api(emulator):
+    devices = [d for d in get_devices() if d.serial_number == 'EMU1']
+    assert [d.device for d in devices] == [emulator.port]
+    dev = devices[0]
+
+    grid = [[1 if (x + y) % 2 else 0 for y in range(34)] for x in range(9)]
+    hardware.send_command(dev, CommandVals.Draw, pack_matrix(grid))
+    hardware.brightness(dev, 77)
+
+    assert hardware.get_version(dev) == '0.2.0'
+    assert dev.location == '1-3.2'
+    assert hardware.get_brightness(dev) == 77
+    assert hardware.get_framebuffer_brightness_grid(dev)[0][:3] == [0, 255, 0]
+    with emulator.lock:
+        assert emulator.matrix.lit == grid
+
+
+def test_latency_model_bounds_throughput():
+    if not HAS_PTY:
+        pytest.skip('needs a pty')
+    with VirtualMatrixDevice(latency=0.01, register=False) as emu:
+        try:
+            start = time.monotonic()
+            for _ in range(5):
+                hardware.get_version(emu.port_info)
+            elapsed = time.monotonic() - start
+        finally:
+            get_pool().discard(emu.port)
+
+    assert elapsed >= 0.05
+    assert emu.matrix.commands['Version'] == 5
+
+
+def test_env_var_devices_are_discovered(monkeypatch):
+    monkeypatch.setenv('LED_MATRIX_VIRTUAL_PORTS', '/dev/pts/90@1-4.3')
+    dev = next(d for d in get_devices() if d.device == '/dev/pts/90')
+    assert (dev.vid, dev.pid, dev.location) == (0x32AC, 0x20, '1-4.3')